@@ -46,6 +46,7 @@ from dendropy.datamodel.charstatemodel import RESTRICTION_SITES_STATE_ALPHABET
 from dendropy.datamodel.charstatemodel import INFINITE_SITES_STATE_ALPHABET
 from dendropy.datamodel.charstatemodel import new_standard_state_alphabet
 from dendropy.datamodel.charmatrixmodel import CharacterDataSequence
+from dendropy.datamodel.charmatrixmodel import CharacterDataSequenceView
 from dendropy.datamodel.charmatrixmodel import CharacterMatrix
 from dendropy.datamodel.charmatrixmodel import DnaCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import DnaCharacterMatrix
@@ -65,6 +66,7 @@ from dendropy.datamodel.charmatrixmodel import ContinuousCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import ContinuousCharacterMatrix
 from dendropy.calculate.phylogeneticdistance import PhylogeneticDistanceMatrix
 from dendropy.datamodel.datasetmodel import DataSet
+from dendropy.datamodel.datasetmodel import LazyDataSet
 from dendropy.utility.error import ImmutableTaxonNamespaceError
 from dendropy.utility.error import DataParseError
 from dendropy.utility.error import UnsupportedSchemaError
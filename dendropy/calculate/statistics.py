@@ -21,6 +21,8 @@ Functions to calculate some general statistics.
 """
 
 import math
+import bisect
+import operator
 from dendropy.calculate import probability
 from operator import itemgetter
 
@@ -75,15 +77,17 @@ def median(pool):
     """
     Returns median of sample. From: http://wiki.python.org/moin/SimplePrograms
     """
-    copy = sorted(pool)
-    size = len(copy)
+    return _median_of_sorted(sorted(pool))
+
+def _median_of_sorted(values):
+    size = len(values)
     if size % 2 == 1:
         idx = int((size - 1) / 2)
-        return copy[idx]
+        return values[idx]
     else:
         idx1 = int(size/2) - 1
         idx2 = int(size/2)
-        return (copy[idx1] + copy[idx2]) / 2
+        return (values[idx1] + values[idx2]) / 2
 
 def empirical_hpd(values, conf=0.05):
     """
@@ -92,25 +96,18 @@ def empirical_hpd(values, conf=0.05):
     Adapted from ``emp.hpd`` in the "TeachingDemos" R package (Copyright Greg
     Snow; licensed under the Artistic License).
     """
+    return _empirical_hpd_of_sorted(sorted(values), conf=conf)
+
+def _empirical_hpd_of_sorted(x, conf=0.05):
     conf = min([conf, 1.0 - conf])
-    n = len(values)
+    n = len(x)
     nn = int(round(n * conf))
-    x = sorted(values)
-    xx = []
     if nn == 0:
-        raise ValueError("Sample size too small: %s" % len(values))
-    for i in range(nn):
-        Z1 = x[n-(nn-i)]
-        Z2 = x[i]
-        #print "==>", Z1, Z2
-        xx.append(Z1 - Z2)
+        raise ValueError("Sample size too small: %s" % n)
+    # widths of all intervals spanning n - nn observations
+    xx = list(map(operator.sub, x[n-nn:], x[:nn]))
     m = min(xx)
     nnn = xx.index(m)
-    #print "n=", n
-    #print "nn=", nn
-    #print "xx=", xx
-    #print "m=", m
-    #print "nnn=", n
     return (x[nnn], x[n-nn+nnn])
 
 def empirical_cdf(values, v):
@@ -200,7 +197,9 @@ def quantile_5_95(values):
     """
     Returns 5% and 95% quantiles.
     """
-    values = sorted(values)
+    return _quantile_5_95_of_sorted(sorted(values))
+
+def _quantile_5_95_of_sorted(values):
     size = len(values)
     idx5 = int(round(size * 0.05)) - 1
     idx95 = int(round(size * 0.95)) - 1
@@ -478,13 +477,19 @@ def summarize(values):
         - ``hpd95``       : tuple pair representing 5% and 95% HPD
         - ``quant_5_95``  : tuple pair representing 5% and 95% quantile
 
+    The values are sorted only once, with all the order statistics calculated
+    from the same sorted copy.
     """
     summary = {}
     if len(values) == 0:
         raise ValueError("No values in data")
     try:
-        summary['range'] = (min(values), max(values))
+        sorted_values = sorted(values)
     except (ValueError, OverflowError):
+        sorted_values = None
+    try:
+        summary['range'] = (sorted_values[0], sorted_values[-1])
+    except (TypeError, ValueError, OverflowError):
         summary['range'] = None
     try:
         summary['mean'], summary['var'] = mean_and_sample_variance(values)
@@ -498,15 +503,287 @@ def summarize(values):
     except (ValueError, OverflowError, IndexError):
         summary['mean'], summary['var'], summary['sd'] = None, None, None
     try:
-        summary['median'] = median(values)
-    except (ValueError, OverflowError):
+        summary['median'] = _median_of_sorted(sorted_values)
+    except (TypeError, ValueError, OverflowError):
         summary['median'] = None
     try:
-        summary['hpd95'] = empirical_hpd(values, conf=0.95)
-    except (ValueError, OverflowError):
+        summary['hpd95'] = _empirical_hpd_of_sorted(sorted_values, conf=0.95)
+    except (TypeError, ValueError, OverflowError):
         summary['hpd95'] = None
     try:
-        summary['quant_5_95'] = quantile_5_95(values)
-    except (ValueError, OverflowError):
+        summary['quant_5_95'] = _quantile_5_95_of_sorted(sorted_values)
+    except (TypeError, ValueError, OverflowError):
         summary['quant_5_95'] = None
     return summary
+
+def summarize_many(value_collections):
+    """
+    Summarizes each of multiple samples of values (e.g., the edge lengths of
+    all the splits in a set of trees), as given by :func:`summarize`.
+
+    Parameters
+    ----------
+    value_collections : dict or iterable of lists of values
+        If a dictionary, then its values are the samples to be summarized;
+        otherwise, each element is a sample to be summarized.
+
+    Returns
+    -------
+    s : dict or list
+        If ``value_collections`` is a dictionary, a dictionary with the same
+        keys, mapped to the summaries of the corresponding samples; otherwise,
+        a list of summaries in the same order as the samples. Samples
+        without any values are summarized as |None| (or, for dictionaries,
+        skipped).
+    """
+    if isinstance(value_collections, dict):
+        summaries = {}
+        for key, values in value_collections.items():
+            if values:
+                summaries[key] = summarize(values)
+        return summaries
+    summaries = []
+    for values in value_collections:
+        if values:
+            summaries.append(summarize(values))
+        else:
+            summaries.append(None)
+    return summaries
+
+class QuantileSketch(object):
+    """
+    Streaming approximation of the distribution of a sample of values, for
+    estimating quantiles (and summaries such as those given by
+    :func:`summarize`) without storing every value.
+
+    This is a "merging t-digest" (Dunning and Ertl 2019): incoming values are
+    buffered, and the buffer is periodically merged into a sorted list of
+    weighted centroids, with the size of the centroids limited such that those
+    near the tails of the distribution are small, so that extreme quantiles
+    are estimated more precisely than central ones. The number of centroids is
+    bounded by (approximately) the ``compression`` parameter, regardless of the
+    number of values added. The count, minimum, maximum, mean, and variance of
+    the values are tracked exactly.
+
+    Sketches of different samples can be combined using :meth:`merge`, e.g.,
+    to combine the results of processing different files in parallel.
+
+    References:
+
+        -   Dunning, T. and O. Ertl. 2019. Computing extremely accurate
+            quantiles using t-digests. arXiv:1902.04023.
+
+    """
+
+    def __init__(self, compression=100, buffer_size=None):
+        """
+
+        Parameters
+        ----------
+        compression : numeric
+            Controls the trade-off between accuracy and size: larger values
+            result in more centroids and more accurate estimates.
+        buffer_size : int
+            Number of values to accumulate before merging them into the
+            centroids. Defaults to ten times ``compression``.
+        """
+        if compression <= 0:
+            raise ValueError("Compression must be positive: {}".format(compression))
+        self.compression = compression
+        if buffer_size is None:
+            buffer_size = int(10 * compression)
+        self.buffer_size = max(1, buffer_size)
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._mean = 0.0
+        self._sum_of_squared_deviations = 0.0
+        self._centroid_means = []
+        self._centroid_weights = []
+        self._buffer = []
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value):
+        """
+        Adds a single value to the sample.
+        """
+        self.count += 1
+        if self.count == 1:
+            self.min = value
+            self.max = value
+        elif value < self.min:
+            self.min = value
+        elif value > self.max:
+            self.max = value
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._sum_of_squared_deviations += delta * (value - self._mean)
+        self._buffer.append(value)
+        if len(self._buffer) >= self.buffer_size:
+            self._compress()
+
+    def update(self, values):
+        """
+        Adds each of the values in ``values`` to the sample.
+        """
+        for value in values:
+            self.add(value)
+
+    def merge(self, other):
+        """
+        Adds all the values summarized by the sketch ``other`` to this sketch.
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.min = other.min
+            self.max = other.max
+            self._mean = other._mean
+            self._sum_of_squared_deviations = other._sum_of_squared_deviations
+        else:
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            total = self.count + other.count
+            delta = other._mean - self._mean
+            self._sum_of_squared_deviations += other._sum_of_squared_deviations \
+                    + delta * delta * self.count * other.count / total
+            self._mean += delta * other.count / total
+        self.count += other.count
+        self._centroid_means.extend(other._centroid_means)
+        self._centroid_weights.extend(other._centroid_weights)
+        self._buffer.extend(other._buffer)
+        self._compress()
+
+    def _scale_function(self, q):
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _inverse_scale_function(self, k):
+        x = k * 2 * math.pi / self.compression
+        if x >= math.pi / 2:
+            return 1.0
+        return (math.sin(x) + 1) / 2
+
+    def _compress(self):
+        if not self._buffer and len(self._centroid_means) <= 1:
+            return
+        points = sorted(list(zip(self._centroid_means, self._centroid_weights))
+                + [(value, 1) for value in self._buffer], key=itemgetter(0))
+        self._buffer = []
+        total = float(sum(weight for mean, weight in points))
+        means = []
+        weights = []
+        weight_so_far = 0.0
+        current_mean, current_weight = points[0]
+        weight_limit = total * self._inverse_scale_function(self._scale_function(0.0) + 1)
+        for mean, weight in points[1:]:
+            if weight_so_far + current_weight + weight <= weight_limit:
+                current_weight += weight
+                current_mean += (mean - current_mean) * weight / current_weight
+            else:
+                means.append(current_mean)
+                weights.append(current_weight)
+                weight_so_far += current_weight
+                weight_limit = total * self._inverse_scale_function(self._scale_function(weight_so_far / total) + 1)
+                current_mean, current_weight = mean, weight
+        means.append(current_mean)
+        weights.append(current_weight)
+        self._centroid_means = means
+        self._centroid_weights = weights
+
+    def _get_num_centroids(self):
+        self._compress()
+        return len(self._centroid_means)
+    num_centroids = property(_get_num_centroids)
+
+    def quantile(self, q):
+        """
+        Returns the (approximate) ``q``-th quantile of the sample.
+        """
+        if self.count == 0:
+            raise ValueError("No values in data")
+        self._compress()
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        means = self._centroid_means
+        weights = self._centroid_weights
+        target = q * self.count
+        # positions of the centers of the centroids in the ranked sample
+        position = weights[0] / 2.0
+        if target < position:
+            return self.min + (means[0] - self.min) * (target / position)
+        for idx in range(len(means) - 1):
+            delta = (weights[idx] + weights[idx+1]) / 2.0
+            if target < position + delta:
+                return means[idx] + (means[idx+1] - means[idx]) * ((target - position) / delta)
+            position += delta
+        remaining = self.count - position
+        if remaining <= 0:
+            return self.max
+        return means[-1] + (self.max - means[-1]) * ((target - position) / remaining)
+
+    def cdf(self, value):
+        """
+        Returns the (approximate) proportion of values in the sample that are
+        less than or equal to ``value``.
+        """
+        if self.count == 0:
+            raise ValueError("No values in data")
+        self._compress()
+        if value < self.min:
+            return 0.0
+        if value >= self.max:
+            return 1.0
+        means = self._centroid_means
+        weights = self._centroid_weights
+        idx = bisect.bisect_right(means, value)
+        position = sum(weights[:idx]) - (weights[idx-1] / 2.0 if idx > 0 else 0.0)
+        if idx == 0:
+            lower, upper, span = self.min, means[0], weights[0] / 2.0
+        elif idx == len(means):
+            lower, upper, span = means[-1], self.max, weights[-1] / 2.0
+        else:
+            lower, upper, span = means[idx-1], means[idx], (weights[idx-1] + weights[idx]) / 2.0
+        if upper > lower:
+            position += span * (value - lower) / (upper - lower)
+        return min(1.0, position / self.count)
+
+    def hpd(self, conf=0.95, num_steps=200):
+        """
+        Returns the (approximate) shortest interval containing a proportion
+        ``conf`` of the sample, assuming a **unimodal** distribution, found by
+        searching over ``num_steps`` intervals.
+        """
+        conf = max([conf, 1.0 - conf])
+        best = None
+        for step in range(num_steps + 1):
+            lower_q = (1.0 - conf) * step / num_steps
+            lower = self.quantile(lower_q)
+            upper = self.quantile(lower_q + conf)
+            if best is None or upper - lower < best[1] - best[0]:
+                best = (lower, upper)
+        return best
+
+    def summarize(self):
+        """
+        Returns a summary of the sample, with the same keys as given by
+        :func:`summarize`, but with the median, HPD, and quantiles being
+        approximate.
+        """
+        if self.count == 0:
+            raise ValueError("No values in data")
+        summary = {}
+        summary['range'] = (self.min, self.max)
+        summary['mean'] = self._mean
+        if self.count == 1:
+            summary['var'] = float('inf')
+        else:
+            summary['var'] = self._sum_of_squared_deviations / (self.count - 1)
+        summary['sd'] = summary['var'] ** 0.5
+        summary['median'] = self.quantile(0.5)
+        summary['hpd95'] = self.hpd(conf=0.95)
+        summary['quant_5_95'] = (self.quantile(0.05), self.quantile(0.95))
+        return summary
@@ -22,6 +22,7 @@ from dendropy.dataio import newickwriter
 from dendropy.dataio import newickyielder
 from dendropy.dataio import fastareader
 from dendropy.dataio import fastawriter
+from dendropy.dataio import fastayielder
 from dendropy.dataio import nexusreader
 from dendropy.dataio import nexuswriter
 from dendropy.dataio import nexusyielder
@@ -34,19 +35,22 @@ from dendropy.utility import container
 
 _IOServices = collections.namedtuple(
         "_IOServices",
-        ["reader", "writer", "tree_yielder"]
+        ["reader", "writer", "tree_yielder", "char_yielder"]
         )
 
+# Number of chunks read ahead by yielders when 'prefetch=True'
+DEFAULT_PREFETCH_CHUNKS = 8
+
 _IO_SERVICE_REGISTRY = container.CaseInsensitiveDict()
-_IO_SERVICE_REGISTRY["newick"] = _IOServices(newickreader.NewickReader, newickwriter.NewickWriter, newickyielder.NewickTreeDataYielder)
-_IO_SERVICE_REGISTRY["nexus"] = _IOServices(nexusreader.NexusReader, nexuswriter.NexusWriter, nexusyielder.NexusTreeDataYielder)
-_IO_SERVICE_REGISTRY["nexus/newick"] = _IOServices(None, None, nexusyielder.NexusNewickTreeDataYielder)
-_IO_SERVICE_REGISTRY["nexml"] = _IOServices(nexmlreader.NexmlReader, nexmlwriter.NexmlWriter, nexmlyielder.NexmlTreeDataYielder)
-_IO_SERVICE_REGISTRY["fasta"] = _IOServices(fastareader.FastaReader, fastawriter.FastaWriter, None)
-_IO_SERVICE_REGISTRY["dnafasta"] = _IOServices(fastareader.DnaFastaReader, fastawriter.FastaWriter, None)
-_IO_SERVICE_REGISTRY["rnafasta"] = _IOServices(fastareader.RnaFastaReader, fastawriter.FastaWriter, None)
-_IO_SERVICE_REGISTRY["proteinfasta"] = _IOServices(fastareader.ProteinFastaReader, fastawriter.FastaWriter, None)
-_IO_SERVICE_REGISTRY["phylip"] = _IOServices(phylipreader.PhylipReader, phylipwriter.PhylipWriter, None)
+_IO_SERVICE_REGISTRY["newick"] = _IOServices(newickreader.NewickReader, newickwriter.NewickWriter, newickyielder.NewickTreeDataYielder, None)
+_IO_SERVICE_REGISTRY["nexus"] = _IOServices(nexusreader.NexusReader, nexuswriter.NexusWriter, nexusyielder.NexusTreeDataYielder, None)
+_IO_SERVICE_REGISTRY["nexus/newick"] = _IOServices(None, None, nexusyielder.NexusNewickTreeDataYielder, None)
+_IO_SERVICE_REGISTRY["nexml"] = _IOServices(nexmlreader.NexmlReader, nexmlwriter.NexmlWriter, nexmlyielder.NexmlTreeDataYielder, None)
+_IO_SERVICE_REGISTRY["fasta"] = _IOServices(fastareader.FastaReader, fastawriter.FastaWriter, None, fastayielder.FastaCharacterDataYielder)
+_IO_SERVICE_REGISTRY["dnafasta"] = _IOServices(fastareader.DnaFastaReader, fastawriter.FastaWriter, None, fastayielder.FastaCharacterDataYielder)
+_IO_SERVICE_REGISTRY["rnafasta"] = _IOServices(fastareader.RnaFastaReader, fastawriter.FastaWriter, None, fastayielder.FastaCharacterDataYielder)
+_IO_SERVICE_REGISTRY["proteinfasta"] = _IOServices(fastareader.ProteinFastaReader, fastawriter.FastaWriter, None, fastayielder.FastaCharacterDataYielder)
+_IO_SERVICE_REGISTRY["phylip"] = _IOServices(phylipreader.PhylipReader, phylipwriter.PhylipWriter, None, None)
 
 def get_reader(schema, **kwargs):
     try:
@@ -76,6 +80,7 @@ def get_tree_yielder(
         taxon_namespace,
         tree_type,
         **kwargs):
+    yielder_options = _pop_yielder_options(kwargs)
     try:
         yielder_type =_IO_SERVICE_REGISTRY[schema].tree_yielder
         if yielder_type is None:
@@ -85,13 +90,51 @@ def get_tree_yielder(
                 taxon_namespace=taxon_namespace,
                 tree_type=tree_type,
                 **kwargs)
+        _configure_yielder(yielder, **yielder_options)
         return yielder
     except KeyError:
         raise NotImplementedError("'{}' is not a supported data yielding schema".format(schema))
 
-def register_service(schema, reader=None, writer=None, tree_yielder=None):
+def get_char_yielder(
+        files,
+        schema,
+        **kwargs):
+    yielder_options = _pop_yielder_options(kwargs)
+    try:
+        yielder_type =_IO_SERVICE_REGISTRY[schema].char_yielder
+        if yielder_type is None:
+            raise KeyError
+        yielder = yielder_type(
+                files=files,
+                **kwargs)
+        _configure_yielder(yielder, **yielder_options)
+        return yielder
+    except KeyError:
+        raise NotImplementedError("'{}' is not a supported character data yielding schema".format(schema))
+
+_YIELDER_OPTIONS = (
+        "prefetch",
+        "prefetch_hook",
+        "follow",
+        "follow_sleep_interval",
+        "follow_timeout",
+        )
+
+def _pop_yielder_options(kwargs):
+    return dict((k, kwargs.pop(k)) for k in _YIELDER_OPTIONS if k in kwargs)
+
+def _configure_yielder(yielder, **kwargs):
+    prefetch = kwargs.pop("prefetch", None)
+    if prefetch is True:
+        prefetch = DEFAULT_PREFETCH_CHUNKS
+    if prefetch:
+        yielder.prefetch = prefetch
+    for k in kwargs:
+        setattr(yielder, k, kwargs[k])
+
+def register_service(schema, reader=None, writer=None, tree_yielder=None, char_yielder=None):
     global _IO_SERVICE_REGISTRY
-    _IO_SERVICE_REGISTRY[schema] = _IOServices(reader, writer, tree_yielder)
+    _IO_SERVICE_REGISTRY[schema] = _IOServices(reader, writer, tree_yielder, char_yielder)
 
 def register_reader(schema, reader):
     global _IO_SERVICE_REGISTRY
@@ -100,7 +143,8 @@ def register_reader(schema, reader):
         register_service(schema=schema,
                 reader=reader,
                 writer=current.writer,
-                tree_yielder=current.tree_yielder)
+                tree_yielder=current.tree_yielder,
+                char_yielder=current.char_yielder)
     except KeyError:
         register_service(schema=schema, reader=reader)
 
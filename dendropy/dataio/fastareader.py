@@ -71,7 +71,8 @@ class FastaReader(ioservice.DataReader):
                     self.data_type,
                     label=None,
                     taxon_namespace=taxon_namespace)
-        symbol_state_map = char_matrix.default_state_alphabet.full_symbol_state_map
+        state_alphabet = char_matrix.default_state_alphabet
+        symbol_state_map = state_alphabet.full_symbol_state_map
         curr_vec = None
         curr_taxon = None
         for line_index, line in enumerate(stream):
@@ -89,16 +90,15 @@ class FastaReader(ioservice.DataReader):
             elif curr_vec is None:
                 raise DataParseError(message="FASTA error: Expecting a lines starting with > before sequences", line_num=line_index + 1, stream=stream)
             else:
-                states = []
-                for col_ind, c in enumerate(s):
-                    c = c.strip()
-                    if not c:
-                        continue
-                    try:
-                        state = symbol_state_map[c]
-                    except KeyError:
-                        raise DataParseError(message="Unrecognized sequence symbol '{}'".format(c), line_num=line_index + 1, col_num=col_ind + 1, stream=stream)
-                    states.append(state)
+                try:
+                    states = state_alphabet.get_states_for_symbol_string(s)
+                except KeyError:
+                    # locate the offending symbol for the error message
+                    for col_ind, c in enumerate(s):
+                        c = c.strip()
+                        if c and c not in symbol_state_map:
+                            raise DataParseError(message="Unrecognized sequence symbol '{}'".format(c), line_num=line_index + 1, col_num=col_ind + 1, stream=stream)
+                    raise
                 curr_vec.extend(states)
         product = self.Product(
                 taxon_namespaces=None,
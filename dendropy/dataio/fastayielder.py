@@ -0,0 +1,97 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Implementation of FASTA-schema character sequence iterator.
+"""
+
+from dendropy.dataio import ioservice
+from dendropy.utility.error import DataParseError
+
+class FastaCharacterDataYielder(ioservice.CharacterDataYielder):
+
+    def __init__(self,
+            files=None,
+            state_alphabet=None,
+            as_bytes=False,
+            batch_size=None,
+            **kwargs):
+        """
+
+        Parameters
+        ----------
+        files : iterable of sources
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading. If a source element is
+            a string, then it is assumed to be a path to a file. Otherwise, the
+            source is assumed to be a file-like object.
+        state_alphabet : |StateAlphabet| instance
+            If given, every sequence will be validated against this alphabet
+            as it is read, and an error raised on unrecognized symbols.
+        as_bytes : bool
+            If |True|, sequences will be yielded as ``bytes`` objects rather
+            than strings.
+        batch_size : int
+            If given, records will be yielded in lists of (up to)
+            ``batch_size`` records instead of one at a time.
+        """
+        ioservice.CharacterDataYielder.__init__(self,
+                files=files,
+                state_alphabet=state_alphabet,
+                as_bytes=as_bytes,
+                batch_size=batch_size)
+        self.check_for_unused_keyword_arguments(kwargs)
+
+    ###########################################################################
+    ## Implementation of DataYielder interface
+
+    def _yield_items_from_stream(self, stream):
+        label = None
+        label_line_index = None
+        seq_parts = None
+        for line_index, line in enumerate(stream):
+            s = line.strip()
+            if not s:
+                continue
+            if s.startswith('>'):
+                if seq_parts is not None:
+                    if not seq_parts:
+                        raise DataParseError(message="FASTA error: Expected sequence, but found another sequence name ('{}')".format(s[1:].strip()), line_num=line_index + 1, stream=stream)
+                    yield self._compose_record(label, seq_parts, label_line_index, stream)
+                label = s[1:].strip()
+                label_line_index = line_index
+                seq_parts = []
+            elif seq_parts is None:
+                raise DataParseError(message="FASTA error: Expecting a lines starting with > before sequences", line_num=line_index + 1, stream=stream)
+            else:
+                seq_parts.append("".join(s.split()))
+        if seq_parts is not None:
+            yield self._compose_record(label, seq_parts, label_line_index, stream)
+
+    def _compose_record(self, label, seq_parts, label_line_index, stream):
+        sequence = "".join(seq_parts)
+        if self.state_alphabet is not None:
+            try:
+                self.state_alphabet.get_state_indexes_for_symbol_string(sequence, skip_whitespace=False)
+            except KeyError:
+                for col_ind, c in enumerate(sequence):
+                    if c not in self.state_alphabet.full_symbol_state_map:
+                        raise DataParseError(message="Unrecognized sequence symbol '{}' at position {} of sequence '{}'".format(c, col_ind + 1, label), line_num=label_line_index + 1, stream=stream)
+        if self.as_bytes and not isinstance(sequence, bytes):
+            sequence = sequence.encode("latin-1")
+        return self.SequenceRecord(label, sequence)
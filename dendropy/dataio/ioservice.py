@@ -19,9 +19,12 @@
 import sys
 import collections
 import warnings
+from threading import Event
 from dendropy.datamodel import taxonmodel
 from dendropy.utility import deprecate
 from dendropy.utility import textprocessing
+from dendropy.utility import filesys
+from dendropy.utility import error
 if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
 
@@ -505,6 +508,15 @@ class DataYielder(IOService):
         self._current_file_index = None
         self._current_file = None
         self._current_file_name = None
+        # If > 0, then files given as paths will be read ahead (up to this
+        # many chunks) in a background thread
+        self.prefetch = 0
+        self.prefetch_hook = None
+        # If |True|, then files given as paths will be followed as they grow
+        self.follow = False
+        self.follow_sleep_interval = 0.5
+        self.follow_timeout = None
+        self._follow_stop_event = Event()
 
     def reset(self):
         self.current_file_index = None
@@ -523,15 +535,46 @@ class DataYielder(IOService):
         return self._current_file_name
     current_file_name = property(_get_current_file_name)
 
+    def stop_following(self):
+        """
+        If following files, stops waiting for more data (can be called from
+        another thread).
+        """
+        self._follow_stop_event.set()
+
     def __iter__(self):
+        if self.prefetch and not self.follow:
+            for item in self._iterate_with_prefetch():
+                yield item
+            return
         for current_file_index, current_file in enumerate(self.files):
             self._current_file_index = current_file_index
             for item in self.iterate_over_file(current_file):
                 yield item
 
+    def _iterate_with_prefetch(self):
+        files = list(self.files)
+        prefetching_reader = filesys.PrefetchingReader(
+                paths=[f for f in files if textprocessing.is_str_type(f)],
+                max_queued_chunks=self.prefetch,
+                read_hook=self.prefetch_hook)
+        try:
+            for current_file_index, current_file in enumerate(files):
+                self._current_file_index = current_file_index
+                if textprocessing.is_str_type(current_file):
+                    current_file = prefetching_reader.open_next()
+                for item in self.iterate_over_file(current_file):
+                    yield item
+        finally:
+            prefetching_reader.close()
+
     def iterate_over_file(self, current_file):
+        if textprocessing.is_str_type(current_file) and self.follow:
+            for item in self._iterate_over_followed_file(current_file):
+                yield item
+            return
         if textprocessing.is_str_type(current_file):
-            self._current_file = open(current_file, "r")
+            self._current_file = filesys.open_path(current_file, "r")
             self._current_file_name = current_file
         else:
             self._current_file = current_file
@@ -549,6 +592,25 @@ class DataYielder(IOService):
                 yield item
         self._current_file = None
 
+    def _iterate_over_followed_file(self, path):
+        self._follow_stop_event.clear()
+        raw_stream = filesys.FollowingFileStream(path,
+                sleep_interval=self.follow_sleep_interval,
+                idle_timeout=self.follow_timeout,
+                stop_event=self._follow_stop_event)
+        self._current_file = filesys.wrap_binary_stream(raw_stream)
+        self._current_file_name = path
+        try:
+            with self._current_file:
+                for item in self._yield_items_from_stream(stream=self._current_file):
+                    yield item
+        except error.DataParseError:
+            # data cut off when we stopped following: the incomplete item
+            # is discarded
+            if not raw_stream.is_stopped:
+                raise
+        self._current_file = None
+
 ###############################################################################
 ## DataYielder
 
@@ -567,4 +629,57 @@ class TreeDataYielder(DataYielder):
     def tree_factory(self):
         return self.tree_type(taxon_namespace=self.taxon_namespace)
 
+###############################################################################
+## CharacterDataYielder
+
+class CharacterDataYielder(DataYielder):
+    """
+    Base class for yielders that iterate over character sequences in data
+    sources one sequence at a time, without instantiating a full character
+    matrix in memory.
+    """
+
+    SequenceRecord = collections.namedtuple(
+            "SequenceRecord",
+            ["label", "sequence"]
+            )
+
+    def __init__(self,
+            files=None,
+            state_alphabet=None,
+            as_bytes=False,
+            batch_size=None):
+        """
+        Parameters
+        ----------
+        files : iterable of sources
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading.
+        state_alphabet : |StateAlphabet| instance
+            If given, every sequence will be validated against this alphabet
+            as it is read, and an error raised on unrecognized symbols.
+        as_bytes : bool
+            If |True|, sequences will be yielded as ``bytes`` objects rather
+            than strings.
+        batch_size : int
+            If given, records will be yielded in lists of (up to)
+            ``batch_size`` records instead of one at a time.
+        """
+        DataYielder.__init__(self, files=files)
+        self.state_alphabet = state_alphabet
+        self.as_bytes = as_bytes
+        self.batch_size = batch_size
 
+    def __iter__(self):
+        if not self.batch_size:
+            for item in DataYielder.__iter__(self):
+                yield item
+            return
+        batch = []
+        for item in DataYielder.__iter__(self):
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
@@ -142,6 +142,8 @@ class NewickReader(ioservice.DataReader):
         suppress_edge_lengths : boolean, default: |False|
             If |True|, edge length values will not be processed. If |False|,
             edge length values will be processed.
+        parse_edge_lengths : boolean, default: |True|
+            If |False|, equivalent to ``suppress_edge_lengths=True``.
         extract_comment_metadata : boolean, default: |True|
             If |True| (default), any comments that begin with '&' or '&&' will
             be parsed and stored as part of the annotation set of the
@@ -151,6 +153,11 @@ class NewickReader(ioservice.DataReader):
             value'). If |False|, then the comments will not be parsed,
             but will be instead stored directly as elements of the ``comments``
             list attribute of the associated object.
+        parse_annotations : boolean, default: |True|
+            If |False|, then comments within tree statements will not even be
+            captured, let alone stored or parsed for metadata: only the
+            rooting ("[&R]"/"[&U]") and weight ("[&W ...]") comments preceding
+            a tree statement will be processed.
         store_tree_weights : boolean, default: |False|
             If |True|, process the tree weight (e.g. "[&W 1/2]") comment
             associated with each tree, if any. Defaults to |False|.
@@ -170,6 +177,9 @@ class NewickReader(ioservice.DataReader):
             If |False|, internal node labels will be instantantiated into
             |Taxon| objects. If |True|, internal node labels
             will *not* be instantantiated as strings.
+        parse_internal_labels : boolean, default: |True|
+            If |False|, internal node labels will be discarded. Cannot be
+            used with ``suppress_internal_node_taxa=False``.
         suppress_leaf_node_taxa : boolean, default: |False|
             If |False|, leaf (external) node labels will be instantantiated
             into |Taxon| objects. If |True|, leaff (external) node
@@ -250,7 +260,10 @@ class NewickReader(ioservice.DataReader):
         self.rooting = kwargs.pop("rooting", self.__class__._default_rooting_directive)
         self.edge_length_type = kwargs.pop("edge_length_type", float)
         self.suppress_edge_lengths = kwargs.pop("suppress_edge_lengths", False)
+        if not kwargs.pop("parse_edge_lengths", True):
+            self.suppress_edge_lengths = True
         self.extract_comment_metadata = kwargs.pop('extract_comment_metadata', True)
+        self.parse_annotations = kwargs.pop("parse_annotations", True)
         self.store_tree_weights = kwargs.pop("store_tree_weights", False)
         self.default_tree_weight = kwargs.pop("default_tree_weight", self.__class__._default_tree_weight)
         self.finish_node_fn = kwargs.pop("finish_node_fn", None)
@@ -263,6 +276,9 @@ class NewickReader(ioservice.DataReader):
         self.is_assign_internal_labels_to_edges = kwargs.pop("is_assign_internal_labels_to_edges", None)
         if self.is_assign_internal_labels_to_edges and not self.suppress_internal_node_taxa:
             raise ValueError("Conflicting options: cannot simultaneously assign internal labels to edges and to internal taxa")
+        self.parse_internal_labels = kwargs.pop("parse_internal_labels", True)
+        if not self.parse_internal_labels and not self.suppress_internal_node_taxa:
+            raise ValueError("Conflicting options: cannot simultaneously discard internal labels and assign them to internal taxa")
         self.terminating_semicolon_required = kwargs.pop("terminating_semicolon_required", True)
         self.check_for_unused_keyword_arguments(kwargs)
 
@@ -270,6 +286,7 @@ class NewickReader(ioservice.DataReader):
         self._tree_statement_complete = None
         self._parenthesis_nesting_level = None
         self._seen_taxa = None
+        self._saved_capture_comments = None
 
     def tree_iter(self,
             stream,
@@ -376,12 +393,20 @@ class NewickReader(ioservice.DataReader):
         self._process_tree_comments(tree, tree_comments, nexus_tokenizer)
         self._tree_statement_complete = False
         self._seen_taxa = set()
-        self._parse_tree_node_description(
-                nexus_tokenizer=nexus_tokenizer,
-                tree=tree,
-                current_node=tree.seed_node,
-                taxon_symbol_map_fn=taxon_symbol_map_fn,
-                is_internal_node=None)
+        self._saved_capture_comments = nexus_tokenizer.capture_comments
+        if not self.parse_annotations:
+            # restored on reaching the end of the statement, so that the
+            # comments preceding the next statement are captured
+            nexus_tokenizer.capture_comments = False
+        try:
+            self._parse_tree_node_description(
+                    nexus_tokenizer=nexus_tokenizer,
+                    tree=tree,
+                    current_node=tree.seed_node,
+                    taxon_symbol_map_fn=taxon_symbol_map_fn,
+                    is_internal_node=None)
+        finally:
+            nexus_tokenizer.capture_comments = self._saved_capture_comments
         current_token = nexus_tokenizer.current_token
         if not self._tree_statement_complete:
             raise NewickReader.NewickReaderIncompleteTreeStatementError(
@@ -390,6 +415,7 @@ class NewickReader(ioservice.DataReader):
                     col_num=nexus_tokenizer.token_column_num,
                     stream=nexus_tokenizer.src)
         self._seen_taxa = None
+        self._saved_capture_comments = None
         self._parenthesis_nesting_level = None
         self._tree_statement_complete = None
         while current_token == ";" and not nexus_tokenizer.is_eof():
@@ -445,6 +471,8 @@ class NewickReader(ioservice.DataReader):
                     exc.__context__ = None # Python 3.0, 3.1, 3.2
                     exc.__cause__ = None # Python 3.3, 3.4
                     raise exc
+            elif not self.parse_annotations:
+                pass
             elif self.extract_comment_metadata and comment.startswith("&"):
                 annotations = nexusprocessing.parse_comment_metadata_to_annotations(
                     comment=comment)
@@ -614,6 +642,7 @@ class NewickReader(ioservice.DataReader):
             elif nexus_tokenizer.current_token == ";": #256
                 # end of tree statement
                 self._tree_statement_complete = True
+                nexus_tokenizer.capture_comments = self._saved_capture_comments
                 nexus_tokenizer.next_token()
                 break
             elif nexus_tokenizer.current_token == ",": #260
@@ -660,7 +689,9 @@ class NewickReader(ioservice.DataReader):
                 else:
                     # Label
                     label = nexus_tokenizer.current_token
-                    if ( (is_internal_node and self.suppress_internal_node_taxa)
+                    if is_internal_node and not self.parse_internal_labels:
+                        pass
+                    elif ( (is_internal_node and self.suppress_internal_node_taxa)
                             or ((not is_internal_node) and self.suppress_leaf_node_taxa) ):
                         if self.is_assign_internal_labels_to_edges:
                             current_node.edge.label = label
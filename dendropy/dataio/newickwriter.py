@@ -194,6 +194,9 @@ class NewickWriter(ioservice.DataWriter):
         self.real_value_format_specifier = kwargs.pop("real_value_format_specifier", self._real_value_format_specifier)
         if self.edge_label_compose_fn is None:
             self.edge_label_compose_fn = self._format_edge_length
+        self._taxon_tag_cache = {}
+        self._taxon_tag_cache_namespace = None
+        self._taxon_tag_cache_token_map = None
         self.check_for_unused_keyword_arguments(kwargs)
 
     def _get_taxon_tree_token(self, taxon):
@@ -206,6 +209,20 @@ class NewickWriter(ioservice.DataWriter):
             self.taxon_token_map[taxon] = t
             return t
 
+    def _get_taxon_tree_tag(self, taxon):
+        """
+        Returns the (escaped) token representing ``taxon`` in a tree statement,
+        caching it for reuse across nodes and trees.
+        """
+        try:
+            return self._taxon_tag_cache[taxon]
+        except KeyError:
+            tag = nexusprocessing.escape_nexus_token(self._get_taxon_tree_token(taxon),
+                    preserve_spaces=self.preserve_spaces,
+                    quote_underscores=not self.unquoted_underscores)
+            self._taxon_tag_cache[taxon] = tag
+            return tag
+
     def _get_real_value_format_specifier(self):
         return self._real_value_format_specifier
     def _set_real_value_format_specifier(self, f):
@@ -239,8 +256,7 @@ class NewickWriter(ioservice.DataWriter):
         Writes a |TreeList| in Newick schema to ``stream``.
         """
         for tree in tree_list:
-            self._write_tree(stream, tree)
-            stream.write("\n")
+            stream.write(self._compose_tree(tree) + "\n")
         # In Newick format, no clear way to distinguish between
         # annotations/comments associated with tree collection and
         # annotations/comments associated with first tree. So we place them at
@@ -261,6 +277,17 @@ class NewickWriter(ioservice.DataWriter):
         """
         Composes and writes ``tree`` to ``stream``.
         """
+        stream.write(self._compose_tree(tree))
+
+    def _compose_tree(self, tree):
+        """
+        Composes and returns the Newick string representation of ``tree``
+        (including the terminating semi-colon).
+
+        The string is assembled in a buffer by an iterative traversal of the
+        tree, so that the cost of writing a tree to a stream is that of a
+        single ``write`` call, and deep trees do not run into recursion limits.
+        """
         if tree.rooting_state_is_undefined or self.suppress_rooting:
             rooting = ""
         elif tree.is_rooted:
@@ -273,7 +300,7 @@ class NewickWriter(ioservice.DataWriter):
             weight = "[&W {}] ".format(tree.weight)
         else:
             weight = ""
-        if not self.suppress_annotations:
+        if not self.suppress_annotations and tree.has_annotations:
             annotation_comments = nexusprocessing.format_item_annotations_as_comments(tree,
                     nhx=self.annotations_as_nhx,
                     real_value_format_specifier=self.real_value_format_specifier,
@@ -281,49 +308,56 @@ class NewickWriter(ioservice.DataWriter):
         else:
             annotation_comments = ""
         tree_comments = self._compose_comment_string(tree)
-        stream.write("{}{}{}{}".format(
-                rooting,
-                weight,
-                annotation_comments,
-                tree_comments,
-                ))
-        tree.apply(
-                before_fn=lambda x: self._write_node_open(x, stream),
-                after_fn=lambda x: self._write_node_close(x, stream),
-                leaf_fn=lambda x: self._write_leaf(x, stream),
-                )
-        stream.write(";")
+        if (self._taxon_tag_cache_namespace is not tree.taxon_namespace
+                or self._taxon_tag_cache_token_map is not self.taxon_token_map):
+            self._taxon_tag_cache = {}
+            self._taxon_tag_cache_namespace = tree.taxon_namespace
+            self._taxon_tag_cache_token_map = self.taxon_token_map
+        parts = [rooting, weight, annotation_comments, tree_comments]
+        compose_node_body = self._compose_node_body
+        # stack entries are: nodes still to be visited, literal strings to be
+        # emitted (commas), or 1-tuples holding internal nodes to be closed
+        stack = [tree.seed_node]
+        while stack:
+            item = stack.pop()
+            if item.__class__ is str:
+                parts.append(item)
+            elif item.__class__ is tuple:
+                parts.append(")")
+                parts.append(compose_node_body(item[0]))
+            else:
+                child_nodes = item._child_nodes
+                if child_nodes:
+                    parts.append("(")
+                    stack.append( (item,) )
+                    for ch_idx in range(len(child_nodes)-1, 0, -1):
+                        stack.append(child_nodes[ch_idx])
+                        stack.append(",")
+                    stack.append(child_nodes[0])
+                else:
+                    parts.append(compose_node_body(item))
+        parts.append(";")
+        return "".join(parts)
 
-    def _write_node_open(self, node, out):
-        if node._parent_node is None or node._parent_node._child_nodes[0] is node:
-            out.write("(")
+    def _compose_node_body(self, node):
+        edge = node.edge
+        if edge.length is not None and not self.suppress_edge_lengths:
+            body = "{}:{}".format(self._render_node_tag(node), self.edge_label_compose_fn(edge))
         else:
-            out.write(",(")
-
-    def _write_leaf(self, node, out):
-        if not (node._parent_node is None or node._parent_node._child_nodes[0] is node):
-            out.write(",")
-        self._write_node_body(node, out)
-
-    def _write_node_close(self, node, out):
-        out.write(")")
-        self._write_node_body(node, out)
-
-    def _write_node_body(self, node, out):
-        out.write(self._render_node_tag(node))
-        if node.edge and node.edge.length != None and not self.suppress_edge_lengths:
-            out.write(":{}".format(self.edge_label_compose_fn(node.edge)))
+            body = self._render_node_tag(node)
         if not self.suppress_annotations:
-            node_annotation_comments = nexusprocessing.format_item_annotations_as_comments(node,
-                    nhx=self.annotations_as_nhx,
-                    real_value_format_specifier=self.real_value_format_specifier)
-            out.write(node_annotation_comments)
-            edge_annotation_comments = nexusprocessing.format_item_annotations_as_comments(node.edge,
-                    nhx=self.annotations_as_nhx,
-                    real_value_format_specifier=self.real_value_format_specifier)
-            out.write(edge_annotation_comments)
-        out.write(self._compose_comment_string(node))
-        out.write(self._compose_comment_string(node.edge))
+            if node.has_annotations:
+                body += nexusprocessing.format_item_annotations_as_comments(node,
+                        nhx=self.annotations_as_nhx,
+                        real_value_format_specifier=self.real_value_format_specifier)
+            if edge.has_annotations:
+                body += nexusprocessing.format_item_annotations_as_comments(edge,
+                        nhx=self.annotations_as_nhx,
+                        real_value_format_specifier=self.real_value_format_specifier)
+        if not self.suppress_item_comments:
+            body += self._compose_comment_string(node)
+            body += self._compose_comment_string(edge)
+        return body
 
     def _compose_comment_string(self, item):
         if not self.suppress_item_comments and item.comments:
@@ -347,12 +381,17 @@ class NewickWriter(ioservice.DataWriter):
             tag = self.node_label_compose_fn(node)
         else:
             tag_parts = []
-            is_leaf = len(node.child_nodes()) == 0
+            is_leaf = len(node._child_nodes) == 0
             if is_leaf:
                 if hasattr(node, 'taxon') \
                         and node.taxon \
                         and node.taxon.label is not None \
                         and not self.suppress_leaf_taxon_labels:
+                    if not (hasattr(node, 'label')
+                            and node.label
+                            and not self.suppress_leaf_node_labels):
+                        # most common case: leaf labeled by taxon only
+                        return self._get_taxon_tree_tag(node.taxon)
                     tag_parts.append(self._get_taxon_tree_token(node.taxon))
                 if hasattr(node, 'label') \
                         and node.label \
@@ -279,15 +279,12 @@ class NexmlReader(ioservice.DataReader, _AnnotationParser):
             char_matrix_factory=None,
             state_alphabet_factory=None,
             global_annotations_target=None):
-        xml_doc = xmlprocessing.XmlDocument(file_obj=stream,
-                subelement_factory=self._subelement_factory)
-        self._namespace_registry = xml_doc.namespace_registry
         self._taxon_namespace_factory = taxon_namespace_factory
         self._tree_list_factory = tree_list_factory
         self._char_matrix_factory = char_matrix_factory
         self._state_alphabet_factory = state_alphabet_factory
         self._global_annotations_target = global_annotations_target
-        self._parse_document(xml_doc)
+        self._parse_document(stream)
         self._product = self.Product(
                 taxon_namespaces=self._taxon_namespaces,
                 tree_lists=self._tree_lists,
@@ -334,88 +331,159 @@ class NexmlReader(ioservice.DataReader, _AnnotationParser):
 
     ## Following methods are class-specific ###
 
-    def _parse_document(self, xml_doc):
-        xml_root = xml_doc.root
-        self._parse_taxon_namespaces(xml_root)
-        if self._char_matrix_factory is not None:
-            self._parse_char_matrices(xml_root)
-        if self._tree_list_factory is not None:
-            self._parse_tree_lists(xml_root)
-        if self._global_annotations_target is not None:
-            top_annotations = [i for i in xml_root.findall_annotations()]
-            for annotation in top_annotations:
-                self._parse_annotations(self._global_annotations_target, annotation)
-
-    def _parse_taxon_namespaces(self, xml_root):
-        for nxtaxa in xml_root.iter_otus():
-            taxon_namespace_label = nxtaxa.get('label', None)
-            taxon_namespace = self._new_taxon_namespace(label=taxon_namespace_label)
-            taxon_namespace_id = nxtaxa.get('id', id(taxon_namespace))
-            self._id_taxon_namespace_map[taxon_namespace_id] = taxon_namespace
-            annotations = [i for i in nxtaxa.findall_annotations()]
-            for annotation in annotations:
-                self._parse_annotations(taxon_namespace, annotation)
-            if self.case_sensitive_taxon_labels:
-                label_taxon_map = {}
-            else:
-                label_taxon_map = container.OrderedCaselessDict()
-            if self.attached_taxon_namespace is not None:
-                for t in taxon_namespace:
-                    label_taxon_map[t.label] = t
-            for idx, nxtaxon in enumerate(nxtaxa.findall_otu()):
-                taxon = None
-                taxon_label = nxtaxon.get('label', None)
-                taxon_oid = nxtaxon.get('id', id(nxtaxon))
-                if taxon_label is not None and self.attached_taxon_namespace is not None:
-                    # taxon = label_taxon_map.get_taxon(
-                    #         label=taxon_label,
-                    #         case_sensitive=self.case_sensitive_taxon_labels)
-                    try:
-                        taxon = label_taxon_map[taxon_label]
-                    except KeyError:
-                        taxon = None
-                if taxon is None:
-                    taxon = taxon_namespace.new_taxon(label=taxon_label)
-                annotations = [i for i in nxtaxon.findall_annotations()]
+    def _parse_document(self, stream):
+        tree_list = None
+        tree_parser = None
+        for event, nxelement in self._iterparse_document(stream):
+            if event == "trees-start":
+                if self._tree_list_factory is None:
+                    continue
+                otus_id, taxon_namespace = self._get_tree_list_taxon_namespace(nxelement)
+                tree_list = self._new_tree_list(
+                        label=nxelement.get('label', None),
+                        taxon_namespace=taxon_namespace)
+                tree_parser = _NexmlTreeParser(
+                        id_taxon_map=self._id_taxon_map,
+                        annotations_processor_fn=self._parse_annotations,
+                        )
+            elif event == "tree":
+                if tree_list is None:
+                    continue
+                tree_obj = tree_list.new_tree()
+                tree_parser.build_tree(tree_obj, nxelement, otus_id)
+            elif event == "trees-end":
+                if tree_list is None:
+                    continue
+                # by now, only the annotations of the trees block remain
+                annotations = [i for i in nxelement.findall_annotations()]
                 for annotation in annotations:
-                    self._parse_annotations(taxon, annotation)
-                self._id_taxon_map[(taxon_namespace_id, taxon_oid)] = taxon
-
-    def _parse_char_matrices(self, xml_root):
-        nxc = _NexmlCharBlockParser(self._namespace_registry,
-                self._id_taxon_namespace_map,
-                self._id_taxon_map,
-                self._new_char_matrix,
-                self._state_alphabet_factory)
-        for char_matrix_element in xml_root.iter_characters():
-            nxc.parse_char_matrix(char_matrix_element)
-
-    def _parse_tree_lists(self, xml_root):
-        for trees_idx, trees_element in enumerate(xml_root.iter_trees()):
-            self._parse_tree_list(trees_element, trees_idx, True)
-
-    def _parse_tree_list(self, nxtrees, trees_idx=None, add_to_tree_list=True):
-        trees_id = nxtrees.get('id', "Trees" + str(trees_idx))
-        trees_label = nxtrees.get('label', None)
+                    self._parse_annotations(tree_list, annotation)
+                tree_list = None
+                tree_parser = None
+            elif event == "document-end":
+                if self._global_annotations_target is not None:
+                    top_annotations = [i for i in nxelement.findall_annotations()]
+                    for annotation in top_annotations:
+                        self._parse_annotations(self._global_annotations_target, annotation)
+
+    def _iterparse_document(self, stream):
+        """
+        Incrementally parses the NEXML document in ``stream``.
+
+        Taxon namespace ("otus") blocks are processed as soon as they are
+        complete, and character matrix ("characters") blocks are processed a
+        row at a time (if a character matrix factory has been set). Tree blocks
+        are left to the caller, by yielding ``(event, element)`` pairs, where
+        ``event`` is one of:
+
+            - "trees-start": start of a tree block (attributes only).
+            - "tree": a complete tree element.
+            - "trees-end": end of a tree block; at this point only the
+              annotations of the block remain as child elements.
+            - "document-end": end of the document; the element is the root
+              element, with only top-level annotations remaining.
+
+        Processed elements are discarded as parsing proceeds, so memory use
+        is bounded by the largest single tree or character matrix row rather
+        than the size of the document.
+        """
+        xml_doc = xmlprocessing.XmlDocument(subelement_factory=self._subelement_factory)
+        self._namespace_registry = xml_doc.namespace_registry
+        ns = "{%s}" % self.default_namespace if self.default_namespace else ""
+        otus_tag = ns + "otus"
+        characters_tag = ns + "characters"
+        format_tag = ns + "format"
+        matrix_tag = ns + "matrix"
+        row_tag = ns + "row"
+        trees_tag = ns + "trees"
+        tree_tag = ns + "tree"
+        char_block_parser = None
+        in_char_block = False
+        for event, nxelement in xml_doc.iterparse_file(stream,
+                start_tags=(characters_tag, matrix_tag, trees_tag),
+                end_tags=(otus_tag, characters_tag, format_tag, matrix_tag, row_tag, trees_tag, tree_tag)):
+            tag = nxelement.tag
+            if tag == tree_tag:
+                yield "tree", nxelement
+            elif tag == row_tag:
+                if in_char_block:
+                    char_block_parser.parse_char_matrix_row(nxelement)
+            elif tag == otus_tag:
+                self._parse_taxon_namespace(nxelement)
+            elif tag == trees_tag:
+                if event == "start":
+                    yield "trees-start", nxelement
+                else:
+                    yield "trees-end", nxelement
+            elif tag == characters_tag:
+                if self._char_matrix_factory is None:
+                    continue
+                if event == "start":
+                    if char_block_parser is None:
+                        char_block_parser = _NexmlCharBlockParser(self._namespace_registry,
+                                self._id_taxon_namespace_map,
+                                self._id_taxon_map,
+                                self._new_char_matrix,
+                                self._state_alphabet_factory)
+                    char_block_parser.begin_char_matrix(nxelement)
+                    in_char_block = True
+                else:
+                    char_block_parser.end_char_matrix(nxelement)
+                    in_char_block = False
+            elif in_char_block:
+                if tag == format_tag:
+                    char_block_parser.parse_char_matrix_format(nxelement)
+                elif tag == matrix_tag:
+                    if event == "start":
+                        char_block_parser.begin_char_matrix_rows()
+                    else:
+                        char_block_parser.end_char_matrix_rows(nxelement)
+        if xml_doc.root is not None:
+            yield "document-end", xml_doc.root
+
+    def _parse_taxon_namespace(self, nxtaxa):
+        taxon_namespace_label = nxtaxa.get('label', None)
+        taxon_namespace = self._new_taxon_namespace(label=taxon_namespace_label)
+        taxon_namespace_id = nxtaxa.get('id', id(taxon_namespace))
+        self._id_taxon_namespace_map[taxon_namespace_id] = taxon_namespace
+        annotations = [i for i in nxtaxa.findall_annotations()]
+        for annotation in annotations:
+            self._parse_annotations(taxon_namespace, annotation)
+        if self.case_sensitive_taxon_labels:
+            label_taxon_map = {}
+        else:
+            label_taxon_map = container.OrderedCaselessDict()
+        if self.attached_taxon_namespace is not None:
+            for t in taxon_namespace:
+                label_taxon_map[t.label] = t
+        for idx, nxtaxon in enumerate(nxtaxa.findall_otu()):
+            taxon = None
+            taxon_label = nxtaxon.get('label', None)
+            taxon_oid = nxtaxon.get('id', id(nxtaxon))
+            if taxon_label is not None and self.attached_taxon_namespace is not None:
+                # taxon = label_taxon_map.get_taxon(
+                #         label=taxon_label,
+                #         case_sensitive=self.case_sensitive_taxon_labels)
+                try:
+                    taxon = label_taxon_map[taxon_label]
+                except KeyError:
+                    taxon = None
+            if taxon is None:
+                taxon = taxon_namespace.new_taxon(label=taxon_label)
+            annotations = [i for i in nxtaxon.findall_annotations()]
+            for annotation in annotations:
+                self._parse_annotations(taxon, annotation)
+            self._id_taxon_map[(taxon_namespace_id, taxon_oid)] = taxon
+
+    def _get_tree_list_taxon_namespace(self, nxtrees):
+        trees_id = nxtrees.get('id', None)
         otus_id = nxtrees.get('otus', None)
         if otus_id is None:
-            raise Exception("Taxa block not specified for trees block '{}'".format(otus_id))
+            raise Exception("Taxa block not specified for trees block '{}'".format(trees_id))
         taxon_namespace = self._id_taxon_namespace_map.get(otus_id, None)
         if not taxon_namespace:
             raise Exception("Tree block '{}': Taxa block '{}' not found".format(trees_id, otus_id))
-        tree_list = self._new_tree_list(
-                label=trees_label,
-                taxon_namespace=taxon_namespace)
-        annotations = [i for i in nxtrees.findall_annotations()]
-        for annotation in annotations:
-            self._parse_annotations(tree_list, annotation)
-        tree_parser = _NexmlTreeParser(
-                id_taxon_map=self._id_taxon_map,
-                annotations_processor_fn=self._parse_annotations,
-                )
-        for tree_element in nxtrees.findall_tree():
-            tree_obj = tree_list.new_tree()
-            tree_parser.build_tree(tree_obj, tree_element, otus_id)
+        return otus_id, taxon_namespace
 
 class _NexmlTreeParser(object):
 
@@ -598,6 +666,25 @@ class _NexmlCharBlockParser(_AnnotationParser):
         Given an XmlElement representing a nexml characters block, this
         instantiates and returns a corresponding DendroPy CharacterMatrix object.
         """
+        self.begin_char_matrix(nxchars)
+        nxformat = nxchars.find_char_format()
+        if nxformat is not None:
+            self.parse_char_matrix_format(nxformat)
+        nxmatrix = nxchars.find_char_matrix()
+        self.begin_char_matrix_rows()
+        for nxrow in nxmatrix.findall_char_row():
+            self.parse_char_matrix_row(nxrow)
+        self.end_char_matrix_rows(nxmatrix)
+        return self.end_char_matrix(nxchars)
+
+    def begin_char_matrix(self, nxchars):
+        """
+        Given an XmlElement representing a nexml characters block, of which
+        only the attributes need to have been parsed, this instantiates the
+        corresponding DendroPy CharacterMatrix object, to be populated by
+        subsequent calls to ``parse_char_matrix_format()``,
+        ``parse_char_matrix_row()``, etc.
+        """
 
         # clear
         self._id_state_alphabet_map = {}
@@ -641,113 +728,129 @@ class _NexmlCharBlockParser(_AnnotationParser):
                 taxon_namespace=taxon_namespace,
                 label=label,
                 **extra_kwargs)
+        self._char_matrix = char_matrix
+        self._char_matrix_oid = char_matrix_oid
+        self._otus_id = otus_id
+        self._data_type = data_type
+        self._nxchartype = nxchartype
+        self._char_matrix_format_parsed = False
+
+    def parse_char_matrix_format(self, nxformat):
+        self.parse_characters_format(nxformat, self._data_type, self._char_matrix)
+        self._char_matrix_format_parsed = True
+
+    def begin_char_matrix_rows(self):
+        if not self._char_matrix_format_parsed and self._data_type == "standard":
+            self.create_standard_character_alphabet(self._char_matrix)
+        self._char_matrix_format_parsed = True
+
+    def end_char_matrix_rows(self, nxmatrix):
+        annotations = [i for i in nxmatrix.findall_annotations()]
+        for annotation in annotations:
+            self._parse_annotations(self._char_matrix.taxon_seq_map, annotation)
 
-        # annotation processing
+    def end_char_matrix(self, nxchars):
+        char_matrix = self._char_matrix
         annotations = [i for i in nxchars.findall_annotations()]
         for annotation in annotations:
             self._parse_annotations(char_matrix, annotation)
+        self._char_matrix = None
+        # if fixed_state_alphabet:
+        #     char_matrix.remap_to_default_state_alphabet_by_symbol(purge_other_state_alphabets=True)
+        return char_matrix
 
-        # get state mappings
-        nxformat = nxchars.find_char_format()
-        if nxformat is not None:
-            self.parse_characters_format(nxformat, data_type, char_matrix)
-        elif data_type == "standard":
-            self.create_standard_character_alphabet(char_matrix)
+    def parse_char_matrix_row(self, nxrow):
+        char_matrix = self._char_matrix
+        char_matrix_oid = self._char_matrix_oid
+        otus_id = self._otus_id
+        data_type = self._data_type
+        nxchartype = self._nxchartype
+        row_id = nxrow.get('id', None)
+        label = nxrow.get('label', None)
+        taxon_id = nxrow.get('otu', None)
+        try:
+            taxon = self._id_taxon_map[(otus_id, taxon_id)]
+        except KeyError:
+            raise error.DataParseError(message='Character Block %s (\"%s\"): Taxon with id "%s" not defined in taxa block "%s"' % (char_matrix.oid, char_matrix.label, taxon_id, otus_id))
 
-        nxmatrix = nxchars.find_char_matrix()
-        annotations = [i for i in nxmatrix.findall_annotations()]
+        character_vector = char_matrix.new_sequence(taxon=taxon)
+        annotations = [i for i in nxrow.findall_annotations()]
         for annotation in annotations:
-            self._parse_annotations(char_matrix.taxon_seq_map, annotation)
-        for nxrow in nxmatrix.findall_char_row():
-            row_id = nxrow.get('id', None)
-            label = nxrow.get('label', None)
-            taxon_id = nxrow.get('otu', None)
-            try:
-                taxon = self._id_taxon_map[(otus_id, taxon_id)]
-            except KeyError:
-                raise error.DataParseError(message='Character Block %s (\"%s\"): Taxon with id "%s" not defined in taxa block "%s"' % (char_matrix.oid, char_matrix.label, taxon_id, otus_id))
-
-            character_vector = char_matrix.new_sequence(taxon=taxon)
-            annotations = [i for i in nxrow.findall_annotations()]
-            for annotation in annotations:
-                self._parse_annotations(character_vector, annotation)
-
-            if data_type == "continuous":
-                if nxchartype.endswith('Seqs'):
-                    seq = nxrow.find_char_seq()
-                    if seq is not None:
-                        seq = seq.replace('\n\r', ' ').replace('\r\n', ' ').replace('\n', ' ').replace('\r',' ')
-                        col_idx = -1
-                        for char in seq.split(' '):
-                            char = char.strip()
-                            if char:
-                                col_idx += 1
-                                if len(self._char_types) <= col_idx:
-                                    raise error.DataParseError(message="Character column/type ('<char>') not defined for character in position"\
-                                        + " %d (matrix = '%s' row='%s', taxon='%s')" % (col_idx+1, char_matrix.oid, row_id, taxon.label))
-                                character_vector.append(character_value=float(char), character_type=self._char_types[col_idx])
-                else:
-                    for nxcell in nxrow.findall_char_cell():
-                        chartype_id = nxcell.get('char', None)
-                        if chartype_id is None:
-                            raise error.DataParseError(message="'char' attribute missing for cell: cell markup must indicate character column type for character"\
-                                        + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix.oid, row_id, taxon.label))
-                        if chartype_id not in self._id_chartype_map:
-                            raise error.DataParseError(message="Character type ('<char>') with id '%s' referenced but not found for character" % chartype_id \
-                                        + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix.oid, row_id, taxon.label))
-                        chartype = self._id_chartype_map[chartype_id]
-                        pos_idx = self._char_types.index(chartype)
-#                         column = id_chartype_map[chartype_id]
-#                         state = column.state_id_map[cell.get('state', None)]
-                        # annotations = [i for i in nxcell.findall_annotations]
-                        # for annotation in annotations:
-                        #     self._parse_annotations(cell, annotation)
-                        character_vector.append(character_value=float(nxcell.get('state')),
-                                character_type=chartype)
-            else:
-                if nxchartype.endswith('Seqs'):
-                    seq = nxrow.find_char_seq()
-                    if seq is not None:
-                        seq = seq.replace(' ', '').replace('\n', '').replace('\r', '')
-                        col_idx = -1
-                        for char in seq:
+            self._parse_annotations(character_vector, annotation)
+
+        if data_type == "continuous":
+            if nxchartype.endswith('Seqs'):
+                seq = nxrow.find_char_seq()
+                if seq is not None:
+                    seq = seq.replace('\n\r', ' ').replace('\r\n', ' ').replace('\n', ' ').replace('\r',' ')
+                    col_idx = -1
+                    for char in seq.split(' '):
+                        char = char.strip()
+                        if char:
                             col_idx += 1
-                            state_alphabet = char_matrix.character_types[col_idx].state_alphabet
-                            try:
-                                state = state_alphabet[char]
-                            except KeyError:
-                                raise error.DataParseError(message="Character Block row '%s', character position %s: State with symbol '%s' in sequence '%s' not defined" \
-                                        % (row_id, col_idx, char, seq))
                             if len(self._char_types) <= col_idx:
                                 raise error.DataParseError(message="Character column/type ('<char>') not defined for character in position"\
-                                    + " %d (row='%s', taxon='%s')" % (col_idx+1, row_id, taxon.label))
-                            character_type = self._char_types[col_idx]
-                            character_vector.append(character_value=state,
-                                    character_type=character_type)
-                else:
-                    for nxcell in nxrow.findall_char_cell():
-                        chartype_id = nxcell.get('char', None)
-                        if chartype_id is None:
-                            raise error.DataParseError(message="'char' attribute missing for cell: cell markup must indicate character column type for character"\
-                                        + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix_oid, row_id, taxon.label))
-                        if chartype_id not in self._id_chartype_map:
-                            raise error.DataParseError(message="Character type ('<char>') with id '%s' referenced but not found for character" % chartype_id \
-                                        + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix_oid, row_id, taxon.label))
-                        chartype = self._id_chartype_map[chartype_id]
-                        state_alphabet = self._id_chartype_map[chartype_id].state_alphabet
-                        pos_idx = self._chartype_id_to_pos_map[chartype_id]
-                        state = self._id_state_map[ (state_alphabet, nxcell.get('state', None)) ]
-                        character_vector.set_at(pos_idx,
-                                character_value=state,
-                                character_type=chartype)
-                        # self._id_state_alphabet_map = {}
-                        # self._id_state_map = {}
-                        # self._id_chartype_map = {}
-
-            char_matrix[taxon] = character_vector
-
-        # if fixed_state_alphabet:
-        #     char_matrix.remap_to_default_state_alphabet_by_symbol(purge_other_state_alphabets=True)
+                                    + " %d (matrix = '%s' row='%s', taxon='%s')" % (col_idx+1, char_matrix.oid, row_id, taxon.label))
+                            character_vector.append(character_value=float(char), character_type=self._char_types[col_idx])
+            else:
+                for nxcell in nxrow.findall_char_cell():
+                    chartype_id = nxcell.get('char', None)
+                    if chartype_id is None:
+                        raise error.DataParseError(message="'char' attribute missing for cell: cell markup must indicate character column type for character"\
+                                    + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix.oid, row_id, taxon.label))
+                    if chartype_id not in self._id_chartype_map:
+                        raise error.DataParseError(message="Character type ('<char>') with id '%s' referenced but not found for character" % chartype_id \
+                                    + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix.oid, row_id, taxon.label))
+                    chartype = self._id_chartype_map[chartype_id]
+                    pos_idx = self._char_types.index(chartype)
+#                     column = id_chartype_map[chartype_id]
+#                     state = column.state_id_map[cell.get('state', None)]
+                    # annotations = [i for i in nxcell.findall_annotations]
+                    # for annotation in annotations:
+                    #     self._parse_annotations(cell, annotation)
+                    character_vector.append(character_value=float(nxcell.get('state')),
+                            character_type=chartype)
+        else:
+            if nxchartype.endswith('Seqs'):
+                seq = nxrow.find_char_seq()
+                if seq is not None:
+                    seq = seq.replace(' ', '').replace('\n', '').replace('\r', '')
+                    col_idx = -1
+                    for char in seq:
+                        col_idx += 1
+                        state_alphabet = char_matrix.character_types[col_idx].state_alphabet
+                        try:
+                            state = state_alphabet[char]
+                        except KeyError:
+                            raise error.DataParseError(message="Character Block row '%s', character position %s: State with symbol '%s' in sequence '%s' not defined" \
+                                    % (row_id, col_idx, char, seq))
+                        if len(self._char_types) <= col_idx:
+                            raise error.DataParseError(message="Character column/type ('<char>') not defined for character in position"\
+                                + " %d (row='%s', taxon='%s')" % (col_idx+1, row_id, taxon.label))
+                        character_type = self._char_types[col_idx]
+                        character_vector.append(character_value=state,
+                                character_type=character_type)
+            else:
+                for nxcell in nxrow.findall_char_cell():
+                    chartype_id = nxcell.get('char', None)
+                    if chartype_id is None:
+                        raise error.DataParseError(message="'char' attribute missing for cell: cell markup must indicate character column type for character"\
+                                    + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix_oid, row_id, taxon.label))
+                    if chartype_id not in self._id_chartype_map:
+                        raise error.DataParseError(message="Character type ('<char>') with id '%s' referenced but not found for character" % chartype_id \
+                                    + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix_oid, row_id, taxon.label))
+                    chartype = self._id_chartype_map[chartype_id]
+                    state_alphabet = self._id_chartype_map[chartype_id].state_alphabet
+                    pos_idx = self._chartype_id_to_pos_map[chartype_id]
+                    state = self._id_state_map[ (state_alphabet, nxcell.get('state', None)) ]
+                    character_vector.set_at(pos_idx,
+                            character_value=state,
+                            character_type=chartype)
+                    # self._id_state_alphabet_map = {}
+                    # self._id_state_map = {}
+                    # self._id_chartype_map = {}
+
+        char_matrix[taxon] = character_vector
 
     def parse_ambiguous_state(self, nxstate, state_alphabet):
         """
@@ -25,7 +25,6 @@ if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
 from dendropy.dataio import ioservice
 from dendropy.dataio import nexmlreader
-from dendropy.dataio import xmlprocessing
 
 class NexmlTreeDataYielder(
         ioservice.TreeDataYielder,
@@ -64,25 +63,20 @@ class NexmlTreeDataYielder(
     ## Implementation of DataYielder interface
 
     def _yield_items_from_stream(self, stream):
-        xml_doc = xmlprocessing.XmlDocument(file_obj=stream,
-                subelement_factory=self._subelement_factory)
-        self._namespace_registry = xml_doc.namespace_registry
-        xml_root = xml_doc.root
-        self._parse_taxon_namespaces(xml_root)
-        tree_parser = nexmlreader._NexmlTreeParser(
-                id_taxon_map=self._id_taxon_map,
-                annotations_processor_fn=self._parse_annotations,
-                )
-        for trees_idx, trees_element in enumerate(xml_root.iter_trees()):
-            trees_id = trees_element.get('id', "Trees" + str(trees_idx))
-            trees_label = trees_element.get('label', None)
-            otus_id = trees_element.get('otus', None)
-            if otus_id is None:
-                raise Exception("Taxa block not specified for trees block '{}'".format(otus_id))
-            taxon_namespace = self._id_taxon_namespace_map.get(otus_id, None)
-            if not taxon_namespace:
-                raise Exception("Tree block '{}': Taxa block '{}' not found".format(trees_id, otus_id))
-            for tree_element in trees_element.findall_tree():
+        # Trees are built as their elements are completed, and the elements
+        # discarded, so the document is never held in memory in its entirety.
+        tree_parser = None
+        otus_id = None
+        for event, nxelement in self._iterparse_document(stream):
+            if event == "trees-start":
+                otus_id, taxon_namespace = self._get_tree_list_taxon_namespace(nxelement)
+                tree_parser = nexmlreader._NexmlTreeParser(
+                        id_taxon_map=self._id_taxon_map,
+                        annotations_processor_fn=self._parse_annotations,
+                        )
+            elif event == "tree":
                 tree_obj = self.tree_factory()
-                tree_parser.build_tree(tree_obj, tree_element, otus_id)
+                tree_parser.build_tree(tree_obj, nxelement, otus_id)
                 yield tree_obj
+            elif event == "trees-end":
+                tree_parser = None
@@ -33,6 +33,43 @@ from dendropy.datamodel import basemodel
 ##############################################################################
 ## NexusTokenizer
 
+# Patterns used when fast-forwarding over a block: the next significant
+# character in normal text, quoted text, and comments, respectively; and
+# a complete, or possibly incomplete, block terminator following the
+# semi-colon terminating a command.
+_SKIP_BLOCK_PATTERN = re.compile(r"['\[;]")
+_SKIP_BLOCK_QUOTED_PATTERN = re.compile(r"'")
+_SKIP_BLOCK_COMMENT_PATTERN = re.compile(r"[\[\]]")
+_BLOCK_END_PATTERN = re.compile(r"\s*END(?:BLOCK)?\s*;", re.IGNORECASE)
+_PARTIAL_BLOCK_END_PATTERN = re.compile(r"\s*(?:E|EN|END\s*|ENDB|ENDBL|ENDBLO|ENDBLOC|ENDBLOCK\s*)?\Z", re.IGNORECASE)
+
+class _PushbackStream(object):
+    """
+    Returns the characters of ``prefix`` before those of the stream ``src``.
+    Once the prefix has been consumed, reads go straight to ``src``.
+    """
+
+    def __init__(self, prefix, src):
+        self._prefix = prefix
+        self._prefix_pos = 0
+        self._src = src
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            s = self._prefix[self._prefix_pos:] + self._src.read()
+            self._prefix_pos = len(self._prefix)
+        else:
+            s = self._prefix[self._prefix_pos:self._prefix_pos+size]
+            self._prefix_pos += len(s)
+            if len(s) < size:
+                s += self._src.read(size - len(s))
+        if self._prefix_pos >= len(self._prefix):
+            self.read = self._src.read
+        return s
+
+    def __getattr__(self, name):
+        return getattr(self._src, name)
+
 class NexusTokenizer(Tokenizer):
 
     def __init__(self, src,
@@ -129,6 +166,90 @@ class NexusTokenizer(Tokenizer):
         while token != ';' and not self._cur_char == "" and token != None:
             token = self.next_token()
 
+    def skip_to_end_of_block(self, chunk_size=65536):
+        """
+        Fast-forwards past the 'END;' (or 'ENDBLOCK;') command terminating the
+        current block, scanning the raw text in chunks rather than tokenizing
+        it. Quoted tokens and (nested) comments are respected, but comments
+        are not captured. Expects to be positioned within the 'BEGIN' command
+        of the block (e.g., just after the block name). On return, the current
+        token is the terminating semi-colon.
+        """
+        if self._cur_char == "":
+            return
+        if self._cur_char is None:
+            self._get_next_char()
+        text = self._cur_char
+        pos = 0
+        in_quote = False
+        comment_nesting = 0
+        at_command_start = False
+        num_newlines_read = 0
+        while True:
+            need_more = False
+            if comment_nesting:
+                m = _SKIP_BLOCK_COMMENT_PATTERN.search(text, pos)
+                if m is not None:
+                    if m.group(0) == "[":
+                        comment_nesting += 1
+                    else:
+                        comment_nesting -= 1
+                    pos = m.end()
+                    continue
+            elif in_quote:
+                m = _SKIP_BLOCK_QUOTED_PATTERN.search(text, pos)
+                if m is not None:
+                    # escaped (doubled) quotes are handled by simply
+                    # re-entering the quoted state
+                    in_quote = False
+                    pos = m.end()
+                    continue
+            else:
+                if at_command_start:
+                    m = _BLOCK_END_PATTERN.match(text, pos)
+                    if m is not None:
+                        break
+                    need_more = _PARTIAL_BLOCK_END_PATTERN.match(text, pos) is not None
+                if not need_more:
+                    m = _SKIP_BLOCK_PATTERN.search(text, pos)
+                    if m is not None:
+                        c = m.group(0)
+                        if c == ";":
+                            at_command_start = True
+                        elif c == "'":
+                            in_quote = True
+                            at_command_start = False
+                        else:
+                            comment_nesting = 1
+                            if text[pos:m.start()].strip():
+                                at_command_start = False
+                        pos = m.end()
+                        continue
+                    if text[pos:].strip():
+                        at_command_start = False
+            chunk = self.src.read(chunk_size)
+            if not chunk:
+                self.current_line_num += num_newlines_read
+                self._cur_char = ""
+                self.current_token = None
+                return
+            num_newlines_read += chunk.count("\n")
+            if need_more:
+                text = text[pos:] + chunk
+            else:
+                text = chunk
+            pos = 0
+        end = m.end()
+        leftover = text[end:]
+        self.current_line_num += num_newlines_read - leftover.count("\n")
+        last_newline = text.rfind("\n", 0, end)
+        if last_newline >= 0:
+            self.current_column_num = end - last_newline - 1
+        if leftover:
+            self.src = _PushbackStream(leftover, self.src)
+        self.current_token = ";"
+        self._get_next_char()
+
 ###############################################################################
 ## Taxon Handling
 
@@ -169,6 +290,15 @@ class NexusTaxonSymbolMapper(object):
     To this end, the of the |TaxonNamespace| object is locked, and all
     |Taxon| object creation should be through this class's native
     methods.
+
+    Resolved symbols are cached in a plain dictionary, so that (for example)
+    the same translation tokens or labels used in every tree of a TREES
+    block are resolved through the above mappings only once. The
+    translation tokens, and, if look-up is case-insensitive, their
+    lower- and upper-case variants, are entered into this cache as they are
+    added. The numbers of look-ups resolved by the cache and requiring full
+    resolution are given by the ``num_symbol_cache_hits`` and
+    ``num_symbol_cache_misses`` attributes, respectively.
     """
 
     def __init__(self,
@@ -187,6 +317,10 @@ class NexusTaxonSymbolMapper(object):
         self.number_taxon_map = {}
         self.number_taxon_label_map = {}
         self.enable_lookup_by_taxon_number = enable_lookup_by_taxon_number
+        self._symbol_taxon_cache = {}
+        self._num_cached_resolutions = 0
+        self.num_symbol_cache_hits = 0
+        self.num_symbol_cache_misses = 0
         self._set_taxon_namespace(taxon_namespace)
 
     def restore_taxon_namespace_mutability(self):
@@ -220,21 +354,59 @@ class NexusTaxonSymbolMapper(object):
             s = str(idx+1)
             self.number_taxon_map[s] = taxon
             self.number_taxon_label_map[s] = taxon.label
+        self._reset_symbol_cache()
+
+    def _reset_symbol_cache(self):
+        self._symbol_taxon_cache.clear()
+        self._num_cached_resolutions = 0
+        for token in self.token_taxon_map:
+            self._cache_translate_token(token, self.token_taxon_map[token])
+
+    def _cache_translate_token(self, token, taxon):
+        self._symbol_taxon_cache[token] = taxon
+        if not self.case_sensitive:
+            self._symbol_taxon_cache[token.lower()] = taxon
+            self._symbol_taxon_cache[token.upper()] = taxon
+
+    def _uncache_label(self, label):
+        if label in self.label_taxon_map:
+            # an existing label is being remapped: any case-variant of it
+            # may have been cached
+            self._reset_symbol_cache()
+        else:
+            # the label may have been cached as a taxon number
+            self._symbol_taxon_cache.pop(label, None)
 
     def add_translate_token(self, token, taxon):
         if not textprocessing.is_str_type(token):
             token = str(token)
         self.token_taxon_map[token] = taxon
+        if self._num_cached_resolutions:
+            # previously-cached resolutions may be superceded by this token
+            self._reset_symbol_cache()
+        else:
+            self._cache_translate_token(token, taxon)
 
     def lookup_taxon_symbol(self, symbol, create_taxon_if_not_found=True):
-        # if symbol in self.token_taxon_map:
-        #     return self.token_taxon_map[symbol]
-        # if symbol in self.label_taxon_map:
-        #     return self.label_taxon_map[symbol]
-        # if symbol in self.number_taxon_map:
-        #     return self.number_taxon_map[symbol]
         if not textprocessing.is_str_type(symbol):
             symbol = str(symbol)
+        try:
+            taxon = self._symbol_taxon_cache[symbol]
+            self.num_symbol_cache_hits += 1
+            return taxon
+        except KeyError:
+            pass
+        self.num_symbol_cache_misses += 1
+        taxon = self._resolve_taxon_symbol(symbol)
+        if taxon is None:
+            if not create_taxon_if_not_found:
+                return None
+            taxon = self.new_taxon(symbol)
+        self._symbol_taxon_cache[symbol] = taxon
+        self._num_cached_resolutions += 1
+        return taxon
+
+    def _resolve_taxon_symbol(self, symbol):
         try:
             return self.token_taxon_map[symbol]
         except KeyError:
@@ -248,17 +420,21 @@ class NexusTaxonSymbolMapper(object):
                 return self.number_taxon_map[symbol]
             except KeyError:
                 pass
-        if create_taxon_if_not_found:
-            return self.new_taxon(symbol)
         return None
 
     def require_taxon_for_symbol(self, symbol):
-        return self.lookup_taxon_symbol(symbol=symbol, create_taxon_if_not_found=True)
+        try:
+            taxon = self._symbol_taxon_cache[symbol]
+        except (KeyError, TypeError):
+            return self.lookup_taxon_symbol(symbol=symbol, create_taxon_if_not_found=True)
+        self.num_symbol_cache_hits += 1
+        return taxon
 
     def new_taxon(self, label):
         self._taxon_namespace.is_mutable = self.taxon_namespace_original_mutability_state
         t = self._taxon_namespace.new_taxon(label)
         self._taxon_namespace.is_mutable = False
+        self._uncache_label(label)
         self.label_taxon_map[label] = t
         taxon_number = str(len(self._taxon_namespace))
         self.number_taxon_map[taxon_number] = t
@@ -268,6 +444,7 @@ class NexusTaxonSymbolMapper(object):
         self._taxon_namespace.is_mutable = self.taxon_namespace_original_mutability_state
         self._taxon_namespace.add_taxon(taxon)
         self._taxon_namespace.is_mutable = False
+        self._uncache_label(taxon.label)
         self.label_taxon_map[taxon.label] = taxon
         taxon_number = str(len(self._taxon_namespace))
         self.number_taxon_map[taxon_number] = taxon
@@ -218,6 +218,8 @@ class NexusReader(ioservice.DataReader):
         suppress_edge_lengths : boolean, default: |False|
             If |True|, edge length values will not be processed. If |False|,
             edge length values will be processed.
+        parse_edge_lengths : boolean, default: |True|
+            If |False|, equivalent to ``suppress_edge_lengths=True``.
         extract_comment_metadata : boolean, default: |True|
             If |True| (default), any comments that begin with '&' or '&&' will
             be parsed and stored as part of the annotation set of the
@@ -227,6 +229,11 @@ class NexusReader(ioservice.DataReader):
             value'). If |False|, then the comments will not be parsed,
             but will be instead stored directly as elements of the ``comments``
             list attribute of the associated object.
+        parse_annotations : boolean, default: |True|
+            If |False|, then comments within tree statements will not even be
+            captured, let alone stored or parsed for metadata: only the
+            rooting ("[&R]"/"[&U]") and weight ("[&W ...]") comments preceding
+            a tree statement will be processed.
         store_tree_weights : boolean, default: |False|
             If |True|, process the tree weight (e.g. "[&W 1/2]") comment
             associated with each tree, if any. Defaults to |False|.
@@ -280,6 +287,14 @@ class NexusReader(ioservice.DataReader):
         exclude_trees : bool
             If |False|, then tree data will not be read. Defaults to
             |True|: tree data will be read.
+        blocks : iterable of strings
+            If given, only blocks with these names (case-insensitive; e.g.,
+            ``blocks=["trees"]``) will be parsed. All other blocks will be
+            skipped over with a fast raw scan of the text, without tokenizing
+            their contents. "DATA" and "CHARACTERS" are treated as equivalent.
+        parse_internal_labels : boolean, default: |True|
+            If |False|, internal node labels will be discarded. Cannot be
+            used with ``suppress_internal_node_taxa=False``.
         attached_taxon_namespace : |TaxonNamespace|
             Unify all operational taxonomic unit definitions in this namespace.
         ignore_unrecognized_keyword_arguments : boolean, default: |False|
@@ -296,6 +311,13 @@ class NexusReader(ioservice.DataReader):
         # keyword validation scheme
         self.exclude_chars = kwargs.pop("exclude_chars", False)
         self.exclude_trees = kwargs.pop("exclude_trees", False)
+        self.blocks = kwargs.pop("blocks", None)
+        if self.blocks is not None:
+            if textprocessing.is_str_type(self.blocks):
+                self.blocks = [self.blocks]
+            self.blocks = set(b.upper() for b in self.blocks)
+            if "DATA" in self.blocks or "CHARACTERS" in self.blocks:
+                self.blocks.update(("DATA", "CHARACTERS"))
         self._data_type = kwargs.pop("data_type", "standard")
         self.attached_taxon_namespace = kwargs.pop("attached_taxon_namespace", None)
 
@@ -309,6 +331,7 @@ class NexusReader(ioservice.DataReader):
         self.preserve_underscores = kwargs.get('preserve_underscores', False)
         self.case_sensitive_taxon_labels = kwargs.get('case_sensitive_taxon_labels', False)
         self.extract_comment_metadata = kwargs.get('extract_comment_metadata', True)
+        self.parse_annotations = kwargs.get('parse_annotations', True)
 
         # As above, but the NEXUS format default is different from the NEWICK
         # default, so this rather convoluted approach
@@ -366,6 +389,46 @@ class NexusReader(ioservice.DataReader):
                 char_matrices=self._char_matrices)
         return self._product
 
+    def read_block(self,
+            stream,
+            dataset,
+            taxon_namespaces=None,
+            ntax=None,
+            state_alphabet_factory=None):
+        """
+        Populates the given |DataSet| object from a NEXUS-formatted source
+        consisting of the '#NEXUS' header followed by a single block, e.g., as
+        extracted from a larger source using the offsets given by
+        :func:`index_nexus_blocks`.
+
+        Parameters
+        ----------
+        stream : file or file-like object
+            Source of data.
+        dataset : |DataSet| object
+            The target |DataSet| to populate.
+        taxon_namespaces : iterable of |TaxonNamespace| objects
+            Namespaces corresponding to the TAXA blocks preceding the block in
+            the original source, against which (explicit or implicit)
+            references to TAXA blocks will be resolved.
+        ntax : int
+            The number of taxa declared by the last TAXA block preceding the
+            block in the original source, if any.
+        state_alphabet_factory : function object
+            Used to create state alphabets for character data.
+
+        Returns
+        -------
+        p : ``Product``
+            The objects created.
+        """
+        self._taxon_namespaces = list(taxon_namespaces) if taxon_namespaces is not None else []
+        self._file_specified_ntax = ntax
+        return self.read_dataset(
+                stream=stream,
+                dataset=dataset,
+                state_alphabet_factory=state_alphabet_factory)
+
     ###########################################################################
     ## Tokenizer Control
 
@@ -559,7 +622,9 @@ class NexusReader(ioservice.DataReader):
                     self._global_annotations_target,
                     self.extract_comment_metadata)
             token = self._nexus_tokenizer.next_token_ucase()
-            if token == 'TAXA':
+            if token is not None and not self._is_block_selected(token):
+                self._nexus_tokenizer.skip_to_end_of_block()
+            elif token == 'TAXA':
                 self._parse_taxa_block()
             elif token == 'CHARACTERS' or token == 'DATA':
                 self._parse_characters_data_block()
@@ -591,6 +656,9 @@ class NexusReader(ioservice.DataReader):
                 # unknown block
                 token = self._consume_to_end_of_block(token)
 
+    def _is_block_selected(self, block_name):
+        return self.blocks is None or block_name in self.blocks
+
     ###########################################################################
     ## TAXA BLOCK
 
@@ -994,8 +1062,9 @@ class NexusReader(ioservice.DataReader):
         self._nexus_tokenizer.next_token()
         tree = self._build_tree_from_newick_tree_string(tree_factory, taxon_symbol_mapper)
         tree.label = tree_name
-        nexusprocessing.process_comments_for_item(tree, pre_tree_comments, self.extract_comment_metadata)
-        nexusprocessing.process_comments_for_item(tree, tree_comments, self.extract_comment_metadata)
+        if self.parse_annotations:
+            nexusprocessing.process_comments_for_item(tree, pre_tree_comments, self.extract_comment_metadata)
+            nexusprocessing.process_comments_for_item(tree, tree_comments, self.extract_comment_metadata)
         # if self.extract_comment_metadata:
         #     annotations = nexustokenizer.parse_comment_metadata(tree_comments)
         #     for annote in annotations:
@@ -1032,18 +1101,32 @@ class NexusReader(ioservice.DataReader):
             # Badly-formed NEXUS file, yet widely-found in the wild
             # Override namespace modification lock
             taxon_namespace.is_mutable = True
+        # Index of labels to taxa, consistent with
+        # ``TaxonNamespace.require_taxon()``, so that the translation labels
+        # can be resolved without a search of the namespace for each one.
+        if taxon_namespace.is_case_sensitive:
+            label_key = lambda label: label
+        else:
+            label_key = lambda label: str(label).lower()
+        label_taxon_map = {}
+        for taxon in reversed(list(taxon_namespace)):
+            label_taxon_map[label_key(taxon.label)] = taxon
         while True:
             translation_token = self._nexus_tokenizer.next_token()
             if translation_token == ";" and not self._nexus_tokenizer.is_token_quoted:
                 raise self._nexus_error("Expecting translation token but found ';' instead")
             translation_label = self._nexus_tokenizer.next_token()
             try:
-                taxon = taxon_namespace.require_taxon(label=translation_label)
-            except error.ImmutableTaxonNamespaceError:
-                exc = self._undefined_taxon_error(taxon_namespace=taxon_namespace, label=translation_label)
-                exc.__context__ = None # Python 3.0, 3.1, 3.2
-                exc.__cause__ = None # Python 3.3, 3.4
-                raise exc
+                taxon = label_taxon_map[label_key(translation_label)]
+            except KeyError:
+                try:
+                    taxon = taxon_namespace.require_taxon(label=translation_label)
+                except error.ImmutableTaxonNamespaceError:
+                    exc = self._undefined_taxon_error(taxon_namespace=taxon_namespace, label=translation_label)
+                    exc.__context__ = None # Python 3.0, 3.1, 3.2
+                    exc.__cause__ = None # Python 3.3, 3.4
+                    raise exc
+                label_taxon_map[label_key(translation_label)] = taxon
             taxon_symbol_mapper.add_translate_token(translation_token, taxon)
             token = self._nexus_tokenizer.next_token() # ","
             if (not token) or (token == ';'):
@@ -1291,6 +1374,17 @@ class NexusReader(ioservice.DataReader):
             elif token == ";":
                 raise NexusReader.BlockTerminatedException
             else:
+                if self._match_char.isdisjoint(token):
+                    try:
+                        states = state_alphabet.get_states_for_symbol_string(token, skip_whitespace=False)
+                    except KeyError:
+                        pass
+                    else:
+                        if len(character_data_vector) + len(states_to_add) + len(states) <= self._file_specified_nchar:
+                            states_to_add.extend(states)
+                            continue
+                # slow path: match characters, unrecognized symbols, or too
+                # many characters
                 for c in token:
                     if c in self._match_char:
                         try:
@@ -1392,3 +1486,172 @@ class NexusReader(ioservice.DataReader):
             self._nexus_tokenizer.set_capture_eol(False)
         return character_data_vector
 
+###############################################################################
+## Block Indexing
+
+_INDEX_WHITESPACE_PATTERN = re.compile(br"\s*")
+_INDEX_COMMAND_PATTERN = re.compile(br"[A-Za-z]+")
+_INDEX_SIGNIFICANT_PATTERN = re.compile(br"['\[;]")
+_INDEX_COMMENT_PATTERN = re.compile(br"[\[\]]")
+_INDEX_HEADER_PATTERN = re.compile(br"\s*#NEXUS", re.IGNORECASE)
+_INDEX_TOKEN_PATTERN = re.compile(br"\s*('(?:[^']|'')*'|[^\s;=]+)")
+_INDEX_TAXA_LINK_PATTERN = re.compile(br"TAXA\s*=\s*('(?:[^']|'')*'|[^\s;]+)", re.IGNORECASE)
+_INDEX_NTAX_PATTERN = re.compile(br"\bNTAX\s*=\s*(\d+)", re.IGNORECASE)
+_INDEX_NCHAR_PATTERN = re.compile(br"\bNCHAR\s*=\s*(\d+)", re.IGNORECASE)
+_INDEX_DATATYPE_PATTERN = re.compile(br"\bDATATYPE\s*=\s*([^\s;]+)", re.IGNORECASE)
+
+class NexusBlockInfo(object):
+    """
+    Describes a block of a NEXUS-formatted source, as found by
+    :func:`index_nexus_blocks`.
+
+    Attributes
+    ----------
+    index : int
+        Position of the block in the source.
+    block_type : string
+        The (upper-cased) block name, e.g. "TAXA", "CHARACTERS", "DATA" or
+        "TREES".
+    start : int
+        Offset (in bytes) of the 'BEGIN' command of the block.
+    end : int
+        Offset (in bytes) just past the terminating 'END;' command.
+    title : string
+        Title given by a 'TITLE' command, if any.
+    link_title : string
+        Title of the TAXA block given by a 'LINK' command, if any.
+    ntax : int
+        Number of taxa declared by a 'DIMENSIONS' command, if any.
+    nchar : int
+        Number of characters declared by a 'DIMENSIONS' command, if any.
+    ntrees : int
+        Number of 'TREE' commands (TREES blocks only).
+    data_type : string
+        Data type declared by a 'FORMAT' command, if any.
+    """
+
+    def __init__(self, index, block_type, start):
+        self.index = index
+        self.block_type = block_type
+        self.start = start
+        self.end = None
+        self.title = None
+        self.link_title = None
+        self.ntax = None
+        self.nchar = None
+        self.ntrees = 0 if block_type == "TREES" else None
+        self.data_type = None
+
+    def _get_is_char_matrix_block(self):
+        return self.block_type in ("CHARACTERS", "DATA")
+    is_char_matrix_block = property(_get_is_char_matrix_block)
+
+    def __repr__(self):
+        return "<NexusBlockInfo {} {}: {}>".format(self.index, self.block_type, self.title)
+
+def _index_token_value(b):
+    b = b.decode("utf-8")
+    if len(b) > 1 and b.startswith("'") and b.endswith("'"):
+        return b[1:-1].replace("''", "'")
+    return b.replace("_", " ")
+
+def _index_skip_comment(buf, pos):
+    nesting = 1
+    while nesting:
+        m = _INDEX_COMMENT_PATTERN.search(buf, pos)
+        if m is None:
+            return len(buf)
+        pos = m.end()
+        if m.group(0) == b"[":
+            nesting += 1
+        else:
+            nesting -= 1
+    return pos
+
+def _index_skip_command(buf, pos):
+    while True:
+        m = _INDEX_SIGNIFICANT_PATTERN.search(buf, pos)
+        if m is None:
+            return len(buf)
+        c = m.group(0)
+        pos = m.end()
+        if c == b";":
+            return pos
+        elif c == b"'":
+            # escaped (doubled) quotes are handled by simply re-entering the
+            # quoted state
+            pos = buf.find(b"'", pos)
+            if pos < 0:
+                return len(buf)
+            pos += 1
+        else:
+            pos = _index_skip_comment(buf, pos)
+
+def index_nexus_blocks(buf):
+    """
+    Quickly scans a NEXUS-formatted source and returns a list of
+    :class:`NexusBlockInfo` objects describing its blocks (their positions,
+    titles, dimensions, etc.), without parsing their contents.
+
+    Parameters
+    ----------
+    buf : bytes or bytes-like object (e.g., ``mmap.mmap``)
+        The contents of the source.
+
+    Returns
+    -------
+    b : list[:class:`NexusBlockInfo`]
+        The blocks of the source, in order.
+    """
+    m = _INDEX_HEADER_PATTERN.match(buf)
+    if m is None:
+        raise NexusReader.NotNexusFileError("Expecting '#NEXUS'")
+    pos = m.end()
+    blocks = []
+    block = None
+    while True:
+        pos = _INDEX_WHITESPACE_PATTERN.match(buf, pos).end()
+        if pos >= len(buf):
+            break
+        if buf[pos:pos+1] == b"[":
+            pos = _index_skip_comment(buf, pos+1)
+            continue
+        m = _INDEX_COMMAND_PATTERN.match(buf, pos)
+        command_end = _index_skip_command(buf, pos)
+        if m is None:
+            pos = command_end
+            continue
+        command = m.group(0).upper()
+        body = buf[m.end():command_end].rstrip(b";")
+        if command == b"BEGIN":
+            t = _INDEX_TOKEN_PATTERN.match(body)
+            block_type = t.group(1).decode("utf-8").upper() if t else ""
+            block = NexusBlockInfo(len(blocks), block_type, pos)
+        elif block is not None:
+            if command == b"END" or command == b"ENDBLOCK":
+                block.end = command_end
+                blocks.append(block)
+                block = None
+            elif command == b"TREE":
+                block.ntrees += 1
+            elif command == b"TITLE":
+                t = _INDEX_TOKEN_PATTERN.match(body)
+                if t:
+                    block.title = _index_token_value(t.group(1))
+            elif command == b"LINK":
+                t = _INDEX_TAXA_LINK_PATTERN.search(body)
+                if t:
+                    block.link_title = _index_token_value(t.group(1))
+            elif command == b"DIMENSIONS":
+                t = _INDEX_NTAX_PATTERN.search(body)
+                if t:
+                    block.ntax = int(t.group(1))
+                t = _INDEX_NCHAR_PATTERN.search(body)
+                if t:
+                    block.nchar = int(t.group(1))
+            elif command == b"FORMAT":
+                t = _INDEX_DATATYPE_PATTERN.search(body)
+                if t:
+                    block.data_type = t.group(1).decode("utf-8").lower()
+        pos = command_end
+    return blocks
@@ -355,9 +355,7 @@ class NexusWriter(ioservice.DataWriter):
                     tree_name,
                     preserve_spaces=self.preserve_spaces,
                     quote_underscores=not self.unquoted_underscores)
-            stream.write("    TREE {} = ".format(tree_name))
-            self._newick_writer._write_tree(stream, tree)
-            stream.write("\n")
+            stream.write("    TREE {} = {}\n".format(tree_name, self._newick_writer._compose_tree(tree)))
         stream.write("END;\n\n")
 
     def _write_char_block(self, stream, char_matrix):
@@ -98,7 +98,9 @@ class NexusTreeDataYielder(
                     self._global_annotations_target,
                     self.extract_comment_metadata)
             token = self._nexus_tokenizer.next_token_ucase()
-            if token == 'TAXA':
+            if token is not None and not self._is_block_selected(token):
+                self._nexus_tokenizer.skip_to_end_of_block()
+            elif token == 'TAXA':
                 self._parse_taxa_block()
             elif token == 'TREES':
                 for tree in self._yield_from_trees_block():
@@ -0,0 +1,340 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Reading of multiple data files in parallel, using multiple processes, into a
+single shared |TaxonNamespace|.
+
+Each file is parsed in a worker process into a |TaxonNamespace| seeded with
+the labels of the taxa already known to the parent. Instead of the full data
+objects, the workers return compact payloads in which taxa are referenced by
+their (integer) index in the worker's namespace, together with the labels of
+any new taxa encountered. The parent then maps the indexes to |Taxon|
+instances in its namespace using a single label to |Taxon| table, and
+reconstructs the data objects.
+
+Only the structure, taxa, node labels, and edge lengths of trees (as well as
+the label, rooting state, and weight of each tree) are transferred; comments
+and metadata annotations are not. Similarly, only the taxa and sequences of
+character matrices are transferred, which means that matrices with
+file-defined state alphabets (e.g., "standard" data) are not supported.
+"""
+
+import multiprocessing
+from dendropy.datamodel import taxonmodel
+from dendropy.datamodel import treecollectionmodel
+from dendropy.datamodel import charmatrixmodel
+
+class ParallelReadError(Exception):
+    """
+    Raised when reading a file fails, whether in a worker process or (if only
+    one process is used) in the current process. The message describes the
+    original error (which, e.g., may hold references to unpicklable objects
+    such as streams, and so cannot itself be passed back to the parent
+    process).
+    """
+    def __init__(self, message=None):
+        Exception.__init__(self, message)
+
+##############################################################################
+## Payload Encoding
+
+def encode_tree(tree, taxon_index_map):
+    """
+    Returns a compact, picklable representation of the structure of ``tree``,
+    with taxa given by their indexes in ``taxon_index_map``.
+    """
+    node_index_map = {}
+    parent_indexes = []
+    taxon_indexes = []
+    labels = []
+    edge_lengths = []
+    for node_idx, nd in enumerate(tree.preorder_node_iter()):
+        node_index_map[nd] = node_idx
+        if nd._parent_node is None:
+            parent_indexes.append(-1)
+        else:
+            parent_indexes.append(node_index_map[nd._parent_node])
+        if nd.taxon is None:
+            taxon_indexes.append(-1)
+        else:
+            taxon_indexes.append(taxon_index_map[nd.taxon])
+        labels.append(nd.label)
+        edge_lengths.append(nd.edge.length)
+    return (tree.label,
+            tree._is_rooted,
+            tree.weight,
+            parent_indexes,
+            taxon_indexes,
+            labels,
+            edge_lengths)
+
+def decode_tree(payload, taxa, tree_type, taxon_namespace):
+    """
+    Reconstructs a tree of type ``tree_type`` from a representation created
+    by :func:`encode_tree`, with taxa dereferenced by index from ``taxa``.
+    """
+    label, is_rooted, weight, parent_indexes, taxon_indexes, labels, edge_lengths = payload
+    tree = tree_type(taxon_namespace=taxon_namespace, label=label)
+    tree.is_rooted = is_rooted
+    tree.weight = weight
+    nodes = []
+    node_factory = tree.node_factory
+    for parent_idx, taxon_idx, node_label, edge_length in zip(parent_indexes, taxon_indexes, labels, edge_lengths):
+        if parent_idx < 0:
+            nd = tree.seed_node
+            nd.label = node_label
+            nd.edge.length = edge_length
+        else:
+            nd = node_factory(label=node_label, edge_length=edge_length)
+            nodes[parent_idx].add_child(nd)
+        if taxon_idx >= 0:
+            nd.taxon = taxa[taxon_idx]
+        nodes.append(nd)
+    return tree
+
+def encode_char_matrix(char_matrix, taxon_index_map):
+    """
+    Returns a compact, picklable representation of the sequences of
+    ``char_matrix``, with taxa given by their indexes in
+    ``taxon_index_map``.
+    """
+    if isinstance(char_matrix, charmatrixmodel.ContinuousCharacterMatrix):
+        encode_values = lambda s: list(s.values())
+    elif isinstance(char_matrix, charmatrixmodel.FixedAlphabetCharacterMatrix):
+        encode_values = lambda s: s.symbols_as_string()
+    else:
+        raise NotImplementedError("Parallel reading of '{}' data is not supported".format(char_matrix.data_type))
+    return (char_matrix.label,
+            [(taxon_index_map[taxon], encode_values(char_matrix[taxon])) for taxon in char_matrix])
+
+def decode_char_matrix(payload, taxa, char_matrix_type, taxon_namespace):
+    """
+    Reconstructs a character matrix of type ``char_matrix_type`` from a
+    representation created by :func:`encode_char_matrix`, with taxa
+    dereferenced by index from ``taxa``.
+    """
+    label, sequences = payload
+    char_matrix = char_matrix_type(taxon_namespace=taxon_namespace, label=label)
+    for taxon_idx, values in sequences:
+        char_matrix[taxa[taxon_idx]] = char_matrix.coerce_values(values)
+    return char_matrix
+
+##############################################################################
+## Workers
+
+def _seeded_taxon_namespace(seed_labels, is_case_sensitive):
+    taxon_namespace = taxonmodel.TaxonNamespace(is_case_sensitive=is_case_sensitive)
+    for label in seed_labels:
+        taxon_namespace.new_taxon(label=label)
+    return taxon_namespace
+
+def _new_taxon_labels(taxon_namespace, num_seed_labels):
+    return [taxon.label for taxon in taxon_namespace[num_seed_labels:]]
+
+def _read_tree_list_payload(task):
+    path, schema, seed_labels, is_case_sensitive, kwargs = task
+    taxon_namespace = _seeded_taxon_namespace(seed_labels, is_case_sensitive)
+    tree_list = treecollectionmodel.TreeList.get(path=path,
+            schema=schema,
+            taxon_namespace=taxon_namespace,
+            **kwargs)
+    taxon_index_map = dict((taxon, idx) for idx, taxon in enumerate(taxon_namespace))
+    tree_payloads = [encode_tree(tree, taxon_index_map) for tree in tree_list]
+    return (_new_taxon_labels(taxon_namespace, len(seed_labels)),
+            tree_list.label,
+            tree_payloads)
+
+def _read_char_matrix_payload(task):
+    path, schema, char_matrix_type, seed_labels, is_case_sensitive, kwargs = task
+    taxon_namespace = _seeded_taxon_namespace(seed_labels, is_case_sensitive)
+    char_matrix = char_matrix_type.get(path=path,
+            schema=schema,
+            taxon_namespace=taxon_namespace,
+            **kwargs)
+    taxon_index_map = dict((taxon, idx) for idx, taxon in enumerate(taxon_namespace))
+    return (_new_taxon_labels(taxon_namespace, len(seed_labels)),
+            encode_char_matrix(char_matrix, taxon_index_map))
+
+##############################################################################
+## Parent
+
+class _TaxonTable(object):
+    """
+    Maps taxon labels to |Taxon| instances in the parent |TaxonNamespace|,
+    creating them as needed.
+    """
+
+    def __init__(self, taxon_namespace, taxon_labels):
+        self.taxon_namespace = taxon_namespace
+        self.label_taxon_map = {}
+        for taxon in taxon_namespace:
+            self.label_taxon_map.setdefault(self.normalize(taxon.label), taxon)
+        if taxon_labels:
+            for label in taxon_labels:
+                self.get_taxon(label)
+        self.seed_taxa = list(taxon_namespace)
+        self.seed_labels = [taxon.label for taxon in self.seed_taxa]
+
+    def normalize(self, label):
+        if label is not None and not self.taxon_namespace.is_case_sensitive:
+            return label.lower()
+        return label
+
+    def get_taxon(self, label):
+        key = self.normalize(label)
+        try:
+            return self.label_taxon_map[key]
+        except KeyError:
+            taxon = self.taxon_namespace.new_taxon(label=label)
+            self.label_taxon_map[key] = taxon
+            return taxon
+
+    def get_taxa(self, new_labels):
+        return self.seed_taxa + [self.get_taxon(label) for label in new_labels]
+
+def _run_task(worker_task):
+    worker, task = worker_task
+    try:
+        return worker(task)
+    except Exception as e:
+        raise ParallelReadError("Error reading '{}': {}: {}".format(task[0], e.__class__.__name__, e))
+
+def _map_tasks(worker, tasks, num_processes):
+    if num_processes is None:
+        num_processes = multiprocessing.cpu_count()
+    num_processes = min(num_processes, len(tasks))
+    if num_processes <= 1:
+        return [_run_task((worker, task)) for task in tasks]
+    pool = multiprocessing.Pool(num_processes)
+    try:
+        results = pool.map(_run_task, [(worker, task) for task in tasks], chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    return results
+
+def read_tree_lists(paths,
+        schema,
+        taxon_namespace=None,
+        taxon_labels=None,
+        num_processes=None,
+        tree_list_type=None,
+        **kwargs):
+    """
+    Reads trees from each of the files in ``paths``, parsing the files in
+    parallel in multiple processes, and returns a |TreeList| for each file.
+    All the tree lists (and their trees) will reference the same
+    |TaxonNamespace|.
+
+    Parameters
+    ----------
+    paths : iterable of strings
+        Paths of the files to be read.
+    schema : string
+        Format of the data, e.g. "newick" or "nexus".
+    taxon_namespace : |TaxonNamespace|
+        Namespace to be used for the taxa. If not given, a new one will be
+        created.
+    taxon_labels : iterable of strings
+        If given, these labels will be added to the namespace (if not already
+        present) before the files are read. Pre-seeding the namespace in this
+        way with the labels of (all or most of) the taxa expected ensures that
+        the workers find, rather than create, taxa.
+    num_processes : int
+        Number of processes to use. Defaults to the number of CPUs. If 1, then
+        the files will be read in the current process.
+    tree_list_type : type
+        Type of the tree lists to return (default: |TreeList|).
+    \*\*kwargs : keyword arguments
+        Passed to the underlying schema-specific reader; must be picklable.
+
+    Returns
+    -------
+    t : list of |TreeList|
+        Tree lists, in the order of ``paths``.
+    """
+    paths = list(paths)
+    if taxon_namespace is None:
+        taxon_namespace = taxonmodel.TaxonNamespace()
+    if tree_list_type is None:
+        tree_list_type = treecollectionmodel.TreeList
+    taxon_table = _TaxonTable(taxon_namespace, taxon_labels)
+    tasks = [(path, schema, taxon_table.seed_labels, taxon_namespace.is_case_sensitive, kwargs) for path in paths]
+    tree_lists = []
+    for new_labels, tree_list_label, tree_payloads in _map_tasks(_read_tree_list_payload, tasks, num_processes):
+        taxa = taxon_table.get_taxa(new_labels)
+        tree_list = tree_list_type(taxon_namespace=taxon_namespace, label=tree_list_label)
+        for payload in tree_payloads:
+            tree_list.append(decode_tree(payload,
+                taxa=taxa,
+                tree_type=tree_list.tree_type,
+                taxon_namespace=taxon_namespace))
+        tree_lists.append(tree_list)
+    return tree_lists
+
+def read_char_matrices(paths,
+        schema,
+        char_matrix_type,
+        taxon_namespace=None,
+        taxon_labels=None,
+        num_processes=None,
+        **kwargs):
+    """
+    Reads a character matrix of type ``char_matrix_type`` from each of the
+    files in ``paths``, parsing the files in parallel in multiple processes.
+    All the matrices will reference the same |TaxonNamespace|.
+
+    Parameters
+    ----------
+    paths : iterable of strings
+        Paths of the files to be read.
+    schema : string
+        Format of the data, e.g. "fasta" or "nexus".
+    char_matrix_type : type
+        Type of character matrix, e.g. |DnaCharacterMatrix|. Only matrices
+        with fixed state alphabets and continuous matrices are supported.
+    taxon_namespace : |TaxonNamespace|
+        Namespace to be used for the taxa. If not given, a new one will be
+        created.
+    taxon_labels : iterable of strings
+        If given, these labels will be added to the namespace (if not already
+        present) before the files are read.
+    num_processes : int
+        Number of processes to use. Defaults to the number of CPUs. If 1, then
+        the files will be read in the current process.
+    \*\*kwargs : keyword arguments
+        Passed to the underlying schema-specific reader; must be picklable.
+
+    Returns
+    -------
+    m : list of |CharacterMatrix|
+        Character matrices, in the order of ``paths``.
+    """
+    paths = list(paths)
+    if taxon_namespace is None:
+        taxon_namespace = taxonmodel.TaxonNamespace()
+    taxon_table = _TaxonTable(taxon_namespace, taxon_labels)
+    tasks = [(path, schema, char_matrix_type, taxon_table.seed_labels, taxon_namespace.is_case_sensitive, kwargs) for path in paths]
+    char_matrices = []
+    for new_labels, payload in _map_tasks(_read_char_matrix_payload, tasks, num_processes):
+        char_matrices.append(decode_char_matrix(payload,
+            taxa=taxon_table.get_taxa(new_labels),
+            char_matrix_type=char_matrix_type,
+            taxon_namespace=taxon_namespace))
+    return char_matrices
@@ -240,11 +240,19 @@ class PhylipReader(ioservice.DataReader):
                 else:
                     self.char_matrix[current_taxon].append(state)
         else:
+            state_alphabet = self.char_matrix.default_state_alphabet
+            try:
+                states = state_alphabet.get_states_for_symbol_string(line)
+            except KeyError:
+                pass
+            else:
+                self.char_matrix[current_taxon].extend(states)
+                return
             for c in line:
                 if c in [' ', '\t']:
                     continue
                 try:
-                    state = self.char_matrix.default_state_alphabet[c]
+                    state = state_alphabet[c]
                 except KeyError:
                     if not self.ignore_invalid_chars:
                         raise self._data_parse_error("Invalid state symbol for taxon '%s': '%s'" % (current_taxon.label, c),
@@ -0,0 +1,306 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Compact binary container for persisting split and tree summaries (e.g.,
+|SplitDistribution| and |TreeArray| instances).
+
+The layout of an archive is:
+
+    - an 8-byte magic string, followed by the format version and the length
+      of the metadata block as little-endian unsigned 32-bit integers;
+    - the metadata block: a UTF-8 encoded JSON object holding the
+      configuration of the archived object, the labels of the taxa of the
+      |TaxonNamespace| (in order), and a directory giving the name, type
+      code, offset and length of each of the data sections;
+    - the data sections, each a flat little-endian array of unsigned 64-bit
+      integers ("Q") or 64-bit floating point values ("d"), aligned on 8-byte
+      boundaries so that the archive can be memory-mapped and the sections
+      unpacked (or viewed) in place.
+
+Split bitmasks are stored as packed 64-bit words, least-significant word
+first, with the number of words per bitmask determined by the number of taxa.
+Variable-length per-split or per-tree lists (e.g., edge lengths) are stored as
+a single concatenated array together with an array of offsets into it.
+Missing (|None|) floating point values are stored as NaN.
+"""
+
+import json
+import mmap
+import struct
+from dendropy.utility import textprocessing
+
+ARCHIVE_MAGIC = b"DPYSPLTA"
+ARCHIVE_VERSION = 1
+_HEADER_FORMAT = "<8sII"
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+_WORD_BITS = 64
+_WORD_MASK = (1 << _WORD_BITS) - 1
+_ITEM_SIZE = 8
+
+class SplitArchiveError(ValueError):
+    def __init__(self, message=None):
+        ValueError.__init__(self, message)
+
+##############################################################################
+## Packing and Unpacking
+
+def num_bitmask_words(num_taxa):
+    """
+    Returns the number of 64-bit words required to store a bitmask over
+    ``num_taxa`` taxa.
+    """
+    return max(1, (num_taxa + _WORD_BITS - 1) // _WORD_BITS)
+
+def pack_bitmasks(bitmasks, num_words):
+    """
+    Returns a list of ``num_words`` words for each of the (arbitrary
+    precision) integers in ``bitmasks``, least-significant word first.
+    """
+    if num_words == 1:
+        return list(bitmasks)
+    words = []
+    for bitmask in bitmasks:
+        for k in range(num_words):
+            words.append(bitmask & _WORD_MASK)
+            bitmask >>= _WORD_BITS
+    return words
+
+def unpack_bitmasks(words, num_words):
+    """
+    Reverses :func:`pack_bitmasks`.
+    """
+    if num_words == 1:
+        return list(words)
+    bitmasks = []
+    for i in range(0, len(words), num_words):
+        bitmask = 0
+        for k in range(num_words-1, -1, -1):
+            bitmask = (bitmask << _WORD_BITS) | words[i+k]
+        bitmasks.append(bitmask)
+    return bitmasks
+
+def pack_float_values(values):
+    """
+    Returns ``values`` as floats, with |None| mapped to NaN.
+    """
+    nan = float("nan")
+    return [nan if v is None else float(v) for v in values]
+
+def unpack_float_values(values):
+    """
+    Reverses :func:`pack_float_values`.
+    """
+    return [None if v != v else v for v in values]
+
+def pack_list_offsets(lists):
+    """
+    Flattens the sequence of sequences, ``lists``, returning the concatenated
+    values and the (``len(lists)+1``) offsets of the start of each component
+    sequence in it.
+    """
+    values = []
+    offsets = [0]
+    for x in lists:
+        values.extend(x)
+        offsets.append(len(values))
+    return values, offsets
+
+def unpack_list_offsets(values, offsets):
+    """
+    Reverses :func:`pack_list_offsets`.
+    """
+    return [values[offsets[i]:offsets[i+1]] for i in range(len(offsets)-1)]
+
+##############################################################################
+## Writing
+
+def write_archive(dest, metadata, sections):
+    """
+    Writes an archive.
+
+    Parameters
+    ----------
+    dest : string or file-like object
+        Path or (binary) file-like object to which to write.
+    metadata : dict
+        JSON-serializable metadata describing the archived object.
+    sections : iterable of tuples
+        Iterable of (name, typecode, values) tuples, where "typecode" is one
+        of "Q" (unsigned 64-bit integer) or "d" (64-bit float).
+    """
+    sections = list(sections)
+    metadata = dict(metadata)
+    directory = {}
+    for name, typecode, values in sections:
+        directory[name] = [typecode, 0, len(values)]
+    metadata["sections"] = directory
+    # the offsets of the data sections depend on the length of the metadata
+    # block, which in turn includes the offsets: iterate until stable
+    data_start = 0
+    while True:
+        offset = data_start
+        for name, typecode, values in sections:
+            directory[name][1] = offset
+            offset += len(values) * _ITEM_SIZE
+        metadata_bytes = _encode_metadata(metadata)
+        required_start = _HEADER_SIZE + _padded_length(len(metadata_bytes))
+        if required_start <= data_start:
+            break
+        data_start = required_start
+    padding = data_start - _HEADER_SIZE - len(metadata_bytes)
+    if textprocessing.is_str_type(dest):
+        with open(dest, "wb") as f:
+            _write_archive_to_stream(f, metadata_bytes, padding, sections)
+    else:
+        _write_archive_to_stream(dest, metadata_bytes, padding, sections)
+
+def _write_archive_to_stream(stream, metadata_bytes, padding, sections):
+    stream.write(struct.pack(_HEADER_FORMAT, ARCHIVE_MAGIC, ARCHIVE_VERSION, len(metadata_bytes)))
+    stream.write(metadata_bytes)
+    stream.write(b"\x00" * padding)
+    for name, typecode, values in sections:
+        if values:
+            stream.write(struct.pack("<{}{}".format(len(values), typecode), *values))
+
+def _encode_metadata(metadata):
+    return json.dumps(metadata, sort_keys=True).encode("utf-8")
+
+def _padded_length(n):
+    return ((n + _ITEM_SIZE - 1) // _ITEM_SIZE) * _ITEM_SIZE
+
+##############################################################################
+## Reading
+
+class SplitArchive(object):
+    """
+    Provides access to the metadata and data sections of an archive. If
+    given a path, the file will be memory-mapped, so that only the sections
+    requested are actually read.
+    """
+
+    def __init__(self, src, use_mmap=True):
+        """
+        Parameters
+        ----------
+        src : string or file-like object
+            Path or (binary) file-like object from which to read.
+        use_mmap : bool
+            If |True| (default) and ``src`` is a path, memory-map the file
+            instead of reading it into memory.
+        """
+        self._file = None
+        if textprocessing.is_str_type(src):
+            self._file = open(src, "rb")
+            if use_mmap:
+                self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._buffer = self._file.read()
+        else:
+            self._buffer = src.read()
+        if len(self._buffer) < _HEADER_SIZE:
+            self.close()
+            raise SplitArchiveError("Not a split archive: too short")
+        magic, version, metadata_length = struct.unpack_from(_HEADER_FORMAT, self._buffer, 0)
+        if magic != ARCHIVE_MAGIC:
+            self.close()
+            raise SplitArchiveError("Not a split archive: unrecognized header")
+        if version > ARCHIVE_VERSION:
+            self.close()
+            raise SplitArchiveError("Unsupported split archive version: {} (maximum supported is {})".format(version, ARCHIVE_VERSION))
+        self.version = version
+        metadata_bytes = self._buffer[_HEADER_SIZE:_HEADER_SIZE+metadata_length]
+        self.metadata = json.loads(metadata_bytes.decode("utf-8"))
+        self.sections = self.metadata.pop("sections")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __contains__(self, name):
+        return name in self.sections
+
+    def validate_object_type(self, object_type):
+        """
+        Raises :class:`SplitArchiveError` if the archive does not hold an
+        object of type ``object_type`` (e.g., "TreeArray").
+        """
+        if self.metadata.get("object_type") != object_type:
+            raise SplitArchiveError("Expecting split archive of '{}', but found '{}'".format(object_type, self.metadata.get("object_type")))
+
+    def get_values(self, name):
+        """
+        Returns the values of section ``name`` as a tuple.
+        """
+        try:
+            typecode, offset, count = self.sections[name]
+        except KeyError:
+            raise SplitArchiveError("Section not found in split archive: '{}'".format(name))
+        if offset + count * _ITEM_SIZE > len(self._buffer):
+            raise SplitArchiveError("Truncated split archive: section '{}' extends beyond end of data".format(name))
+        if count == 0:
+            return ()
+        return struct.unpack_from("<{}{}".format(count, typecode), self._buffer, offset)
+
+    def get_bitmasks(self, name, num_words):
+        return unpack_bitmasks(self.get_values(name), num_words)
+
+    def get_float_values(self, name):
+        return unpack_float_values(self.get_values(name))
+
+    def get_lists(self, name, offsets_name=None):
+        """
+        Returns the values of section ``name`` split into sub-lists as given by
+        the offsets in section ``offsets_name`` (defaults to ``name`` +
+        "_offsets").
+        """
+        if offsets_name is None:
+            offsets_name = name + "_offsets"
+        return unpack_list_offsets(self.get_values(name), self.get_values(offsets_name))
+
+##############################################################################
+## Taxon Namespace
+
+def taxon_namespace_labels(taxon_namespace):
+    return [t.label for t in taxon_namespace]
+
+def reconcile_taxon_namespace(labels, taxon_namespace):
+    """
+    Ensures that the taxa of ``taxon_namespace`` correspond, in order, to
+    ``labels``, creating taxa as needed. As split bitmasks depend on the
+    order of the taxa, raises :class:`SplitArchiveError` if this is not
+    possible.
+    """
+    for idx, label in enumerate(labels):
+        if idx < len(taxon_namespace):
+            if taxon_namespace[idx].label != label:
+                raise SplitArchiveError("Taxon {} in split archive ('{}') does not match corresponding taxon in namespace ('{}')".format(
+                    idx+1, label, taxon_namespace[idx].label))
+        else:
+            taxon_namespace.new_taxon(label=label)
+    return taxon_namespace
@@ -71,6 +71,10 @@ class XmlObject(object):
         return self._element.text
     text = property(_get_text)
 
+    def _get_tag(self):
+        return self._element.tag
+    tag = property(_get_tag)
+
 class XmlElement(XmlObject):
     """
     Abstraction layer around an item.
@@ -172,3 +176,46 @@ class XmlDocument(XmlObject):
         for prefix, namespace in ns_map:
             self.namespace_registry.add_namespace(prefix=prefix, namespace=namespace)
 
+    def iterparse_file(self, source, start_tags=None, end_tags=None):
+        """
+        Incrementally parses an XML document from source, which can either be
+        a filepath string or a file object, without building the complete
+        document tree in memory.
+
+        Yields ``(event, element)`` pairs, where ``event`` is "start" or "end",
+        for elements with (fully-qualified) tags in ``start_tags`` or
+        ``end_tags`` respectively. On a "start" event, only the attributes of
+        the element are available; on an "end" event, the element is
+        complete. Once processing resumes after an "end" event, the element is
+        cleared and removed from its parent, so that memory use is bounded by
+        the largest element yielded (plus any elements not yielded, which
+        remain attached to their parents). The document root is available as
+        ``self.root`` as soon as the first event is yielded.
+        """
+        if start_tags is None:
+            start_tags = frozenset()
+        else:
+            start_tags = frozenset(start_tags)
+        if end_tags is None:
+            end_tags = frozenset()
+        else:
+            end_tags = frozenset(end_tags)
+        events = "start", "end", "start-ns"
+        open_elements = []
+        for event, elem in ElementTree.iterparse(source, events):
+            if event == "start":
+                if self.root is None:
+                    self.root = self.subelement_factory(elem)
+                open_elements.append(elem)
+                if elem.tag in start_tags:
+                    yield event, self.subelement_factory(elem)
+            elif event == "end":
+                open_elements.pop()
+                if elem.tag in end_tags:
+                    yield event, self.subelement_factory(elem)
+                    elem.clear()
+                    if open_elements:
+                        open_elements[-1].remove(elem)
+            else:
+                prefix, namespace = elem
+                self.namespace_registry.add_namespace(prefix=prefix, namespace=namespace)
@@ -31,6 +31,7 @@ from dendropy.utility import container
 from dendropy.utility import bibtex
 from dendropy.utility import textprocessing
 from dendropy.utility import urlio
+from dendropy.utility import filesys
 from dendropy.utility import error
 from dendropy.utility import deprecate
 
@@ -212,7 +213,7 @@ class Deserializable(object):
             New instance of object, constructed and populated from data given
             in source.
         """
-        with open(src, "r", newline=None) as fsrc:
+        with filesys.open_path(src, "r") as fsrc:
             return cls._parse_and_create_from_stream(stream=fsrc,
                     schema=schema,
                     **kwargs)
@@ -409,7 +410,7 @@ class MultiReadable(object):
                 - |CharacterMatrix|: number of sequences
                 - |DataSet|: ``tuple`` (number of taxon namespaces, number of tree lists, number of matrices)
         """
-        with open(src, "r", newline=None) as fsrc:
+        with filesys.open_path(src, "r") as fsrc:
             return self._parse_and_add_from_stream(stream=fsrc, schema=schema, **kwargs)
 
     def read_from_string(self, src, schema, **kwargs):
@@ -598,7 +599,7 @@ class Serializable(object):
         """
         Writes to file specified by ``dest``.
         """
-        with open(os.path.expandvars(os.path.expanduser(dest)), "w") as f:
+        with filesys.open_path(dest, "w") as f:
             return self._format_and_write_to_stream(stream=f, schema=schema, **kwargs)
 
     def as_string(self, schema, **kwargs):
@@ -22,12 +22,14 @@ Character and character-sequence data structures.
 
 import warnings
 import copy
+import bisect
 import collections
 from dendropy.utility.textprocessing import StringIO
 from dendropy.utility import textprocessing
 from dendropy.utility import error
 from dendropy.utility import deprecate
 from dendropy.utility import container
+from dendropy.utility import filesys
 from dendropy.datamodel import charstatemodel
 from dendropy.datamodel.charstatemodel import DNA_STATE_ALPHABET
 from dendropy.datamodel.charstatemodel import RNA_STATE_ALPHABET
@@ -401,6 +403,213 @@ class CharacterDataSequence(
         """
         self._character_annotations[idx] = annotations
 
+###############################################################################
+## View of Character Data Sequence(s)
+
+class CharacterDataSequenceView(CharacterDataSequence):
+    """
+    A read-through window onto columns of one or more `CharacterDataSequence`
+    objects.
+
+    A view does not copy any cells: each element access is resolved to the
+    corresponding cell of the source sequence(s). Values, character types, and
+    annotations can be set through the view, in which case the changes are
+    reflected in the source sequences (and vice versa). Operations that
+    change the size of the sequence (e.g., ``append``, ``insert``,
+    ``__delitem__``) are not supported; use ``materialize()`` to obtain an
+    independent, fully-mutable copy.
+
+    Views are typically not created directly, but through
+    :meth:`CharacterMatrix.view_character_indices`,
+    :meth:`CharacterMatrix.view_character_subset`, or
+    :meth:`CharacterMatrix.concatenate` with ``as_view=True``.
+    """
+
+    def __init__(self, segments=None):
+        """
+        Parameters
+        ----------
+        segments : iterable of (`CharacterDataSequence`, indices) tuples
+            Each element is a source sequence and the (0-based) column indices
+            in that source sequence that make up consecutive elements of this
+            view. ``indices`` can be any indexable object that supports
+            ``len()``, e.g. a list or a ``range``.
+        """
+        self._segments = []
+        self._segment_offsets = []
+        self._size = 0
+        if segments:
+            for sequence, indices in segments:
+                self._add_segment(sequence, indices)
+
+    def _add_segment(self, sequence, indices):
+        if isinstance(sequence, CharacterDataSequenceView):
+            # resolve to the underlying sequences so that views of views do
+            # not stack lookups
+            for sub_sequence, sub_indices in sequence._resolve_indices(indices):
+                self._add_segment(sub_sequence, sub_indices)
+            return
+        if not len(indices):
+            return
+        self._segments.append( (sequence, indices) )
+        self._segment_offsets.append(self._size)
+        self._size += len(indices)
+
+    def _resolve_indices(self, indices):
+        # groups ``indices`` of self into runs of (source, source-indices)
+        runs = []
+        current_sequence = None
+        current_indices = None
+        for idx in indices:
+            sequence, col_idx = self._resolve(idx)
+            if sequence is not current_sequence:
+                current_sequence = sequence
+                current_indices = []
+                runs.append( (current_sequence, current_indices) )
+            current_indices.append(col_idx)
+        return runs
+
+    def _resolve(self, idx):
+        if idx < 0:
+            idx += self._size
+        if idx < 0 or idx >= self._size:
+            raise IndexError(idx)
+        if len(self._segments) == 1:
+            sequence, indices = self._segments[0]
+            return sequence, indices[idx]
+        seg_idx = bisect.bisect_right(self._segment_offsets, idx) - 1
+        sequence, indices = self._segments[seg_idx]
+        return sequence, indices[idx - self._segment_offsets[seg_idx]]
+
+    def _iter_cells(self):
+        for sequence, indices in self._segments:
+            for col_idx in indices:
+                yield sequence, col_idx
+
+    def _get_source_sequences(self):
+        return [sequence for sequence, indices in self._segments]
+    source_sequences = property(_get_source_sequences)
+
+    def materialize(self, sequence_type=None):
+        """
+        Returns a new, independent `CharacterDataSequence` populated with
+        (references to) the values, character types and annotations of the
+        cells in this view.
+
+        Parameters
+        ----------
+        sequence_type : class
+            Type of sequence to create. If not specified, the type of the
+            (first) source sequence is used.
+
+        Returns
+        -------
+        s : `CharacterDataSequence`
+            A new sequence.
+        """
+        if sequence_type is None:
+            if self._segments:
+                sequence_type = self._segments[0][0].__class__
+            else:
+                sequence_type = CharacterDataSequence
+        values = []
+        types = []
+        annotations = []
+        for sequence, col_idx in self._iter_cells():
+            values.append(sequence._character_values[col_idx])
+            types.append(sequence._character_types[col_idx])
+            annotations.append(sequence._character_annotations[col_idx])
+        s = sequence_type()
+        s._character_values = values
+        s._character_types = types
+        s._character_annotations = annotations
+        return s
+
+    def __deepcopy__(self, memo=None):
+        if memo is None:
+            memo = {}
+        other = copy.deepcopy(self.materialize(), memo)
+        memo[id(self)] = other
+        return other
+
+    def values(self):
+        """
+        Returns list of values of this vector.
+
+        Returns
+        -------
+        v : list
+            List of values making up this vector.
+        """
+        return [sequence._character_values[col_idx] for sequence, col_idx in self._iter_cells()]
+
+    def symbols_as_list(self):
+        return list(str(cs) for cs in self.values())
+
+    def symbols_as_string(self, sep=""):
+        return sep.join(str(cs) for cs in self.values())
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self._size))]
+        sequence, col_idx = self._resolve(idx)
+        return sequence._character_values[col_idx]
+
+    def __setitem__(self, idx, value):
+        sequence, col_idx = self._resolve(idx)
+        sequence._character_values[col_idx] = value
+
+    def __next__(self):
+        for sequence, indices in self._segments:
+            values = sequence._character_values
+            for col_idx in indices:
+                yield values[col_idx]
+
+    next = __next__ # Python 2 legacy support
+
+    def cell_iter(self):
+        for sequence, col_idx in self._iter_cells():
+            yield (sequence._character_values[col_idx],
+                    sequence._character_types[col_idx],
+                    sequence._character_annotations[col_idx])
+
+    def _raise_resize_error(self, *args, **kwargs):
+        raise TypeError("'{}' does not support changing the number of elements; call 'materialize()' to obtain a mutable copy".format(self.__class__.__name__))
+    append = _raise_resize_error
+    extend = _raise_resize_error
+    insert = _raise_resize_error
+    __delitem__ = _raise_resize_error
+
+    def set_at(self, idx, character_value, character_type=None, character_annotations=None):
+        sequence, col_idx = self._resolve(idx)
+        sequence.set_at(col_idx, character_value, character_type, character_annotations)
+
+    def value_at(self, idx):
+        return self[idx]
+
+    def character_type_at(self, idx):
+        sequence, col_idx = self._resolve(idx)
+        return sequence.character_type_at(col_idx)
+
+    def annotations_at(self, idx):
+        sequence, col_idx = self._resolve(idx)
+        return sequence.annotations_at(col_idx)
+
+    def has_annotations_at(self, idx):
+        sequence, col_idx = self._resolve(idx)
+        return sequence.has_annotations_at(col_idx)
+
+    def set_character_type_at(self, idx, character_type):
+        sequence, col_idx = self._resolve(idx)
+        sequence.set_character_type_at(col_idx, character_type)
+
+    def set_annotations_at(self, idx, annotations):
+        sequence, col_idx = self._resolve(idx)
+        sequence.set_annotations_at(col_idx, annotations)
+
 ###############################################################################
 ## Subset of Character (Columns)
 
@@ -603,7 +812,7 @@ class CharacterMatrix(
         """
         return cls._get_from(**kwargs)
 
-    def concatenate(cls, char_matrices):
+    def concatenate(cls, char_matrices, as_view=False):
         """
         Creates and returns a single character matrix from multiple
         CharacterMatrix objects specified as a list, 'char_matrices'.
@@ -612,10 +821,18 @@ class CharacterMatrix(
         must be present in all alignments, all all alignments must
         be of the same length. Component parts will be recorded as
         character subsets.
+
+        If ``as_view`` is |True|, then no data is copied: the sequences of
+        the resulting matrix will be `CharacterDataSequenceView` objects
+        that reference the cells of the sequences in the source matrices.
         """
         taxon_namespace = char_matrices[0].taxon_namespace
         nseqs = len(char_matrices[0])
-        concatenated_chars = cls(taxon_namespace=taxon_namespace)
+        if as_view:
+            concatenated_chars = char_matrices[0]._new_view_matrix()
+            segments = collections.OrderedDict()
+        else:
+            concatenated_chars = cls(taxon_namespace=taxon_namespace)
         pos_start = 0
         for cidx, cm in enumerate(char_matrices):
             if cm.taxon_namespace is not taxon_namespace:
@@ -628,7 +845,11 @@ class CharacterMatrix(
             for t, s in cm.items():
                 if len(s) != v1:
                     raise ValueError("Unequal length sequences in character matrix %d".format(cidx+1))
-            concatenated_chars.extend_matrix(cm)
+            if as_view:
+                for t, s in cm._taxon_sequence_map.items():
+                    segments.setdefault(t, []).append( (s, range(len(s))) )
+            else:
+                concatenated_chars.extend_matrix(cm)
             if cm.label is None:
                 new_label = "locus%03d" % cidx
             else:
@@ -642,6 +863,9 @@ class CharacterMatrix(
             pos_start += cm.vector_size
             concatenated_chars.new_character_subset(character_indices=character_indices,
                     label=cs_label)
+        if as_view:
+            for t in segments:
+                concatenated_chars._taxon_sequence_map[t] = CharacterDataSequenceView(segments[t])
         return concatenated_chars
     concatenate = classmethod(concatenate)
 
@@ -672,10 +896,65 @@ class CharacterMatrix(
         character matrix. Component parts will be recorded as character
         subsets.
         """
-        streams = [open(path, "rU") for path in paths]
+        streams = [filesys.open_path(path, "r") for path in paths]
         return cls.concatenate_from_streams(streams, schema, **kwargs)
     concatenate_from_paths = classmethod(concatenate_from_paths)
 
+    def yield_from_files(cls, files, schema, **kwargs):
+        """
+        Iterates over character sequences from files, returning them
+        one-by-one instead of instantiating a full character matrix in memory.
+
+        Each item yielded is a ``(label, sequence)`` named tuple, where
+        ``sequence`` is the raw symbol string (or ``bytes``, if ``as_bytes``
+        is |True|) of the sequence. No |Taxon| objects are created. If the
+        matrix type has a fixed state alphabet (e.g., |DnaCharacterMatrix|),
+        sequences are validated against it as they are read, unless a
+        different ``state_alphabet`` is passed in explicitly (|None| disables
+        validation).
+
+        Parameters
+        ----------
+        files : iterable of file paths or file-like objects.
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading. If a source element is
+            a string (``isinstance(i,str) == True``), then it is assumed to be
+            a path to a file. Otherwise, the source is assumed to be a file-like
+            object.
+        schema : string
+            The name of the data format (e.g., "fasta").
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the schema-yielder
+            implementation. Common options are ``state_alphabet``,
+            ``as_bytes``, and ``batch_size`` (yield lists of up to this many
+            records at a time).
+
+        Yields
+        ------
+        r : ``(label, sequence)``
+            Sequence records as read from the file.
+
+        Examples
+        --------
+
+        ::
+
+            lengths = {}
+            for label, seq in dendropy.DnaCharacterMatrix.yield_from_files(
+                    files=["path/to/seqs1.fasta", "path/to/seqs2.fasta"],
+                    schema="fasta"):
+                lengths[label] = len(seq)
+
+        """
+        if "state_alphabet" not in kwargs:
+            kwargs["state_alphabet"] = getattr(cls, "datatype_alphabet", None)
+        char_yielder = dataio.get_char_yielder(
+                files,
+                schema,
+                **kwargs)
+        return char_yielder
+    yield_from_files = classmethod(yield_from_files)
+
     def from_dict(cls,
             source_dict,
             char_matrix=None,
@@ -1601,18 +1880,121 @@ class CharacterMatrix(
         of columns given by the 0-based indices in ``indices``.
         Note that this new matrix will still reference the same taxon set.
         """
-        clone = self.__class__(self)
-        # clear out character subsets; otherwise all indices will have to be
-        # recalculated, which will require some careful and perhaps arbitrary
-        # handling of corner cases
-        clone.character_subsets = container.OrderedCaselessDict()
-        # clone.clone_from(self)
-        for vec in clone.values():
-            for cell_idx in range(len(vec)-1, -1, -1):
-                if cell_idx not in indices:
-                    del(vec[cell_idx])
+        # only the selected columns get copied: the view resolves to the
+        # cells of ``self`` and is materialized when cloned
+        indices = sorted(set(indices))
+        view = self._new_view_matrix(label=self.label)
+        for taxon, seq in self._taxon_sequence_map.items():
+            seq_len = len(seq)
+            view._taxon_sequence_map[taxon] = CharacterDataSequenceView(
+                    [(seq, [idx for idx in indices if idx < seq_len])])
+        view.comments = self.comments
+        view.copy_annotations_from(self)
+        clone = self.__class__(view)
+        # character subsets are not carried over; otherwise all indices will
+        # have to be recalculated, which will require some careful and perhaps
+        # arbitrary handling of corner cases
         return clone
 
+    ###########################################################################
+    ### Views
+
+    def _new_view_matrix(self, label=None):
+        """
+        Returns a new, empty matrix of the same type and sharing the same
+        taxon namespace as ``self``, to be populated with views onto ``self``.
+        """
+        return self.__class__(label=label, taxon_namespace=self.taxon_namespace)
+
+    def view_character_indices(self, indices, label=None):
+        """
+        Returns a new CharacterMatrix (of the same type) consisting only of
+        columns given by the 0-based indices in ``indices``, *without* copying
+        any data.
+
+        Sequences of the new matrix are `CharacterDataSequenceView` objects,
+        which resolve element access to cells in the corresponding sequences
+        of ``self``: changes to the values of cells in either matrix will be
+        reflected in the other. Columns are presented in the order given by
+        ``indices``. The new matrix will reference the same taxon namespace
+        (and, for discrete data, the same state alphabets) as ``self``, but
+        will not have any character subsets defined.
+
+        Parameters
+        ----------
+        indices : iterable of integers, or ``slice``
+            The (0-based) column indices to be presented by the view. A
+            ``slice`` object (e.g. ``slice(100, 200)``) can be given to select
+            a range of columns without building a list of indices.
+        label : string
+            Label for the new matrix.
+
+        Returns
+        -------
+        m : |CharacterMatrix|
+            A new matrix of the same type as ``self``, with sequences that are
+            views onto the sequences of ``self``.
+        """
+        view = self._new_view_matrix(label=label)
+        if isinstance(indices, slice):
+            index_slice = indices
+            for taxon, seq in self._taxon_sequence_map.items():
+                view._taxon_sequence_map[taxon] = CharacterDataSequenceView(
+                        [(seq, range(*index_slice.indices(len(seq))))])
+        else:
+            indices = list(indices)
+            for taxon, seq in self._taxon_sequence_map.items():
+                view._taxon_sequence_map[taxon] = CharacterDataSequenceView(
+                        [(seq, indices)])
+        return view
+
+    def view_character_subset(self, character_subset):
+        """
+        Returns a new CharacterMatrix (of the same type) consisting only
+        of columns given by the CharacterSubset, ``character_subset``,
+        *without* copying any data. See
+        :meth:`CharacterMatrix.view_character_indices` for details.
+        """
+        if textprocessing.is_str_type(character_subset):
+            if character_subset not in self.character_subsets:
+                raise KeyError(character_subset)
+            else:
+                character_subset = self.character_subsets[character_subset]
+        return self.view_character_indices(
+                sorted(character_subset.character_indices),
+                label=character_subset.label)
+
+    def iter_character_windows(self, window_size, step_size=None):
+        """
+        Iterates over successive windows of ``window_size`` columns, returned
+        as views onto ``self`` (see
+        :meth:`CharacterMatrix.view_character_indices`). No data is copied.
+
+        Parameters
+        ----------
+        window_size : integer
+            Number of columns in each window. The last window may be shorter.
+        step_size : integer
+            Number of columns by which the start of each window is advanced.
+            Defaults to ``window_size`` (i.e., non-overlapping windows).
+
+        Yields
+        ------
+        m : |CharacterMatrix|
+            A view onto a window of columns of ``self``.
+        """
+        if window_size < 1:
+            raise ValueError("'window_size' must be a positive integer")
+        if step_size is None:
+            step_size = window_size
+        elif step_size < 1:
+            raise ValueError("'step_size' must be a positive integer")
+        nchar = self.max_sequence_size
+        for start in range(0, nchar, step_size):
+            yield self.view_character_indices(slice(start, start + window_size))
+            if start + window_size >= nchar:
+                break
+
     ###########################################################################
     ### Representation
 
@@ -1736,6 +2118,12 @@ class DiscreteCharacterMatrix(CharacterMatrix):
         self._default_state_alphabet = s
     default_state_alphabet = property(_get_default_state_alphabet, _set_default_state_alphabet)
 
+    def _new_view_matrix(self, label=None):
+        view = CharacterMatrix._new_view_matrix(self, label=label)
+        view.state_alphabets = list(self.state_alphabets)
+        view._default_state_alphabet = self._default_state_alphabet
+        return view
+
     def append_taxon_sequence(self, taxon, state_symbols):
         if taxon not in self:
             self[taxon] = CharacterDataSequence()
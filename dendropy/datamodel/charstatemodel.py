@@ -34,6 +34,9 @@ from dendropy.utility import container
 ###############################################################################
 ## StateAlphabet
 
+_WHITESPACE_BYTES = b" \t\r\n\x0b\x0c"
+_UNRECOGNIZED_SYMBOL_BYTE = bytes(bytearray([255]))
+
 class StateAlphabet(
         basemodel.DataObject,
         basemodel.Annotable):
@@ -143,6 +146,11 @@ class StateAlphabet(
     AMBIGUOUS_STATE = 1
     POLYMORPHIC_STATE = 2
 
+    # Code used in the symbol translation table for bytes that do not map to
+    # a state (or that map to a state with an index that cannot be
+    # represented by a single byte).
+    UNRECOGNIZED_SYMBOL_CODE = 255
+
     ###########################################################################
     ### Life-Cycle and Identity
 
@@ -172,6 +180,7 @@ class StateAlphabet(
         self._index_state_map = None
         self._fundamental_states_to_ambiguous_state_map = None
         self._fundamental_states_to_polymorphic_state_map = None
+        self._symbol_translation_table = None
 
         # Suppress for initialization
         self.autocompile_lookup_tables = False
@@ -565,6 +574,23 @@ class StateAlphabet(
         self._canonical_symbol_state_map = container.FrozenOrderedDict(temp_canonical_symbol_state_map)
         self._full_symbol_state_map = container.FrozenOrderedDict(temp_full_symbol_state_map)
         self._index_state_map = container.FrozenOrderedDict(temp_index_state_map)
+        self._symbol_translation_table = None
+
+    def compile_symbol_translation_table(self):
+        """
+        Builds the byte translation table returned by
+        :attr:`symbol_translation_table`.
+        """
+        table = bytearray([StateAlphabet.UNRECOGNIZED_SYMBOL_CODE] * 256)
+        for symbol, state in self._full_symbol_state_map.items():
+            if symbol is None or len(symbol) != 1:
+                continue
+            code = ord(symbol)
+            if code > 255 or state._index >= StateAlphabet.UNRECOGNIZED_SYMBOL_CODE:
+                continue
+            table[code] = state._index
+        self._symbol_translation_table = bytes(table)
+        return self._symbol_translation_table
 
     def set_state_as_attribute(self, state, attr_name=None):
         """
@@ -790,6 +816,95 @@ class StateAlphabet(
         else:
             return self._full_symbol_state_map[key]
 
+    def _get_symbol_translation_table(self):
+        """
+        A 256-byte translation table mapping (single-byte) symbols to the
+        indexes of the states they represent, with all other bytes mapping to
+        ``StateAlphabet.UNRECOGNIZED_SYMBOL_CODE``. This can be passed to
+        ``bytes.translate()`` to convert an entire sequence of symbols to
+        state indexes in a single call, or used as a lookup array (e.g.,
+        ``numpy.frombuffer(table, dtype=numpy.uint8)[codes]``).
+        """
+        if self._symbol_translation_table is None:
+            self.compile_symbol_translation_table()
+        return self._symbol_translation_table
+    symbol_translation_table = property(_get_symbol_translation_table)
+
+    def get_state_indexes_for_symbol_string(self, symbols, skip_whitespace=True):
+        """
+        Returns the indexes of the states represented by each of the
+        (single-character) symbols in the string ``symbols``, using the
+        precompiled :attr:`symbol_translation_table`.
+
+        Parameters
+        ----------
+        symbols : string or bytes
+            String of symbols, e.g., a line of sequence data.
+        skip_whitespace : bool
+            If |True| [default], whitespace characters in ``symbols`` are
+            ignored.
+
+        Returns
+        -------
+        s : bytes
+            The state index of each symbol, one per byte.
+
+        Raises
+        ------
+        KeyError if any symbol in ``symbols`` cannot be translated through
+        the table.
+        """
+        if not isinstance(symbols, bytes):
+            try:
+                symbols = symbols.encode("latin-1")
+            except UnicodeEncodeError:
+                raise KeyError(symbols)
+        if skip_whitespace:
+            codes = symbols.translate(self.symbol_translation_table, _WHITESPACE_BYTES)
+        else:
+            codes = symbols.translate(self.symbol_translation_table)
+        if codes.find(_UNRECOGNIZED_SYMBOL_BYTE) >= 0:
+            raise KeyError(symbols)
+        return codes
+
+    def get_states_for_symbol_string(self, symbols, skip_whitespace=True):
+        """
+        Returns list of states corresponding to the (single-character) symbols
+        in the string ``symbols``.
+
+        This is equivalent to calling :meth:`get_states_for_symbols` on each
+        character, but converts the entire string in one pass through
+        the :attr:`symbol_translation_table`, falling back to symbol-by-symbol
+        lookup only if some symbols are not in the table.
+
+        Parameters
+        ----------
+        symbols : string or bytes
+            String of symbols, e.g., a line of sequence data.
+        skip_whitespace : bool
+            If |True| [default], whitespace characters in ``symbols`` are
+            ignored.
+
+        Returns
+        -------
+        s : list of |StateIdentity|
+            A list of |StateIdentity| instances corresponding to symbols
+            given in ``symbols``.
+
+        Raises
+        ------
+        KeyError if any symbol in ``symbols`` is not recognized.
+        """
+        try:
+            codes = self.get_state_indexes_for_symbol_string(symbols, skip_whitespace=skip_whitespace)
+        except KeyError:
+            if isinstance(symbols, bytes) and not isinstance(symbols, str):
+                symbols = symbols.decode("latin-1")
+            if skip_whitespace:
+                symbols = [c for c in symbols if not c.isspace()]
+            return self.get_states_for_symbols(symbols)
+        return list(map(self._state_identities.__getitem__, bytearray(codes)))
+
     def get_states_for_symbols(self, symbols):
         """
         Returns list of states corresponding to symbols.
@@ -25,16 +25,21 @@ that manages collections of |TaxonNamespace|, |TreeList|, and
 import warnings
 import copy
 import sys
+import os
+import mmap
 from dendropy.utility import container
 from dendropy.utility import error
 from dendropy.utility import deprecate
 from dendropy.utility import textprocessing
+from dendropy.utility import filesys
+from dendropy.utility.textprocessing import StringIO
 from dendropy.datamodel import basemodel
 from dendropy.datamodel import taxonmodel
 from dendropy.datamodel import treecollectionmodel
 from dendropy.datamodel import charmatrixmodel
 from dendropy.datamodel import charstatemodel
 from dendropy import dataio
+from dendropy.dataio import nexusreader
 
 ###############################################################################
 ## DataSet
@@ -164,6 +169,10 @@ class DataSet(
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
               arguments will result in an error.
+            - **lazy** (*bool*) -- If |True|, then a |LazyDataSet| will be
+              returned, with blocks of the data source only being parsed
+              when first accessed (supported for "``path``" or "``data``"
+              sources in the ":doc:`nexus </schemas/nexus>`" schema only).
 
         **Optional Schema-Specific Keyword Arguments:**
 
@@ -184,6 +193,8 @@ class DataSet(
                     schema="nexml")
 
         """
+        if kwargs.pop("lazy", False):
+            return LazyDataSet(**kwargs)
         return cls._get_from(**kwargs)
 
     ###########################################################################
@@ -647,3 +658,221 @@ class DataSet(
         else:
             char_matrix = char_matrix_type(*args, **kwargs)
         return self.add_char_matrix(char_matrix)
+
+###############################################################################
+## LazyDataSet
+
+class LazyDataSet(DataSet):
+    """
+    A |DataSet| that is populated on demand from a NEXUS-formatted source.
+
+    On instantiation, the source is only quickly scanned to index its blocks
+    (their positions, titles, and dimensions: see ``blocks``). A block is
+    parsed only when the data object corresponding to it is first requested
+    through :meth:`LazyDataSet.get_tree_list`,
+    :meth:`LazyDataSet.get_char_matrix`, or
+    :meth:`LazyDataSet.load_block`, after which it is cached (in the
+    ``tree_lists`` or ``char_matrices`` collections, as usual) until
+    released using :meth:`LazyDataSet.release`. This allows, e.g., a single
+    alignment or tree block of a large multi-block file to be accessed
+    without the cost (in time or memory) of parsing the rest of the file.
+
+    Note that, as data objects are added to the ``tree_lists`` and
+    ``char_matrices`` collections in the order in which they are loaded, this
+    may not correspond to the order of the blocks in the source. If the
+    source has no TAXA block before a requested block, then the taxa are
+    defined implicitly by the character blocks, and so any that precede the
+    requested block will be loaded along with it.
+
+    Usage::
+
+        ds = dendropy.DataSet.get(
+                path="pythonidae.chars_and_trees.nex",
+                schema="nexus",
+                lazy=True)
+        for block in ds.blocks:
+            print(block.block_type, block.title, block.ntax, block.nchar, block.ntrees)
+        trees = ds.get_tree_list(index=0)
+        ds.release(trees)
+    """
+
+    def __init__(self, path=None, data=None, schema="nexus", **kwargs):
+        """
+        Parameters
+        ----------
+        path : str
+            Path to file of data (which may be compressed).
+        data : str
+            Data given directly.
+        schema : str
+            Identifier of format of data: currently only ":doc:`nexus
+            </schemas/nexus>`" is supported.
+        \*\*kwargs : keyword arguments, optional
+            ``label`` and ``taxon_namespace`` are handled as for |DataSet|;
+            the remaining arguments are passed to the reader used to parse
+            each block.
+        """
+        if schema != "nexus":
+            raise NotImplementedError("Lazy loading is only supported for the 'nexus' schema, not '{}'".format(schema))
+        if (path is None) == (data is None):
+            raise TypeError("Exactly one of 'path' or 'data' must be specified")
+        basemodel.DataObject.__init__(self, label=kwargs.pop("label", None))
+        self.taxon_namespaces = container.OrderedSet()
+        self.tree_lists = container.OrderedSet()
+        self.char_matrices = container.OrderedSet()
+        self.comments = []
+        self.attached_taxon_namespace = taxonmodel.process_kwargs_dict_for_taxon_namespace(kwargs, None)
+        if self.attached_taxon_namespace is not None:
+            self.add_taxon_namespace(self.attached_taxon_namespace)
+        self._reader_kwargs = kwargs
+        # validates reader arguments
+        dataio.get_reader("nexus", **dict(kwargs))
+        self._path = path
+        self._data = None
+        if data is not None:
+            self._data = data.encode("utf-8") if not isinstance(data, bytes) else data
+            self.blocks = nexusreader.index_nexus_blocks(self._data)
+        elif filesys.detect_compression(path, use_extension=False) is not None:
+            with filesys.open_binary_path(path) as src:
+                self._data = src.read()
+            self.blocks = nexusreader.index_nexus_blocks(self._data)
+        else:
+            self.blocks = self._index_file(path)
+        self._block_products = {}
+        self._implicit_taxon_namespaces = []
+
+    def _index_file(self, path):
+        with open(os.path.expandvars(os.path.expanduser(path)), "rb") as src:
+            if os.fstat(src.fileno()).st_size == 0:
+                return nexusreader.index_nexus_blocks(b"")
+            buf = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return nexusreader.index_nexus_blocks(buf)
+            finally:
+                buf.close()
+
+    def _read_block_text(self, block):
+        if self._data is not None:
+            b = self._data[block.start:block.end]
+        else:
+            with open(os.path.expandvars(os.path.expanduser(self._path)), "rb") as src:
+                src.seek(block.start)
+                b = src.read(block.end - block.start)
+        return b.decode("utf-8")
+
+    def _resolve_block(self, block):
+        if isinstance(block, int):
+            return self.blocks[block]
+        if block not in self.blocks:
+            for b in self.blocks:
+                if self._block_products.get(b.index) is block:
+                    return b
+            raise ValueError("Not a block of this data set: {}".format(block))
+        return block
+
+    def is_loaded(self, block):
+        """
+        Returns |True| if the given block (a :class:`NexusBlockInfo` object or
+        its index) has been loaded.
+        """
+        return self._resolve_block(block).index in self._block_products
+
+    def load_block(self, block):
+        """
+        Parses the given block (a :class:`NexusBlockInfo` object or its index)
+        if it has not already been loaded, and returns the corresponding data
+        object (a |TaxonNamespace|, |TreeList|, or |CharacterMatrix|), or
+        |None| for blocks that do not result in a data object.
+        """
+        block = self._resolve_block(block)
+        if block.index in self._block_products:
+            return self._block_products[block.index]
+        taxon_namespaces = []
+        ntax = None
+        for b in self.blocks[:block.index]:
+            if b.block_type == "TAXA":
+                taxon_namespaces.append(self.load_block(b))
+                if b.ntax is not None:
+                    ntax = b.ntax
+        if not taxon_namespaces and block.block_type != "TAXA":
+            # taxa are defined implicitly by the character blocks, which are
+            # loaded (in order) before any block that refers to them
+            for b in self.blocks[:block.index]:
+                if b.is_char_matrix_block:
+                    self.load_block(b)
+            taxon_namespaces = self._implicit_taxon_namespaces
+        reader = dataio.get_reader("nexus", **dict(self._reader_kwargs))
+        product = reader.read_block(
+                stream=StringIO("#NEXUS\n" + self._read_block_text(block)),
+                dataset=self,
+                taxon_namespaces=taxon_namespaces,
+                ntax=ntax,
+                state_alphabet_factory=charstatemodel.StateAlphabet)
+        if block.block_type == "TAXA":
+            result = product.taxon_namespaces[-1] if product.taxon_namespaces else self.attached_taxon_namespace
+        elif product.tree_lists:
+            result = product.tree_lists[0]
+        elif product.char_matrices:
+            result = product.char_matrices[0]
+        else:
+            result = None
+        if taxon_namespaces is self._implicit_taxon_namespaces:
+            self._implicit_taxon_namespaces[:] = product.taxon_namespaces
+        self._block_products[block.index] = result
+        return result
+
+    def load_all(self):
+        """
+        Loads all blocks that have not already been loaded.
+        """
+        for block in self.blocks:
+            self.load_block(block)
+
+    def _get_block_data(self, block_types, label, index):
+        blocks = [b for b in self.blocks if b.block_type in block_types]
+        if index is not None:
+            return self.load_block(blocks[index])
+        for b in blocks:
+            if b.title == label:
+                return self.load_block(b)
+        return None
+
+    def get_tree_list(self, label=None, index=None):
+        """
+        Returns the |TreeList| corresponding to the TREES block with the given
+        title (``label``) or at the given position among the TREES blocks
+        (``index``), loading it if necessary.
+        """
+        return self._get_block_data(("TREES",), label, index)
+
+    def get_char_matrix(self, label=None, index=None):
+        """
+        Returns the |CharacterMatrix| corresponding to the CHARACTERS (or
+        DATA) block with the given title (``label``) or at the given position
+        among the CHARACTERS blocks (``index``), loading it if necessary.
+        """
+        return self._get_block_data(("CHARACTERS", "DATA"), label, index)
+
+    def release(self, block):
+        """
+        Discards the data object loaded from the given block (given as a
+        :class:`NexusBlockInfo` object, its index, or the data object itself)
+        so that its memory can be reclaimed. It will be parsed again if
+        subsequently requested. TAXA blocks cannot be released, as other data
+        objects may reference their taxa.
+        """
+        block = self._resolve_block(block)
+        if block.block_type == "TAXA":
+            raise ValueError("TAXA blocks cannot be released")
+        result = self._block_products.pop(block.index, None)
+        if result is not None:
+            self.tree_lists.discard(result)
+            self.char_matrices.discard(result)
+
+    def release_all(self):
+        """
+        Discards all loaded data objects (except those of TAXA blocks).
+        """
+        for block in self.blocks:
+            if block.block_type != "TAXA":
+                self.release(block)
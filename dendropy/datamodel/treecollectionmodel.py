@@ -35,6 +35,7 @@ from dendropy.datamodel import basemodel
 from dendropy.datamodel import taxonmodel
 from dendropy.datamodel import treemodel
 from dendropy import dataio
+from dendropy.dataio import splitarchive
 
 ##############################################################################
 ### TreeList
@@ -1462,6 +1463,137 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
             self.split_edge_lengths[split] += split_dist.split_edge_lengths[split]
             self.split_node_ages[split] += split_dist.split_node_ages[split]
 
+    ###########################################################################
+    ### Binary Archive
+
+    def write_archive(self, dest):
+        """
+        Writes the split counts, edge lengths and node ages collected by this
+        distribution to a compact binary archive. This can be restored using
+        :meth:`SplitDistribution.from_archive` or merged into an existing
+        distribution using :meth:`SplitDistribution.read_archive`, which is
+        much faster than reprocessing the source trees.
+
+        Parameters
+        ----------
+        dest : string or file-like object
+            Path or (binary) file-like object to which to write.
+        """
+        metadata = self._get_archive_metadata()
+        metadata["object_type"] = "SplitDistribution"
+        metadata["taxon_labels"] = splitarchive.taxon_namespace_labels(self.taxon_namespace)
+        sections, split_table = self._get_archive_sections()
+        splitarchive.write_archive(dest, metadata, sections)
+
+    @classmethod
+    def from_archive(cls, src, taxon_namespace=None, use_mmap=True):
+        """
+        Returns a new |SplitDistribution| instance restored from a binary
+        archive written by :meth:`SplitDistribution.write_archive`.
+
+        Parameters
+        ----------
+        src : string or file-like object
+            Path or (binary) file-like object from which to read.
+        taxon_namespace : |TaxonNamespace|
+            If given, taxa in the archive will be mapped to those in this
+            namespace (which must list them in the same order); otherwise a
+            new namespace will be created.
+        use_mmap : bool
+            If |True| (default) and ``src`` is a path, the archive will be
+            memory-mapped rather than read into memory.
+
+        Returns
+        -------
+        s : |SplitDistribution|
+            The restored distribution.
+        """
+        with splitarchive.SplitArchive(src, use_mmap=use_mmap) as archive:
+            archive.validate_object_type("SplitDistribution")
+            taxon_namespace = splitarchive.reconcile_taxon_namespace(
+                    archive.metadata["taxon_labels"],
+                    taxon_namespace if taxon_namespace is not None else taxonmodel.TaxonNamespace())
+            sd, split_table = cls._new_from_archive(archive, archive.metadata, taxon_namespace)
+        return sd
+
+    def read_archive(self, src, use_mmap=True):
+        """
+        Adds the data in a binary archive written by
+        :meth:`SplitDistribution.write_archive` to this distribution. The
+        taxa of the archive must correspond to those of
+        ``self.taxon_namespace``.
+        """
+        self.update(self.__class__.from_archive(src,
+                taxon_namespace=self.taxon_namespace,
+                use_mmap=use_mmap))
+
+    def _get_archive_metadata(self):
+        return {
+            "ignore_edge_lengths": self.ignore_edge_lengths,
+            "ignore_node_ages": self.ignore_node_ages,
+            "use_tree_weights": self.use_tree_weights,
+            "ultrametricity_precision": self.ultrametricity_precision,
+            "is_force_max_age": self.is_force_max_age,
+            "is_force_min_age": self.is_force_min_age,
+            "taxon_label_age_map": self.taxon_label_age_map,
+            "total_trees_counted": self.total_trees_counted,
+            "sum_of_tree_weights": self.sum_of_tree_weights,
+            "tree_rooting_types_counted": sorted(self.tree_rooting_types_counted),
+            "is_rooted": self._is_rooted,
+            "num_counted_splits": len(self.split_counts),
+            }
+
+    def _get_archive_sections(self, prefix="", additional_splits=None):
+        # The split table lists the splits counted by this distribution,
+        # followed by any in ``additional_splits`` not already listed, so
+        # that clients can refer to splits by their index in the table.
+        split_table = list(self.split_counts)
+        if additional_splits:
+            split_table_set = set(split_table)
+            for split in additional_splits:
+                if split not in split_table_set:
+                    split_table.append(split)
+                    split_table_set.add(split)
+        num_counted_splits = len(self.split_counts)
+        num_words = splitarchive.num_bitmask_words(len(self.taxon_namespace))
+        sections = [
+            (prefix + "split_bitmasks", "Q", splitarchive.pack_bitmasks(split_table, num_words)),
+            (prefix + "split_counts", "d", [float(self.split_counts[split]) for split in split_table[:num_counted_splits]]),
+            ]
+        for attr in ("split_edge_lengths", "split_node_ages"):
+            d = getattr(self, attr)
+            values, offsets = splitarchive.pack_list_offsets(d.get(split, ()) for split in split_table[:num_counted_splits])
+            sections.append((prefix + attr, "d", splitarchive.pack_float_values(values)))
+            sections.append((prefix + attr + "_offsets", "Q", offsets))
+        return sections, split_table
+
+    @classmethod
+    def _new_from_archive(cls, archive, metadata, taxon_namespace, prefix=""):
+        sd = cls(taxon_namespace=taxon_namespace,
+                ignore_edge_lengths=metadata["ignore_edge_lengths"],
+                ignore_node_ages=metadata["ignore_node_ages"],
+                use_tree_weights=metadata["use_tree_weights"],
+                ultrametricity_precision=metadata["ultrametricity_precision"],
+                is_force_max_age=metadata["is_force_max_age"],
+                taxon_label_age_map=metadata["taxon_label_age_map"])
+        sd.is_force_min_age = metadata["is_force_min_age"]
+        sd.total_trees_counted = metadata["total_trees_counted"]
+        sd.sum_of_tree_weights = metadata["sum_of_tree_weights"]
+        sd.tree_rooting_types_counted = set(metadata["tree_rooting_types_counted"])
+        sd._is_rooted = metadata["is_rooted"]
+        num_words = splitarchive.num_bitmask_words(len(archive.metadata["taxon_labels"]))
+        split_table = archive.get_bitmasks(prefix + "split_bitmasks", num_words)
+        counted_splits = split_table[:metadata["num_counted_splits"]]
+        sd.split_counts.update(zip(counted_splits, archive.get_values(prefix + "split_counts")))
+        for attr in ("split_edge_lengths", "split_node_ages"):
+            d = getattr(sd, attr)
+            values = archive.get_float_values(prefix + attr)
+            offsets = archive.get_values(prefix + attr + "_offsets")
+            for idx, split in enumerate(counted_splits):
+                if offsets[idx+1] > offsets[idx]:
+                    d[split] = values[offsets[idx]:offsets[idx+1]]
+        return sd, split_table
+
     ###########################################################################
     ### Basic Information Access
 
@@ -1558,25 +1690,11 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
             yield support
 
     def calc_split_edge_length_summaries(self):
-        self._split_edge_length_summaries = {}
-        for split, elens in self.split_edge_lengths.items():
-            if not elens:
-                continue
-            try:
-                self._split_edge_length_summaries[split] = statistics.summarize(elens)
-            except ValueError:
-                pass
+        self._split_edge_length_summaries = statistics.summarize_many(self.split_edge_lengths)
         return self._split_edge_length_summaries
 
     def calc_split_node_age_summaries(self):
-        self._split_node_age_summaries = {}
-        for split, ages in self.split_node_ages.items():
-            if not ages:
-                continue
-            try:
-                self._split_node_age_summaries[split] = statistics.summarize(ages)
-            except ValueError:
-                pass
+        self._split_node_age_summaries = statistics.summarize_many(self.split_node_ages)
         return self._split_node_age_summaries
 
     def _set_node_age(self, nd):
@@ -2481,6 +2599,116 @@ class TreeArray(
         """
         return basemodel.MultiReadable._read_from(self, **kwargs)
 
+    ##############################################################################
+    ## Binary Archive
+
+    def write_archive(self, dest):
+        """
+        Writes the trees in this collection, together with their split
+        distribution, to a compact binary archive. This can be restored using
+        :meth:`TreeArray.from_archive` or merged into an existing collection
+        using :meth:`TreeArray.read_archive`, allowing, e.g., summaries over
+        many runs to be checkpointed, resumed and combined without
+        reprocessing the source trees.
+
+        Parameters
+        ----------
+        dest : string or file-like object
+            Path or (binary) file-like object to which to write.
+        """
+        metadata = {
+            "object_type": "TreeArray",
+            "taxon_labels": splitarchive.taxon_namespace_labels(self.taxon_namespace),
+            "is_rooted_trees": self._is_rooted_trees,
+            "ignore_edge_lengths": self.ignore_edge_lengths,
+            "ignore_node_ages": self.ignore_node_ages,
+            "use_tree_weights": self.use_tree_weights,
+            "default_edge_length_value": self.default_edge_length_value,
+            "split_distribution": self._split_distribution._get_archive_metadata(),
+            }
+        sections, split_table = self._split_distribution._get_archive_sections(
+                prefix="split_distribution.",
+                additional_splits=(split for splits in self._tree_split_bitmasks for split in splits))
+        split_index_map = dict((split, idx) for idx, split in enumerate(split_table))
+        tree_split_indexes, tree_offsets = splitarchive.pack_list_offsets(
+                [split_index_map[split] for split in splits] for splits in self._tree_split_bitmasks)
+        tree_edge_lengths, edge_length_offsets = splitarchive.pack_list_offsets(self._tree_edge_lengths)
+        num_words = splitarchive.num_bitmask_words(len(self.taxon_namespace))
+        sections.extend([
+            ("tree_split_indexes", "Q", tree_split_indexes),
+            ("tree_split_indexes_offsets", "Q", tree_offsets),
+            ("tree_edge_lengths", "d", splitarchive.pack_float_values(tree_edge_lengths)),
+            ("tree_edge_lengths_offsets", "Q", edge_length_offsets),
+            ("tree_leafset_bitmasks", "Q", splitarchive.pack_bitmasks(self._tree_leafset_bitmasks, num_words)),
+            ("tree_weights", "d", [float(w) for w in self._tree_weights]),
+            ])
+        splitarchive.write_archive(dest, metadata, sections)
+
+    @classmethod
+    def from_archive(cls, src, taxon_namespace=None, use_mmap=True):
+        """
+        Returns a new |TreeArray| instance restored from a binary archive
+        written by :meth:`TreeArray.write_archive`.
+
+        Parameters
+        ----------
+        src : string or file-like object
+            Path or (binary) file-like object from which to read.
+        taxon_namespace : |TaxonNamespace|
+            If given, taxa in the archive will be mapped to those in this
+            namespace (which must list them in the same order); otherwise a
+            new namespace will be created.
+        use_mmap : bool
+            If |True| (default) and ``src`` is a path, the archive will be
+            memory-mapped rather than read into memory.
+
+        Returns
+        -------
+        t : |TreeArray|
+            The restored collection.
+        """
+        with splitarchive.SplitArchive(src, use_mmap=use_mmap) as archive:
+            archive.validate_object_type("TreeArray")
+            metadata = archive.metadata
+            taxon_namespace = splitarchive.reconcile_taxon_namespace(
+                    metadata["taxon_labels"],
+                    taxon_namespace if taxon_namespace is not None else taxonmodel.TaxonNamespace())
+            sd_metadata = metadata["split_distribution"]
+            ta = cls(taxon_namespace=taxon_namespace,
+                    is_rooted_trees=metadata["is_rooted_trees"],
+                    ignore_edge_lengths=metadata["ignore_edge_lengths"],
+                    ignore_node_ages=metadata["ignore_node_ages"],
+                    use_tree_weights=metadata["use_tree_weights"],
+                    ultrametricity_precision=sd_metadata["ultrametricity_precision"],
+                    is_force_max_age=sd_metadata["is_force_max_age"],
+                    taxon_label_age_map=sd_metadata["taxon_label_age_map"])
+            ta.default_edge_length_value = metadata["default_edge_length_value"]
+            ta._split_distribution, split_table = SplitDistribution._new_from_archive(
+                    archive,
+                    sd_metadata,
+                    taxon_namespace,
+                    prefix="split_distribution.")
+            for split_indexes in archive.get_lists("tree_split_indexes"):
+                ta._tree_split_bitmasks.append(tuple(split_table[idx] for idx in split_indexes))
+            tree_edge_lengths = archive.get_float_values("tree_edge_lengths")
+            offsets = archive.get_values("tree_edge_lengths_offsets")
+            for idx in range(len(offsets)-1):
+                ta._tree_edge_lengths.append(tuple(tree_edge_lengths[offsets[idx]:offsets[idx+1]]))
+            num_words = splitarchive.num_bitmask_words(len(metadata["taxon_labels"]))
+            ta._tree_leafset_bitmasks.extend(archive.get_bitmasks("tree_leafset_bitmasks", num_words))
+            ta._tree_weights.extend(archive.get_values("tree_weights"))
+        return ta
+
+    def read_archive(self, src, use_mmap=True):
+        """
+        Adds the trees in a binary archive written by
+        :meth:`TreeArray.write_archive` to this collection. The taxa of the
+        archive must correspond to those of ``self.taxon_namespace``.
+        """
+        self.update(self.__class__.from_archive(src,
+                taxon_namespace=self.taxon_namespace,
+                use_mmap=use_mmap))
+
     ##############################################################################
     ## Container (List) Interface
 
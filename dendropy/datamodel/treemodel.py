@@ -2762,6 +2762,29 @@ class Tree(
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        prefetch : bool or int
+            If |True| or a positive integer, then sources given as file paths
+            will be read ahead (up to this many 1MB chunks, or
+            ``dataio.DEFAULT_PREFETCH_CHUNKS`` if |True|) in a background
+            thread while trees from the current source are being parsed.
+        prefetch_hook : function object
+            If prefetching, this will be called (from the background thread)
+            with the file path, the number of bytes read from it so far, and
+            the elapsed time in seconds each time a chunk is read.
+        follow : bool
+            If |True|, then sources given as file paths are followed as they
+            are being written to (e.g., by a running MCMC analysis), in the
+            manner of "``tail -f``": instead of stopping at the end of the
+            data, the yielder waits for more to be appended, parsing and
+            yielding trees as their statements are completed, until the
+            file has not grown for ``follow_timeout`` seconds (if given) or
+            ``stop_following()`` is called on the yielder. Any incomplete
+            statement at that point is discarded.
+        follow_timeout : float
+            See ``follow`` above.
+        follow_sleep_interval : float
+            When following, seconds to wait between checks for more data
+            (default: 0.5).
         \*\*kwargs : keyword arguments
             These will be passed directly to the schema-parser implementation.
 
@@ -4743,8 +4766,10 @@ class Tree(
         if rng is None:
             rng = GLOBAL_RNG
         if len(self.taxon_namespace) == 0:
+            # labels are unique and namespace is empty, so no need to look up
+            # existing taxa
             for i, nd in enumerate(self.leaf_nodes()):
-                nd.taxon = self.taxon_namespace.require_taxon(label=("T%d" % (i+1)))
+                nd.taxon = self.taxon_namespace.new_taxon(label=("T%d" % (i+1)))
         else:
             taxa = [t for t in self.taxon_namespace]
             for i, nd in enumerate(self.leaf_nodes()):
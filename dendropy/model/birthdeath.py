@@ -24,7 +24,6 @@ import sys
 import math
 import collections
 import itertools
-from dendropy.calculate import probability
 from dendropy.utility import GLOBAL_RNG
 from dendropy.utility.error import TreeSimTotalExtinctionException
 from dendropy.utility import constants
@@ -131,21 +130,24 @@ def birth_death_tree(birth_rate, death_rate, birth_rate_sd=0.0, death_rate_sd=0.
         tree.seed_node.death_rate = death_rate
 
     # grow tree
-    leaf_nodes = tree.leaf_nodes()
-    #_LOG.debug("Will generate a tree with no more than %s leaves to get a tree of %s leaves" % (str(gsa_ntax), str(target_num_taxa)))
-    curr_num_leaves = len(leaf_nodes)
+    # Edge lengths are not accumulated as the tree grows: instead, the times at
+    # which each lineage arose and ended are recorded, and the length of its
+    # edge is only set when it speciates, goes extinct, or the simulation
+    # ends. The event rates of the current lineages (leaves) are tracked in a
+    # Fenwick tree, so that the lineage and event of each step can be selected
+    # in O(log n) time.
+    lineages = _BirthDeathLineages(birth_rate, death_rate)
+    for nd in tree.leaf_nodes():
+        lineages.add(nd, 0.0)
     total_time = 0
-    # for the GSA simulations targetted_time_slices is a list of tuple
-    #   the first element in the tuple is the duration of the amount
-    #   that the simulation spent at the (targetted) number of taxa
-    #   and a list of edge information. The list of edge information includes
-    #   a list of terminal edges in the tree and the length for that edge
-    #   that marks the beginning of the time slice that corresponds to the
-    #   targetted number of taxa.
-
+    # for the GSA simulations targetted_time_slices is a list of tuples: the
+    # first element in the tuple is the duration of the amount that the
+    # simulation spent at the (targetted) number of taxa, and the second is
+    # the time at which this began.
     targetted_time_slices = []
     extinct_tips = []
     while True:
+        curr_num_leaves = lineages.num_lineages
         if gsa_ntax is None:
             assert (max_time is not None)
             if total_time >= max_time:
@@ -153,22 +155,8 @@ def birth_death_tree(birth_rate, death_rate, birth_rate_sd=0.0, death_rate_sd=0.
         elif curr_num_leaves >= gsa_ntax:
             break
 
-        # get vector of birth/death probabilities, and
-        # associate with nodes/events
-        event_rates = []
-        event_nodes = []
-        for nd in leaf_nodes:
-            if not hasattr(nd, 'birth_rate'):
-                nd.birth_rate = birth_rate
-            if not hasattr(nd, 'death_rate'):
-                nd.death_rate = death_rate
-            event_rates.append(nd.birth_rate)
-            event_nodes.append((nd, True)) # birth event = True
-            event_rates.append(nd.death_rate)
-            event_nodes.append((nd, False)) # birth event = False; i.e. death
-
         # get total probability of any birth/death
-        rate_of_any_event = sum(event_rates)
+        rate_of_any_event = lineages.total_rate()
 
         # waiting time based on above probability
         #_LOG.debug("rate_of_any_event = %f" % (rate_of_any_event))
@@ -176,52 +164,31 @@ def birth_death_tree(birth_rate, death_rate, birth_rate_sd=0.0, death_rate_sd=0.
         #_LOG.debug("Drew waiting time of %f from hazard parameter of %f" % (waiting_time, rate_of_any_event))
 
         if (gsa_ntax is not None) and (curr_num_leaves == target_num_taxa):
-            edge_and_start_length = []
-            for nd in leaf_nodes:
-                e = nd.edge
-                edge_and_start_length.append((e, e.length))
-            targetted_time_slices.append((waiting_time, edge_and_start_length))
-            #_LOG.debug("Recording slice with %d edges" % len(edge_and_start_length))
+            targetted_time_slices.append((waiting_time, total_time))
             if terminate_at_full_tree:
                 break
 
-        # add waiting time to nodes
-        for nd in leaf_nodes:
-            try:
-                nd.edge.length += waiting_time
-            except TypeError:
-                nd.edge.length = waiting_time
-        #_LOG.debug("Next waiting_time = %f" % waiting_time)
         total_time += waiting_time
 
         # if event occurs within time constraints
         if max_time is None or total_time <= max_time:
 
-            # normalize probability
-            for i in range(len(event_rates)):
-                event_rates[i] = event_rates[i]/rate_of_any_event
-
             # select node/event and process
-            nd, birth_event = probability.weighted_choice(event_nodes, event_rates, rng=rng)
-            leaf_nodes.remove(nd)
-            curr_num_leaves -= 1
+            nd, birth_event = lineages.sample(rng)
+            lineages.remove(nd, total_time)
             if birth_event:
                 #_LOG.debug("Speciation")
                 c1 = nd.new_child()
                 c2 = nd.new_child()
-                c1.edge.length = 0
-                c2.edge.length = 0
                 c1.birth_rate = nd.birth_rate + rng.gauss(0, birth_rate_sd)
                 c1.death_rate = nd.death_rate + rng.gauss(0, death_rate_sd)
                 c2.birth_rate = nd.birth_rate + rng.gauss(0, birth_rate_sd)
                 c2.death_rate = nd.death_rate + rng.gauss(0, death_rate_sd)
-                leaf_nodes.append(c1)
-                leaf_nodes.append(c2)
-                curr_num_leaves += 2
+                lineages.add(c1, total_time)
+                lineages.add(c2, total_time)
             else:
                 #_LOG.debug("Extinction")
-                if curr_num_leaves > 0:
-                    #_LOG.debug("Will delete " + str(id(nd)) + " with parent = " + str(id(nd.parent_node)))
+                if lineages.num_lineages > 0:
                     extinct_tips.append(nd)
                 else:
                     if (gsa_ntax is not None):
@@ -230,16 +197,11 @@ def birth_death_tree(birth_rate, death_rate, birth_rate_sd=0.0, death_rate_sd=0.
                     if not repeat_until_success:
                         raise TreeSimTotalExtinctionException()
                     # We are going to basically restart the simulation because the tree has gone extinct (without reaching the specified ntax)
-                    leaf_nodes = [tree.seed_node]
-                    curr_num_leaves = 1
-                    for nd in tree.seed_node.child_nodes():
-                        tree.prune_subtree(nd, suppress_unifurcations=False)
+                    tree.seed_node.clear_child_nodes()
+                    lineages = _BirthDeathLineages(birth_rate, death_rate)
+                    lineages.add(tree.seed_node, 0.0)
                     extinct_tips = []
                     total_time = 0
-            assert(curr_num_leaves == len(leaf_nodes))
-            #_LOG.debug("Current tree \n%s" % (tree.as_ascii_plot(plot_metric='length', show_internal_node_labels=True)))
-    #tree._debug_tree_is_valid()
-    #_LOG.debug("Terminated with %d leaves (%d, %d  according to len(leaf_nodes))" % (curr_num_leaves, len(leaf_nodes), len(tree.leaf_nodes())))
     if gsa_ntax is not None:
         total_duration_at_target_n_tax = 0.0
         for i in targetted_time_slices:
@@ -251,48 +213,16 @@ def birth_death_tree(birth_rate, death_rate, birth_rate_sd=0.0, death_rate_sd=0.
             r -= i[0]
             if r < 0.0:
                 selected_slice = i
+                break
         assert(selected_slice is not None)
         #_LOG.debug("Selected time slice index %d" % n)
-        edges_at_slice = selected_slice[1]
-        last_waiting_time = selected_slice[0]
-        for e, prev_length in edges_at_slice:
-            daughter_nd = e.head_node
-            for nd in daughter_nd.child_nodes():
-                tree.prune_subtree(nd, suppress_unifurcations=False)
-                #_LOG.debug("After pruning %s:\n%s" % (str(id(nd)), tree.as_ascii_plot(plot_metric='length', show_internal_node_labels=True)))
-                try:
-                    extinct_tips.remove(nd)
-                except:
-                    pass
-            try:
-                extinct_tips.remove(daughter_nd)
-            except:
-                pass
-            e.length = prev_length + last_waiting_time
-
-
-
-#     tree._debug_tree_is_valid()
-#     for nd in extinct_tips:
-#         _LOG.debug("Will be deleting " + str(id(nd)))
-
-    for nd in extinct_tips:
-        bef = len(tree.leaf_nodes())
-        while (nd.parent_node is not None) and (len(nd.parent_node.child_nodes()) == 1):
-            nd = nd.parent_node
-#         _LOG.debug("Deleting " + str(nd.__dict__) + '\n' + str(nd.edge.__dict__))
-#         for n, pnd in enumerate(tree.postorder_node_iter()):
-#             _LOG.debug("%d %s" % (n, repr(pnd)))
-#        _LOG.debug("Before prune of %s:\n%s" % (str(id(nd)), tree.as_ascii_plot(plot_metric='length', show_internal_node_labels=True)))
-        if nd.parent_node:
-            tree.prune_subtree(nd, suppress_unifurcations=False)
-#         _LOG.debug("Deleted " + str(nd.__dict__))
-#         for n, pnd in enumerate(tree.postorder_node_iter()):
-#             _LOG.debug("%d %s" % (n, repr(pnd)))
-#         tree._debug_tree_is_valid()
+        last_waiting_time, slice_start_time = selected_slice
+        lineages.truncate(tree, slice_start_time, slice_start_time + last_waiting_time)
+        extinct_tips = [nd for nd in extinct_tips if lineages.end_times[nd] <= slice_start_time]
+    else:
+        lineages.finalize(total_time)
+    _prune_extinct_lineages(tree, extinct_tips)
     tree.suppress_unifurcations()
-#    tree._debug_tree_is_valid()
-#    _LOG.debug("After deg2suppression:\n%s" % (tree.as_ascii_plot(plot_metric='length', show_internal_node_labels=True)))
 
     if kwargs.get("assign_taxa", True):
         tree.randomly_assign_taxa(create_required_taxa=True, rng=rng)
@@ -302,6 +232,205 @@ def birth_death_tree(birth_rate, death_rate, birth_rate_sd=0.0, death_rate_sd=0.
     return tree
 
 
+class _LineageEventSampler(object):
+    """
+    Maintains the (combined birth and death) event rates of a set of lineages
+    in a Fenwick (binary indexed) tree, so that lineages can be added, removed,
+    and selected with probability proportional to their rates in O(log n)
+    time. Lineages retain the order in which they were added, so that
+    selection is equivalent to a linear scan through the list of lineages
+    (with lineages removed from the list as they end, and new lineages
+    appended to it).
+    """
+
+    def __init__(self):
+        self._nodes = []
+        self._rates = []
+        self._tree = [0.0] # 1-based
+        self._node_slots = {}
+        self.num_lineages = 0
+
+    def __len__(self):
+        return self.num_lineages
+
+    def nodes(self):
+        return [nd for nd in self._nodes if nd is not None]
+
+    def _prefix_sum(self, i):
+        t = self._tree
+        total = 0.0
+        while i > 0:
+            total += t[i]
+            i &= i - 1
+        return total
+
+    def total_rate(self):
+        return self._prefix_sum(len(self._nodes))
+
+    def add(self, nd, rate):
+        t = self._tree
+        i = len(self._nodes) + 1
+        # new cell covers (i - lowbit(i), i]: sum its child cells
+        value = rate
+        j = i - 1
+        stop = i - (i & -i)
+        while j > stop:
+            value += t[j]
+            j &= j - 1
+        t.append(value)
+        self._node_slots[nd] = len(self._nodes)
+        self._nodes.append(nd)
+        self._rates.append(rate)
+        self.num_lineages += 1
+
+    def remove(self, nd):
+        slot = self._node_slots.pop(nd)
+        rate = self._rates[slot]
+        self._nodes[slot] = None
+        self._rates[slot] = 0.0
+        self.num_lineages -= 1
+        if len(self._nodes) > 2 * self.num_lineages + 64:
+            self._compact()
+            return
+        t = self._tree
+        i = slot + 1
+        n = len(t)
+        while i < n:
+            t[i] -= rate
+            i += i & -i
+
+    def _compact(self):
+        nodes = []
+        rates = []
+        for nd, rate in zip(self._nodes, self._rates):
+            if nd is not None:
+                nodes.append(nd)
+                rates.append(rate)
+        t = [0.0] + rates
+        n = len(rates)
+        for i in range(1, n + 1):
+            j = i + (i & -i)
+            if j <= n:
+                t[j] += t[i]
+        self._nodes = nodes
+        self._rates = rates
+        self._tree = t
+        self._node_slots = dict((nd, idx) for idx, nd in enumerate(nodes))
+
+    def sample(self, rng):
+        """
+        Returns a lineage selected with probability proportional to its rate,
+        and the offset of the random draw into the rate of the lineage.
+        """
+        t = self._tree
+        n = len(self._nodes)
+        target = rng.random() * self.total_rate()
+        pos = 0
+        bit = 1 << (n.bit_length() - 1)
+        while bit:
+            i = pos + bit
+            if i <= n and t[i] <= target:
+                pos = i
+                target -= t[i]
+            bit >>= 1
+        if pos >= n or self._nodes[pos] is None:
+            # floating-point error has taken us past the end of the last
+            # lineage, or into a removed one
+            pos = min(pos, n - 1)
+            while self._nodes[pos] is None:
+                pos -= 1
+            target = self._rates[pos]
+        return self._nodes[pos], target
+
+class _BirthDeathLineages(object):
+    """
+    The current lineages of a birth-death process, with the times at which
+    they (and all lineages since the start of the process) arose and ended.
+    """
+
+    def __init__(self, birth_rate, death_rate):
+        self.birth_rate = birth_rate
+        self.death_rate = death_rate
+        self.sampler = _LineageEventSampler()
+        self.start_times = {}
+        self.end_times = {}
+        # Time from which edge length is measured, allowing for any existing
+        # length of the edge of a lineage (e.g., a leaf of a tree passed in to
+        # be grown further).
+        self.origins = {}
+
+    def _get_num_lineages(self):
+        return self.sampler.num_lineages
+    num_lineages = property(_get_num_lineages)
+
+    def total_rate(self):
+        return self.sampler.total_rate()
+
+    def add(self, nd, time):
+        if not hasattr(nd, 'birth_rate'):
+            nd.birth_rate = self.birth_rate
+        if not hasattr(nd, 'death_rate'):
+            nd.death_rate = self.death_rate
+        self.start_times[nd] = time
+        self.origins[nd] = time - (nd.edge.length or 0.0)
+        self.sampler.add(nd, nd.birth_rate + nd.death_rate)
+
+    def remove(self, nd, time):
+        self.sampler.remove(nd)
+        self.end_times[nd] = time
+        nd.edge.length = time - self.origins[nd]
+
+    def sample(self, rng):
+        """
+        Returns a (node, is_birth_event) tuple.
+        """
+        nd, offset = self.sampler.sample(rng)
+        return nd, offset < nd.birth_rate
+
+    def finalize(self, time):
+        """
+        Sets the edge lengths of the current lineages, ending at ``time``.
+        """
+        for nd in self.sampler.nodes():
+            nd.edge.length = time - self.origins[nd]
+
+    def truncate(self, tree, slice_start_time, slice_end_time):
+        """
+        Discards all events after ``slice_start_time``, with the lineages
+        present at that time becoming the leaves of ``tree``, their edges
+        ending at ``slice_end_time``.
+        """
+        to_visit = [tree.seed_node]
+        while to_visit:
+            nd = to_visit.pop()
+            if nd in self.start_times \
+                    and self.start_times[nd] <= slice_start_time \
+                    and self.end_times.get(nd, slice_end_time) > slice_start_time:
+                nd.clear_child_nodes()
+                nd.edge.length = slice_end_time - self.origins[nd]
+            else:
+                to_visit.extend(nd._child_nodes)
+
+def _prune_extinct_lineages(tree, extinct_tips):
+    # Removes the maximal subtrees all of whose leaves are in
+    # ``extinct_tips`` in a single postorder pass.
+    extinct_tips = set(extinct_tips)
+    if not extinct_tips:
+        return
+    extinct_nodes = set()
+    for nd in tree.postorder_node_iter():
+        children = nd._child_nodes
+        if not children:
+            if nd in extinct_tips:
+                extinct_nodes.add(nd)
+            continue
+        surviving_children = [ch for ch in children if ch not in extinct_nodes]
+        if not surviving_children:
+            extinct_nodes.add(nd)
+        elif len(surviving_children) < len(children):
+            for ch in [ch for ch in children if ch in extinct_nodes]:
+                nd.remove_child(ch)
+
 def discrete_birth_death_tree(birth_rate, death_rate, birth_rate_sd=0.0, death_rate_sd=0.0, **kwargs):
     """
     Returns a birth-death tree with birth rate specified by ``birth_rate``, and
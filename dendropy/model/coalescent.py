@@ -22,6 +22,7 @@ framework.
 """
 
 import math
+import bisect
 import dendropy
 from dendropy.utility import GLOBAL_RNG
 from dendropy.utility import constants
@@ -192,7 +193,7 @@ def coalesce_nodes(nodes,
     exhausted or if any draw of ``t`` exceeds ``period``, if ``period`` is
     given or when there is only one node left.
 
-    As each coalescent event occurs, *all* nodes have their edges
+    As each coalescent event occurs, the coalescing nodes have their edges
     extended to the point of the coalescent event. In the case of
     constrained coalescence, all uncoalesced nodes have their edges
     extended to the end of the period (coalesced nodes have the edges
@@ -246,6 +247,13 @@ def coalesce_nodes(nodes,
     # make a shallow copy of the node list
     nodes = list(nodes)
 
+    # Rather than stretching out the edges of all the nodes in the pool at
+    # each coalescent event, we track the time (since the start of the
+    # period) at which each node entered the pool, and only extend its edge
+    # once, when it coalesces or when the period ends.
+    entry_times = [0.0] * len(nodes)
+    elapsed_time = 0.0
+
     # start tracking the time remaining
     time_remaining = period
 
@@ -267,35 +275,39 @@ def coalesce_nodes(nodes,
 
         # if no time_remaining is given (i.e, we want to coalesce till
         # there is only one gene left) or, if we are working under the
-        # constrained coalescent, if the time to the next coalescence
+        # constrained coalescent, if the time to the next coalescent
         # event is not longer than the time_remaining
         if time_remaining is None or tmrca <= time_remaining:
 
-            # stretch out the edges of all the nodes to this time
-            for node in nodes:
-                if node.edge.length is None:
-                    node.edge.length = 0.0
-                node.edge.length = node.edge.length + tmrca
+            elapsed_time += tmrca
 
             # pick two nodes to coalesce at random
-            to_coalesce = rng.sample(nodes, 2)
+            num_nodes = len(nodes)
+            idx1 = rng.randrange(num_nodes)
+            idx2 = rng.randrange(num_nodes - 1)
+            if idx2 >= idx1:
+                idx2 += 1
 
             # create the new ancestor of these nodes
             new_ancestor = new_node()
 
-            # add the nodes as child nodes of the new node, their
-            # common ancestor, and set the ancestor's edge length
-            new_ancestor.add_child(to_coalesce[0])
-            new_ancestor.add_child(to_coalesce[1])
+            # stretch out the edges of the nodes to this time, and add them
+            # as child nodes of the new node, their common ancestor
+            for idx in (idx1, idx2):
+                _extend_pooled_node_edge(nodes[idx], elapsed_time - entry_times[idx])
+                new_ancestor.add_child(nodes[idx])
             new_ancestor.edge.length = 0.0
 
-            # remove the nodes that have coalesced from the pool of
-            # nodes
-            nodes.remove(to_coalesce[0])
-            nodes.remove(to_coalesce[1])
-
-            # add the ancestor to the pool of nodes
-            nodes.append(new_ancestor)
+            # replace the nodes that have coalesced in the pool of nodes
+            # with the ancestor (swapping the last node in the pool into the
+            # vacated position)
+            lo_idx, hi_idx = min(idx1, idx2), max(idx1, idx2)
+            nodes[lo_idx] = new_ancestor
+            entry_times[lo_idx] = elapsed_time
+            nodes[hi_idx] = nodes[-1]
+            entry_times[hi_idx] = entry_times[-1]
+            nodes.pop()
+            entry_times.pop()
 
             # adjust the time_remaining left to coalesce
             if time_remaining is not None:
@@ -308,14 +320,20 @@ def coalesce_nodes(nodes,
     # correct height, with the edges 'lining up' at the end of
     # coalescent period
     if time_remaining is not None and time_remaining > 0:
-        for node in nodes:
-            if node.edge.length is None:
-                node.edge.length = 0.0
-            node.edge.length = node.edge.length + time_remaining
+        elapsed_time += time_remaining
+    for node, entry_time in zip(nodes, entry_times):
+        _extend_pooled_node_edge(node, elapsed_time - entry_time)
 
     # return the list of nodes that have not coalesced
     return nodes
 
+def _extend_pooled_node_edge(node, length):
+    if length > 0:
+        if node.edge.length is None:
+            node.edge.length = length
+        else:
+            node.edge.length = node.edge.length + length
+
 def node_waiting_time_pairs(tree, ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION):
     """
     Returns a list of tuples of (nodes, coalescent interval time) on the tree.
@@ -421,6 +439,232 @@ def log_probability_of_coalescent_tree(tree, haploid_pop_size, ultrametricity_pr
     return log_probability_of_coalescent_frames(extract_coalescent_frames(tree),
             haploid_pop_size)
 
+class CoalescentFrameArray(object):
+    """
+    The coalescent frames of multiple trees (e.g., a posterior sample of gene
+    trees), stored as a ragged array for evaluating coalescent likelihoods of
+    all the trees over grids of population size parameters.
+
+    The coalescence events of all trees are stored in flat lists, in order of
+    increasing age within each tree, with the events of tree ``i`` found at
+    positions ``offsets[i]`` to ``offsets[i+1] - 1``:
+
+        ``coalescence_ages``
+            The age of each coalescence event.
+        ``waiting_times``
+            The time between each coalescence event and the previous (more
+            recent) one, or the present for the first one.
+        ``num_lineages``
+            The number of lineages present during the waiting time before each
+            event.
+
+    The node ages of each tree are calculated only once, when the tree is
+    added, and each tree is reduced to the sufficient statistics needed to
+    evaluate its likelihood under a given population size in constant time
+    (or in time proportional to the number of epochs, for piecewise-constant
+    population sizes).
+    """
+
+    def __init__(self,
+            trees=None,
+            ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION):
+        """
+
+        Parameters
+        ----------
+        trees : iterable of |Tree| objects
+            Trees to add.
+        ultrametricity_precision : float
+            Precision of the ultrametricity validation when calculating the
+            node ages of the trees (see :func:`extract_coalescent_frames`).
+        """
+        self.ultrametricity_precision = ultrametricity_precision
+        self.coalescence_ages = []
+        self.waiting_times = []
+        self.num_lineages = []
+        self.offsets = [0]
+        self.num_leaves = []
+        self._num_coalesced_lineages = []
+        self._constant_size_statistics = []
+        self._epoch_statistics_cache = None
+        if trees is not None:
+            self.add_trees(trees)
+
+    def __len__(self):
+        return len(self.num_leaves)
+
+    def add_tree(self, tree):
+        """
+        Adds the coalescent frames of ``tree``.
+        """
+        tree.calc_node_ages(ultrametricity_precision=self.ultrametricity_precision)
+        events = []
+        num_leaves = 0
+        for nd in tree.postorder_node_iter():
+            num_children = len(nd._child_nodes)
+            if num_children == 0:
+                num_leaves += 1
+            elif num_children > 1:
+                events.append((nd.age, num_children - 1))
+        events.sort(key=lambda x: x[0])
+        num_lineages = num_leaves
+        prev_age = 0.0
+        num_events = 0
+        sum_of_log_rates = 0.0
+        sum_of_scaled_times = 0.0
+        for age, num_coalesced_lineages in events:
+            k2 = (num_lineages * (num_lineages - 1)) / 2.0
+            waiting_time = age - prev_age
+            self.coalescence_ages.append(age)
+            self.waiting_times.append(waiting_time)
+            self.num_lineages.append(num_lineages)
+            self._num_coalesced_lineages.append(num_coalesced_lineages)
+            num_events += 1
+            sum_of_log_rates += math.log(k2)
+            sum_of_scaled_times += k2 * waiting_time
+            num_lineages -= num_coalesced_lineages
+            prev_age = age
+        self.offsets.append(len(self.coalescence_ages))
+        self.num_leaves.append(num_leaves)
+        self._constant_size_statistics.append((num_events, sum_of_log_rates, sum_of_scaled_times))
+        self._epoch_statistics_cache = None
+
+    def add_trees(self, trees):
+        """
+        Adds the coalescent frames of each tree in ``trees``.
+        """
+        for tree in trees:
+            self.add_tree(tree)
+
+    def frames(self, tree_index):
+        """
+        Returns the coalescent frames of the tree with index ``tree_index`` as
+        a dictionary, with key = number of lineages, and value = waiting time
+        for a coalescence event, as :func:`extract_coalescent_frames`.
+        """
+        start, end = self.offsets[tree_index], self.offsets[tree_index+1]
+        return dict(zip(self.num_lineages[start:end], self.waiting_times[start:end]))
+
+    def tree_coalescence_ages(self, tree_index):
+        """
+        Returns the list of ages of the coalescence events of the tree with
+        index ``tree_index``, sorted from youngest to oldest.
+        """
+        return self.coalescence_ages[self.offsets[tree_index]:self.offsets[tree_index+1]]
+
+    def num_lineages_at(self, tree_index, age):
+        """
+        Returns the number of lineages on the tree with index ``tree_index`` at
+        time ``age`` before the present (with coalescence events at exactly
+        ``age`` counted as having occurred).
+        """
+        start, end = self.offsets[tree_index], self.offsets[tree_index+1]
+        idx = bisect.bisect_right(self.coalescence_ages, age, start, end)
+        if idx == start:
+            return self.num_leaves[tree_index]
+        return self.num_lineages[idx-1] - self._num_coalesced_lineages[idx-1]
+
+    def log_probabilities(self, haploid_pop_sizes):
+        """
+        Returns the log probabilities of the coalescent frames of all trees
+        under a constant (haploid) population size, for each of the sizes in
+        ``haploid_pop_sizes``, as given by
+        :func:`log_probability_of_coalescent_frames`.
+
+        Parameters
+        ----------
+        haploid_pop_sizes : iterable of float
+            Grid of population sizes to evaluate.
+
+        Returns
+        -------
+        p : list of lists of float
+            A list, with one element for each tree, of lists with the log
+            probability of the tree under each population size.
+        """
+        inverse_sizes = [1.0 / v for v in haploid_pop_sizes]
+        log_sizes = [math.log(v) for v in haploid_pop_sizes]
+        results = []
+        for num_events, sum_of_log_rates, sum_of_scaled_times in self._constant_size_statistics:
+            results.append([sum_of_log_rates - num_events * log_size - sum_of_scaled_times * inverse_size
+                    for log_size, inverse_size in zip(log_sizes, inverse_sizes)])
+        return results
+
+    def _get_epoch_statistics(self, change_ages):
+        key = tuple(change_ages)
+        if self._epoch_statistics_cache is not None and self._epoch_statistics_cache[0] == key:
+            return self._epoch_statistics_cache[1]
+        for idx, change_age in enumerate(change_ages):
+            if change_age < 0 or (idx > 0 and change_age <= change_ages[idx-1]):
+                raise ValueError("Ages of population size changes must be non-negative and strictly increasing: {}".format(change_ages))
+        num_epochs = len(change_ages) + 1
+        epoch_statistics = []
+        for tree_index in range(len(self)):
+            event_counts = [0] * num_epochs
+            scaled_times = [0.0] * num_epochs
+            epoch = 0
+            prev_age = 0.0
+            for idx in range(self.offsets[tree_index], self.offsets[tree_index+1]):
+                num_lineages = self.num_lineages[idx]
+                k2 = (num_lineages * (num_lineages - 1)) / 2.0
+                age = self.coalescence_ages[idx]
+                while epoch < num_epochs - 1 and change_ages[epoch] <= age:
+                    scaled_times[epoch] += k2 * (change_ages[epoch] - prev_age)
+                    prev_age = change_ages[epoch]
+                    epoch += 1
+                scaled_times[epoch] += k2 * (age - prev_age)
+                event_counts[epoch] += 1
+                prev_age = age
+            epoch_statistics.append((self._constant_size_statistics[tree_index][1], event_counts, scaled_times))
+        self._epoch_statistics_cache = (key, epoch_statistics)
+        return epoch_statistics
+
+    def log_probabilities_piecewise_constant(self, change_ages, haploid_pop_sizes):
+        """
+        Returns the log probabilities of the coalescent frames of all trees
+        under piecewise-constant (haploid) population sizes (i.e., a skyline),
+        for each set of sizes in ``haploid_pop_sizes``.
+
+        Parameters
+        ----------
+        change_ages : list of float
+            Ages (i.e., times before the present) at which the population size
+            changes, in strictly increasing order. These define
+            ``len(change_ages) + 1`` epochs, with epoch ``i`` running from
+            ``change_ages[i-1]`` (or the present, for the first) up to, but not
+            including, ``change_ages[i]`` (or without limit, for the last).
+        haploid_pop_sizes : iterable of lists of float
+            Grid of population sizes to evaluate, with each element being a
+            list of the population size in each epoch, starting with the most
+            recent.
+
+        Returns
+        -------
+        p : list of lists of float
+            A list, with one element for each tree, of lists with the log
+            probability of the tree under each set of population sizes.
+        """
+        change_ages = list(change_ages)
+        num_epochs = len(change_ages) + 1
+        epoch_statistics = self._get_epoch_statistics(change_ages)
+        inverse_sizes = []
+        log_sizes = []
+        for pop_sizes in haploid_pop_sizes:
+            if len(pop_sizes) != num_epochs:
+                raise ValueError("Expecting {} population sizes but found {}: {}".format(num_epochs, len(pop_sizes), pop_sizes))
+            inverse_sizes.append([1.0 / v for v in pop_sizes])
+            log_sizes.append([math.log(v) for v in pop_sizes])
+        results = []
+        for sum_of_log_rates, event_counts, scaled_times in epoch_statistics:
+            tree_results = []
+            for epoch_log_sizes, epoch_inverse_sizes in zip(log_sizes, inverse_sizes):
+                lp = sum_of_log_rates
+                for epoch in range(num_epochs):
+                    lp -= event_counts[epoch] * epoch_log_sizes[epoch] + scaled_times[epoch] * epoch_inverse_sizes[epoch]
+                tree_results.append(lp)
+            results.append(tree_results)
+        return results
+
 ###############################################################################
 ## Tree Simulations
 
@@ -71,6 +71,8 @@ class PhylogeneticIndependentConstrasts(object):
         self._is_fully_analyzed = False
         self._polytomy_strategy = None
         self._character_contrasts = {}
+        self._contrasts_structure = None
+        self._contrasts_result = None
         self._set_polytomy_strategy(polytomy_strategy)
         self.tree = tree
         self.char_matrix = char_matrix
@@ -130,6 +132,8 @@ class PhylogeneticIndependentConstrasts(object):
         self._is_dirty = is_dirty
         if self._is_dirty:
             self._character_contrasts = {}
+            self._contrasts_structure = None
+            self._contrasts_result = None
             self._is_fully_analyzed = False
     is_dirty = property(_get_is_dirty, _set_is_dirty)
 
@@ -152,66 +156,20 @@ class PhylogeneticIndependentConstrasts(object):
         """
         if character_index in self._character_contrasts:
             return self._character_contrasts[character_index]
-        all_results = {}
-        for nd in self._tree.postorder_node_iter():
-            nd_results = {}
-            child_nodes = nd.child_nodes()
-            if len(child_nodes) == 0:
-                nd_results['pic_state_value'] = self._char_matrix[nd.taxon][character_index]
-                nd_results['pic_state_variance'] = None
-                nd_results['pic_contrast_raw'] = None
-                nd_results['pic_contrast_variance'] = None
-                nd_results['pic_contrast_standardized'] = None
-                nd_results['pic_edge_length_error'] = 0.0
-                nd_results['pic_corrected_edge_length'] = nd.edge.length
-            elif len(child_nodes) == 1:
-                # root node?
-                nd_results['pic_state_value'] = None
-                nd_results['pic_state_variance'] = None
-                nd_results['pic_contrast_raw'] = None
-                nd_results['pic_contrast_variance'] = None
-                nd_results['pic_contrast_standardized'] = None
-                nd_results['pic_edge_length_error'] = None
-                nd_results['pic_corrected_edge_length'] = None
-            else:
-                state_vals = []
-                corrected_edge_lens = []
-                actual_edge_lens = []
-                for cnd in child_nodes:
-                    state_vals.append(all_results[cnd._track_id]['pic_state_value'])
-                    actual_edge_lens.append(cnd.edge.length)
-                    if all_results[cnd._track_id]['pic_corrected_edge_length'] is not None:
-                        corrected_edge_lens.append(all_results[cnd._track_id]['pic_corrected_edge_length'])
-                    else:
-                        corrected_edge_lens.append(cnd.edge.length)
-                n = len(state_vals)
-                numerator_fn = lambda i : (1.0/corrected_edge_lens[i]) * state_vals[i]
-                denominator_fn = lambda i  : 1.0/corrected_edge_lens[i]
-                nd_results['pic_state_value'] = \
-                        sum(numerator_fn(i) for i in range(n)) \
-                        / sum(denominator_fn(i) for i in range(n))
-
-                sum_of_child_edges = sum(corrected_edge_lens)
-                prod_of_child_edges = reduce(operator.mul, corrected_edge_lens)
-                nd_results['pic_edge_length_error'] = (  prod_of_child_edges / (sum_of_child_edges) )
-                if nd.edge.length is not None:
-                    nd_results['pic_corrected_edge_length'] = nd.edge.length + nd_results['pic_edge_length_error']
-                else:
-                    nd_results['pic_corrected_edge_length'] = None
-                nd_results['pic_state_variance'] = nd_results['pic_corrected_edge_length']
-
-                if len(child_nodes) != 2:
-                    if self._polytomy_strategy == "ignore":
-                        nd_results['pic_contrast_raw'] = None
-                        nd_results['pic_contrast_standardized'] = None
-                        nd_results['pic_contrast_variance'] = sum_of_child_edges
-                    else:
-                        raise ValueError("Tree is not fully-bifurcating")
+        if self._contrasts_result is None:
+            if self._contrasts_structure is None:
+                # polytomies have already been resolved on our copy of the tree
+                if self._polytomy_strategy == "resolve":
+                    polytomy_strategy = "ignore"
                 else:
-                    nd_results['pic_contrast_raw'] = state_vals[0] - state_vals[1]
-                    nd_results['pic_contrast_standardized'] = nd_results['pic_contrast_raw'] / (sum_of_child_edges ** 0.5)
-                    nd_results['pic_contrast_variance'] = sum_of_child_edges
-
+                    polytomy_strategy = self._polytomy_strategy
+                self._contrasts_structure = PhylogeneticIndependentContrastsStructure(
+                        tree=self._tree,
+                        polytomy_strategy=polytomy_strategy)
+            self._contrasts_result = self._contrasts_structure.contrasts(self._char_matrix)
+        all_results = {}
+        for node_idx, nd in enumerate(self._contrasts_structure.nodes):
+            nd_results = self._contrasts_result.node_statistics(node_idx, character_index)
             nd._track_id = id(nd) # will get cloned
             all_results[nd._track_id] = nd_results
             try:
@@ -254,6 +212,253 @@ class PhylogeneticIndependentConstrasts(object):
                 nd.label = str(nd_results['pic_state_value'])
         return tree
 
+class PhylogeneticIndependentContrastsStructure(object):
+    """
+    Precomputed structure of a tree for calculating Phylogenetic Independent
+    Contrasts (Felsenstein 1985) for all characters of a matrix at once.
+
+    The (corrected) edge lengths, contrast variances, and weights used to
+    estimate ancestral states depend only on the tree, and so are calculated
+    once, when the structure is constructed. Each call to :meth:`contrasts`
+    then requires just a single postorder pass over the nodes of the tree,
+    in which the values of all characters are handled together, and the same
+    structure can be reused for any number of character matrices.
+    """
+
+    def __init__(self, tree, polytomy_strategy=None):
+        """
+
+        Parameters
+        ----------
+        tree : |Tree| object
+            Tree to use. This will not be modified, unless
+            ``polytomy_strategy`` is 'resolve', in which case a copy of it will
+            be made and its polytomies randomly resolved.
+        polytomy_strategy
+            One of: 'error', 'ignore', 'resolve', as for
+            :class:`PhylogeneticIndependentConstrasts`. Defaults to 'error' if
+            not specified or set to None.
+        """
+        if polytomy_strategy is None:
+            polytomy_strategy = "error"
+        polytomy_strategy = polytomy_strategy.lower()
+        if polytomy_strategy not in ["error", "ignore", "resolve"]:
+            raise ValueError("Invalid polytomy strategy: '%s'" % polytomy_strategy)
+        if polytomy_strategy == "resolve":
+            tree = dendropy.Tree(tree)
+            tree.resolve_polytomies()
+        self.tree = tree
+        self.polytomy_strategy = polytomy_strategy
+        self.nodes = []
+        self.leaf_taxa = []
+        self.edge_length_errors = []
+        self.corrected_edge_lengths = []
+        self.contrast_variances = []
+        self._child_indexes = []
+        self._child_weights = []
+        self._has_contrast = []
+        node_indexes = {}
+        for nd in tree.postorder_node_iter():
+            child_indexes = [node_indexes[cnd] for cnd in nd.child_node_iter()]
+            node_indexes[nd] = len(self.nodes)
+            self.nodes.append(nd)
+            self._child_indexes.append(child_indexes)
+            if len(child_indexes) == 0:
+                self.leaf_taxa.append(nd.taxon)
+                self.edge_length_errors.append(0.0)
+                self.corrected_edge_lengths.append(nd.edge.length)
+                self.contrast_variances.append(None)
+                self._child_weights.append(None)
+                self._has_contrast.append(False)
+            elif len(child_indexes) == 1:
+                # root node?
+                self.edge_length_errors.append(None)
+                self.corrected_edge_lengths.append(None)
+                self.contrast_variances.append(None)
+                self._child_weights.append(None)
+                self._has_contrast.append(False)
+            else:
+                corrected_edge_lens = []
+                for cidx, cnd in zip(child_indexes, nd.child_node_iter()):
+                    if self.corrected_edge_lengths[cidx] is not None:
+                        corrected_edge_lens.append(self.corrected_edge_lengths[cidx])
+                    else:
+                        corrected_edge_lens.append(cnd.edge.length)
+                inverse_edge_lens = [1.0/v for v in corrected_edge_lens]
+                sum_of_inverse_edge_lens = sum(inverse_edge_lens)
+                self._child_weights.append([v / sum_of_inverse_edge_lens for v in inverse_edge_lens])
+                sum_of_child_edges = sum(corrected_edge_lens)
+                prod_of_child_edges = reduce(operator.mul, corrected_edge_lens)
+                edge_length_error = prod_of_child_edges / sum_of_child_edges
+                self.edge_length_errors.append(edge_length_error)
+                if nd.edge.length is not None:
+                    self.corrected_edge_lengths.append(nd.edge.length + edge_length_error)
+                else:
+                    self.corrected_edge_lengths.append(None)
+                self.contrast_variances.append(sum_of_child_edges)
+                if len(child_indexes) != 2:
+                    if polytomy_strategy != "ignore":
+                        raise ValueError("Tree is not fully-bifurcating")
+                    self._has_contrast.append(False)
+                else:
+                    self._has_contrast.append(True)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def contrasts(self, char_matrix, character_indexes=None):
+        """
+        Calculates the contrasts and ancestral state estimates for all
+        characters (or those given by ``character_indexes``) of
+        ``char_matrix``, in a single pass over the tree.
+
+        Parameters
+        ----------
+        char_matrix : |ContinuousCharacterMatrix|
+            Source of the data. Any object that maps the |Taxon| objects of the
+            leaves of the tree to sequences of values may also be used.
+        character_indexes : iterable of int
+            Indexes of the characters (columns) to analyze, in the order in
+            which they should appear in the results. If not given, then all
+            characters are analyzed.
+
+        Returns
+        -------
+        r : :class:`PhylogeneticIndependentContrastsResult`
+            The contrasts of the characters.
+        """
+        if character_indexes is not None:
+            character_indexes = list(character_indexes)
+        leaf_states = []
+        for taxon in self.leaf_taxa:
+            values = char_matrix[taxon]
+            if character_indexes is None:
+                leaf_states.append([float(v) for v in values])
+            else:
+                leaf_states.append([float(values[i]) for i in character_indexes])
+        if leaf_states:
+            num_chars = len(leaf_states[0])
+            for states in leaf_states:
+                if len(states) != num_chars:
+                    raise ValueError("Sequences of different lengths: {} and {}".format(num_chars, len(states)))
+        else:
+            num_chars = 0
+        num_nodes = len(self.nodes)
+        state_values = [None] * num_nodes
+        contrasts_raw = [None] * num_nodes
+        contrasts_standardized = [None] * num_nodes
+        leaf_states = iter(leaf_states)
+        for node_idx in range(num_nodes):
+            child_indexes = self._child_indexes[node_idx]
+            weights = self._child_weights[node_idx]
+            if not child_indexes:
+                state_values[node_idx] = next(leaf_states)
+            elif weights is None:
+                continue
+            elif len(child_indexes) == 2:
+                states1 = state_values[child_indexes[0]]
+                states2 = state_values[child_indexes[1]]
+                w1, w2 = weights
+                state_values[node_idx] = [w1 * x1 + w2 * x2 for x1, x2 in zip(states1, states2)]
+                raw = list(map(operator.sub, states1, states2))
+                contrasts_raw[node_idx] = raw
+                scale = 1.0 / (self.contrast_variances[node_idx] ** 0.5)
+                contrasts_standardized[node_idx] = [v * scale for v in raw]
+            else:
+                child_states = [state_values[cidx] for cidx in child_indexes]
+                state_values[node_idx] = [sum(map(operator.mul, weights, xs)) for xs in zip(*child_states)]
+        return PhylogeneticIndependentContrastsResult(
+                structure=self,
+                num_chars=num_chars,
+                state_values=state_values,
+                contrasts_raw=contrasts_raw,
+                contrasts_standardized=contrasts_standardized)
+
+class PhylogeneticIndependentContrastsResult(object):
+    """
+    Contrasts and ancestral state estimates for multiple characters, as
+    calculated by :meth:`PhylogeneticIndependentContrastsStructure.contrasts`.
+
+    Values are given by node index, i.e., in the (postorder) order of the
+    nodes in ``nodes``. The following attributes are lists with a row of
+    values, one per character, for each node, or |None| if the statistic is
+    not defined for the node:
+
+        - ``state_values``
+        - ``contrasts_raw``
+        - ``contrasts_standardized``
+
+    The following attributes are lists with a single value for each node,
+    as the statistics do not depend on the character:
+
+        - ``state_variances``
+        - ``contrast_variances``
+        - ``edge_length_errors``
+        - ``corrected_edge_lengths``
+    """
+
+    def __init__(self,
+            structure,
+            num_chars,
+            state_values,
+            contrasts_raw,
+            contrasts_standardized):
+        self.structure = structure
+        self.num_chars = num_chars
+        self.nodes = structure.nodes
+        self.state_values = state_values
+        self.contrasts_raw = contrasts_raw
+        self.contrasts_standardized = contrasts_standardized
+        self.edge_length_errors = structure.edge_length_errors
+        self.corrected_edge_lengths = structure.corrected_edge_lengths
+        self.contrast_variances = structure.contrast_variances
+        self.state_variances = [v if child_indexes else None
+                for v, child_indexes in zip(self.corrected_edge_lengths, structure._child_indexes)]
+
+    def contrasts_matrix(self, standardized=True):
+        """
+        Returns a list of the (standardized, by default, or raw) contrasts of
+        all nodes for which they are defined, with each row containing the
+        contrasts of all characters at a node.
+        """
+        if standardized:
+            rows = self.contrasts_standardized
+        else:
+            rows = self.contrasts_raw
+        return [row for row in rows if row is not None]
+
+    def node_statistics(self, node_index, character_index):
+        """
+        Returns a dictionary with the statistics of a single character at the
+        node with index ``node_index``, with the same keys as used by
+        :class:`PhylogeneticIndependentConstrasts`:
+
+                - ``pic_state_value``
+                - ``pic_state_variance``
+                - ``pic_contrast_raw``
+                - ``pic_contrast_variance``
+                - ``pic_contrast_standardized``
+                - ``pic_edge_length_error``
+                - ``pic_corrected_edge_length``
+
+        """
+        results = {}
+        for key, rows in (
+                ("pic_state_value", self.state_values),
+                ("pic_contrast_raw", self.contrasts_raw),
+                ("pic_contrast_standardized", self.contrasts_standardized),
+                ):
+            row = rows[node_index]
+            if row is None:
+                results[key] = None
+            else:
+                results[key] = row[character_index]
+        results["pic_state_variance"] = self.state_variances[node_index]
+        results["pic_contrast_variance"] = self.contrast_variances[node_index]
+        results["pic_edge_length_error"] = self.edge_length_errors[node_index]
+        results["pic_corrected_edge_length"] = self.corrected_edge_lengths[node_index]
+        return results
+
 def evolve_continuous_char(node, rng=None, **kwargs):
     """
     Takes a node and a random number generator object, ``rng`` This function
@@ -498,3 +703,278 @@ def _calc_KTB_rates_linear_bounce(starting_rate, duration, roeotroe, rng,  min_r
         min_rate = 0.0
     return _bounce_constrain(starting_rate, r, min_rate, max_rate)
 
+
+##############################################################################
+## Multivariate Brownian motion and Ornstein-Uhlenbeck processes
+
+def _cholesky_decomposition(matrix):
+    """
+    Returns the lower-triangular Cholesky factor of the symmetric positive
+    semi-definite matrix ``matrix`` (a list of lists).
+    """
+    n = len(matrix)
+    factor = [[0.0] * n for i in range(n)]
+    for i in range(n):
+        if len(matrix[i]) != n:
+            raise ValueError("Matrix is not square")
+        for j in range(i + 1):
+            if abs(matrix[i][j] - matrix[j][i]) > 1e-12 * max(1.0, abs(matrix[i][j])):
+                raise ValueError("Matrix is not symmetric")
+            s = matrix[i][j] - sum(factor[i][k] * factor[j][k] for k in range(j))
+            if i == j:
+                if s < 0.0:
+                    if s < -1e-12 * max(1.0, abs(matrix[i][i])):
+                        raise ValueError("Matrix is not positive semi-definite")
+                    s = 0.0
+                factor[i][i] = math.sqrt(s)
+            elif factor[j][j] > 0.0:
+                factor[i][j] = s / factor[j][j]
+    return factor
+
+def _lower_triangular_rows(matrix):
+    return [row[:i + 1] for i, row in enumerate(matrix)]
+
+def _iter_multivariate_normal_leaf_states(
+        tree,
+        num_chars,
+        num_replicates,
+        rate_matrix=None,
+        root_states=None,
+        ou_alpha=None,
+        ou_optima=None,
+        rng=None):
+    """
+    Evolves ``num_replicates`` independent replicates of ``num_chars``
+    (possibly correlated) continuous characters over ``tree`` in a single
+    preorder pass, and yields, for each leaf, a tuple of the leaf node and a
+    list of the states of all characters of all replicates (the characters
+    of the first replicate, followed by those of the second, etc.). The
+    states of an internal node are discarded as soon as those of all its
+    children have been drawn.
+    """
+    if rng is None:
+        rng = GLOBAL_RNG
+    if root_states is None:
+        root_states = [0.0] * num_chars
+    elif len(root_states) != num_chars:
+        raise ValueError("Expecting {} root states, but found {}".format(num_chars, len(root_states)))
+    if rate_matrix is not None:
+        if len(rate_matrix) != num_chars:
+            raise ValueError("Expecting a {0}x{0} rate matrix, but found {1} rows".format(num_chars, len(rate_matrix)))
+        rate_factor = _lower_triangular_rows(_cholesky_decomposition(rate_matrix))
+    else:
+        rate_factor = None
+    if ou_alpha is None:
+        alphas = None
+    else:
+        try:
+            alphas = [float(a) for a in ou_alpha]
+        except TypeError:
+            alphas = [float(ou_alpha)] * num_chars
+        if len(alphas) != num_chars:
+            raise ValueError("Expecting {} values for alpha, but found {}".format(num_chars, len(alphas)))
+        if min(alphas) < 0.0:
+            raise ValueError("Alpha cannot be negative")
+        if max(alphas) == 0.0:
+            alphas = None
+    if alphas is not None:
+        if ou_optima is None:
+            optima = list(root_states)
+        elif len(ou_optima) != num_chars:
+            raise ValueError("Expecting {} optima, but found {}".format(num_chars, len(ou_optima)))
+        else:
+            optima = list(ou_optima)
+        is_uniform_alpha = len(set(alphas)) == 1
+    gauss = rng.gauss
+    char_indexes = range(num_chars)
+    node_states = {}
+    remaining_children = {}
+    for nd in tree.preorder_node_iter():
+        parent_node = nd._parent_node
+        if parent_node is None or parent_node not in node_states:
+            states = list(root_states) * num_replicates
+        else:
+            parent_states = node_states[parent_node]
+            remaining_children[parent_node] -= 1
+            if remaining_children[parent_node] == 0:
+                del node_states[parent_node]
+                del remaining_children[parent_node]
+            t = nd.edge.length
+            if t is None:
+                t = 0.0
+            # conditional mean and Cholesky factor (or scale of the Cholesky
+            # factor of the rate matrix) of the covariance of the states at
+            # the end of the edge, given those at its start
+            if alphas is None:
+                decays = None
+                edge_factor = rate_factor
+                scale = math.sqrt(t)
+            elif is_uniform_alpha:
+                alpha = alphas[0]
+                decay = math.exp(-alpha * t)
+                decays = [decay] * num_chars
+                edge_factor = rate_factor
+                scale = math.sqrt((1.0 - decay * decay) / (2.0 * alpha))
+            else:
+                decays = [math.exp(-a * t) for a in alphas]
+                edge_cov = []
+                for i in char_indexes:
+                    row = []
+                    for j in char_indexes:
+                        a = alphas[i] + alphas[j]
+                        if a > 0.0:
+                            v = (1.0 - math.exp(-a * t)) / a
+                        else:
+                            v = t
+                        if rate_matrix is not None:
+                            v *= rate_matrix[i][j]
+                        elif i != j:
+                            v = 0.0
+                        row.append(v)
+                    edge_cov.append(row)
+                edge_factor = _lower_triangular_rows(_cholesky_decomposition(edge_cov))
+                scale = 1.0
+            states = []
+            for offset in range(0, num_chars * num_replicates, num_chars):
+                z = [gauss(0.0, scale) for i in char_indexes]
+                if edge_factor is not None:
+                    z = [sum(map(operator.mul, row, z)) for row in edge_factor]
+                x = parent_states[offset:offset + num_chars]
+                if decays is not None:
+                    x = [m + (xi - m) * d for xi, m, d in zip(x, optima, decays)]
+                states.extend(map(operator.add, x, z))
+        if nd._child_nodes:
+            node_states[nd] = states
+            remaining_children[nd] = len(nd._child_nodes)
+        else:
+            yield nd, states
+
+def _resolve_num_continuous_chars(num_chars, rate_matrix, root_states):
+    if num_chars is not None:
+        return num_chars
+    if rate_matrix is not None:
+        return len(rate_matrix)
+    if root_states is not None:
+        return len(root_states)
+    return 1
+
+def simulate_continuous_chars(
+        tree_model,
+        num_chars=None,
+        rate_matrix=None,
+        root_states=None,
+        ou_alpha=None,
+        ou_optima=None,
+        char_matrix=None,
+        rng=None):
+    """
+    Simulates (possibly correlated) continuous characters on a tree under a
+    multivariate Brownian motion or Ornstein-Uhlenbeck process.
+
+    The characters evolve jointly, with the changes along an edge of length
+    ``t`` being drawn from their exact multivariate normal distribution in a
+    single pass over the tree: under Brownian motion, these have a mean of
+    zero and a variance-covariance matrix of ``t * rate_matrix``. Under the
+    Ornstein-Uhlenbeck process, the states of character ``i`` are pulled
+    towards the optimum ``ou_optima[i]`` with strength ``ou_alpha[i]``.
+
+    Parameters
+    ----------
+    tree_model : |Tree|
+        Tree on which to simulate.
+    num_chars : int
+        Number of characters. If not given, taken from the dimensions of
+        ``rate_matrix`` or ``root_states``, or 1.
+    rate_matrix : list of lists of floats
+        The (symmetric, positive semi-definite) evolutionary
+        variance-covariance matrix of the characters per unit of edge
+        length. If not given, the characters evolve independently with a
+        rate of 1.0.
+    root_states : list of floats
+        States of the characters at the root. Defaults to 0.0.
+    ou_alpha : float or list of floats
+        Strength of selection towards the optima under the Ornstein-Uhlenbeck
+        process, for all or for each of the characters. If not given or 0.0,
+        the characters evolve under Brownian motion.
+    ou_optima : list of floats
+        Optimum of each character under the Ornstein-Uhlenbeck process.
+        Defaults to the root states.
+    char_matrix : |ContinuousCharacterMatrix|
+        If given, the states for the taxa of the leaves of ``tree_model``
+        will be appended to the existing sequences of the corresponding taxa
+        in ``char_matrix``; if not, a new |ContinuousCharacterMatrix| will be
+        created.
+    rng : random number generator
+        If not given, 'GLOBAL_RNG' will be used.
+
+    Returns
+    -------
+    m : |ContinuousCharacterMatrix|
+        The simulated characters.
+
+    """
+    num_chars = _resolve_num_continuous_chars(num_chars, rate_matrix, root_states)
+    if char_matrix is None:
+        char_matrix = dendropy.ContinuousCharacterMatrix(taxon_namespace=tree_model.taxon_namespace)
+    else:
+        assert char_matrix.taxon_namespace is tree_model.taxon_namespace, "conflicting taxon sets"
+    for leaf, states in _iter_multivariate_normal_leaf_states(
+            tree=tree_model,
+            num_chars=num_chars,
+            num_replicates=1,
+            rate_matrix=rate_matrix,
+            root_states=root_states,
+            ou_alpha=ou_alpha,
+            ou_optima=ou_optima,
+            rng=rng):
+        char_matrix[leaf.taxon].extend(states)
+    return char_matrix
+
+def simulate_continuous_char_replicates(
+        tree_model,
+        num_replicates,
+        num_chars=None,
+        rate_matrix=None,
+        root_states=None,
+        ou_alpha=None,
+        ou_optima=None,
+        rng=None):
+    """
+    Simulates multiple replicate sets of (possibly correlated) continuous
+    characters on a tree under a multivariate Brownian motion or
+    Ornstein-Uhlenbeck process in a single call.
+
+    This is more efficient than calling :func:`simulate_continuous_chars`
+    repeatedly, as all the replicates are evolved together in a single pass
+    over the tree, sharing the decomposition of the rate matrix.
+
+    Parameters
+    ----------
+    tree_model : |Tree|
+        Tree on which to simulate.
+    num_replicates : int
+        Number of replicate character matrices to simulate.
+    num_chars, rate_matrix, root_states, ou_alpha, ou_optima, rng
+        As for :func:`simulate_continuous_chars`.
+
+    Returns
+    -------
+    m : list of |ContinuousCharacterMatrix| objects
+        The simulated characters, one matrix for each replicate.
+
+    """
+    num_chars = _resolve_num_continuous_chars(num_chars, rate_matrix, root_states)
+    char_matrices = [dendropy.ContinuousCharacterMatrix(taxon_namespace=tree_model.taxon_namespace)
+            for i in range(num_replicates)]
+    for leaf, states in _iter_multivariate_normal_leaf_states(
+            tree=tree_model,
+            num_chars=num_chars,
+            num_replicates=num_replicates,
+            rate_matrix=rate_matrix,
+            root_states=root_states,
+            ou_alpha=ou_alpha,
+            ou_optima=ou_optima,
+            rng=rng):
+        for rep_idx, char_matrix in enumerate(char_matrices):
+            char_matrix[leaf.taxon] = states[rep_idx * num_chars:(rep_idx + 1) * num_chars]
+    return char_matrices
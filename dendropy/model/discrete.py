@@ -23,16 +23,36 @@ Models and modeling of discrete character evolution.
 import copy
 import math
 import itertools
+import bisect
 from dendropy.utility import GLOBAL_RNG
+from dendropy.utility.error import TaxonNamespaceIdentityError
 from dendropy.calculate import probability
 import dendropy
 
 ############################################################################
 ## Character Evolution Modeling
 
+def _cumulative_probs(probs):
+    """
+    Returns list of running totals of ``probs``, with the last element set to
+    1.0 so that all rounding error contributes to the last bin.
+    """
+    cprobs = []
+    total = 0.0
+    for p in probs:
+        total += p
+        cprobs.append(total)
+    cprobs[-1] = 1.0
+    return cprobs
+
 class DiscreteCharacterEvolutionModel(object):
     "Base class for discrete character substitution models."
 
+    # Maximum number of (branch length, rate) combinations for which
+    # transition probability matrices will be cached before the cache is
+    # flushed.
+    max_pmatrix_cache_size = 10000
+
     def __init__(self, state_alphabet, stationary_freqs=None, rng=None):
         """
         __init__ initializes the state_alphabet to define the character type on which
@@ -43,6 +63,7 @@ class DiscreteCharacterEvolutionModel(object):
             self.rng = GLOBAL_RNG
         else:
             self.rng = rng
+        self._pmatrix_cache = {}
 
     def pmatrix(self, tlen, rate=1.0):
         """
@@ -51,6 +72,58 @@ class DiscreteCharacterEvolutionModel(object):
         """
         raise NotImplementedError
 
+    def pmatrix_cache_key(self, tlen, rate=1.0):
+        """
+        Returns the key under which the (cumulative) transition probability
+        matrix for ``tlen`` and ``rate`` is cached. Derived classes should
+        extend this to include any model parameters on which the matrix
+        depends, so that changing parameters does not return stale matrices.
+        """
+        return (tlen, rate)
+
+    def clear_pmatrix_cache(self):
+        """
+        Discards all cached transition probability matrices.
+        """
+        self._pmatrix_cache.clear()
+
+    def cumulative_pmatrix(self, tlen, rate=1.0):
+        """
+        Returns a matrix in which each row holds the cumulative
+        substitution probabilities for the corresponding ancestral state over
+        time ``tlen`` at rate ``rate``, suitable for sampling descendant states
+        by bisection. Matrices are cached per (branch length, rate) and model
+        parameters, so repeated calls for the same edge are cheap.
+        """
+        key = self.pmatrix_cache_key(tlen, rate)
+        try:
+            return self._pmatrix_cache[key]
+        except KeyError:
+            pass
+        cmat = []
+        for row in self.pmatrix(tlen, rate):
+            cmat.append(_cumulative_probs(row))
+        if len(self._pmatrix_cache) >= self.max_pmatrix_cache_size:
+            self._pmatrix_cache.clear()
+        self._pmatrix_cache[key] = cmat
+        return cmat
+
+    def simulate_descendant_state_indices(self,
+            ancestral_state_indices,
+            edge_length,
+            mutation_rate=1.0,
+            rng=None):
+        """
+        Returns list of descendent state indices given list of ancestral state
+        indices.
+        """
+        if rng is None:
+            rng = self.rng
+        cmat = self.cumulative_pmatrix(edge_length, mutation_rate)
+        rand = rng.random
+        bisect_right = bisect.bisect_right
+        return [bisect_right(cmat[idx], rand()) for idx in ancestral_state_indices]
+
     def simulate_descendant_states(self,
         ancestral_states,
         edge_length,
@@ -59,16 +132,13 @@ class DiscreteCharacterEvolutionModel(object):
         """
         Returns descendent sequence given ancestral sequence.
         """
-        if rng is None:
-            rng = self.rng
-        pmat = self.pmatrix(edge_length, mutation_rate)
-        multi = probability.sample_multinomial
-        desc_states = []
-        for state in ancestral_states:
-            anc_state_idx = state.index
-            desc_state_idx = multi(pmat[anc_state_idx], rng)
-            desc_states.append(self.state_alphabet[desc_state_idx])
-        return desc_states
+        states = self.state_alphabet
+        desc_state_indices = self.simulate_descendant_state_indices(
+                ancestral_state_indices=[state.index for state in ancestral_states],
+                edge_length=edge_length,
+                mutation_rate=mutation_rate,
+                rng=rng)
+        return [states[idx] for idx in desc_state_indices]
 
 class DiscreteCharacterEvolver(object):
     "Evolves sequences on a tree."
@@ -143,6 +213,67 @@ class DiscreteCharacterEvolver(object):
                     n_prev_seq -= 1
         return tree
 
+    def evolve_replicate_state_indices(self,
+            tree,
+            seq_len,
+            num_replicates,
+            root_state_indices=None,
+            rng=None):
+        """
+        Generator that simulates ``num_replicates`` independent sets of
+        sequences of length ``seq_len`` on ``tree``, yielding, for each
+        replicate, a dictionary mapping the leaf nodes of ``tree`` to lists of
+        (fundamental) state indices.
+
+        Unlike :meth:`evolve_states`, nothing is stored on the tree: the
+        character model, rate and cumulative transition probability matrix of
+        each edge are resolved once, and then reused across all replicates.
+        If ``root_state_indices`` is given, this will be used as the sequence
+        for the root in every replicate; otherwise the sequence for the root
+        is drawn from the stationary distribution of the character model
+        for each replicate.
+        """
+        if rng is None:
+            rng = GLOBAL_RNG
+        default_seq_model = self.seq_model
+        if default_seq_model is None:
+            default_seq_model = getattr(tree, self.seq_model_attr, None)
+        default_mutation_rate = self.mutation_rate
+        if default_mutation_rate is None:
+            default_mutation_rate = 1.0
+        nodes = []
+        leaf_indices = []
+        node_index_map = {}
+        edge_plan = []
+        for nd in tree.preorder_node_iter():
+            node_idx = len(nodes)
+            node_index_map[nd] = node_idx
+            nodes.append(nd)
+            if nd.is_leaf():
+                leaf_indices.append(node_idx)
+            if nd.parent_node is None:
+                continue
+            edge = nd.edge
+            seq_model  = getattr(edge, self.seq_model_attr, None) or default_seq_model
+            length = getattr(edge, self.edge_length_attr)
+            mutation_rate = getattr(edge, self.edge_rate_attr, None) or default_mutation_rate
+            edge_plan.append((
+                node_idx,
+                node_index_map[nd.parent_node],
+                seq_model.cumulative_pmatrix(length, mutation_rate)))
+        root_seq_model = getattr(tree.seed_node.edge, self.seq_model_attr, None) or default_seq_model
+        rand = rng.random
+        bisect_right = bisect.bisect_right
+        for rep_idx in range(num_replicates):
+            seqs = [None] * len(nodes)
+            if root_state_indices is not None:
+                seqs[0] = list(root_state_indices)
+            else:
+                seqs[0] = root_seq_model.stationary_state_indices(seq_len, rng=rng)
+            for node_idx, parent_idx, cmat in edge_plan:
+                seqs[node_idx] = [bisect_right(cmat[idx], rand()) for idx in seqs[parent_idx]]
+            yield dict((nodes[idx], seqs[idx]) for idx in leaf_indices)
+
     def extend_char_matrix_with_characters_on_tree(self,
             char_matrix,
             tree,
@@ -198,9 +329,20 @@ class NucleotideCharacterEvolutionModel(DiscreteCharacterEvolutionModel):
         representing a sample of characters drawn from this model's
         stationary distribution.
         """
-        probs = self.base_freqs
-        char_state_indices = [probability.sample_multinomial(probs, rng) for i in range(seq_len)]
-        return [self.state_alphabet[idx] for idx in char_state_indices]
+        states = self.state_alphabet
+        return [states[idx] for idx in self.stationary_state_indices(seq_len, rng=rng)]
+
+    def stationary_state_indices(self, seq_len, rng=None):
+        """
+        Returns a list of ``seq_len`` state indices drawn from this model's
+        stationary distribution.
+        """
+        if rng is None:
+            rng = self.rng
+        cprobs = _cumulative_probs(self.base_freqs)
+        rand = rng.random
+        bisect_right = bisect.bisect_right
+        return [bisect_right(cprobs, rand()) for i in range(seq_len)]
 
     def is_purine(self, state_index):
         """
@@ -357,11 +499,39 @@ class Hky85(NucleotideCharacterEvolutionModel):
         al., 1996. (tlen * rate = nu, expected number of
         substitutions)
         """
+        # Same calculation as ``pij``, but with the exponential terms
+        # evaluated once for the whole matrix rather than once per cell.
+        nu = self.corrected_substitution_rate(rate) * tlen
+        freqs = self.base_freqs
+        purine_freqs = freqs[0] + freqs[2]
+        pyrimidine_freqs = freqs[1] + freqs[3]
+        exp_nu = math.exp(-1.0 * nu)
+        exp_purine = math.exp(-1.0 * nu * (1 + (purine_freqs * (self.kappa - 1.0))))
+        exp_pyrimidine = math.exp(-1.0 * nu * (1 + (pyrimidine_freqs * (self.kappa - 1.0))))
         pmatrix = []
         for state_i in range(4):
-            pmatrix.append(self.pvector(state_i, tlen=tlen, rate=rate))
+            pvec = []
+            for state_j in range(4):
+                fj = freqs[state_j]
+                if self.is_purine(state_j):
+                    sumfreqs = purine_freqs
+                    exp_a = exp_purine
+                else:
+                    sumfreqs = pyrimidine_freqs
+                    exp_a = exp_pyrimidine
+                if state_i == state_j:
+                    pij = fj + fj * (1.0/sumfreqs - 1) * exp_nu + ((sumfreqs - fj)/sumfreqs) * exp_a
+                elif self.is_transition(state_i, state_j):
+                    pij = fj + fj * (1.0/sumfreqs - 1) * exp_nu - (fj / sumfreqs) * exp_a
+                else:
+                    pij = fj * (1.0 - exp_nu)
+                pvec.append(pij)
+            pmatrix.append(pvec)
         return pmatrix
 
+    def pmatrix_cache_key(self, tlen, rate=1.0):
+        return (tlen, rate, self.kappa, tuple(self.base_freqs), self.correct_rate)
+
 class Jc69(Hky85):
     """
     Jukes-Cantor 1969 model. Specializes HKY85 such that
@@ -377,6 +547,433 @@ class Jc69(Hky85):
                 )
 
 
+############################################################################
+## Likelihood
+
+def _regularized_lower_incomplete_gamma(a, x):
+    """
+    Returns the regularized lower incomplete gamma function, P(a, x), using
+    the series expansion for small ``x`` and the continued fraction (modified
+    Lentz's method) otherwise.
+    """
+    if x <= 0.0:
+        return 0.0
+    log_prefactor = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1.0:
+        ap = a
+        delta = 1.0 / a
+        total = delta
+        for i in range(10000):
+            ap += 1.0
+            delta *= x / ap
+            total += delta
+            if abs(delta) < abs(total) * 1e-15:
+                break
+        return total * math.exp(log_prefactor)
+    tiny = 1e-300
+    b = x + 1.0 - a
+    c = 1.0 / tiny
+    d = 1.0 / b
+    h = d
+    for i in range(1, 10000):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        if abs(d) < tiny:
+            d = tiny
+        c = b + an / c
+        if abs(c) < tiny:
+            c = tiny
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-15:
+            break
+    return 1.0 - math.exp(log_prefactor) * h
+
+def _gamma_quantile(p, shape):
+    """
+    Returns the value, ``x``, such that the cumulative distribution function
+    of a gamma distribution with shape ``shape`` and unit scale evaluated at
+    ``x`` is ``p``.
+    """
+    lower = 0.0
+    upper = max(1.0, shape)
+    while _regularized_lower_incomplete_gamma(shape, upper) < p:
+        lower = upper
+        upper *= 2.0
+    for i in range(200):
+        mid = 0.5 * (lower + upper)
+        if _regularized_lower_incomplete_gamma(shape, mid) < p:
+            lower = mid
+        else:
+            upper = mid
+        if upper - lower <= 1e-14 * upper:
+            break
+    return 0.5 * (lower + upper)
+
+def discrete_gamma_rates(shape, num_categories):
+    """
+    Returns the list of mean relative rates of each of ``num_categories``
+    equal-probability categories of a discretized gamma distribution of
+    rates with shape parameter ``shape`` and a mean of 1, following Yang
+    (1994).
+
+    Parameters
+    ----------
+    shape : float
+        Shape (alpha) parameter of the gamma distribution.
+    num_categories : int
+        Number of rate categories.
+
+    Returns
+    -------
+    r : list of floats
+        The mean rate of each category.
+    """
+    if shape <= 0:
+        raise ValueError("Gamma shape parameter must be positive: {}".format(shape))
+    if num_categories < 1:
+        raise ValueError("Number of rate categories must be positive: {}".format(num_categories))
+    if num_categories == 1:
+        return [1.0]
+    # Rates are gamma distributed with shape ``shape`` and rate ``shape``;
+    # boundaries are calculated in units of ``shape * rate``.
+    boundaries = [_gamma_quantile(float(k)/num_categories, shape) for k in range(1, num_categories)]
+    cdf = [0.0]
+    for y in boundaries:
+        cdf.append(_regularized_lower_incomplete_gamma(shape + 1.0, y))
+    cdf.append(1.0)
+    rates = [num_categories * (cdf[k+1] - cdf[k]) for k in range(num_categories)]
+    mean_rate = sum(rates) / num_categories
+    return [r / mean_rate for r in rates]
+
+class DiscreteCharacterLikelihoodCalculator(object):
+    """
+    Calculates the likelihood of a tree given aligned discrete character data
+    under a character substitution model, using Felsenstein's (1981) pruning
+    algorithm.
+
+    Identical columns of the character matrix are compressed into weighted
+    site patterns, and the conditional (partial) likelihoods of each node are
+    held as arrays over rate categories, patterns and states. Partial
+    likelihoods are rescaled whenever they become small to avoid underflow on
+    large trees. Rate heterogeneity across sites can be modeled using a
+    discretized gamma distribution.
+
+    The partial likelihoods of each node are retained between calls to
+    :meth:`log_likelihood`, so that if the length of a single edge changes
+    (e.g., in an optimization loop), only the partial likelihoods of the nodes
+    ancestral to that edge need to be recalculated. Changes to edge lengths
+    should be made through :meth:`update_edge_length`, or reported to this
+    calculator using :meth:`invalidate_edge`. If the tree topology or the
+    parameters of the substitution model change, :meth:`invalidate` must be
+    called before the likelihood is recalculated.
+
+    Parameters
+    ----------
+    tree : |Tree|
+        The tree to be scored. Must reference the same |TaxonNamespace| as
+        ``char_matrix``.
+    char_matrix : |DnaCharacterMatrix|
+        The character data. Gaps are treated as missing data.
+    seq_model : |NucleotideCharacterEvolutionModel|
+        The character substitution model. The stationary (root) state
+        frequencies are given by its ``base_freqs`` attribute.
+    num_gamma_categories : int
+        Number of categories of the discretized gamma distribution of rates
+        across sites. If 1 [default], then all sites evolve at the same rate.
+    gamma_shape : float
+        Shape parameter of the discretized gamma distribution of rates across
+        sites. Required if ``num_gamma_categories`` is greater than 1.
+    mutation_rate : float
+        Mutation *modifier* rate (should be 1.0 if branch lengths on tree
+        reflect true expected number of changes).
+
+    Examples
+    --------
+
+    ::
+
+        import dendropy
+        from dendropy.model import discrete
+
+        taxa = dendropy.TaxonNamespace()
+        chars = dendropy.DnaCharacterMatrix.get(
+                path="pythonidae.chars.fasta",
+                schema="fasta",
+                taxon_namespace=taxa)
+        tree = dendropy.Tree.get(
+                path="pythonidae.mle.nex",
+                schema="nexus",
+                taxon_namespace=taxa)
+        calc = discrete.DiscreteCharacterLikelihoodCalculator(
+                tree=tree,
+                char_matrix=chars,
+                seq_model=discrete.Hky85(kappa=2.0),
+                num_gamma_categories=4,
+                gamma_shape=0.5)
+        print(calc.log_likelihood())
+
+        # Only the path from this edge to the root is recalculated.
+        edge = tree.seed_node.child_nodes()[0].edge
+        calc.update_edge_length(edge, edge.length * 2)
+        print(calc.log_likelihood())
+
+    """
+
+    # Partial likelihoods of a pattern are rescaled if they all fall below this value.
+    scaling_threshold = 1e-40
+
+    def __init__(self,
+            tree,
+            char_matrix,
+            seq_model,
+            num_gamma_categories=1,
+            gamma_shape=None,
+            mutation_rate=1.0):
+        if tree.taxon_namespace is not char_matrix.taxon_namespace:
+            raise TaxonNamespaceIdentityError(tree, char_matrix)
+        self.tree = tree
+        self.char_matrix = char_matrix
+        self.seq_model = seq_model
+        self.mutation_rate = mutation_rate
+        if num_gamma_categories > 1:
+            if gamma_shape is None:
+                raise TypeError("'gamma_shape' must be specified if 'num_gamma_categories' is greater than 1")
+            self.category_rates = discrete_gamma_rates(gamma_shape, num_gamma_categories)
+        else:
+            self.category_rates = [1.0]
+        self.num_states = len(seq_model.base_freqs)
+        self._compile_site_patterns()
+        self.invalidate()
+
+    def _compile_site_patterns(self):
+        leaves = self.tree.leaf_nodes()
+        seqs = []
+        for nd in leaves:
+            if nd.taxon is None or nd.taxon not in self.char_matrix:
+                raise ValueError("No character data for leaf node: {}".format(nd))
+            seqs.append(self.char_matrix[nd.taxon])
+        nchar = len(seqs[0]) if seqs else 0
+        for nd, seq in zip(leaves, seqs):
+            if len(seq) != nchar:
+                raise ValueError("Sequence for taxon '{}' has {} characters, but sequence for taxon '{}' has {}".format(
+                    nd.taxon.label, len(seq), leaves[0].taxon.label, nchar))
+        pattern_index_map = {}
+        patterns = []
+        self.pattern_weights = []
+        self.site_pattern_indices = []
+        for col in range(nchar):
+            key = tuple(seq[col].fundamental_indexes_with_gaps_as_missing for seq in seqs)
+            try:
+                pattern_idx = pattern_index_map[key]
+                self.pattern_weights[pattern_idx] += 1
+            except KeyError:
+                pattern_idx = len(patterns)
+                pattern_index_map[key] = pattern_idx
+                patterns.append(key)
+                self.pattern_weights.append(1)
+            self.site_pattern_indices.append(pattern_idx)
+        self.num_patterns = len(patterns)
+        num_states = self.num_states
+        num_categories = len(self.category_rates)
+        self._leaf_partials = {}
+        for leaf_idx, nd in enumerate(leaves):
+            partials = []
+            for key in patterns:
+                vec = [0.0] * num_states
+                for state_idx in key[leaf_idx]:
+                    if state_idx < num_states:
+                        vec[state_idx] = 1.0
+                partials.extend(vec)
+            self._leaf_partials[nd] = partials * num_categories
+
+    def invalidate(self):
+        """
+        Discards all retained partial likelihoods, so that the next call to
+        :meth:`log_likelihood` recalculates the likelihood from scratch. Must
+        be called if the topology of the tree or parameters of the
+        substitution model are changed.
+        """
+        self._postorder_internal_nodes = [nd for nd in self.tree.postorder_node_iter() if not nd.is_leaf()]
+        self._partials = {}
+        self._log_scalers = {}
+        self._dirty_nodes = set(self._postorder_internal_nodes)
+
+    def invalidate_edge(self, edge):
+        """
+        Marks the partial likelihoods that depend on the length of ``edge``
+        as requiring recalculation.
+        """
+        nd = edge.tail_node
+        while nd is not None:
+            self._dirty_nodes.add(nd)
+            nd = nd.parent_node
+
+    def update_edge_length(self, edge, length):
+        """
+        Sets the length of ``edge`` to ``length``, and marks the partial
+        likelihoods that depend on it as requiring recalculation.
+        """
+        edge.length = length
+        self.invalidate_edge(edge)
+
+    def _calc_partials(self, nd):
+        num_states = self.num_states
+        state_range = range(num_states)
+        num_patterns = self.num_patterns
+        block_size = num_patterns * num_states
+        partials = None
+        log_scalers = [0.0] * num_patterns
+        for child in nd.child_node_iter():
+            if child.is_leaf():
+                child_partials = self._leaf_partials[child]
+            else:
+                child_partials = self._partials[child]
+                for pattern_idx, s in enumerate(self._log_scalers[child]):
+                    log_scalers[pattern_idx] += s
+            edge_length = child.edge.length
+            if edge_length is None:
+                edge_length = 0.0
+            contrib = []
+            for cat_idx, cat_rate in enumerate(self.category_rates):
+                pmatrix = self.seq_model.pmatrix(edge_length, self.mutation_rate * cat_rate)
+                offset = cat_idx * block_size
+                if num_states == 4:
+                    # unrolled for nucleotides
+                    (p00, p01, p02, p03), (p10, p11, p12, p13), (p20, p21, p22, p23), (p30, p31, p32, p33) = pmatrix
+                    for idx in range(offset, offset + block_size, 4):
+                        c0, c1, c2, c3 = child_partials[idx:idx+4]
+                        contrib.extend((
+                            p00 * c0 + p01 * c1 + p02 * c2 + p03 * c3,
+                            p10 * c0 + p11 * c1 + p12 * c2 + p13 * c3,
+                            p20 * c0 + p21 * c1 + p22 * c2 + p23 * c3,
+                            p30 * c0 + p31 * c1 + p32 * c2 + p33 * c3,
+                            ))
+                else:
+                    for idx in range(offset, offset + block_size, num_states):
+                        cvec = child_partials[idx:idx+num_states]
+                        for row in pmatrix:
+                            contrib.append(sum([row[j] * cvec[j] for j in state_range]))
+            if partials is None:
+                partials = contrib
+            else:
+                partials = [a * b for a, b in zip(partials, contrib)]
+        # rescale patterns with small partials
+        threshold = self.scaling_threshold
+        for pattern_idx in range(num_patterns):
+            pattern_offset = pattern_idx * num_states
+            max_partial = 0.0
+            for cat_idx in range(len(self.category_rates)):
+                idx = cat_idx * block_size + pattern_offset
+                m = max(partials[idx:idx+num_states])
+                if m > max_partial:
+                    max_partial = m
+            if 0.0 < max_partial < threshold:
+                for cat_idx in range(len(self.category_rates)):
+                    idx = cat_idx * block_size + pattern_offset
+                    for i in range(idx, idx + num_states):
+                        partials[i] /= max_partial
+                log_scalers[pattern_idx] += math.log(max_partial)
+        self._partials[nd] = partials
+        self._log_scalers[nd] = log_scalers
+
+    def pattern_log_likelihoods(self):
+        """
+        Returns list of log likelihoods of each (distinct) site pattern.
+        """
+        if self._dirty_nodes:
+            for nd in self._postorder_internal_nodes:
+                if nd in self._dirty_nodes:
+                    self._calc_partials(nd)
+            self._dirty_nodes.clear()
+        root = self.tree.seed_node
+        if root.is_leaf():
+            raise ValueError("Cannot calculate likelihood of a tree with a single node")
+        partials = self._partials[root]
+        log_scalers = self._log_scalers[root]
+        freqs = self.seq_model.base_freqs
+        num_states = self.num_states
+        num_categories = len(self.category_rates)
+        block_size = self.num_patterns * num_states
+        cat_weight = 1.0 / num_categories
+        result = []
+        for pattern_idx in range(self.num_patterns):
+            site_lk = 0.0
+            for cat_idx in range(num_categories):
+                idx = cat_idx * block_size + pattern_idx * num_states
+                for state_idx in range(num_states):
+                    site_lk += freqs[state_idx] * partials[idx + state_idx]
+            site_lk *= cat_weight
+            if site_lk <= 0.0:
+                result.append(float("-inf"))
+            else:
+                result.append(math.log(site_lk) + log_scalers[pattern_idx])
+        return result
+
+    def site_log_likelihoods(self):
+        """
+        Returns list of log likelihoods of each site (column) of the character
+        matrix.
+        """
+        pattern_lnls = self.pattern_log_likelihoods()
+        return [pattern_lnls[idx] for idx in self.site_pattern_indices]
+
+    def log_likelihood(self):
+        """
+        Returns the log likelihood of the tree given the data and the model.
+        """
+        pattern_lnls = self.pattern_log_likelihoods()
+        return sum(w * lnl for w, lnl in zip(self.pattern_weights, pattern_lnls))
+
+def log_likelihood(
+        tree,
+        char_matrix,
+        seq_model,
+        num_gamma_categories=1,
+        gamma_shape=None,
+        mutation_rate=1.0):
+    """
+    Returns the log likelihood of ``tree`` given the data in ``char_matrix``
+    under the character substitution model ``seq_model``.
+
+    If the same tree and data are going to be scored multiple times (e.g.,
+    while optimizing edge lengths), it is better to create a
+    :class:`DiscreteCharacterLikelihoodCalculator` once and reuse it.
+
+    Parameters
+    ----------
+    tree : |Tree|
+        The tree to be scored. Must reference the same |TaxonNamespace| as
+        ``char_matrix``.
+    char_matrix : |DnaCharacterMatrix|
+        The character data. Gaps are treated as missing data.
+    seq_model : |NucleotideCharacterEvolutionModel|
+        The character substitution model.
+    num_gamma_categories : int
+        Number of categories of the discretized gamma distribution of rates
+        across sites.
+    gamma_shape : float
+        Shape parameter of the discretized gamma distribution of rates across
+        sites.
+    mutation_rate : float
+        Mutation *modifier* rate.
+
+    Returns
+    -------
+    lnL : float
+        The log likelihood.
+    """
+    calc = DiscreteCharacterLikelihoodCalculator(
+            tree=tree,
+            char_matrix=char_matrix,
+            seq_model=seq_model,
+            num_gamma_categories=num_gamma_categories,
+            gamma_shape=gamma_shape,
+            mutation_rate=mutation_rate)
+    return calc.log_likelihood()
+
 
 ##############################################################################
 ## Wrappers for Convenience
@@ -506,6 +1103,72 @@ def simulate_discrete_chars(
         seq_evolver.clean_tree(tree)
     return char_matrix
 
+def simulate_discrete_char_replicates(
+        seq_len,
+        tree_model,
+        seq_model,
+        num_replicates,
+        mutation_rate=1.0,
+        root_states=None,
+        rng=None):
+    """
+    Wrapper to conveniently generate multiple replicate alignments simulated
+    under the same tree and character model in a single call.
+
+    This is considerably more efficient than calling
+    :func:`simulate_discrete_chars` repeatedly, as the transition probability
+    matrices of the edges of the tree are calculated only once and shared by
+    all replicates, and the tree is not annotated with the simulated
+    sequences.
+
+    Parameters
+    ----------
+
+    seq_len       : int
+        Length of sequence (number of characters).
+    tree_model    : |Tree|
+        Tree on which to simulate.
+    seq_model     : dendropy.model.discrete.DiscreteCharacterEvolutionModel
+        The character substitution model under which to to evolve the
+        characters.
+    num_replicates : int
+        Number of replicate alignments to simulate.
+    mutation_rate : float
+        Mutation *modifier* rate (should be 1.0 if branch lengths on tree
+        reflect true expected number of changes).
+    root_states``   : list
+        Vector of root states (length must equal ``seq_len``). If not given,
+        root states will be drawn from the stationary distribution of
+        ``seq_model`` independently for each replicate.
+    rng           : random number generator
+        If not given, 'GLOBAL_RNG' will be used.
+
+    Returns
+    -------
+    m : list of |DnaCharacterMatrix| objects
+        The simulated alignments, one for each replicate.
+
+    """
+    seq_evolver = DiscreteCharacterEvolver(seq_model=seq_model,
+                               mutation_rate=mutation_rate)
+    if root_states is not None:
+        root_state_indices = [state.index for state in root_states]
+    else:
+        root_state_indices = None
+    states = seq_model.state_alphabet.states
+    char_matrices = []
+    for leaf_state_indices in seq_evolver.evolve_replicate_state_indices(
+            tree=tree_model,
+            seq_len=seq_len,
+            num_replicates=num_replicates,
+            root_state_indices=root_state_indices,
+            rng=rng):
+        char_matrix = dendropy.DnaCharacterMatrix(taxon_namespace=tree_model.taxon_namespace)
+        for leaf, state_indices in leaf_state_indices.items():
+            char_matrix[leaf.taxon] = [states[idx] for idx in state_indices]
+        char_matrices.append(char_matrix)
+    return char_matrices
+
 def hky85_chars(
         seq_len,
         tree_model,
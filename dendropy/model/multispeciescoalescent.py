@@ -164,6 +164,54 @@ class MultispeciesCoalescent(object):
             logP += subP
         return logP
 
+    def score_coalescent_trees(self,
+            coalescent_trees,
+            coalescent_species_lineage_map_fn,
+            population_theta_fn=None,
+            ):
+        """
+        Returns the sum of the log-probabilities of a collection of coalescent
+        (or gene) trees conditioned on the structure (species or population)
+        tree.
+
+        This is equivalent to summing the results of
+        :meth:`score_coalescent_tree` over all the trees, but is more
+        efficient. To repeatedly score the same coalescent trees under
+        different species trees (e.g., in species tree inference), use a
+        :class:`MultispeciesCoalescentBatchScorer` directly, so that the reduced
+        representation of the coalescent trees and the results of unchanged
+        populations are reused between calls.
+
+        Parameters
+        ----------
+        coalescent_trees : iterable of |Tree| objects
+            The trees to be scored.
+        coalescent_species_lineage_map_fn : function object
+            A function that takes a |Taxon| instance representing a lineage on
+            a coalescent or gene tree and returns the |Taxon| instance
+            corresponding to the species or population on the species tree
+            with which it is associated.
+        population_theta_fn : function object
+            Function that takes an edge on the species structure tree as an argument
+            and returns the population parameter (theta) for that population or
+            species. If not specified, all edges are assumed to have a theta
+            value of 1.0.
+
+        Returns
+        -------
+        p : numeric
+            Sum of the log probabilities of ``coalescent_trees`` given
+            structuring imposed by ``self._species_tree``.
+        """
+        scorer = MultispeciesCoalescentBatchScorer(
+                coalescent_trees=coalescent_trees,
+                coalescent_species_lineage_map_fn=coalescent_species_lineage_map_fn,
+                ultrametricity_precision=self.ultrametricity_precision)
+        scorer.is_enforce_structure_integrity = self.is_enforce_structure_integrity
+        return scorer.score_species_tree(
+                species_tree=self._species_tree,
+                population_theta_fn=population_theta_fn)
+
     def _fit_coalescent_tree(self,
             coalescent_tree,
             coalescent_species_lineage_map_fn,
@@ -273,3 +321,304 @@ class MultispeciesCoalescent(object):
 
     def _compose_edge_desc(self, e):
         return "+".join(x.taxon.label for x in e.head_node.leaf_iter())
+
+class MultispeciesCoalescentBatchScorer(object):
+
+    """
+    Calculates the log-probabilities of a (fixed) collection of coalescent (or
+    gene) trees conditioned on a structure (species or population) tree,
+    under the multispecies coalescent, for many different structure trees.
+
+    The coalescent trees are reduced once, on construction, to arrays of node
+    ages and parent indexes, with their tips grouped by the species or
+    population to which they map. Each coalescent tree is then further
+    reduced, for each structure tree edge (i.e., population), to three
+    summary statistics: the number of coalescent events in the population,
+    the sum of the waiting times between these weighted by the number of
+    pairs of lineages available to coalesce, and the weighted time for which
+    more than one lineage persists to the end of the population. The
+    log-probability contributed by a population with a population parameter
+    of theta is then ``n * log(2/theta) - theta * a - b/theta``, and so the
+    summed log-probability of all the coalescent trees can be calculated from
+    the sums of these statistics over the trees, with a single term per
+    population.
+
+    The statistics of a population depend only on the ages and topology of
+    the structure subtree subtended by the population and on the age of its
+    ancestral speciation event. They are cached, keyed by these, so that when
+    a structure tree that differs from one previously scored in some
+    branches only is scored, only the statistics of the populations that
+    have changed (and their ancestral populations) are recalculated. Changes
+    to the population parameters alone do not require any recalculation.
+    """
+
+    def __init__(self,
+            coalescent_trees,
+            coalescent_species_lineage_map_fn,
+            ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION,
+            max_cache_size=4096):
+        """
+        Parameters
+        ----------
+        coalescent_trees : iterable of |Tree| objects
+            The coalescent or gene trees to be scored.
+        coalescent_species_lineage_map_fn : function object
+            A function that takes a |Taxon| instance representing a lineage on
+            a coalescent or gene tree and returns the |Taxon| instance
+            corresponding to the species or population on the species tree
+            with which it is associated. This is called once for each tip of
+            each coalescent tree, on construction.
+        ultrametricity_precision : float
+            Precision used when calculating node ages.
+        max_cache_size : int
+            Maximum number of populations for which statistics are cached. If
+            this is exceeded, the cache is cleared before the next structure
+            tree is scored. If |None|, the cache size is unlimited.
+        """
+        self.ultrametricity_precision = ultrametricity_precision
+        self.is_enforce_structure_integrity = True
+        self.max_cache_size = max_cache_size
+        self._ages = []
+        self._parents = []
+        self._children = []
+        self._species_lineages = []
+        self._tip_labels = []
+        for coalescent_tree in coalescent_trees:
+            self._add_coalescent_tree(coalescent_tree, coalescent_species_lineage_map_fn)
+        self.clear_cache()
+
+    def __len__(self):
+        return len(self._ages)
+
+    def _add_coalescent_tree(self, coalescent_tree, coalescent_species_lineage_map_fn):
+        coalescent_tree.calc_node_ages(ultrametricity_precision=self.ultrametricity_precision)
+        node_index = {}
+        ages = []
+        parents = []
+        children = []
+        tip_labels = []
+        species_lineages = {}
+        for nd in coalescent_tree.preorder_node_iter():
+            idx = len(ages)
+            node_index[nd] = idx
+            ages.append(nd.age)
+            children.append([])
+            if nd.parent_node is None:
+                parents.append(-1)
+            else:
+                parent_idx = node_index[nd.parent_node]
+                parents.append(parent_idx)
+                children[parent_idx].append(idx)
+            if nd.is_leaf():
+                tip_labels.append(nd.taxon.label if nd.taxon is not None else nd.label)
+                species_taxon = coalescent_species_lineage_map_fn(nd.taxon)
+                species_lineages.setdefault(species_taxon, []).append(idx)
+            else:
+                tip_labels.append(None)
+        self._ages.append(ages)
+        self._parents.append(parents)
+        self._children.append(children)
+        self._species_lineages.append(species_lineages)
+        self._tip_labels.append(tip_labels)
+
+    def clear_cache(self):
+        """
+        Discards all cached population statistics.
+        """
+        self._subtree_ids = {}
+        self._population_cache = {}
+        self.num_population_cache_hits = 0
+        self.num_population_cache_misses = 0
+
+    def score_species_tree(self, species_tree, population_theta_fn=None):
+        """
+        Returns the sum of the log-probabilities of the coalescent trees
+        conditioned on the structure tree, ``species_tree``.
+
+        Parameters
+        ----------
+        species_tree : |Tree|
+            The structure tree. Node ages will be calculated from its edge
+            lengths.
+        population_theta_fn : function object
+            Function that takes an edge on the species structure tree as an argument
+            and returns the population parameter (theta) for that population or
+            species. If not specified, all edges are assumed to have a theta
+            value of 1.0.
+
+        Returns
+        -------
+        p : numeric
+            Sum of the log probabilities of the coalescent trees.
+        """
+        logP = 0.0
+        for species_edge, population in self._iter_populations(species_tree):
+            num_events, weighted_time, tail_weighted_time = population[0]
+            if population_theta_fn is None:
+                theta = 1.0
+            else:
+                theta = population_theta_fn(species_edge)
+            if num_events:
+                logP += num_events * math.log(2.0/theta)
+            if weighted_time:
+                logP -= theta * weighted_time
+            if tail_weighted_time:
+                logP -= tail_weighted_time / theta
+        return logP
+
+    def score_coalescent_trees(self, species_tree, population_theta_fn=None):
+        """
+        Returns a list of the log-probabilities of each of the coalescent
+        trees, in the order in which they were given, conditioned on the
+        structure tree, ``species_tree``. Arguments are as for
+        :meth:`score_species_tree`.
+        """
+        log_probs = [0.0] * len(self._ages)
+        for species_edge, population in self._iter_populations(species_tree):
+            if population_theta_fn is None:
+                theta = 1.0
+            else:
+                theta = population_theta_fn(species_edge)
+            log_2_theta = math.log(2.0/theta)
+            for idx, (num_events, weighted_time, tail_weighted_time, _) in enumerate(population[1]):
+                log_probs[idx] += num_events * log_2_theta - theta * weighted_time - tail_weighted_time / theta
+        return log_probs
+
+    def _iter_populations(self, species_tree):
+        if self.max_cache_size is not None and len(self._population_cache) > self.max_cache_size:
+            self.clear_cache()
+        species_tree.calc_node_ages(ultrametricity_precision=self.ultrametricity_precision)
+        subtree_ids = self._subtree_ids
+        population_cache = self._population_cache
+        node_subtree_ids = {}
+        edge_populations = {}
+        for species_edge in species_tree.postorder_edge_iter():
+            head_node = species_edge.head_node
+            if head_node.is_leaf():
+                subtree_key = (head_node.age, head_node.taxon)
+            else:
+                subtree_key = (head_node.age, tuple(sorted(node_subtree_ids[ch] for ch in head_node._child_nodes)))
+            subtree_id = subtree_ids.setdefault(subtree_key, len(subtree_ids))
+            node_subtree_ids[head_node] = subtree_id
+            if species_edge.tail_node is None:
+                tail_age = None
+            else:
+                tail_age = species_edge.tail_node.age
+            population_key = (subtree_id, tail_age)
+            population = population_cache.get(population_key, None)
+            if population is None:
+                self.num_population_cache_misses += 1
+                population = self._calc_population(species_edge, tail_age, edge_populations)
+                population_cache[population_key] = population
+            else:
+                self.num_population_cache_hits += 1
+            edge_populations[species_edge] = population
+            yield species_edge, population
+
+    def _calc_population(self, species_edge, tail_age, edge_populations):
+        head_node = species_edge.head_node
+        head_age = head_node.age
+        is_leaf = head_node.is_leaf()
+        if not is_leaf:
+            child_populations = [edge_populations[ch.edge][1] for ch in head_node._child_nodes]
+        total_events = 0
+        total_weighted_time = 0.0
+        total_tail_weighted_time = 0.0
+        gene_stats = []
+        for gene_idx in range(len(self._ages)):
+            if is_leaf:
+                lineages = self._species_lineages[gene_idx].get(head_node.taxon, ())
+            else:
+                lineages = []
+                for child_population in child_populations:
+                    lineages.extend(child_population[gene_idx][3])
+            stats = self._reduce_population(gene_idx, species_edge, lineages, head_age, tail_age)
+            total_events += stats[0]
+            total_weighted_time += stats[1]
+            total_tail_weighted_time += stats[2]
+            gene_stats.append(stats)
+        return (total_events, total_weighted_time, total_tail_weighted_time), gene_stats
+
+    def _reduce_population(self, gene_idx, species_edge, lineages, head_age, tail_age):
+        """
+        Returns the number of coalescent events, the weighted waiting time
+        between events, the weighted time from the last event to the end of
+        the population, and the lineages exiting the population, for the
+        lineages (given by node index) of the coalescent tree ``gene_idx``
+        entering the population ``species_edge``.
+        """
+        num_lineages = len(lineages)
+        if num_lineages <= 1:
+            return (0, 0.0, 0.0, tuple(lineages))
+        ages = self._ages[gene_idx]
+        parents = self._parents[gene_idx]
+        event_ages = []
+        if tail_age is None:
+            ## root population: all lineages coalesce
+            seen = set()
+            for nd_idx in lineages:
+                parent_idx = parents[nd_idx]
+                while parent_idx >= 0 and parent_idx not in seen:
+                    seen.add(parent_idx)
+                    event_ages.append(ages[parent_idx])
+                    parent_idx = parents[parent_idx]
+            event_ages.sort()
+            exiting = ()
+        else:
+            current_lineages = [(ages[parents[nd_idx]] if parents[nd_idx] >= 0 else float("inf"), nd_idx) for nd_idx in lineages]
+            heapq.heapify(current_lineages)
+            coalescing_nodes = set()
+            if self.is_enforce_structure_integrity:
+                valid_coalescing_lineages = set(lineages)
+                children = self._children[gene_idx]
+            while len(current_lineages) > 1:
+                coalescent_age, nd_idx = current_lineages[0]
+                if coalescent_age > tail_age:
+                    break
+                heapq.heappop(current_lineages)
+                parent_idx = parents[nd_idx]
+                if parent_idx in coalescing_nodes:
+                    continue
+                if self.is_enforce_structure_integrity:
+                    for ch_idx in children[parent_idx]:
+                        if ch_idx != nd_idx and ch_idx not in valid_coalescing_lineages:
+                            msg = "Invalid coalescence within structure tree edge {}: coalescent tree {} lineage {} cannot coalesce with lineage {} because the latter is not in the same population at this time".format(
+                                    self._compose_species_edge_desc(species_edge), gene_idx, self._compose_lineage_desc(gene_idx, nd_idx), self._compose_lineage_desc(gene_idx, ch_idx))
+                            raise error.InvalidMultispeciesCoalescentStructureError(msg)
+                    valid_coalescing_lineages.add(parent_idx)
+                coalescing_nodes.add(parent_idx)
+                event_ages.append(coalescent_age)
+                grandparent_idx = parents[parent_idx]
+                heapq.heappush(current_lineages, (ages[grandparent_idx] if grandparent_idx >= 0 else float("inf"), parent_idx))
+            exiting = tuple(x[1] for x in current_lineages)
+        j = num_lineages
+        t0 = head_age
+        num_events = 0
+        weighted_time = 0.0
+        for t1 in event_ages:
+            if j == 1:
+                break
+            weighted_time += j * (j-1) * (t1 - t0)
+            num_events += 1
+            j -= 1
+            t0 = t1
+        tail_weighted_time = 0.0
+        if j > 1:
+            tail_weighted_time = j * (j-1) * (tail_age - t0)
+        return (num_events, weighted_time, tail_weighted_time, exiting)
+
+    def _compose_species_edge_desc(self, e):
+        return "+".join(x.taxon.label for x in e.head_node.leaf_iter())
+
+    def _compose_lineage_desc(self, gene_idx, nd_idx):
+        tip_labels = self._tip_labels[gene_idx]
+        children = self._children[gene_idx]
+        labels = []
+        stack = [nd_idx]
+        while stack:
+            idx = stack.pop()
+            if children[idx]:
+                stack.extend(reversed(children[idx]))
+            else:
+                labels.append(str(tip_labels[idx]))
+        return "+".join(labels)
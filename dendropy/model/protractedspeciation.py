@@ -26,12 +26,10 @@ Models, modeling and model-fitting of the protracted speciation, as described in
 """
 
 import math
-import itertools
 import dendropy
 from dendropy.utility import GLOBAL_RNG
 from dendropy.utility.error import ProcessFailedException
 from dendropy.utility.error import TreeSimTotalExtinctionException
-from dendropy.calculate import probability
 
 
 def _D(speciation_initiation_rate,
@@ -332,6 +330,8 @@ class ProtractedSpeciationProcess(object):
             self.lineage_tree_node_history = []
             self._label = "L{}".format(self._index)
             self.orthospecies_index = orthospecies_index
+            self._pool_index = None
+            self._node_start_time = speciation_initiation_time
 
         def _get_node(self):
             return self.lineage_tree_node_history[-1]
@@ -376,9 +376,15 @@ class ProtractedSpeciationProcess(object):
         self.current_lineage_index = 0
         self.current_orthospecies_index = 0
         self.current_node_index = 0
-        self.current_orthospecies_lineages = []
-        self.current_incipient_species_lineages = []
+        try:
+            del self.current_orthospecies_lineages[:]
+            del self.current_incipient_species_lineages[:]
+        except AttributeError:
+            self.current_orthospecies_lineages = []
+            self.current_incipient_species_lineages = []
         self.lineage_to_orthospecies_tree_node_map = {}
+        self._orthospecies_tree_lineage_child_counts = None
+        self._num_orthospecies_tree_leaves = 0
 
     def generate_sample(self, **kwargs):
         """
@@ -470,6 +476,21 @@ class ProtractedSpeciationProcess(object):
         assert lineage_tree is not None
         return lineage_tree, orthospecies_tree
 
+    def iter_samples(self, num_samples=None, **kwargs):
+        """
+        Yields ``num_samples`` independent samples from the Protracted
+        Speciation Model process, each a tuple of the lineage tree and the
+        (ortho- or confirmed- or "good"-)species tree, as returned by
+        :meth:`generate_sample`. If ``num_samples`` is |None|, samples are
+        yielded indefinitely. The lineage pools and other working structures
+        of the process are reused between samples. Keyword arguments are as
+        for :meth:`generate_sample`.
+        """
+        num_generated = 0
+        while num_samples is None or num_generated < num_samples:
+            yield self.generate_sample(**dict(kwargs))
+            num_generated += 1
+
     # def correlate_lineage_and_species_trees(self,
     #         lineage_tree,
     #         orthospecies_tree):
@@ -659,6 +680,10 @@ class ProtractedSpeciationProcess(object):
         max_extant_orthospecies = kwargs.get("max_extant_orthospecies", None)
         is_correlate_lineage_and_species_trees = kwargs.get("is_correlate_lineage_and_species_trees", False)
         taxon_namespace = kwargs.get("taxon_namespace", None)
+        if max_extant_orthospecies is not None:
+            # track the number of leaves on the orthospecies tree as the
+            # process runs, instead of assembling the tree at each step
+            self._orthospecies_tree_lineage_child_counts = {}
         initial_lineage = self._new_lineage(
                 parent_lineage=None,
                 orthospecies_index=self.current_orthospecies_index,
@@ -667,81 +692,67 @@ class ProtractedSpeciationProcess(object):
         seed_node = self._new_node(lineage=initial_lineage)
         lineage_tree = self.tree_factory( taxon_namespace=taxon_namespace, seed_node=seed_node)
         lineage_tree.is_rooted = True
+        if initial_lineage.is_orthospecies and max_extant_orthospecies is not None:
+            self._add_lineage_to_orthospecies_tree(initial_lineage)
+
+        orthospecies_lineages = self.current_orthospecies_lineages
+        incipient_species_lineages = self.current_incipient_species_lineages
+        orthospecies_event_rate = self.speciation_initiation_from_orthospecies_rate + self.orthospecies_extinction_rate
+        incipient_species_event_rate = (self.speciation_initiation_from_incipient_species_rate
+                + self.speciation_completion_rate
+                + self.incipient_species_extinction_rate)
 
         while True:
 
             ## Draw time to next event
-            event_rates = []
-            num_orthospecies = len(self.current_orthospecies_lineages)
-            if max_extant_orthospecies is not None:
-                ## note: expensive operation to count leaves!
-                try:
-                    orthospecies_tree = self._assemble_orthospecies_tree(taxon_namespace=taxon_namespace)
-                    num_leaves = len(orthospecies_tree.leaf_nodes())
-                    if num_leaves >= max_extant_orthospecies:
-                        return self._postprocess_psm_and_orthospecies_trees(
-                                orthospecies_tree=orthospecies_tree,
-                                lineage_tree=lineage_tree,
-                                is_correlate_lineage_and_species_trees=is_correlate_lineage_and_species_trees,
-                                )
-                except ProcessFailedException:
-                    pass
-
-            num_incipient_species = len(self.current_incipient_species_lineages)
+            num_orthospecies = len(orthospecies_lineages)
+            if max_extant_orthospecies is not None and self._count_orthospecies_tree_leaves() >= max_extant_orthospecies:
+                orthospecies_tree = self._assemble_orthospecies_tree(taxon_namespace=taxon_namespace)
+                self._update_lineage_tree_edge_lengths()
+                return self._postprocess_psm_and_orthospecies_trees(
+                        orthospecies_tree=orthospecies_tree,
+                        lineage_tree=lineage_tree,
+                        is_correlate_lineage_and_species_trees=is_correlate_lineage_and_species_trees,
+                        )
+
+            num_incipient_species = len(incipient_species_lineages)
             if max_extant_lineages is not None and (num_incipient_species + num_orthospecies) >= max_extant_lineages:
                 break
 
-            # Event type 0
-            event_rates.append(self.speciation_initiation_from_orthospecies_rate * num_orthospecies)
-
-            # Event type 1
-            event_rates.append(self.orthospecies_extinction_rate * num_orthospecies)
-
-            # Event type 2
-            event_rates.append(self.speciation_initiation_from_incipient_species_rate * num_incipient_species)
-
-            # Event type 3
-            event_rates.append(self.speciation_completion_rate * num_incipient_species)
-
-            # Event type 4
-            event_rates.append(self.incipient_species_extinction_rate * num_incipient_species)
-
             # All events
-            rate_of_any_event = sum(event_rates)
+            orthospecies_rate = orthospecies_event_rate * num_orthospecies
+            rate_of_any_event = orthospecies_rate + incipient_species_event_rate * num_incipient_species
 
             # Waiting time
             waiting_time = self.rng.expovariate(rate_of_any_event)
             if max_time and (self.current_time + waiting_time) > max_time:
-                t = max_time - self.current_time
-                for lineage in itertools.chain(self.current_orthospecies_lineages, self.current_incipient_species_lineages):
-                    lineage.node.edge.length += t
                 self.current_time = max_time
                 break
             self.current_time += waiting_time
-            for lineage in itertools.chain(self.current_orthospecies_lineages, self.current_incipient_species_lineages):
-                lineage.node.edge.length += waiting_time
-
-            # Select event
-            event_type_idx = probability.weighted_index_choice(weights=event_rates, rng=self.rng)
-            assert (event_type_idx >= 0 and event_type_idx <= 4)
-            # print("time {}: {}, selected = {}".format(self.current_time, event_rates, event_type_idx))
-
-            if event_type_idx == 0:
-                self._process_initiation_of_speciation_from_orthospecies(lineage_tree)
-            elif event_type_idx == 1:
-                self._process_orthospecies_extinction(lineage_tree)
-            elif event_type_idx == 2:
-                self._process_initiation_of_speciation_from_incipient_species(lineage_tree)
-            elif event_type_idx == 3:
-                self._process_completion_of_specation(lineage_tree)
-            elif event_type_idx == 4:
-                self._process_incipient_species_extinction(lineage_tree)
-            else:
-                raise Exception("Unexpected event type index: {}".format(event_type_idx))
 
-            if len(self.current_orthospecies_lineages) + len(self.current_incipient_species_lineages) == 0:
+            # Select event: the event type is selected with probability
+            # proportional to its total rate, and then the lineage uniformly
+            # from the pool of lineages subject to it
+            rnd = self.rng.random() * rate_of_any_event
+            if rnd < orthospecies_rate:
+                if rnd < self.speciation_initiation_from_orthospecies_rate * num_orthospecies:
+                    self._process_initiation_of_speciation_from_orthospecies(lineage_tree)
+                else:
+                    self._process_orthospecies_extinction(lineage_tree)
+            else:
+                rnd -= orthospecies_rate
+                threshold = self.speciation_initiation_from_incipient_species_rate * num_incipient_species
+                if rnd < threshold:
+                    self._process_initiation_of_speciation_from_incipient_species(lineage_tree)
+                elif rnd < threshold + self.speciation_completion_rate * num_incipient_species:
+                    self._process_completion_of_specation(lineage_tree)
+                else:
+                    self._process_incipient_species_extinction(lineage_tree)
+
+            if len(orthospecies_lineages) + len(incipient_species_lineages) == 0:
                 raise TreeSimTotalExtinctionException()
 
+        self._update_lineage_tree_edge_lengths()
         orthospecies_tree = self._assemble_orthospecies_tree(taxon_namespace=taxon_namespace)
         return self._postprocess_psm_and_orthospecies_trees(
                 lineage_tree=lineage_tree,
@@ -749,6 +760,73 @@ class ProtractedSpeciationProcess(object):
                 is_correlate_lineage_and_species_trees=is_correlate_lineage_and_species_trees,
                 )
 
+    def _update_lineage_tree_edge_lengths(self):
+        # The edges of the nodes of extant lineages grow with time; rather
+        # than being extended at every event, their lengths are brought up to
+        # date when the node is split or the process ends.
+        for lineage_pool in (self.current_orthospecies_lineages, self.current_incipient_species_lineages):
+            for lineage in lineage_pool:
+                lineage.node.edge.length += self.current_time - lineage._node_start_time
+                lineage._node_start_time = self.current_time
+
+    def _add_lineage_to_pool(self, lineage_pool, lineage):
+        lineage._pool_index = len(lineage_pool)
+        lineage_pool.append(lineage)
+
+    def _remove_lineage_from_pool(self, lineage_pool, lineage):
+        idx = lineage._pool_index
+        last_lineage = lineage_pool.pop()
+        if last_lineage is not lineage:
+            lineage_pool[idx] = last_lineage
+            last_lineage._pool_index = idx
+        lineage._pool_index = None
+
+    def _add_lineage_to_orthospecies_tree(self, lineage):
+        # The orthospecies tree consists of the extant "good" species
+        # lineages and their ancestral lineages, which are themselves marked
+        # as "good" species, as in ``_assemble_orthospecies_tree``. Each
+        # lineage on the tree maps to the number of its daughter lineages on
+        # the tree; its leaves are the lineages without any.
+        child_counts = self._orthospecies_tree_lineage_child_counts
+        if lineage in child_counts:
+            return
+        child_counts[lineage] = 0
+        self._num_orthospecies_tree_leaves += 1
+        parent_lineage = lineage.parent_lineage
+        while parent_lineage is not None:
+            if parent_lineage in child_counts:
+                if child_counts[parent_lineage] == 0:
+                    self._num_orthospecies_tree_leaves -= 1
+                child_counts[parent_lineage] += 1
+                break
+            child_counts[parent_lineage] = 1
+            parent_lineage.is_orthospecies = True
+            parent_lineage = parent_lineage.parent_lineage
+
+    def _remove_lineage_from_orthospecies_tree(self, lineage):
+        child_counts = self._orthospecies_tree_lineage_child_counts
+        if child_counts is None or child_counts.get(lineage, None) != 0:
+            return
+        del child_counts[lineage]
+        self._num_orthospecies_tree_leaves -= 1
+        parent_lineage = lineage.parent_lineage
+        while parent_lineage is not None:
+            child_counts[parent_lineage] -= 1
+            if child_counts[parent_lineage] > 0:
+                break
+            if parent_lineage._pool_index is not None:
+                # extant, and so remains on the tree as a leaf
+                self._num_orthospecies_tree_leaves += 1
+                break
+            del child_counts[parent_lineage]
+            parent_lineage = parent_lineage.parent_lineage
+
+    def _count_orthospecies_tree_leaves(self):
+        # a tree consisting of the initial lineage alone cannot be assembled
+        if len(self._orthospecies_tree_lineage_child_counts) <= 1:
+            return 0
+        return self._num_orthospecies_tree_leaves
+
     def _process_initiation_of_speciation_from_orthospecies(self, tree):
         # parent_lineage = self.rng.choice(self.current_orthospecies_lineages)
         # parent_node = parent_lineage.node
@@ -779,6 +857,7 @@ class ProtractedSpeciationProcess(object):
 
     def _process_initiation_of_speciation(self, parent_lineage):
         parent_node = parent_lineage.node
+        parent_node.edge.length += self.current_time - parent_lineage._node_start_time
         new_lineage = self._new_lineage(
                 parent_lineage=parent_lineage,
                 orthospecies_index=parent_lineage.orthospecies_index,
@@ -808,12 +887,14 @@ class ProtractedSpeciationProcess(object):
     def _process_completion_of_specation(self, tree):
 
         lineage = self.rng.choice(self.current_incipient_species_lineages)
-        self.current_incipient_species_lineages.remove(lineage)
-        self.current_orthospecies_lineages.append(lineage)
+        self._remove_lineage_from_pool(self.current_incipient_species_lineages, lineage)
+        self._add_lineage_to_pool(self.current_orthospecies_lineages, lineage)
         self.current_orthospecies_index += 1
         lineage.orthospecies_index = self.current_orthospecies_index
         lineage.is_orthospecies = True
         lineage.speciation_completion_time = self.current_time
+        if self._orthospecies_tree_lineage_child_counts is not None:
+            self._add_lineage_to_orthospecies_tree(lineage)
 
         # original_lineage = self.rng.choice(self.current_incipient_species_lineages)
         # self.current_incipient_species_lineages.remove(original_lineage)
@@ -890,19 +971,38 @@ class ProtractedSpeciationProcess(object):
     def _process_orthospecies_extinction(self, tree):
         sp = self.rng.choice(self.current_orthospecies_lineages)
         sp.extinction_time = self.current_time
-        self.current_orthospecies_lineages.remove(sp)
+        self._remove_lineage_from_pool(self.current_orthospecies_lineages, sp)
         self._make_lineage_extinct_on_phylogeny(tree, sp.node)
+        self._remove_lineage_from_orthospecies_tree(sp)
 
     def _process_incipient_species_extinction(self, tree):
         sp = self.rng.choice(self.current_incipient_species_lineages)
         sp.extinction_time = self.current_time
-        self.current_incipient_species_lineages.remove(sp)
+        self._remove_lineage_from_pool(self.current_incipient_species_lineages, sp)
         self._make_lineage_extinct_on_phylogeny(tree, sp.node)
+        self._remove_lineage_from_orthospecies_tree(sp)
 
     def _make_lineage_extinct_on_phylogeny(self, tree, sp):
         if len(self.current_orthospecies_lineages) == 0 and len(self.current_incipient_species_lineages) == 0:
             raise TreeSimTotalExtinctionException()
-        tree.prune_subtree(sp)
+        # Equivalent to ``tree.prune_subtree(sp)``, but, as all other nodes
+        # have two children, only the parent of the pruned node needs to be
+        # checked for suppression.
+        parent_node = sp._parent_node
+        parent_node.remove_child(sp)
+        if len(parent_node._child_nodes) == 1:
+            child_node = parent_node._child_nodes[0]
+            child_node.edge.length += parent_node.edge.length
+            grandparent_node = parent_node._parent_node
+            if grandparent_node is not None:
+                pos = grandparent_node._child_nodes.index(parent_node)
+                grandparent_node.remove_child(parent_node)
+                grandparent_node.insert_child(index=pos, node=child_node)
+                parent_node._parent_node = None
+            else:
+                parent_node.remove_child(child_node)
+                tree.seed_node = child_node
+                tree.seed_node._parent_node = None
 
     def _new_lineage(self,
             parent_lineage,
@@ -920,9 +1020,9 @@ class ProtractedSpeciationProcess(object):
                 orthospecies_index=orthospecies_index)
         if add_to_current_lineages:
             if is_orthospecies:
-                self.current_orthospecies_lineages.append(new_lineage)
+                self._add_lineage_to_pool(self.current_orthospecies_lineages, new_lineage)
             else:
-                self.current_incipient_species_lineages.append(new_lineage)
+                self._add_lineage_to_pool(self.current_incipient_species_lineages, new_lineage)
         return new_lineage
 
     def _new_node(self,
@@ -939,43 +1039,32 @@ class ProtractedSpeciationProcess(object):
         node.annotations.add_new(name="lineage_label", value=lineage.label)
         node.annotations.add_new(name="speciation_initiation_time", value=lineage.speciation_initiation_time)
         lineage.node = node
+        lineage._node_start_time = self.current_time
         return node
 
     def _assemble_orthospecies_tree(self, taxon_namespace=None):
-        lineage_set = set(self.current_incipient_species_lineages + self.current_orthospecies_lineages)
-        sorted_lineages = sorted(lineage_set,
+        # The "good" species lineages and all their ancestors (which are
+        # marked as "good" species in turn) are joined to their parent
+        # lineages, from the most recently to the least recently initiated.
+        orthospecies_tree_lineages = set()
+        for lineage_pool in (self.current_incipient_species_lineages, self.current_orthospecies_lineages):
+            for lineage in lineage_pool:
+                if not lineage.is_orthospecies:
+                    continue
+                while lineage is not None and lineage not in orthospecies_tree_lineages:
+                    orthospecies_tree_lineages.add(lineage)
+                    lineage.is_orthospecies = True
+                    lineage = lineage.parent_lineage
+        sorted_lineages = sorted(orthospecies_tree_lineages,
                 key = lambda x: -x.speciation_initiation_time)
         self.lineage_to_orthospecies_tree_node_map = {}
-        while sorted_lineages:
-            lineage = sorted_lineages.pop(0)
-            lineage_set.remove(lineage)
+        for lineage in sorted_lineages:
             parent_lineage = lineage.parent_lineage
             if parent_lineage is None:
                 break
-            if lineage.is_orthospecies:
-                orthospecies_tree_node = self._require_orthospecies_tree_node(lineage=lineage)
-                # try:
-                #     orthospecies_tree_node = self.lineage_to_orthospecies_tree_node_map[lineage]
-                # except KeyError:
-                #     orthospecies_tree_node = dendropy.Node()
-                #     orthospecies_tree_node.label = "L{}".format(lineage.index)
-                #     orthospecies_tree_node.protracted_speciation_model_lineage = lineage
-                #     self.lineage_to_orthospecies_tree_node_map[lineage] = orthospecies_tree_node
-                if lineage.is_orthospecies:
-                    parent_lineage.is_orthospecies = True
-                # try:
-                #     orthospecies_tree_parent_node = self.lineage_to_orthospecies_tree_node_map[parent_lineage]
-                # except KeyError:
-                #     orthospecies_tree_parent_node = dendropy.Node()
-                #     orthospecies_tree_parent_node.label = "L{}".format(parent_lineage.index)
-                #     orthospecies_tree_parent_node.protracted_speciation_model_lineage = parent_lineage
-                #     self.lineage_to_orthospecies_tree_node_map[parent_lineage] = orthospecies_tree_parent_node
-                orthospecies_tree_parent_node = self._require_orthospecies_tree_node(lineage=parent_lineage)
-                orthospecies_tree_parent_node.add_child(orthospecies_tree_node)
-                if parent_lineage not in lineage_set:
-                    lineage_set.add(parent_lineage)
-                    sorted_lineages = sorted(lineage_set,
-                            key = lambda x: -x.speciation_initiation_time)
+            orthospecies_tree_node = self._require_orthospecies_tree_node(lineage=lineage)
+            orthospecies_tree_parent_node = self._require_orthospecies_tree_node(lineage=parent_lineage)
+            orthospecies_tree_parent_node.add_child(orthospecies_tree_node)
 
         # identify seed node
         seed_node = None
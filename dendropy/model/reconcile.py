@@ -21,6 +21,8 @@ Classes and Methods for working with tree reconciliation, fitting, embedding,
 contained/containing etc.
 """
 
+import collections
+import multiprocessing
 import dendropy
 from dendropy.model import coalescent
 
@@ -474,6 +476,292 @@ class ContainingTree(dendropy.Tree):
         nw._write_trees_block(out, dendropy.TreeList(self.contained_trees, taxon_namespace=contained_taxon_namespace, label=contained_label))
         out.write('\n')
 
+##############################################################################
+## Batch Reconciliation
+
+ReconciliationCounts = collections.namedtuple("ReconciliationCounts",
+        ["num_deep_coalescences", "num_duplications", "num_losses"])
+
+class _LcaTable(object):
+    """
+    Answers lowest common ancestor queries on a tree in constant time, using
+    a sparse table of minimum-depth nodes over an Euler tour of the tree.
+    Nodes are identified by integer indexes; the tables are plain lists so
+    that the object can be cheaply passed to other processes.
+    """
+
+    def __init__(self, depths, euler_tour, first_visits):
+        self.depths = depths
+        self.first_visits = first_visits
+        table = [euler_tour]
+        span = 1
+        while 2 * span <= len(euler_tour):
+            prev = table[-1]
+            row = []
+            for i in range(len(euler_tour) - 2 * span + 1):
+                x = prev[i]
+                y = prev[i + span]
+                row.append(x if depths[x] <= depths[y] else y)
+            table.append(row)
+            span *= 2
+        self.table = table
+
+    def lca(self, a, b):
+        if a == b:
+            return a
+        i = self.first_visits[a]
+        j = self.first_visits[b]
+        if i > j:
+            i, j = j, i
+        k = (j - i + 1).bit_length() - 1
+        row = self.table[k]
+        x = row[i]
+        y = row[j - (1 << k) + 1]
+        if self.depths[x] <= self.depths[y]:
+            return x
+        return y
+
+    def distance(self, a, b):
+        depths = self.depths
+        return depths[a] + depths[b] - 2 * depths[self.lca(a, b)]
+
+def _reconcile_encoded_tree(lca_table, parents, leaf_species):
+    """
+    Reconciles a gene tree, given as a list of parent indexes of its nodes in
+    preorder (-1 for the root) and a list of the species node indexes to
+    which its leaves map (-1 for internal nodes), in a single pass over the
+    nodes in reverse preorder. Returns a ``ReconciliationCounts`` object and
+    the list of species node indexes to which each gene node maps.
+    """
+    depths = lca_table.depths
+    lca = lca_table.lca
+    num_nodes = len(parents)
+    mapped = list(leaf_species)
+    num_children = [0] * num_nodes
+    child_depth_sums = [0] * num_nodes
+    min_child_depths = [0] * num_nodes
+    num_lineage_edges = 0
+    num_duplications = 0
+    num_losses = 0
+    for idx in range(num_nodes - 1, -1, -1):
+        species_idx = mapped[idx]
+        depth = depths[species_idx]
+        k = num_children[idx]
+        if k:
+            # number of species edges crossed by the child lineages before
+            # they coalesce in this node
+            path_length = child_depth_sums[idx] - k * depth
+            num_lineage_edges += path_length
+            if k > 1 and min_child_depths[idx] == depth:
+                num_duplications += 1
+                num_losses += path_length
+            elif k > 1:
+                num_losses += path_length - k
+        parent_idx = parents[idx]
+        if parent_idx >= 0:
+            if num_children[parent_idx]:
+                mapped[parent_idx] = lca(mapped[parent_idx], species_idx)
+                if depth < min_child_depths[parent_idx]:
+                    min_child_depths[parent_idx] = depth
+            else:
+                mapped[parent_idx] = species_idx
+                min_child_depths[parent_idx] = depth
+            child_depth_sums[parent_idx] += depth
+            num_children[parent_idx] += 1
+    # every species edge in the subtree spanned by the species of the leaves
+    # contains at least one lineage, and so contributes one less than the
+    # number of lineages it contains to the number of deep coalescences; the
+    # number of edges in the subtree is half the length of a tour through its
+    # leaves in Euler tour order
+    leaf_species_set = sorted(set(x for x in leaf_species if x >= 0), key=lca_table.first_visits.__getitem__)
+    tour_length = 0
+    for i in range(1, len(leaf_species_set)):
+        tour_length += lca_table.distance(leaf_species_set[i-1], leaf_species_set[i])
+    if len(leaf_species_set) > 1:
+        tour_length += lca_table.distance(leaf_species_set[-1], leaf_species_set[0])
+    num_deep_coalescences = num_lineage_edges - tour_length // 2
+    return ReconciliationCounts(num_deep_coalescences, num_duplications, num_losses), mapped
+
+_WORKER_LCA_TABLE = None
+
+def _initialize_reconciliation_worker(lca_table):
+    global _WORKER_LCA_TABLE
+    _WORKER_LCA_TABLE = lca_table
+
+def _reconcile_encoded_trees(encoded_trees):
+    return [_reconcile_encoded_tree(_WORKER_LCA_TABLE, parents, leaf_species)[0]
+            for parents, leaf_species in encoded_trees]
+
+class ReconciliationIndex(object):
+    """
+    Reconciles many gene (or other contained) trees with a single species (or
+    other containing) tree.
+
+    A lowest common ancestor (LCA) index of the species tree is built once,
+    on construction, after which each node of a gene tree can be mapped to
+    the species tree node that is the LCA of the species of its leaves in
+    constant time. The numbers of deep coalescences, gene duplications and
+    gene losses implied by a gene tree are then calculated in a single pass
+    over its nodes.
+
+    Unlike :class:`ContainingTree`, no edge lengths are taken into account: gene
+    tree nodes are mapped to the species tree nodes at which they can first
+    coalesce, as in :func:`reconciliation_discordance`. Both trees are
+    treated as rooted.
+    """
+
+    def __init__(self, species_tree, contained_to_containing_taxon_map=None):
+        """
+        Parameters
+        ----------
+        species_tree : |Tree|
+            The species or other containing tree.
+        contained_to_containing_taxon_map : |TaxonNamespaceMapping| or dict
+            Maps the |Taxon| objects of the gene trees to the |Taxon| objects
+            of ``species_tree``. If not given, then the gene trees are
+            expected to have the same taxa as the species tree.
+        """
+        self.species_tree = species_tree
+        self.contained_to_containing_taxon_map = contained_to_containing_taxon_map
+        self._species_nodes = []
+        self._species_taxon_node_indexes = {}
+        self._contained_taxon_node_indexes = {}
+        depths = []
+        euler_tour = []
+        first_visits = []
+        stack = [(species_tree.seed_node, 0)]
+        while stack:
+            nd, depth = stack.pop()
+            if nd is None:
+                # returning to the parent
+                euler_tour.append(depth)
+                continue
+            idx = len(self._species_nodes)
+            self._species_nodes.append(nd)
+            depths.append(depth)
+            first_visits.append(len(euler_tour))
+            euler_tour.append(idx)
+            if nd.taxon is not None:
+                self._species_taxon_node_indexes[nd.taxon] = idx
+            for ch in reversed(nd._child_nodes):
+                stack.append((None, idx))
+                stack.append((ch, depth + 1))
+        self._lca_table = _LcaTable(depths, euler_tour, first_visits)
+
+    def _get_species_node_index(self, taxon):
+        try:
+            return self._contained_taxon_node_indexes[taxon]
+        except KeyError:
+            pass
+        if self.contained_to_containing_taxon_map is None:
+            species_taxon = taxon
+        else:
+            species_taxon = self.contained_to_containing_taxon_map[taxon]
+        try:
+            idx = self._species_taxon_node_indexes[species_taxon]
+        except KeyError:
+            raise ValueError("Taxon '{}' not found on species tree".format(
+                species_taxon.label if species_taxon is not None else taxon.label))
+        self._contained_taxon_node_indexes[taxon] = idx
+        return idx
+
+    def _encode_gene_tree(self, gene_tree):
+        nodes = []
+        node_indexes = {}
+        parents = []
+        leaf_species = []
+        for nd in gene_tree.preorder_node_iter():
+            node_indexes[nd] = len(nodes)
+            nodes.append(nd)
+            parents.append(node_indexes.get(nd.parent_node, -1))
+            if nd._child_nodes:
+                leaf_species.append(-1)
+            else:
+                leaf_species.append(self._get_species_node_index(nd.taxon))
+        return nodes, parents, leaf_species
+
+    def map_gene_tree(self, gene_tree):
+        """
+        Returns a dictionary mapping each node of ``gene_tree`` to the node of
+        the species tree that is the lowest common ancestor of the species
+        of the leaves descending from it.
+        """
+        nodes, parents, leaf_species = self._encode_gene_tree(gene_tree)
+        _, mapped = _reconcile_encoded_tree(self._lca_table, parents, leaf_species)
+        species_nodes = self._species_nodes
+        return dict((nd, species_nodes[species_idx]) for nd, species_idx in zip(nodes, mapped))
+
+    def reconcile(self, gene_tree):
+        """
+        Returns a ``ReconciliationCounts`` object (a named tuple) with the
+        number of deep coalescences (``num_deep_coalescences``), gene
+        duplications (``num_duplications``) and gene losses (``num_losses``)
+        implied by ``gene_tree``. The numbers of duplications and losses
+        assume that the gene tree is fully resolved.
+        """
+        _, parents, leaf_species = self._encode_gene_tree(gene_tree)
+        return _reconcile_encoded_tree(self._lca_table, parents, leaf_species)[0]
+
+    def reconcile_trees(self, gene_trees, num_processes=1, chunk_size=None):
+        """
+        Returns a list of ``ReconciliationCounts`` objects, one for each tree
+        in ``gene_trees`` (see :meth:`reconcile`).
+
+        Parameters
+        ----------
+        gene_trees : iterable of |Tree| objects
+            The gene trees to reconcile.
+        num_processes : int
+            Number of processes over which to distribute the gene trees. If
+            |None|, the number of CPUs. The gene trees are encoded as lists
+            of integers in the current process, so using multiple processes
+            is only worthwhile with large numbers of large trees.
+        chunk_size : int
+            Number of gene trees in each task sent to other processes.
+            Defaults to 256.
+        """
+        if num_processes is None:
+            num_processes = multiprocessing.cpu_count()
+        if num_processes <= 1:
+            results = []
+            for gene_tree in gene_trees:
+                results.append(self.reconcile(gene_tree))
+            return results
+        if chunk_size is None:
+            chunk_size = 256
+        pool = multiprocessing.Pool(num_processes,
+                initializer=_initialize_reconciliation_worker,
+                initargs=(self._lca_table,))
+        try:
+            results = []
+            for chunk_results in pool.imap(_reconcile_encoded_trees, self._iter_encoded_chunks(gene_trees, chunk_size)):
+                results.extend(chunk_results)
+        finally:
+            pool.terminate()
+            pool.join()
+        return results
+
+    def _iter_encoded_chunks(self, gene_trees, chunk_size):
+        chunk = []
+        for gene_tree in gene_trees:
+            chunk.append(self._encode_gene_tree(gene_tree)[1:])
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def num_deep_coalescences(self, gene_trees, **kwargs):
+        """
+        Returns the total number of deep coalescences implied by the trees in
+        ``gene_trees``. Keyword arguments are passed to
+        :meth:`reconcile_trees`.
+        """
+        return sum(r.num_deep_coalescences for r in self.reconcile_trees(gene_trees, **kwargs))
+
+##############################################################################
+## Discordance
+
 def reconciliation_discordance(gene_tree, species_tree):
     """
     Given two trees (with splits encoded), this returns the number of gene
@@ -488,47 +776,13 @@ def reconciliation_discordance(gene_tree, species_tree):
         Maddison, W. P. 1997. Gene trees in species trees. Syst. Biol. 46:
         523-536.
 
-    This function requires that the gene tree and species tree *have the same
-    leaf set*. Note that for correct results,
-
-        (a) trees must be rooted (i.e., is_rooted = True)
-        (b) split masks must have been added as rooted (i.e., when
-            encode_splits was called, is_rooted must have been set to True)
+    The leaves of the gene tree must be associated with the same taxa as the
+    leaves of the species tree, and both trees are treated as rooted. To
+    reconcile many gene trees with the same species tree, use a
+    :class:`ReconciliationIndex` directly.
 
     """
-    taxa_mask = species_tree.taxon_namespace.all_taxa_bitmask()
-    species_node_gene_nodes = {}
-    gene_node_species_nodes = {}
-    for gnd in gene_tree.postorder_node_iter():
-        gn_children = gnd.child_nodes()
-        if len(gn_children) > 0:
-            ssplit = 0
-            for gn_child in gn_children:
-                ssplit = ssplit | gene_node_species_nodes[gn_child].edge.leafset_bitmask
-            sanc = species_tree.mrca(start_node=species_tree.seed_node, leafset_bitmask=ssplit)
-            gene_node_species_nodes[gnd] = sanc
-            if sanc not in species_node_gene_nodes:
-                species_node_gene_nodes[sanc] = []
-            species_node_gene_nodes[sanc].append(gnd)
-        else:
-            gene_node_species_nodes[gnd] = species_tree.find_node(lambda x : x.taxon == gnd.taxon)
-    contained_gene_lineages = {}
-    for snd in species_tree.postorder_node_iter():
-        if snd in species_node_gene_nodes:
-            for gnd in species_node_gene_nodes[snd]:
-                for gnd_child in gnd.child_nodes():
-                    sanc = gene_node_species_nodes[gnd_child]
-                    p = sanc
-                    while p is not None and p != snd:
-                        if p.edge not in contained_gene_lineages:
-                            contained_gene_lineages[p.edge] = 0
-                        contained_gene_lineages[p.edge] += 1
-                        p = p.parent_node
-
-    dc = 0
-    for v in contained_gene_lineages.values():
-        dc += v - 1
-    return dc
+    return ReconciliationIndex(species_tree).reconcile(gene_tree).num_deep_coalescences
 
 def monophyletic_partition_discordance(tree, taxon_namespace_partition):
     """
@@ -23,10 +23,13 @@ models.
 """
 
 from dendropy.model.continuous import evolve_continuous_char
+from dendropy.model.continuous import simulate_continuous_chars
+from dendropy.model.continuous import simulate_continuous_char_replicates
 from dendropy.model.discrete import DiscreteCharacterEvolutionModel
 from dendropy.model.discrete import DiscreteCharacterEvolver
 from dendropy.model.discrete import simulate_discrete_char_dataset
 from dendropy.model.discrete import simulate_discrete_chars
+from dendropy.model.discrete import simulate_discrete_char_replicates
 from dendropy.model.discrete import Hky85
 from dendropy.model.discrete import Jc69
 from dendropy.model.discrete import hky85_chars
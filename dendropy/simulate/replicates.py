@@ -0,0 +1,231 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Simulation of replicate trees in parallel, using multiple processes.
+
+Replicates are generated in chunks, with each chunk simulated in a worker
+process. Each replicate is simulated using its own random number generator,
+seeded with a value derived from a single master seed and the index of the
+replicate, so that the results are reproducible and independent of the
+number of processes or the chunk size used. The trees are returned from the
+workers either as Newick strings or as compact payloads (see
+:func:`dendropy.dataio.parallelreader.encode_tree`), from which they are
+reconstructed in the parent process, with all taxa mapped to a single
+|TaxonNamespace|.
+"""
+
+import hashlib
+import random
+import multiprocessing
+from dendropy.utility import GLOBAL_RNG
+from dendropy.datamodel import taxonmodel
+from dendropy.datamodel import treecollectionmodel
+from dendropy.dataio import parallelreader
+
+def replicate_seeds(seed, num_replicates, start=0):
+    """
+    Returns a list of seeds for the random number generators of replicates
+    ``start`` to ``start + num_replicates - 1``, derived from the master seed
+    ``seed``. The seed of each replicate depends only on the master seed
+    and the index of the replicate.
+    """
+    seeds = []
+    for idx in range(start, start + num_replicates):
+        digest = hashlib.sha256("{}:{}".format(seed, idx).encode("utf-8")).hexdigest()
+        seeds.append(int(digest[:16], 16))
+    return seeds
+
+##############################################################################
+## Workers
+
+def _simulate_chunk(task):
+    simulator, kwargs, seeds, as_newick = task
+    results = []
+    taxon_labels = []
+    taxon_index_map = {}
+    for seed in seeds:
+        tree = simulator(rng=random.Random(seed), **kwargs)
+        if as_newick:
+            results.append(tree.as_string(schema="newick"))
+            continue
+        for taxon in tree.taxon_namespace:
+            if taxon not in taxon_index_map:
+                taxon_index_map[taxon] = len(taxon_labels)
+                taxon_labels.append(taxon.label)
+        results.append(parallelreader.encode_tree(tree, taxon_index_map))
+    return taxon_labels, results
+
+##############################################################################
+## Parent
+
+def iter_replicate_trees(simulator,
+        num_replicates,
+        simulator_kwargs=None,
+        seed=None,
+        num_processes=None,
+        chunk_size=None,
+        as_newick=False,
+        taxon_namespace=None,
+        progress_hook=None):
+    """
+    Simulates ``num_replicates`` trees by calling ``simulator`` in parallel in
+    multiple processes, and yields the trees, in order, as they become
+    available.
+
+    Parameters
+    ----------
+    simulator : function object
+        Called as ``simulator(rng=rng, **simulator_kwargs)`` to simulate each
+        replicate, where ``rng`` is a ``random.Random`` instance specific to the
+        replicate, and returning a |Tree|, e.g.
+        :func:`dendropy.simulate.treesim.birth_death_tree` or
+        :func:`dendropy.simulate.treesim.pure_kingman_tree`. This must be
+        picklable (i.e., defined at the top level of a module) for it to be
+        called in other processes. Simulators that do not follow this
+        signature (e.g., :meth:`ProtractedSpeciationProcess.generate_sample`)
+        can be adapted by wrapping them in such a function.
+    num_replicates : int
+        Number of replicates.
+    simulator_kwargs : dict
+        Keyword arguments passed to ``simulator``; must be picklable.
+    seed : int
+        Master seed from which the seed of each replicate is derived. If not
+        given, one is drawn from ``GLOBAL_RNG``.
+    num_processes : int
+        Number of processes to use. Defaults to the number of CPUs. If 1, then
+        the replicates will be simulated in the current process.
+    chunk_size : int
+        Number of replicates to simulate in each task. Defaults to dividing
+        the replicates into four tasks per process.
+    as_newick : bool
+        If |True|, then the trees are yielded as Newick strings rather than
+        |Tree| objects.
+    taxon_namespace : |TaxonNamespace|
+        Namespace to which the taxa of the trees will be mapped (by label). If
+        not given, the "``taxon_namespace``" argument of the simulator (if
+        any) will be used, or otherwise a new one will be created.
+    progress_hook : function object
+        If given, this will be called after each chunk of replicates is
+        received, with the number of replicates completed so far and the
+        total number of replicates as arguments.
+    """
+    if simulator_kwargs is None:
+        simulator_kwargs = {}
+    if seed is None:
+        seed = GLOBAL_RNG.getrandbits(64)
+    if num_processes is None:
+        num_processes = multiprocessing.cpu_count()
+    num_processes = max(1, min(num_processes, num_replicates))
+    if chunk_size is None:
+        chunk_size = max(1, -(-num_replicates // (4 * num_processes)))
+    if taxon_namespace is None:
+        taxon_namespace = simulator_kwargs.get("taxon_namespace")
+    if taxon_namespace is None:
+        taxon_namespace = taxonmodel.TaxonNamespace()
+    tasks = []
+    for start in range(0, num_replicates, chunk_size):
+        seeds = replicate_seeds(seed, min(chunk_size, num_replicates - start), start=start)
+        tasks.append((simulator, simulator_kwargs, seeds, as_newick))
+    taxon_table = parallelreader._TaxonTable(taxon_namespace, None)
+    pool = None
+    if num_processes <= 1:
+        chunks = (_simulate_chunk(task) for task in tasks)
+    else:
+        pool = multiprocessing.Pool(num_processes)
+        chunks = pool.imap(_simulate_chunk, tasks)
+    try:
+        num_completed = 0
+        for taxon_labels, results in chunks:
+            if as_newick:
+                for result in results:
+                    yield result
+            else:
+                taxa = [taxon_table.get_taxon(label) for label in taxon_labels]
+                for payload in results:
+                    yield parallelreader.decode_tree(payload,
+                            taxa=taxa,
+                            tree_type=treecollectionmodel.TreeList.DEFAULT_TREE_TYPE,
+                            taxon_namespace=taxon_namespace)
+            num_completed += len(results)
+            if progress_hook is not None:
+                progress_hook(num_completed, num_replicates)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+def simulate_replicate_trees(simulator,
+        num_replicates,
+        simulator_kwargs=None,
+        tree_collection=None,
+        **kwargs):
+    """
+    Simulates ``num_replicates`` trees by calling ``simulator`` in parallel in
+    multiple processes, and returns them in a tree collection.
+
+    Parameters
+    ----------
+    simulator : function object
+        Called as ``simulator(rng=rng, **simulator_kwargs)`` to simulate each
+        replicate (see :func:`iter_replicate_trees`).
+    num_replicates : int
+        Number of replicates.
+    simulator_kwargs : dict
+        Keyword arguments passed to ``simulator``; must be picklable.
+    tree_collection : |TreeList| or |TreeArray|
+        Collection to which the trees will be added (with taxa mapped to its
+        |TaxonNamespace|). If not given, a new |TreeList| will be created
+        (using the "``taxon_namespace``" argument of the simulator, if any).
+    \*\*kwargs : keyword arguments
+        Passed to :func:`iter_replicate_trees` (``seed``, ``num_processes``,
+        ``chunk_size``, ``progress_hook``).
+
+    Returns
+    -------
+    t : |TreeList| or |TreeArray|
+        The collection of trees.
+
+    Examples
+    --------
+
+    ::
+
+        from dendropy.simulate import treesim
+
+        trees = treesim.simulate_replicate_trees(
+                treesim.birth_death_tree,
+                num_replicates=10000,
+                simulator_kwargs={"birth_rate": 1.0, "death_rate": 0.5, "ntax": 100},
+                seed=42)
+
+    """
+    if tree_collection is None:
+        tree_collection = treecollectionmodel.TreeList(
+                taxon_namespace=(simulator_kwargs or {}).get("taxon_namespace"))
+    if isinstance(tree_collection, treecollectionmodel.TreeArray):
+        add_tree = tree_collection.add_tree
+    else:
+        add_tree = tree_collection.append
+    for tree in iter_replicate_trees(simulator,
+            num_replicates,
+            simulator_kwargs=simulator_kwargs,
+            taxon_namespace=tree_collection.taxon_namespace,
+            **kwargs):
+        add_tree(tree)
+    return tree_collection
@@ -38,6 +38,8 @@ from dendropy.model.coalescent import pure_kingman_tree
 from dendropy.model.coalescent import mean_kingman_tree
 from dendropy.model.coalescent import constrained_kingman_tree
 from dendropy.model.treeshape import star_tree
+from dendropy.simulate.replicates import iter_replicate_trees
+from dendropy.simulate.replicates import simulate_replicate_trees
 
 ## Required for Sphix auto-documentation of this module
 __all__ = [
@@ -48,4 +50,6 @@ __all__ = [
     "mean_kingman_tree",
     "constrained_kingman_tree",
     "star_tree",
+    "iter_replicate_trees",
+    "simulate_replicate_trees",
     ]
@@ -20,8 +20,10 @@
 Tests of birth-death model fitting.
 """
 
+import random
 import unittest
 import dendropy
+from dendropy.calculate import probability
 from dendropy.test.support.mockrandom import MockRandom
 from dendropy.test.support import pathmap
 from dendropy.model import birthdeath
@@ -87,6 +89,49 @@ class BirthDeathTreeTest(unittest.TestCase):
             self.assertTrue(t._debug_tree_is_valid())
             self.assertEqual(num_leaves, len(t.leaf_nodes()))
 
+    def testMaxTime(self):
+        """test that extinct lineages are pruned and extant lineages extend to the end of the process."""
+        _RNG = MockRandom()
+        for i in range(20):
+            t = birthdeath.birth_death_tree(birth_rate=1.0, death_rate=0.4, max_time=2.5, rng=_RNG)
+            self.assertTrue(t._debug_tree_is_valid())
+            leaf_distances = [nd.distance_from_root() for nd in t.leaf_nodes()]
+            self.assertTrue(leaf_distances[0] >= 2.5)
+            for d in leaf_distances:
+                self.assertAlmostEqual(d, leaf_distances[0])
+            for nd in t.postorder_node_iter():
+                self.assertNotEqual(len(nd.child_nodes()), 1)
+
+    def testGSAUltrametric(self):
+        _RNG = MockRandom()
+        for num_leaves in range(2, 15):
+            t = birthdeath.birth_death_tree(birth_rate=1.0, death_rate=0.5, ntax=num_leaves, gsa_ntax=3*num_leaves, rng=_RNG)
+            leaf_distances = [nd.distance_from_root() for nd in t.leaf_nodes()]
+            for d in leaf_distances:
+                self.assertAlmostEqual(d, leaf_distances[0])
+
+class LineageEventSamplerTest(unittest.TestCase):
+
+    def testSampleMatchesLinearScan(self):
+        rng = random.Random(1)
+        sampler = birthdeath._LineageEventSampler()
+        lineages = []
+        for step in range(2000):
+            if len(lineages) < 2 or rng.random() < 0.55:
+                lineage = (step, rng.uniform(0.1, 2.0))
+                lineages.append(lineage)
+                sampler.add(lineage, lineage[1])
+            else:
+                lineage = lineages.pop(rng.randint(0, len(lineages)-1))
+                sampler.remove(lineage)
+            self.assertEqual(len(sampler), len(lineages))
+            self.assertAlmostEqual(sampler.total_rate(), sum(x[1] for x in lineages))
+            seed = rng.random()
+            selected, offset = sampler.sample(random.Random(seed))
+            expected_idx = probability.weighted_index_choice([x[1] for x in lineages], rng=random.Random(seed))
+            self.assertIs(selected, lineages[expected_idx])
+            self.assertTrue(0 <= offset <= selected[1])
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -20,6 +20,7 @@
 Tests of birth-death model fitting.
 """
 
+import math
 import unittest
 import dendropy
 from dendropy.test.support.mockrandom import MockRandom
@@ -72,5 +73,107 @@ class PureCoalescentTreeTest(unittest.TestCase):
         t = coalescent.pure_kingman_tree(tns, rng=_RNG)
         assert t._debug_tree_is_valid()
 
+class CoalesceNodesTest(unittest.TestCase):
+
+    def testConstrainedEdgeLengths(self):
+        _RNG = MockRandom()
+        for rep in range(50):
+            nodes = [dendropy.Node() for i in range(6)]
+            uncoalesced = coalescent.coalesce_nodes(nodes, pop_size=1, period=0.4, rng=_RNG)
+            self.assertTrue(1 <= len(uncoalesced) <= 6)
+            uncoalesced = coalescent.coalesce_nodes(uncoalesced, pop_size=1, period=0.3, rng=_RNG)
+            # all genes should have been extended to the end of both periods
+            for nd in nodes:
+                length = 0.0
+                while nd is not None:
+                    length += nd.edge.length
+                    nd = nd.parent_node
+                self.assertAlmostEqual(length, 0.7)
+            for nd in uncoalesced:
+                self.assertIs(nd.parent_node, None)
+
+    def testUnconstrained(self):
+        _RNG = MockRandom()
+        nodes = [dendropy.Node() for i in range(50)]
+        root = coalescent.coalesce_nodes(nodes, pop_size=1, rng=_RNG)
+        self.assertEqual(len(root), 1)
+        root = root[0]
+        self.assertEqual(root.edge.length, 0.0)
+        self.assertEqual(len(root.leaf_nodes()), 50)
+        distances = [nd.distance_from_root() for nd in nodes]
+        for d in distances:
+            self.assertAlmostEqual(d, distances[0])
+
+    def testExpectedTmrca(self):
+        rng = MockRandom()
+        tns = dendropy.TaxonNamespace(["t{}".format(i+1) for i in range(10)])
+        num_reps = 2000
+        total = 0.0
+        for rep in range(num_reps):
+            t = coalescent.pure_kingman_tree(tns, rng=rng)
+            total += t.seed_node.leaf_nodes()[0].distance_from_root()
+        # E[TMRCA] = 2(1 - 1/n) in population units
+        self.assertAlmostEqual(total/num_reps, 1.8, delta=0.1)
+
+class CoalescentFrameArrayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.trees = dendropy.TreeList.get(data="""
+            ((A:1.0,B:1.0):2.0,(C:2.0,D:2.0):1.0);
+            (((A:0.5,B:0.5):0.5,C:1.0):3.0,D:4.0);
+            ((A:1.5,B:1.5,C:1.5):1.0,D:2.5);
+            """, schema="newick")
+
+    def test_frames(self):
+        arr = coalescent.CoalescentFrameArray(self.trees)
+        self.assertEqual(len(arr), 3)
+        self.assertEqual(arr.offsets, [0, 3, 6, 8])
+        self.assertEqual(arr.tree_coalescence_ages(0), [1.0, 2.0, 3.0])
+        self.assertEqual(arr.tree_coalescence_ages(2), [1.5, 2.5])
+        self.assertEqual(arr.num_lineages, [4, 3, 2, 4, 3, 2, 4, 2])
+        for tree_idx, tree in enumerate(self.trees):
+            self.assertEqual(arr.frames(tree_idx), coalescent.extract_coalescent_frames(tree))
+        for tree_idx, age, expected in (
+                (0, 0.0, 4),
+                (0, 1.0, 3),
+                (0, 2.5, 2),
+                (0, 3.0, 1),
+                (1, 0.75, 3),
+                (2, 1.5, 2),
+                (2, 10.0, 1),
+                ):
+            self.assertEqual(arr.num_lineages_at(tree_idx, age), expected)
+
+    def test_constant_size(self):
+        arr = coalescent.CoalescentFrameArray()
+        arr.add_trees(self.trees)
+        pop_sizes = [0.5, 1.0, 4.0]
+        lps = arr.log_probabilities(pop_sizes)
+        self.assertEqual(len(lps), 3)
+        for tree, tree_lps in zip(self.trees, lps):
+            self.assertEqual(len(tree_lps), 3)
+            for pop_size, lp in zip(pop_sizes, tree_lps):
+                self.assertAlmostEqual(lp,
+                        coalescent.log_probability_of_coalescent_tree(tree, pop_size))
+
+    def test_piecewise_constant_size(self):
+        arr = coalescent.CoalescentFrameArray(self.trees)
+        pop_sizes = [[1.0, 2.0, 4.0], [0.5, 0.5, 0.5]]
+        lps = arr.log_probabilities_piecewise_constant([1.5, 2.5], pop_sizes)
+        # first tree: 6 lineage pairs for 1.0 in first epoch, 3 pairs for 0.5
+        # in first and 0.5 in second epoch, 1 pair for 0.5 in second and 0.5
+        # in third epoch
+        expected = (math.log(6.0 / 1.0) - 6.0 * 1.0 / 1.0
+                + math.log(3.0 / 2.0) - 3.0 * 0.5 / 1.0 - 3.0 * 0.5 / 2.0
+                + math.log(1.0 / 4.0) - 1.0 * 0.5 / 2.0 - 1.0 * 0.5 / 4.0)
+        self.assertAlmostEqual(lps[0][0], expected)
+        constant_lps = arr.log_probabilities([0.5])
+        for tree_lps, tree_constant_lps in zip(lps, constant_lps):
+            self.assertAlmostEqual(tree_lps[1], tree_constant_lps[0])
+        self.assertRaises(ValueError, arr.log_probabilities_piecewise_constant,
+                [2.5, 1.5], pop_sizes)
+        self.assertRaises(ValueError, arr.log_probabilities_piecewise_constant,
+                [1.5], pop_sizes)
+
 if __name__ == "__main__":
     unittest.main()
@@ -20,6 +20,8 @@
 Continuous character tests.
 """
 
+import math
+import random
 import unittest
 import inspect
 import dendropy
@@ -162,6 +164,43 @@ class BifurcatingTreePICTest(dendropytest.ExtendedTestCase):
                 for vidx, val in enumerate(vals):
                     self.assertAlmostEqual(vals[vidx], exp_vals[vidx])
 
+    def testStructureContrasts(self):
+        structure = continuous.PhylogeneticIndependentContrastsStructure(self.tree)
+        result = structure.contrasts(self.char_matrix)
+        self.assertEqual(result.num_chars, 2)
+        for node_idx, nd in enumerate(structure.nodes):
+            if nd.is_leaf():
+                self.assertEqual(result.state_values[node_idx], list(self.char_matrix[nd.taxon]))
+                self.assertIs(result.contrasts_raw[node_idx], None)
+                continue
+            for cidx in range(2):
+                exp_vals = self.expected_vals[cidx][nd.label]
+                self.assertAlmostEqual(result.state_values[node_idx][cidx], exp_vals[0])
+                self.assertAlmostEqual(result.contrasts_raw[node_idx][cidx], exp_vals[2])
+                self.assertAlmostEqual(result.contrasts_standardized[node_idx][cidx],
+                        exp_vals[2] / (exp_vals[3] ** 0.5))
+            self.assertAlmostEqual(result.contrast_variances[node_idx], exp_vals[3])
+            if nd.edge.length:
+                self.assertAlmostEqual(result.corrected_edge_lengths[node_idx], exp_vals[1])
+        self.assertEqual(len(result.contrasts_matrix()), 4)
+        self.assertEqual(len(result.contrasts_matrix()[0]), 2)
+
+    def testStructureReuseAndCharacterSubsets(self):
+        structure = continuous.PhylogeneticIndependentContrastsStructure(self.tree)
+        result = structure.contrasts(self.char_matrix, character_indexes=[1])
+        shifted_data = dict((taxon, [v + 10.0 for v in self.char_matrix[taxon]])
+                for taxon in self.char_matrix)
+        shifted_result = structure.contrasts(shifted_data)
+        for node_idx, nd in enumerate(structure.nodes):
+            if nd.is_leaf():
+                continue
+            exp_vals = self.expected_vals[1][nd.label]
+            self.assertEqual(len(result.state_values[node_idx]), 1)
+            self.assertAlmostEqual(result.state_values[node_idx][0], exp_vals[0])
+            self.assertAlmostEqual(result.contrasts_raw[node_idx][0], exp_vals[2])
+            self.assertAlmostEqual(shifted_result.state_values[node_idx][1], exp_vals[0] + 10.0)
+            self.assertAlmostEqual(shifted_result.contrasts_raw[node_idx][1], exp_vals[2])
+
 class MultifurcatingTreePICTest(dendropytest.ExtendedTestCase):
 
     def setUp(self):
@@ -212,6 +251,109 @@ class MultifurcatingTreePICTest(dendropytest.ExtendedTestCase):
                 polytomy_strategy="Resolve")
         ctree = pic.contrasts_tree(1)
 
+    def testStructure(self):
+        self.assertRaises(ValueError,
+                continuous.PhylogeneticIndependentContrastsStructure,
+                self.tree)
+        structure = continuous.PhylogeneticIndependentContrastsStructure(self.tree,
+                polytomy_strategy="ignore")
+        self.assertIs(structure.tree, self.tree)
+        result = structure.contrasts(self.char_matrix)
+        self.assertEqual(len(result.contrasts_matrix()), 1)
+        for node_idx, nd in enumerate(structure.nodes):
+            if not nd.is_leaf():
+                self.assertEqual(len(result.state_values[node_idx]), 2)
+            if len(nd.child_nodes()) > 2:
+                self.assertIs(result.contrasts_raw[node_idx], None)
+                self.assertIsNot(result.contrast_variances[node_idx], None)
+        structure = continuous.PhylogeneticIndependentContrastsStructure(self.tree,
+                polytomy_strategy="resolve")
+        self.assertIsNot(structure.tree, self.tree)
+        result = structure.contrasts(self.char_matrix)
+        self.assertEqual(len(result.contrasts_matrix(standardized=False)), 7)
+
+class MultivariateContinuousCharSimulationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = dendropy.Tree.get(
+                data="((A:1,B:1):2,(C:2.5,D:0.5):0.5);",
+                schema="newick")
+        self.taxa = dict((t.label, t) for t in self.tree.taxon_namespace)
+        self.rate_matrix = [[2.0, 0.8], [0.8, 1.0]]
+
+    def get_covariance(self, char_matrices, label1, char_idx1, label2, char_idx2):
+        xs = [m[self.taxa[label1]][char_idx1] for m in char_matrices]
+        ys = [m[self.taxa[label2]][char_idx2] for m in char_matrices]
+        mean_x = sum(xs) / len(xs)
+        mean_y = sum(ys) / len(ys)
+        return mean_x, mean_y, sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / len(xs)
+
+    def test_brownian_motion_moments(self):
+        char_matrices = continuous.simulate_continuous_char_replicates(
+                self.tree,
+                num_replicates=5000,
+                rate_matrix=self.rate_matrix,
+                root_states=[1.0, -1.0],
+                rng=random.Random(42))
+        self.assertEqual(len(char_matrices), 5000)
+        for label1, char_idx1, label2, char_idx2, expected_cov in (
+                ("A", 0, "A", 0, 6.0),
+                ("A", 0, "B", 0, 4.0),
+                ("A", 0, "A", 1, 2.4),
+                ("C", 1, "C", 1, 3.0),
+                ("C", 0, "D", 1, 0.4),
+                ("A", 0, "C", 0, 0.0),
+                ):
+            mean_x, mean_y, cov = self.get_covariance(char_matrices, label1, char_idx1, label2, char_idx2)
+            self.assertAlmostEqual(mean_x, [1.0, -1.0][char_idx1], delta=0.15)
+            self.assertAlmostEqual(mean_y, [1.0, -1.0][char_idx2], delta=0.15)
+            self.assertAlmostEqual(cov, expected_cov, delta=0.1 * max(1.0, expected_cov))
+
+    def test_ornstein_uhlenbeck_moments(self):
+        for ou_alpha in (0.5, [0.5, 0.5]):
+            char_matrices = continuous.simulate_continuous_char_replicates(
+                    self.tree,
+                    num_replicates=5000,
+                    rate_matrix=self.rate_matrix,
+                    root_states=[1.0, -1.0],
+                    ou_alpha=ou_alpha,
+                    ou_optima=[3.0, 0.0],
+                    rng=random.Random(42))
+            mean_x, mean_y, cov = self.get_covariance(char_matrices, "C", 0, "C", 1)
+            self.assertAlmostEqual(mean_x, 3.0 - 2.0 * math.exp(-1.5), delta=0.1)
+            self.assertAlmostEqual(mean_y, -math.exp(-1.5), delta=0.1)
+            self.assertAlmostEqual(cov, 0.8 * (1.0 - math.exp(-3.0)), delta=0.1)
+
+    def test_degenerate(self):
+        char_matrix = continuous.simulate_continuous_chars(
+                self.tree,
+                rate_matrix=[[0.0, 0.0, 0.0]] * 3,
+                root_states=[1.0, 2.0, 3.0])
+        for taxon in self.tree.taxon_namespace:
+            self.assertEqual(list(char_matrix[taxon]), [1.0, 2.0, 3.0])
+        char_matrix = continuous.simulate_continuous_chars(
+                self.tree,
+                num_chars=2,
+                ou_alpha=1e6,
+                ou_optima=[5.0, -5.0],
+                char_matrix=char_matrix,
+                rng=MockRandom())
+        for taxon in self.tree.taxon_namespace:
+            self.assertEqual(len(char_matrix[taxon]), 5)
+            self.assertEqual(list(char_matrix[taxon])[:3], [1.0, 2.0, 3.0])
+            self.assertAlmostEqual(char_matrix[taxon][3], 5.0, delta=0.01)
+            self.assertAlmostEqual(char_matrix[taxon][4], -5.0, delta=0.01)
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, continuous.simulate_continuous_chars,
+                self.tree, rate_matrix=[[1.0, 2.0], [2.0, 1.0]])
+        self.assertRaises(ValueError, continuous.simulate_continuous_chars,
+                self.tree, rate_matrix=[[1.0, 0.5], [0.0, 1.0]])
+        self.assertRaises(ValueError, continuous.simulate_continuous_chars,
+                self.tree, num_chars=3, root_states=[0.0, 0.0])
+        self.assertRaises(ValueError, continuous.simulate_continuous_chars,
+                self.tree, num_chars=2, ou_alpha=[1.0, -1.0])
+
 def approx_equal(x, y, tol=1e-5):
     "Returns True if x and y differ by less than tol"
     return (abs(x - y) < tol)
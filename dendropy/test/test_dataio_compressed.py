@@ -0,0 +1,119 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for transparent reading and writing of compressed data files.
+"""
+
+import os
+import gzip
+import bz2
+import shutil
+import tempfile
+import threading
+import unittest
+import dendropy
+from dendropy.utility import filesys
+from dendropy.test.support import pathmap
+
+class CompressedDataIoTestCase(unittest.TestCase):
+
+    compressors = [("gzip", ".gz", gzip.GzipFile), ("bz2", ".bz2", bz2.BZ2File)]
+    if filesys.lzma is not None:
+        compressors.append(("xz", ".xz", filesys.lzma.LZMAFile))
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.tree_src_path = pathmap.tree_source_path("pythonidae.reference-trees.nexus")
+        with open(self.tree_src_path, "rb") as src:
+            self.tree_src_data = src.read()
+        self.expected_trees = dendropy.TreeList.get(path=self.tree_src_path, schema="nexus")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def compress_to(self, data, filename, opener):
+        path = os.path.join(self.tmpdir, filename)
+        f = opener(path, "wb")
+        f.write(data)
+        f.close()
+        return path
+
+    def check_trees(self, trees):
+        self.assertEqual(len(trees), len(self.expected_trees))
+        for t1, t2 in zip(trees, self.expected_trees):
+            self.assertEqual(t1.as_string("newick"), t2.as_string("newick"))
+
+    def test_detect_compression(self):
+        for compression, ext, opener in self.compressors:
+            # deliberately misleading extension: detection by leading bytes
+            path = self.compress_to(self.tree_src_data, "trees" + ext + ".dat", opener)
+            self.assertEqual(filesys.detect_compression(path), compression)
+            self.assertEqual(filesys.detect_compression(os.path.join(self.tmpdir, "x" + ext)), compression)
+        self.assertIs(filesys.detect_compression(self.tree_src_path), None)
+
+    @unittest.skipIf(not os.path.isdir("/dev/fd"), "/dev/fd not supported")
+    def test_get_from_pipe(self):
+        read_fd, write_fd = os.pipe()
+        path = "/dev/fd/{}".format(read_fd)
+        writer = threading.Thread(target=self.write_to_pipe, args=(write_fd,))
+        writer.start()
+        try:
+            self.assertIs(filesys.detect_compression(path), None)
+            trees = dendropy.TreeList.get(path=path, schema="nexus")
+        finally:
+            writer.join()
+            os.close(read_fd)
+        self.check_trees(trees)
+
+    def write_to_pipe(self, write_fd):
+        with os.fdopen(write_fd, "wb") as dest:
+            dest.write(self.tree_src_data)
+
+    def test_get_from_path(self):
+        for compression, ext, opener in self.compressors:
+            path = self.compress_to(self.tree_src_data, "trees" + ext, opener)
+            trees = dendropy.TreeList.get(path=path, schema="nexus")
+            self.check_trees(trees)
+            trees = dendropy.TreeList()
+            trees.read(path=path, schema="nexus")
+            self.check_trees(trees)
+
+    def test_background_decompression(self):
+        for compression, ext, opener in self.compressors:
+            path = self.compress_to(self.tree_src_data, "trees" + ext, opener)
+            with filesys.open_path(path, "r", background_decompression=True) as f:
+                trees = dendropy.TreeList.get(file=f, schema="nexus")
+            self.check_trees(trees)
+
+    def test_yield_from_files(self):
+        for compression, ext, opener in self.compressors:
+            path = self.compress_to(self.tree_src_data, "trees" + ext, opener)
+            trees = list(dendropy.Tree.yield_from_files(files=[path, self.tree_src_path], schema="nexus"))
+            self.assertEqual(len(trees), 2 * len(self.expected_trees))
+
+    def test_write_to_path(self):
+        for compression, ext, opener in self.compressors:
+            path = os.path.join(self.tmpdir, "out" + ext)
+            self.expected_trees.write(path=path, schema="nexus")
+            self.assertEqual(filesys.detect_compression(path), compression)
+            trees = dendropy.TreeList.get(path=path, schema="nexus")
+            self.check_trees(trees)
+
+if __name__ == "__main__":
+    unittest.main()
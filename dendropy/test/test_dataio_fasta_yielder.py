@@ -0,0 +1,89 @@
+# !/usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for streaming FASTA sequence iteration.
+"""
+
+import unittest
+import dendropy
+from dendropy.utility.textprocessing import StringIO
+from dendropy.utility.error import DataParseError
+from dendropy.test.support import pathmap
+
+class FastaCharacterDataYielderTestCase(unittest.TestCase):
+
+    def test_matches_reader(self):
+        paths = [
+                (dendropy.DnaCharacterMatrix, "standard-test-chars-dna.fasta"),
+                (dendropy.RnaCharacterMatrix, "standard-test-chars-rna.fasta"),
+                (dendropy.ProteinCharacterMatrix, "standard-test-chars-protein.fasta"),
+                ]
+        for matrix_type, filename in paths:
+            src_path = pathmap.char_source_path(filename)
+            char_matrix = matrix_type.get(path=src_path, schema="fasta")
+            alphabet = char_matrix.default_state_alphabet
+            expected = [(taxon.label, list(char_matrix[taxon].values())) for taxon in char_matrix]
+            observed = [(label, alphabet.get_states_for_symbols(seq)) for label, seq in matrix_type.yield_from_files(
+                files=[src_path], schema="fasta")]
+            self.assertEqual(observed, expected)
+
+    def test_multiple_files_and_batches(self):
+        s1 = ">a\nACGT\nAC\n\n>b\nTT TT\n"
+        s2 = ">c\nGGG\n"
+        yielder = dendropy.DnaCharacterMatrix.yield_from_files(
+                files=[StringIO(s1), StringIO(s2)],
+                schema="fasta",
+                batch_size=2)
+        batches = list(yielder)
+        self.assertEqual(len(batches), 2)
+        self.assertEqual([tuple(r) for r in batches[0]], [("a", "ACGTAC"), ("b", "TTTT")])
+        self.assertEqual([tuple(r) for r in batches[1]], [("c", "GGG")])
+
+    def test_as_bytes(self):
+        yielder = dendropy.DnaCharacterMatrix.yield_from_files(
+                files=[StringIO(">a\nAC-GT\n")],
+                schema="fasta",
+                as_bytes=True)
+        records = list(yielder)
+        self.assertEqual(records[0].label, "a")
+        self.assertEqual(records[0].sequence, b"AC-GT")
+
+    def test_validation(self):
+        src = ">a\nACGT\n>b\nACJT\n"
+        yielder = dendropy.DnaCharacterMatrix.yield_from_files(
+                files=[StringIO(src)],
+                schema="fasta")
+        with self.assertRaises(DataParseError):
+            list(yielder)
+        yielder = dendropy.DnaCharacterMatrix.yield_from_files(
+                files=[StringIO(src)],
+                schema="fasta",
+                state_alphabet=None)
+        self.assertEqual([r.sequence for r in yielder], ["ACGT", "ACJT"])
+
+    def test_malformed(self):
+        for src in ("ACGT\n>a\nACGT\n", ">a\n>b\nACGT\n"):
+            yielder = dendropy.DnaCharacterMatrix.yield_from_files(
+                    files=[StringIO(src)],
+                    schema="fasta")
+            with self.assertRaises(DataParseError):
+                list(yielder)
+
+if __name__ == "__main__":
+    unittest.main()
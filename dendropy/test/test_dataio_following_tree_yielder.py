@@ -0,0 +1,99 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for following tree files as they are being written.
+"""
+
+import os
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+import dendropy
+
+class FollowingTreeYielderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "run.trees")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def append_in_background(self, header, statements, delay=0.05):
+        with open(self.path, "w") as f:
+            f.write(header)
+        def _write():
+            for statement in statements:
+                time.sleep(delay)
+                with open(self.path, "a") as f:
+                    # write in two parts to check handling of incomplete
+                    # statements
+                    f.write(statement[:10])
+                    f.flush()
+                    time.sleep(delay / 2)
+                    f.write(statement[10:])
+        writer = threading.Thread(target=_write)
+        writer.start()
+        return writer
+
+    def test_nexus(self):
+        header = "#NEXUS\nbegin trees;\n    translate 1 A, 2 B, 3 C, 4 D;\n"
+        statements = ["    tree t{} = [&R] ((1:1,2:1):1,(3:1,4:{}):1);\n".format(i, i+1) for i in range(5)]
+        writer = self.append_in_background(header, statements)
+        tree_yielder = dendropy.Tree.yield_from_files([self.path], "nexus",
+                follow=True,
+                follow_timeout=0.5,
+                follow_sleep_interval=0.01)
+        trees = list(tree_yielder)
+        writer.join()
+        self.assertEqual([t.label for t in trees], ["t{}".format(i) for i in range(5)])
+        self.assertEqual(trees[-1].find_node_with_taxon_label("D").edge.length, 5)
+        self.assertEqual([t.label for t in tree_yielder.taxon_namespace], ["A", "B", "C", "D"])
+
+    def test_newick_incomplete_statement_discarded(self):
+        statements = ["((A:1,B:1):1,(C:1,D:{}):1);\n".format(i+1) for i in range(4)]
+        statements.append("((A:1,B:1):1,(C:1")
+        writer = self.append_in_background("", statements)
+        tree_yielder = dendropy.Tree.yield_from_files([self.path], "newick",
+                follow=True,
+                follow_timeout=0.5,
+                follow_sleep_interval=0.01)
+        trees = list(tree_yielder)
+        writer.join()
+        self.assertEqual(len(trees), 4)
+
+    def test_stop_following(self):
+        writer = self.append_in_background("", ["(A,(B,C));\n", "(B,(A,C));\n"])
+        tree_yielder = dendropy.Tree.yield_from_files([self.path], "newick",
+                follow=True,
+                follow_sleep_interval=0.01)
+        writer.join()
+        trees = []
+        for tree in tree_yielder:
+            trees.append(tree)
+            if len(trees) == 1:
+                # second tree is complete, and will be yielded on reaching
+                # end of data
+                tree_yielder.stop_following()
+        self.assertEqual(len(trees), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -440,5 +440,33 @@ class NewickTreeWriterGeneralOptionsTests(
         for nd in tree2:
             self.assertEqual(nd.edge.length, 1000)
 
+    def test_deep_tree(self):
+        # iterative composition: no recursion limit on tree depth
+        tree1 = dendropy.Tree()
+        nd = tree1.seed_node
+        for i in range(5000):
+            nd.new_child(taxon=tree1.taxon_namespace.require_taxon("t{}".format(i)), edge_length=1)
+            nd = nd.new_child(edge_length=1)
+        nd.new_child(taxon=tree1.taxon_namespace.require_taxon("last"))
+        nd.new_child(taxon=tree1.taxon_namespace.require_taxon("last2"))
+        s = tree1.as_string("newick", suppress_rooting=True)
+        self.assertTrue(s.startswith("(t0:1,(t1:1,(t2:1,"))
+        self.assertTrue(s.strip().endswith("(t4999:1,(last,last2):1" + ("):1" * 4999) + ");"))
+
+    def test_taxon_token_cache_invalidation(self):
+        tree1 = newick_tree_writer_test_tree(
+                has_leaf_node_labels=False,
+                has_internal_node_labels=False)
+        writer = dendropy.dataio.newickwriter.NewickWriter()
+        s1 = writer._compose_tree(tree1)
+        self.assertEqual(writer._compose_tree(tree1), s1)
+        tree2 = dendropy.Tree(tree1, taxon_namespace=dendropy.TaxonNamespace())
+        for taxon in tree2.taxon_namespace:
+            taxon.label = taxon.label + "x"
+        s2 = writer._compose_tree(tree2)
+        for taxon in tree1.taxon_namespace:
+            self.assertIn(taxon.label, s1)
+            self.assertIn(taxon.label + "x", s2)
+
 if __name__ == "__main__":
     unittest.main()
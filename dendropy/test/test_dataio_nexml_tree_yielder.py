@@ -0,0 +1,92 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for NEXML tree iteration reading.
+"""
+
+import io
+import unittest
+import dendropy
+from dendropy.test.support import dendropytest
+from dendropy.test.support import standard_file_test_trees
+
+class _ReadCountingStream(io.BytesIO):
+
+    def __init__(self, data):
+        io.BytesIO.__init__(self, data)
+        self.max_position = 0
+
+    def read(self, *args, **kwargs):
+        s = io.BytesIO.read(self, *args, **kwargs)
+        self.max_position = max(self.max_position, self.tell())
+        return s
+
+class NexmlTreeYielderDefaultTestCase(
+        standard_file_test_trees.NexmlTestTreesChecker,
+        dendropytest.ExtendedTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        standard_file_test_trees.NexmlTestTreesChecker.create_class_fixtures(cls)
+
+    def test_basic(self):
+        tree_file_titles = [
+            "dendropy-test-trees-n12-x2",
+            "dendropy-test-trees-n33-unrooted-x10a",
+            "dendropy-test-trees-n33-unrooted-annotated-x10a",
+        ]
+        expected_file_names = []
+        expected_tree_references = []
+        tree_files = []
+        for file_idx, tree_file_title in enumerate(tree_file_titles):
+            tree_filepath = self.schema_tree_filepaths[tree_file_title]
+            tree_files.append(tree_filepath)
+            num_trees = self.tree_references[tree_file_title]["num_trees"]
+            for tree_idx in range(num_trees):
+                expected_file_names.append(tree_filepath)
+                expected_tree_references.append(self.tree_references[tree_file_title][str(tree_idx)])
+        collected_trees = []
+        tns = dendropy.TaxonNamespace()
+        tree_sources = dendropy.Tree.yield_from_files(
+                files=tree_files,
+                schema="nexml",
+                taxon_namespace=tns)
+        for tree_idx, tree in enumerate(tree_sources):
+            self.assertEqual(tree_sources.current_file_name, expected_file_names[tree_idx])
+            collected_trees.append(tree)
+        self.assertEqual(len(collected_trees), len(expected_tree_references))
+        for tree, ref_tree in zip(collected_trees, expected_tree_references):
+            self.assertIs(tree.taxon_namespace, tns)
+            self.compare_to_reference_tree(tree, ref_tree)
+
+    def test_incremental(self):
+        tree_filepath = self.schema_tree_filepaths["dendropy-test-trees-n33-unrooted-x100a"]
+        with open(tree_filepath, "rb") as src:
+            stream = _ReadCountingStream(src.read())
+        data_size = len(stream.getvalue())
+        tree_sources = dendropy.Tree.yield_from_files(
+                files=[stream],
+                schema="nexml",
+                taxon_namespace=dendropy.TaxonNamespace())
+        first_tree = next(iter(tree_sources))
+        self.assertEqual(len(first_tree.leaf_nodes()), 33)
+        self.assertLess(stream.max_position, data_size)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -26,6 +26,9 @@ from dendropy.test.support import standard_file_test_chars
 from dendropy.test.support import curated_test_tree
 from dendropy.test.support import standard_file_test_datasets
 from dendropy.utility import messaging
+from dendropy.utility.textprocessing import StringIO
+from dendropy.dataio import nexusprocessing
+from dendropy.dataio import newickreader
 import unittest
 import dendropy
 _LOG = messaging.get_logger(__name__)
@@ -239,6 +242,240 @@ class DataSetNexusReaderMixedTestCase(
         self.assertEqual(result, (1, 7, 4))
         self.verify_dataset(ds)
 
+class DataSetNexusSelectiveParsingTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.src_path = pathmap.mixed_source_path("standard-test-mixed.1.basic.nexus")
+        self.full_ds = dendropy.DataSet.get_from_path(self.src_path, "nexus")
+
+    def test_select_trees_blocks(self):
+        ds = dendropy.DataSet.get_from_path(self.src_path, "nexus",
+                blocks=["taxa", "trees"])
+        self.assertEqual(len(ds.char_matrices), 0)
+        self.assertEqual(len(ds.tree_lists), len(self.full_ds.tree_lists))
+        for tree_list, full_tree_list in zip(ds.tree_lists, self.full_ds.tree_lists):
+            self.assertEqual(
+                    [t.as_string("newick") for t in tree_list],
+                    [t.as_string("newick") for t in full_tree_list])
+
+    def test_select_characters_blocks(self):
+        ds = dendropy.DataSet.get_from_path(self.src_path, "nexus",
+                blocks=["taxa", "data"])
+        self.assertEqual(len(ds.tree_lists), 0)
+        self.assertEqual(len(ds.char_matrices), len(self.full_ds.char_matrices))
+        for char_matrix, full_char_matrix in zip(ds.char_matrices, self.full_ds.char_matrices):
+            self.assertEqual(
+                    [str(s) for s in char_matrix.sequences()],
+                    [str(s) for s in full_char_matrix.sequences()])
+
+    def test_skip_block_with_quotes_and_comments(self):
+        s = """\
+#NEXUS
+begin taxa; dimensions ntax=3; taxlabels a b c; end;
+begin characters; dimensions nchar=4; format datatype=dna;
+    matrix
+        a ACGT [ comment end; [ nested END; ] ]
+        b ACGT [ 'quote ]
+        c ACGT
+    ;
+End ;
+begin paup;
+    set 'end;' flag=endblock;
+    [ comment ] execute x.end;
+ENDBLOCK;
+begin trees;
+    tree t1 = ((a,b),c);
+end;
+"""
+        ds = dendropy.DataSet.get(data=s, schema="nexus", blocks=["trees"])
+        self.assertEqual(len(ds.char_matrices), 0)
+        self.assertEqual(len(ds.tree_lists), 1)
+        self.assertEqual(ds.tree_lists[0][0].as_string("newick").strip(), "((a,b),c);")
+        for chunk_size in (1, 2, 3, 7):
+            tokenizer = nexusprocessing.NexusTokenizer(StringIO(s))
+            tokens = []
+            for token in tokenizer:
+                tokens.append(token.upper())
+                if token.upper() in ("CHARACTERS", "PAUP"):
+                    tokenizer.skip_to_end_of_block(chunk_size)
+            self.assertEqual(" ".join(tokens[tokens.index("CHARACTERS")-1:]),
+                    "BEGIN CHARACTERS BEGIN PAUP BEGIN TREES ; TREE T1 = ( ( A , B ) , C ) ; END ;")
+
+    def test_topology_only(self):
+        src_path = pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-annotated-x10a.nexus")
+        full_trees = dendropy.TreeList.get_from_path(src_path, "nexus")
+        trees = dendropy.TreeList.get_from_path(src_path, "nexus",
+                blocks=["taxa", "trees"],
+                parse_annotations=False,
+                parse_edge_lengths=False,
+                parse_internal_labels=False)
+        self.assertEqual(len(trees), len(full_trees))
+        for tree, full_tree in zip(trees, full_trees):
+            self.assertEqual(tree.is_rooted, full_tree.is_rooted)
+            self.assertEqual(tree.label, full_tree.label)
+            self.assertEqual(len(tree.annotations), 0)
+            self.assertEqual(tree.comments, [])
+            for nd in tree:
+                self.assertIs(nd.edge.length, None)
+                self.assertIs(nd.label, None)
+                self.assertEqual(len(nd.annotations), 0)
+                self.assertEqual(nd.comments, [])
+            self.assertEqual(
+                    tree.as_string("newick", suppress_edge_lengths=True, suppress_internal_node_labels=True),
+                    full_tree.as_string("newick", suppress_edge_lengths=True, suppress_internal_node_labels=True, suppress_annotations=True))
+
+    def test_tokenizer_comment_capture_preserved(self):
+        for parse_annotations in (True, False):
+            for capture_comments in (True, False):
+                tokenizer = nexusprocessing.NexusTokenizer(StringIO("((a,b)[&x=1],c);\n[x] ((a,c),b);"))
+                tokenizer.capture_comments = capture_comments
+                tokenizer.require_next_token()
+                taxon_namespace = dendropy.TaxonNamespace()
+                taxon_symbol_mapper = nexusprocessing.NexusTaxonSymbolMapper(taxon_namespace=taxon_namespace)
+                reader = newickreader.NewickReader(parse_annotations=parse_annotations)
+                tree = reader._parse_tree_statement(
+                        nexus_tokenizer=tokenizer,
+                        tree_factory=lambda: dendropy.Tree(taxon_namespace=taxon_namespace),
+                        taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+                self.assertEqual(tree.as_string("newick", suppress_annotations=True).strip(), "((a,b),c);")
+                self.assertIs(tokenizer.capture_comments, capture_comments)
+                self.assertEqual(tokenizer.has_captured_comments(), capture_comments)
+
+    def test_conflicting_internal_label_options(self):
+        with self.assertRaises(ValueError):
+            dendropy.DataSet.get_from_path(self.src_path, "nexus",
+                    parse_internal_labels=False,
+                    suppress_internal_node_taxa=False)
+
+class LazyDataSetNexusTestCase(dendropytest.ExtendedTestCase):
+
+    def get_datasets(self, src_filename, **kwargs):
+        src_path = pathmap.mixed_source_path(src_filename)
+        full_ds = dendropy.DataSet.get(path=src_path, schema="nexus")
+        lazy_ds = dendropy.DataSet.get(path=src_path, schema="nexus", lazy=True, **kwargs)
+        return full_ds, lazy_ds
+
+    def test_block_index(self):
+        full_ds, lazy_ds = self.get_datasets("standard-test-mixed.1.basic.nexus")
+        self.assertTrue(isinstance(lazy_ds, dendropy.LazyDataSet))
+        self.assertEqual(len(lazy_ds.tree_lists), 0)
+        self.assertEqual(len(lazy_ds.char_matrices), 0)
+        tree_blocks = [b for b in lazy_ds.blocks if b.block_type == "TREES"]
+        char_blocks = [b for b in lazy_ds.blocks if b.block_type == "CHARACTERS"]
+        self.assertEqual(len(tree_blocks), len(full_ds.tree_lists))
+        self.assertEqual(len(char_blocks), len(full_ds.char_matrices))
+        for block, tree_list in zip(tree_blocks, full_ds.tree_lists):
+            self.assertEqual(block.ntrees, len(tree_list))
+        for block, char_matrix in zip(char_blocks, full_ds.char_matrices):
+            self.assertEqual(block.nchar, char_matrix.sequence_size)
+        self.assertEqual(lazy_ds.blocks[0].block_type, "TAXA")
+        self.assertEqual(lazy_ds.blocks[0].ntax, len(full_ds.taxon_namespaces[0]))
+
+    def test_on_demand_loading(self):
+        full_ds, lazy_ds = self.get_datasets("standard-test-mixed.1.basic.nexus")
+        for idx in reversed(range(len(full_ds.char_matrices))):
+            expected = full_ds.char_matrices[idx]
+            char_matrix = lazy_ds.get_char_matrix(index=idx)
+            self.assertIs(lazy_ds.get_char_matrix(index=idx), char_matrix)
+            self.assertIs(type(char_matrix), type(expected))
+            self.assertEqual([t.label for t in char_matrix], [t.label for t in expected])
+            self.assertEqual([str(char_matrix[t]) for t in char_matrix], [str(expected[t]) for t in expected])
+        self.assertEqual(len(lazy_ds.tree_lists), 0)
+        for idx, expected in enumerate(full_ds.tree_lists):
+            tree_list = lazy_ds.get_tree_list(index=idx)
+            self.assertEqual([t.as_string("newick") for t in tree_list],
+                    [t.as_string("newick") for t in expected])
+        self.assertEqual(len(lazy_ds.taxon_namespaces), 1)
+        for data in list(lazy_ds.tree_lists) + list(lazy_ds.char_matrices):
+            self.assertIs(data.taxon_namespace, lazy_ds.taxon_namespaces[0])
+
+    def test_multiple_taxon_namespaces(self):
+        full_ds, lazy_ds = self.get_datasets("multitaxa_mesquite.nex")
+        for idx in reversed(range(len(full_ds.tree_lists))):
+            tree_list = lazy_ds.get_tree_list(index=idx)
+            self.assertEqual(tree_list.label, full_ds.tree_lists[idx].label)
+            self.assertEqual(tree_list.taxon_namespace.label, full_ds.tree_lists[idx].taxon_namespace.label)
+            self.assertIs(lazy_ds.get_tree_list(label=tree_list.label), tree_list)
+        lazy_ds.load_all()
+        self.assertEqual(len(lazy_ds.taxon_namespaces), len(full_ds.taxon_namespaces))
+        self.assertEqual(len(lazy_ds.char_matrices), len(full_ds.char_matrices))
+
+    def test_attached_taxon_namespace(self):
+        tns = dendropy.TaxonNamespace()
+        full_ds, lazy_ds = self.get_datasets("multitaxa_mesquite.nex", taxon_namespace=tns)
+        lazy_ds.load_all()
+        self.assertEqual(len(lazy_ds.taxon_namespaces), 1)
+        self.assertIs(lazy_ds.taxon_namespaces[0], tns)
+        for data in list(lazy_ds.tree_lists) + list(lazy_ds.char_matrices):
+            self.assertIs(data.taxon_namespace, tns)
+
+    def test_implicit_taxa_from_data_block(self):
+        data = """\
+#NEXUS
+BEGIN DATA;
+    DIMENSIONS NTAX=3 NCHAR=4;
+    FORMAT DATATYPE=DNA;
+    MATRIX
+        a ACGT
+        b ACGA
+        c ACTT
+    ;
+END;
+BEGIN TREES;
+    TRANSLATE
+        1 a,
+        2 b,
+        3 c
+    ;
+    TREE t1 = ((1,2),3);
+END;
+"""
+        full_ds = dendropy.DataSet.get(data=data, schema="nexus")
+        lazy_ds = dendropy.DataSet.get(data=data, schema="nexus", lazy=True)
+        tree_list = lazy_ds.get_tree_list(index=0)
+        self.assertEqual(tree_list[0].as_string("newick"), full_ds.tree_lists[0][0].as_string("newick"))
+        self.assertEqual(len(lazy_ds.char_matrices), 1)
+        char_matrix = lazy_ds.get_char_matrix(index=0)
+        self.assertEqual([str(char_matrix[t]) for t in char_matrix],
+                [str(full_ds.char_matrices[0][t]) for t in full_ds.char_matrices[0]])
+        self.assertEqual(len(lazy_ds.taxon_namespaces), 1)
+        self.assertEqual([t.label for t in lazy_ds.taxon_namespaces[0]], ["a", "b", "c"])
+        self.assertIs(tree_list.taxon_namespace, char_matrix.taxon_namespace)
+
+    def test_release(self):
+        full_ds, lazy_ds = self.get_datasets("standard-test-mixed.1.basic.nexus")
+        block = [b for b in lazy_ds.blocks if b.block_type == "CHARACTERS"][0]
+        self.assertFalse(lazy_ds.is_loaded(block))
+        char_matrix = lazy_ds.get_char_matrix(index=0)
+        self.assertTrue(lazy_ds.is_loaded(block))
+        self.assertEqual(len(lazy_ds.char_matrices), 1)
+        lazy_ds.release(char_matrix)
+        self.assertEqual(len(lazy_ds.char_matrices), 0)
+        self.assertFalse(lazy_ds.is_loaded(block))
+        char_matrix2 = lazy_ds.get_char_matrix(index=0)
+        self.assertIsNot(char_matrix2, char_matrix)
+        self.assertEqual([str(char_matrix2[t]) for t in char_matrix2], [str(char_matrix[t]) for t in char_matrix])
+        lazy_ds.get_tree_list(index=0)
+        lazy_ds.release_all()
+        self.assertEqual(len(lazy_ds.char_matrices), 0)
+        self.assertEqual(len(lazy_ds.tree_lists), 0)
+        self.assertEqual(len(lazy_ds.taxon_namespaces), 1)
+        with self.assertRaises(ValueError):
+            lazy_ds.release(0)
+
+    def test_data_source(self):
+        src_path = pathmap.mixed_source_path("standard-test-mixed.1.basic.nexus")
+        with open(src_path) as src:
+            lazy_ds = dendropy.DataSet.get(data=src.read(), schema="nexus", lazy=True)
+        full_ds = dendropy.DataSet.get(path=src_path, schema="nexus")
+        lazy_ds.load_all()
+        self.assertEqual(len(lazy_ds.tree_lists), len(full_ds.tree_lists))
+        self.assertEqual(len(lazy_ds.char_matrices), len(full_ds.char_matrices))
+
+    def test_unsupported_schema(self):
+        with self.assertRaises(NotImplementedError):
+            dendropy.DataSet.get(data="(a,b);", schema="newick", lazy=True)
+
 class DataSetNexusTaxonManagementTestCase(dendropytest.ExtendedTestCase):
 
     def testMultiTaxonNamespace(self):
@@ -194,6 +194,42 @@ class TaxonSymbolMappingTest(unittest.TestCase):
                 self.assertIs(t1, translate[token])
         self.assertEqual(len(tns), len(labels))
 
+    def test_symbol_cache(self):
+        labels = ["t{}".format(i) for i in range(1, 101)]
+        tns = dendropy.TaxonNamespace(labels)
+        tsm = nexusprocessing.NexusTaxonSymbolMapper(taxon_namespace=tns)
+        for label_idx, t in enumerate(tns):
+            tsm.add_translate_token("X{}".format(label_idx), t)
+        for rep in range(3):
+            for label_idx, t in enumerate(tns):
+                self.assertIs(tsm.require_taxon_for_symbol("X{}".format(label_idx)), t)
+                self.assertIs(tsm.require_taxon_for_symbol("x{}".format(label_idx)), t)
+        self.assertEqual(tsm.num_symbol_cache_hits, 3 * 2 * len(labels))
+        self.assertEqual(tsm.num_symbol_cache_misses, 0)
+        for rep in range(3):
+            for t in tns:
+                self.assertIs(tsm.require_taxon_for_symbol(t.label), t)
+        self.assertEqual(tsm.num_symbol_cache_misses, len(labels))
+        self.assertEqual(tsm.num_symbol_cache_hits, 3 * 2 * len(labels) + 2 * len(labels))
+
+    def test_symbol_cache_invalidation(self):
+        tns = dendropy.TaxonNamespace(["a", "b", "c"])
+        tsm = nexusprocessing.NexusTaxonSymbolMapper(taxon_namespace=tns)
+        self.assertIs(tsm.require_taxon_for_symbol("3"), tns[2])
+        self.assertIs(tsm.require_taxon_for_symbol("A"), tns[0])
+        # label takes precedence over number
+        t = tsm.new_taxon("3")
+        self.assertIs(tsm.require_taxon_for_symbol("3"), t)
+        # translation token takes precedence over label
+        tsm.add_translate_token("a", tns[1])
+        self.assertIs(tsm.require_taxon_for_symbol("A"), tns[1])
+        self.assertIs(tsm.require_taxon_for_symbol("a"), tns[1])
+        # remapped label
+        self.assertIs(tsm.require_taxon_for_symbol("c"), tns[2])
+        t = tsm.add_taxon(dendropy.Taxon("C"))
+        self.assertIs(tsm.require_taxon_for_symbol("c"), t)
+        self.assertEqual(len(tns), 5)
+
     def test_taxon_namespace_locking(self):
         tns = dendropy.TaxonNamespace()
         tsm = nexusprocessing.NexusTaxonSymbolMapper(taxon_namespace=tns)
@@ -0,0 +1,114 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for reading multiple files in parallel into a shared taxon namespace.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import dendropy
+from dendropy.dataio import parallelreader
+from dendropy.test.support import pathmap
+
+class ParallelTreeListReaderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        source_trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.reference-trees.nexus"),
+                schema="nexus")
+        self.paths = []
+        for idx, tree in enumerate(source_trees[:6]):
+            path = os.path.join(self.tmpdir, "gene{}.tre".format(idx))
+            tree.label = "gene{}".format(idx)
+            tree.write(path=path, schema="nexus")
+            self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_read_tree_lists(self):
+        expected_taxon_namespace = dendropy.TaxonNamespace()
+        expected = [dendropy.TreeList.get(path=path, schema="nexus", taxon_namespace=expected_taxon_namespace) for path in self.paths]
+        for num_processes in (1, 2):
+            taxon_namespace = dendropy.TaxonNamespace()
+            tree_lists = parallelreader.read_tree_lists(self.paths, "nexus",
+                    taxon_namespace=taxon_namespace,
+                    num_processes=num_processes)
+            self.assertEqual([t.label for t in taxon_namespace],
+                    [t.label for t in expected_taxon_namespace])
+            self.assertEqual(len(tree_lists), len(expected))
+            for tree_list, expected_tree_list in zip(tree_lists, expected):
+                self.assertIs(tree_list.taxon_namespace, taxon_namespace)
+                self.assertEqual(len(tree_list), len(expected_tree_list))
+                for tree, expected_tree in zip(tree_list, expected_tree_list):
+                    self.assertIs(tree.taxon_namespace, taxon_namespace)
+                    self.assertEqual(tree.label, expected_tree.label)
+                    self.assertEqual(tree.is_rooted, expected_tree.is_rooted)
+                    self.assertEqual(tree.as_string("newick"), expected_tree.as_string("newick"))
+                    for nd in tree.leaf_node_iter():
+                        self.assertIn(nd.taxon, taxon_namespace)
+
+    def test_seeded_taxon_namespace(self):
+        paths = []
+        for idx, path in enumerate(self.paths):
+            paths.append(os.path.join(self.tmpdir, "gene{}.nwk".format(idx)))
+            dendropy.Tree.get(path=path, schema="nexus").write(path=paths[-1], schema="newick")
+        taxon_namespace = dendropy.TaxonNamespace(["Python regius", "Unseen taxon"])
+        parallelreader.read_tree_lists(paths, "newick",
+                taxon_namespace=taxon_namespace,
+                taxon_labels=["python sebae", "Morelia viridis"],
+                num_processes=2)
+        labels = [t.label for t in taxon_namespace]
+        self.assertEqual(labels[:3], ["Python regius", "Unseen taxon", "python sebae"])
+        self.assertEqual(len(labels), len(set(label.lower() for label in labels)))
+
+    def test_error(self):
+        paths = self.paths + [os.path.join(self.tmpdir, "missing.tre")]
+        with self.assertRaises(parallelreader.ParallelReadError):
+            parallelreader.read_tree_lists(paths, "nexus", num_processes=2)
+
+    def test_error_in_current_process(self):
+        paths = self.paths + [os.path.join(self.tmpdir, "missing.tre")]
+        with self.assertRaises(parallelreader.ParallelReadError):
+            parallelreader.read_tree_lists(paths, "nexus", num_processes=1)
+
+class ParallelCharacterMatrixReaderTestCase(unittest.TestCase):
+
+    def test_read_char_matrices(self):
+        paths = [pathmap.char_source_path(f) for f in ("pythonidae.chars.fasta", "primates.chars.fasta")]
+        taxon_namespace = dendropy.TaxonNamespace()
+        char_matrices = parallelreader.read_char_matrices(paths, "fasta",
+                char_matrix_type=dendropy.DnaCharacterMatrix,
+                taxon_namespace=taxon_namespace,
+                num_processes=2)
+        expected_taxon_namespace = dendropy.TaxonNamespace()
+        for path, char_matrix in zip(paths, char_matrices):
+            expected = dendropy.DnaCharacterMatrix.get(path=path, schema="fasta", taxon_namespace=expected_taxon_namespace)
+            self.assertIs(char_matrix.taxon_namespace, taxon_namespace)
+            self.assertEqual(len(char_matrix), len(expected))
+            for taxon, expected_taxon in zip(char_matrix, expected):
+                self.assertEqual(taxon.label, expected_taxon.label)
+                self.assertEqual(char_matrix[taxon].symbols_as_string(), expected[expected_taxon].symbols_as_string())
+        self.assertEqual([t.label for t in taxon_namespace], [t.label for t in expected_taxon_namespace])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for reading ahead of multiple sources in a background thread.
+"""
+
+import unittest
+import dendropy
+from dendropy.utility import filesys
+from dendropy.test.support import pathmap
+
+class PrefetchingTreeYielderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.paths = [pathmap.tree_source_path(f) for f in (
+            "pythonidae.reference-trees.nexus",
+            "pythonidae.reference-trees.no-taxa-block.nexus",
+            "pythonidae.reference-trees.newick",
+            )]
+
+    def read_trees(self, files, schema, **kwargs):
+        tree_yielder = dendropy.Tree.yield_from_files(files, schema, **kwargs)
+        return [(tree_yielder.current_file_index,
+                tree_yielder.current_file_name,
+                tree.as_string("newick")) for tree in tree_yielder]
+
+    def test_prefetch(self):
+        for schema, paths in (("nexus", self.paths[:2]), ("nexus/newick", self.paths)):
+            expected = self.read_trees(paths, schema)
+            reads = []
+            observed = self.read_trees(paths, schema,
+                    prefetch=1,
+                    prefetch_hook=lambda *args: reads.append(args))
+            self.assertEqual(observed, expected)
+            self.assertEqual(set(r[0] for r in reads), set(paths))
+
+    def test_mixed_paths_and_streams(self):
+        expected = self.read_trees(self.paths[:2] + self.paths[:1], "nexus")
+        with open(self.paths[1], "r") as f:
+            observed = self.read_trees([self.paths[0], f, self.paths[0]], "nexus", prefetch=True)
+        self.assertEqual([x[2] for x in observed], [x[2] for x in expected])
+
+    def test_early_termination(self):
+        reader = filesys.PrefetchingReader(self.paths, max_queued_chunks=1, chunk_size=1024)
+        with reader.open_next() as f:
+            f.readline()
+        with open(self.paths[1], "r") as src:
+            expected = src.read()
+        with reader.open_next() as f:
+            self.assertEqual(f.read(), expected)
+        reader.close()
+        self.assertFalse(reader._thread.is_alive())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -435,6 +435,81 @@ class CharacterMatrixBinaryOps(dendropytest.ExtendedTestCase):
         self.verify_sequence_equal(c1[tns[1]], [2, 2, 2, 3, 3, 3])
         self.verify_sequence_equal(c1[tns[2]], [4, 4, 4])
 
+class CharacterMatrixViewTests(dendropytest.ExtendedTestCase):
+
+    def get_char_matrix(self):
+        tns = get_taxon_namespace(3)
+        char_matrix = charmatrixmodel.CharacterMatrix(taxon_namespace=tns)
+        for idx, taxon in enumerate(tns):
+            char_matrix[taxon] = [(idx * 10) + i for i in range(10)]
+        return char_matrix, tns
+
+    def test_view_character_indices(self):
+        char_matrix, tns = self.get_char_matrix()
+        view = char_matrix.view_character_indices([7, 2, 5])
+        self.assertIs(view.taxon_namespace, tns)
+        self.assertEqual(len(view), len(char_matrix))
+        self.assertEqual(list(view[tns[1]]), [17, 12, 15])
+        self.assertEqual(view[tns[1]].values(), [17, 12, 15])
+        self.assertEqual(view[tns[1]][-1], 15)
+        view = char_matrix.view_character_indices(slice(3, 6))
+        self.assertEqual(view.max_sequence_size, 3)
+        self.assertEqual(list(view[tns[2]]), [23, 24, 25])
+
+    def test_view_reads_and_writes_through(self):
+        char_matrix, tns = self.get_char_matrix()
+        view = char_matrix.view_character_indices(slice(3, 6))
+        view[tns[0]][1] = "x"
+        self.assertEqual(char_matrix[tns[0]][4], "x")
+        char_matrix[tns[0]][5] = "y"
+        self.assertEqual(view[tns[0]][2], "y")
+        with self.assertRaises(TypeError):
+            view[tns[0]].append(1)
+        with self.assertRaises(TypeError):
+            del view[tns[0]][0]
+
+    def test_view_of_view(self):
+        char_matrix, tns = self.get_char_matrix()
+        v1 = char_matrix.view_character_indices(slice(2, 8))
+        v2 = v1.view_character_indices([0, 5])
+        self.assertEqual(list(v2[tns[2]]), [22, 27])
+        self.assertEqual(v2[tns[2]].source_sequences, [char_matrix[tns[2]]])
+
+    def test_iter_character_windows(self):
+        char_matrix, tns = self.get_char_matrix()
+        windows = list(char_matrix.iter_character_windows(4))
+        self.assertEqual([list(w[tns[0]]) for w in windows],
+                [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+        windows = list(char_matrix.iter_character_windows(6, step_size=4))
+        self.assertEqual([list(w[tns[0]]) for w in windows],
+                [[0, 1, 2, 3, 4, 5], [4, 5, 6, 7, 8, 9]])
+
+    def test_concatenate_as_view(self):
+        char_matrix, tns = self.get_char_matrix()
+        v1 = char_matrix.view_character_indices(slice(0, 2))
+        v2 = char_matrix.view_character_indices(slice(8, 10))
+        cc = charmatrixmodel.CharacterMatrix.concatenate([v1, v2], as_view=True)
+        self.assertEqual(list(cc[tns[1]]), [10, 11, 18, 19])
+        self.assertEqual(len(cc.character_subsets), 2)
+        cc[tns[1]][2] = "z"
+        self.assertEqual(char_matrix[tns[1]][8], "z")
+
+    def test_clone_of_view_is_independent(self):
+        char_matrix, tns = self.get_char_matrix()
+        view = char_matrix.view_character_indices([1, 3])
+        clone = charmatrixmodel.CharacterMatrix(view)
+        self.assertIs(clone.taxon_namespace, tns)
+        self.assertNotIsInstance(clone[tns[0]], charmatrixmodel.CharacterDataSequenceView)
+        self.assertEqual(list(clone[tns[0]]), [1, 3])
+        clone[tns[0]][0] = "q"
+        self.assertEqual(char_matrix[tns[0]][1], 1)
+
+    def test_export_character_indices(self):
+        char_matrix, tns = self.get_char_matrix()
+        exported = char_matrix.export_character_indices([5, 1, 1])
+        self.assertEqual(list(exported[tns[2]]), [21, 25])
+        self.assertNotIsInstance(exported[tns[2]], charmatrixmodel.CharacterDataSequenceView)
+
 class CharacterMatrixTaxonManagement(dendropytest.ExtendedTestCase):
 
     def test_assign_taxon_namespace(self):
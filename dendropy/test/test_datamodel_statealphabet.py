@@ -301,6 +301,29 @@ class StateAlphabetTester(object):
             obs_states = self.sa.get_states_for_symbols(selected_symbols)
             self.assertEqual(obs_states, selected_states, "random seed: {}".format(self.random_seed))
 
+    def test_get_states_for_symbol_string(self):
+        all_symbols = [s for s in self.sa.full_symbol_state_map.keys() if s is not None]
+        for rep in range(3):
+            n = random.randint(5, 100)
+            selected_symbols = [self.rng.choice(all_symbols) for _ in range(n)]
+            selected_states = [self.sa[s] for s in selected_symbols]
+            obs_states = self.sa.get_states_for_symbol_string(" ".join(selected_symbols))
+            self.assertEqual(obs_states, selected_states, "random seed: {}".format(self.random_seed))
+            codes = self.sa.get_state_indexes_for_symbol_string("".join(selected_symbols))
+            self.assertEqual(list(bytearray(codes)), [s._index for s in selected_states])
+
+    def test_symbol_translation_table(self):
+        table = bytearray(self.sa.symbol_translation_table)
+        self.assertEqual(len(table), 256)
+        for code, state_index in enumerate(table):
+            symbol = chr(code)
+            if symbol in self.sa.full_symbol_state_map:
+                self.assertEqual(state_index, self.sa[symbol]._index)
+            else:
+                self.assertEqual(state_index, self.sa.UNRECOGNIZED_SYMBOL_CODE)
+        self.assertRaises(KeyError, self.sa.get_state_indexes_for_symbol_string, "\x01")
+        self.assertRaises(KeyError, self.sa.get_states_for_symbol_string, "\x01")
+
     def test_states_property(self):
         check = list(self.sa.state_iter())
         self.assertEqual(len(check), len(self.sa.states))
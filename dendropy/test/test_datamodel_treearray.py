@@ -16,8 +16,12 @@
 ##
 ##############################################################################
 
+import io
+import random
 import unittest
 from dendropy.test.support import pathmap
+from dendropy.model import coalescent
+from dendropy.dataio import splitarchive
 import dendropy
 
 class TreeArrayBasicTreeAccession(unittest.TestCase):
@@ -55,5 +59,79 @@ class TreeArrayBasicTreeAccession(unittest.TestCase):
         self.verify_tree_array(tree_array, trees)
 
 
+class TreeArrayArchiveTestCase(unittest.TestCase):
+
+    def verify_restored(self, original, restored):
+        self.assertEqual([t.label for t in restored.taxon_namespace],
+                [t.label for t in original.taxon_namespace])
+        self.assertEqual(restored.is_rooted_trees, original.is_rooted_trees)
+        self.assertEqual(restored._tree_split_bitmasks, original._tree_split_bitmasks)
+        self.assertEqual(restored._tree_edge_lengths, original._tree_edge_lengths)
+        self.assertEqual(restored._tree_leafset_bitmasks, original._tree_leafset_bitmasks)
+        self.assertEqual(restored._tree_weights, original._tree_weights)
+        sd1 = original.split_distribution
+        sd2 = restored.split_distribution
+        self.assertEqual(dict(sd2.split_counts), dict(sd1.split_counts))
+        self.assertEqual(dict(sd2.split_edge_lengths), dict(sd1.split_edge_lengths))
+        self.assertEqual(sd2.total_trees_counted, sd1.total_trees_counted)
+        self.assertEqual(sd2.sum_of_tree_weights, sd1.sum_of_tree_weights)
+
+    def test_round_trip(self):
+        trees = dendropy.TreeList.get_from_path(pathmap.tree_source_path(
+                "pythonidae.reference-trees.nexus"),
+                "nexus")
+        tree_array = dendropy.TreeArray.from_tree_list(trees)
+        dest = io.BytesIO()
+        tree_array.write_archive(dest)
+        restored = dendropy.TreeArray.from_archive(io.BytesIO(dest.getvalue()))
+        self.verify_restored(tree_array, restored)
+        self.assertEqual(
+                restored.consensus_tree().as_string("newick"),
+                tree_array.consensus_tree().as_string("newick"))
+
+    def test_multiword_bitmasks_and_node_ages(self):
+        rng = random.Random(1)
+        taxon_namespace = dendropy.TaxonNamespace(["T{}".format(i) for i in range(150)])
+        trees = dendropy.TreeList(taxon_namespace=taxon_namespace)
+        for i in range(5):
+            trees.append(coalescent.pure_kingman_tree(taxon_namespace, rng=rng))
+        tree_array = dendropy.TreeArray.from_tree_list(trees, ignore_node_ages=False)
+        dest = io.BytesIO()
+        tree_array.write_archive(dest)
+        restored = dendropy.TreeArray.from_archive(io.BytesIO(dest.getvalue()))
+        self.verify_restored(tree_array, restored)
+        self.assertEqual(dict(restored.split_distribution.split_node_ages),
+                dict(tree_array.split_distribution.split_node_ages))
+
+    def test_merge(self):
+        trees = dendropy.TreeList.get_from_path(pathmap.tree_source_path(
+                "pythonidae.reference-trees.nexus"),
+                "nexus")
+        tree_array = dendropy.TreeArray.from_tree_list(trees)
+        dest = io.BytesIO()
+        tree_array.write_archive(dest)
+        merged = dendropy.TreeArray(taxon_namespace=trees.taxon_namespace)
+        merged.read_archive(io.BytesIO(dest.getvalue()))
+        merged.read_archive(io.BytesIO(dest.getvalue()))
+        self.assertEqual(len(merged), 2 * len(tree_array))
+        for split in tree_array.split_distribution.split_counts:
+            self.assertEqual(merged.split_distribution.split_counts[split],
+                    2 * tree_array.split_distribution.split_counts[split])
+
+    def test_split_distribution_round_trip(self):
+        trees = dendropy.TreeList.get_from_path(pathmap.tree_source_path(
+                "pythonidae.reference-trees.nexus"),
+                "nexus")
+        sd = trees.split_distribution()
+        dest = io.BytesIO()
+        sd.write_archive(dest)
+        restored = dendropy.SplitDistribution.from_archive(io.BytesIO(dest.getvalue()),
+                taxon_namespace=trees.taxon_namespace)
+        self.assertIs(restored.taxon_namespace, trees.taxon_namespace)
+        self.assertEqual(dict(restored.split_counts), dict(sd.split_counts))
+        self.assertEqual(dict(restored.split_edge_lengths), dict(sd.split_edge_lengths))
+        with self.assertRaises(splitarchive.SplitArchiveError):
+            dendropy.TreeArray.from_archive(io.BytesIO(dest.getvalue()))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,237 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests of discrete character evolution models and simulation.
+"""
+
+import math
+import random
+import unittest
+import dendropy
+from dendropy.test.support import pathmap
+from dendropy.model import discrete
+
+class Hky85TransitionProbabilitiesTest(unittest.TestCase):
+
+    def test_pmatrix_matches_pij(self):
+        model = discrete.Hky85(kappa=3.2, base_freqs=[0.1, 0.2, 0.3, 0.4])
+        for tlen in (0.0, 0.01, 0.2, 1.5):
+            for rate in (0.5, 1.0, 2.0):
+                pmat = model.pmatrix(tlen, rate)
+                for i in range(4):
+                    self.assertAlmostEqual(sum(pmat[i]), 1.0, 10)
+                    for j in range(4):
+                        self.assertAlmostEqual(pmat[i][j], model.pij(i, j, tlen, rate), 12)
+
+    def test_cumulative_pmatrix_cache(self):
+        model = discrete.Hky85(kappa=2.0)
+        cmat1 = model.cumulative_pmatrix(0.1, 1.0)
+        self.assertIs(model.cumulative_pmatrix(0.1, 1.0), cmat1)
+        for row in cmat1:
+            self.assertEqual(row[-1], 1.0)
+            self.assertEqual(row, sorted(row))
+        model.kappa = 5.0
+        cmat2 = model.cumulative_pmatrix(0.1, 1.0)
+        self.assertIsNot(cmat2, cmat1)
+        self.assertNotAlmostEqual(cmat2[0][0], cmat1[0][0])
+        model.clear_pmatrix_cache()
+        self.assertIsNot(model.cumulative_pmatrix(0.1, 1.0), cmat2)
+
+class DiscreteCharacterReplicateSimulationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = dendropy.Tree.get(
+                data="((a:0.1,b:0.2):0.05,(c:0.3,(d:0.1,e:0.15):0.2):0.1);",
+                schema="newick")
+
+    def test_replicate_matrices(self):
+        rng = random.Random(1)
+        seq_model = discrete.Hky85(kappa=2.0, base_freqs=[0.3, 0.2, 0.2, 0.3])
+        char_matrices = discrete.simulate_discrete_char_replicates(
+                seq_len=50,
+                tree_model=self.tree,
+                seq_model=seq_model,
+                num_replicates=5,
+                rng=rng)
+        self.assertEqual(len(char_matrices), 5)
+        for char_matrix in char_matrices:
+            self.assertIs(char_matrix.taxon_namespace, self.tree.taxon_namespace)
+            self.assertEqual(len(char_matrix), 5)
+            for taxon in char_matrix:
+                seq = char_matrix[taxon]
+                self.assertEqual(len(seq), 50)
+                for state in seq:
+                    self.assertIn(str(state), "ACGT")
+        self.assertFalse(hasattr(self.tree.seed_node, "sequences"))
+
+    def test_zero_length_edges_conserve_root_states(self):
+        for edge in self.tree.postorder_edge_iter():
+            edge.length = 0.0
+        root_states = dendropy.DnaCharacterMatrix.datatype_alphabet.get_states_for_symbols("ACGTTGCA")
+        char_matrices = discrete.simulate_discrete_char_replicates(
+                seq_len=8,
+                tree_model=self.tree,
+                seq_model=discrete.Jc69(),
+                num_replicates=3,
+                root_states=root_states,
+                rng=random.Random(2))
+        for char_matrix in char_matrices:
+            for taxon in char_matrix:
+                self.assertEqual(char_matrix[taxon].symbols_as_string(), "ACGTTGCA")
+
+    def test_saturation_approaches_stationary_frequencies(self):
+        for edge in self.tree.postorder_edge_iter():
+            edge.length = 20.0
+        base_freqs = [0.1, 0.2, 0.3, 0.4]
+        seq_model = discrete.Hky85(kappa=2.0, base_freqs=base_freqs)
+        char_matrix = discrete.simulate_discrete_char_replicates(
+                seq_len=4000,
+                tree_model=self.tree,
+                seq_model=seq_model,
+                num_replicates=1,
+                rng=random.Random(3))[0]
+        counts = [0, 0, 0, 0]
+        for state in char_matrix[char_matrix.taxon_namespace[0]]:
+            counts[state.index] += 1
+        for count, freq in zip(counts, base_freqs):
+            self.assertAlmostEqual(float(count)/4000, freq, 1)
+
+class DiscreteGammaRatesTest(unittest.TestCase):
+
+    def test_yang_1994_mean_rates(self):
+        # alpha = 0.5, four categories (Yang 1994, Table 1)
+        expected = [0.0334, 0.2519, 0.8203, 2.8944]
+        rates = discrete.discrete_gamma_rates(0.5, 4)
+        self.assertEqual(len(rates), 4)
+        for r, e in zip(rates, expected):
+            self.assertAlmostEqual(r, e, 4)
+        self.assertAlmostEqual(sum(rates)/4, 1.0, 10)
+
+    def test_single_category(self):
+        self.assertEqual(discrete.discrete_gamma_rates(0.5, 1), [1.0])
+
+class DiscreteCharacterLikelihoodCalculatorTest(unittest.TestCase):
+
+    def get_data(self):
+        taxa = dendropy.TaxonNamespace()
+        chars = dendropy.DnaCharacterMatrix.get(
+                path=pathmap.char_source_path("pythonidae.chars.nexus"),
+                schema="nexus",
+                taxon_namespace=taxa)
+        tree = dendropy.Tree.get(
+                path=pathmap.tree_source_path("pythonidae.mb.con"),
+                schema="nexus",
+                taxon_namespace=taxa)
+        return tree, chars
+
+    def test_two_taxon_jc69(self):
+        chars = dendropy.DnaCharacterMatrix.from_dict({"a": "AACGT", "b": "AGCGA"})
+        tree = dendropy.Tree.get(
+                data="(a:0.1,b:0.3);",
+                schema="newick",
+                taxon_namespace=chars.taxon_namespace)
+        d = 0.4
+        p_same = 0.25 + 0.75 * math.exp(-4.0 * d / 3.0)
+        p_diff = 0.25 - 0.25 * math.exp(-4.0 * d / 3.0)
+        expected = 3 * math.log(0.25 * p_same) + 2 * math.log(0.25 * p_diff)
+        calc = discrete.DiscreteCharacterLikelihoodCalculator(
+                tree=tree,
+                char_matrix=chars,
+                seq_model=discrete.Jc69())
+        self.assertEqual(calc.num_patterns, 5)
+        self.assertAlmostEqual(calc.log_likelihood(), expected, 10)
+
+    def test_sequences_of_different_lengths(self):
+        chars = dendropy.DnaCharacterMatrix.from_dict({
+            "a": "AACGTACG",
+            "b": "AGCGAA",
+            "c": "AACGTTCG"})
+        tree = dendropy.Tree.get(
+                data="((a:0.1,b:0.2):0.1,c:0.3);",
+                schema="newick",
+                taxon_namespace=chars.taxon_namespace)
+        with self.assertRaises(ValueError) as cm:
+            discrete.DiscreteCharacterLikelihoodCalculator(
+                    tree=tree,
+                    char_matrix=chars,
+                    seq_model=discrete.Jc69())
+        message = str(cm.exception)
+        self.assertIn("'b'", message)
+        self.assertIn("6", message)
+        self.assertIn("8", message)
+
+    def test_pattern_compression(self):
+        tree, chars = self.get_data()
+        calc = discrete.DiscreteCharacterLikelihoodCalculator(
+                tree=tree,
+                char_matrix=chars,
+                seq_model=discrete.Hky85(kappa=2.0))
+        self.assertTrue(calc.num_patterns < chars.sequence_size)
+        self.assertEqual(sum(calc.pattern_weights), chars.sequence_size)
+        site_lnls = calc.site_log_likelihoods()
+        self.assertEqual(len(site_lnls), chars.sequence_size)
+        self.assertAlmostEqual(sum(site_lnls), calc.log_likelihood(), 6)
+
+    def test_scaling(self):
+        tree, chars = self.get_data()
+        for edge in tree.postorder_edge_iter():
+            if edge.length is not None:
+                edge.length *= 100
+        seq_model = discrete.Hky85(kappa=2.0)
+        calc = discrete.DiscreteCharacterLikelihoodCalculator(
+                tree=tree,
+                char_matrix=chars,
+                seq_model=seq_model,
+                num_gamma_categories=4,
+                gamma_shape=0.5)
+        calc.scaling_threshold = 0.0
+        unscaled = calc.log_likelihood()
+        calc.scaling_threshold = 1.0
+        calc.invalidate()
+        self.assertAlmostEqual(calc.log_likelihood(), unscaled, 6)
+
+    def test_rooting_invariance(self):
+        tree, chars = self.get_data()
+        seq_model = discrete.Hky85(kappa=4.0, base_freqs=[0.3, 0.2, 0.2, 0.3])
+        lnl1 = discrete.log_likelihood(tree, chars, seq_model, num_gamma_categories=4, gamma_shape=0.8)
+        tree.reroot_at_node(tree.leaf_nodes()[5].parent_node, suppress_unifurcations=False)
+        lnl2 = discrete.log_likelihood(tree, chars, seq_model, num_gamma_categories=4, gamma_shape=0.8)
+        self.assertAlmostEqual(lnl1, lnl2, 6)
+
+    def test_incremental_edge_length_update(self):
+        tree, chars = self.get_data()
+        seq_model = discrete.Hky85(kappa=2.0)
+        calc = discrete.DiscreteCharacterLikelihoodCalculator(
+                tree=tree,
+                char_matrix=chars,
+                seq_model=seq_model,
+                num_gamma_categories=2,
+                gamma_shape=1.0)
+        lnl0 = calc.log_likelihood()
+        for nd in (tree.leaf_nodes()[3], tree.seed_node.child_nodes()[0]):
+            calc.update_edge_length(nd.edge, nd.edge.length * 3.0)
+            lnl1 = calc.log_likelihood()
+            self.assertNotAlmostEqual(lnl0, lnl1)
+            self.assertAlmostEqual(lnl1,
+                    discrete.log_likelihood(tree, chars, seq_model, num_gamma_categories=2, gamma_shape=1.0),
+                    8)
+            lnl0 = lnl1
+
+if __name__ == "__main__":
+    unittest.main()
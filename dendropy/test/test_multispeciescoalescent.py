@@ -302,6 +302,128 @@ class MultispeciesCoalescentBasicTestCase(unittest.TestCase):
                 )
         self.assertAlmostEqual(s, expected_lnL)
 
+class MultispeciesCoalescentBatchScorerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        with open(pathmap.other_source_path("multispecies_coalescent_test_data.json")) as src:
+            self.test_regimes = json.load(src)
+
+    def get_regime(self, test_regime):
+        species_tree = dendropy.Tree.get(
+                data=test_regime["species_tree"],
+                schema="newick",
+                rooting="force-rooted",
+                )
+        species_tree.taxon_namespace.is_mutable = False
+        coalescent_species_lineage_label_map = test_regime["coalescent_species_lineage_label_map"]
+        coalescent_species_lineage_map_fn = lambda x: species_tree.taxon_namespace.require_taxon(coalescent_species_lineage_label_map[x.label])
+        coalescent_taxa = dendropy.TaxonNamespace(sorted(coalescent_species_lineage_label_map.keys()))
+        coalescent_taxa.is_mutable = False
+        coalescent_trees = []
+        expected = []
+        for sub_regime in test_regime["coalescent_trees"]:
+            coalescent_trees.append(dendropy.Tree.get(
+                    data=sub_regime["coalescent_tree"],
+                    schema="newick",
+                    rooting="force-rooted",
+                    taxon_namespace=coalescent_taxa,
+                    ))
+            expected.append(sub_regime["log_likelihood"])
+        return species_tree, coalescent_trees, coalescent_species_lineage_map_fn, expected
+
+    def test_score(self):
+        for test_regime in self.test_regimes:
+            species_tree, coalescent_trees, map_fn, expected = self.get_regime(test_regime)
+            scorer = multispeciescoalescent.MultispeciesCoalescentBatchScorer(
+                    coalescent_trees=coalescent_trees,
+                    coalescent_species_lineage_map_fn=map_fn)
+            self.assertEqual(len(scorer), len(coalescent_trees))
+            obs = scorer.score_coalescent_trees(species_tree)
+            self.assertEqual(len(obs), len(expected))
+            for obs_ln_likelihood, exp_ln_likelihood in zip(obs, expected):
+                self.assertAlmostEqual(obs_ln_likelihood, exp_ln_likelihood, 2)
+            self.assertAlmostEqual(scorer.score_species_tree(species_tree), sum(obs), 6)
+            msc = multispeciescoalescent.MultispeciesCoalescent(species_tree=species_tree)
+            self.assertAlmostEqual(msc.score_coalescent_trees(coalescent_trees, map_fn), sum(obs), 6)
+
+    def test_population_theta(self):
+        species_tree, coalescent_tree, taxon_map = generate_multispecies_coalescent_system(
+                speciation_ages=[10, 20, 30],
+                coalescent_ages=[5, 6, 15, 16, 35, 36]
+                )
+        thetas = {"H": 2.0, "C": 3.0, "HC": 4.0, "HCG": 5.0, "HCGO": 6.0}
+        population_theta_fn = lambda e: thetas.get(e.head_node.label, 1.0)
+        # (number of coalescences, weighted waiting time, weighted time to end of population)
+        population_stats = {
+            "H": (1, 3 * 2 * 5.0, 2 * 1 * 5.0),
+            "C": (1, 2 * 1 * 6.0, 0.0),
+            "HC": (2, 3 * 2 * 5.0 + 2 * 1 * 1.0, 0.0),
+            "HCG": (0, 0.0, 2 * 1 * 10.0),
+            "HCGO": (2, 3 * 2 * 5.0 + 2 * 1 * 1.0, 0.0),
+        }
+        expected = 0.0
+        for label in population_stats:
+            n, a, b = population_stats[label]
+            theta = thetas[label]
+            expected += n * math.log(2.0/theta) - theta * a - b / theta
+        scorer = multispeciescoalescent.MultispeciesCoalescentBatchScorer(
+                coalescent_trees=[coalescent_tree, coalescent_tree],
+                coalescent_species_lineage_map_fn=lambda x: taxon_map[x])
+        obs = scorer.score_coalescent_trees(species_tree, population_theta_fn=population_theta_fn)
+        self.assertAlmostEqual(obs[0], expected, 6)
+        self.assertAlmostEqual(obs[1], expected, 6)
+        self.assertAlmostEqual(scorer.score_species_tree(species_tree, population_theta_fn=population_theta_fn), 2 * expected, 6)
+
+    def test_cache(self):
+        species_tree, coalescent_trees, map_fn, expected = self.get_regime(self.test_regimes[-1])
+        scorer = multispeciescoalescent.MultispeciesCoalescentBatchScorer(
+                coalescent_trees=coalescent_trees,
+                coalescent_species_lineage_map_fn=map_fn)
+        num_edges = len(list(species_tree.postorder_edge_iter()))
+        score1 = scorer.score_species_tree(species_tree)
+        self.assertEqual(scorer.num_population_cache_misses, num_edges)
+        self.assertEqual(scorer.num_population_cache_hits, 0)
+        self.assertEqual(scorer.score_species_tree(species_tree, population_theta_fn=lambda e: 2.0),
+                multispeciescoalescent.MultispeciesCoalescentBatchScorer(coalescent_trees, map_fn).score_species_tree(species_tree, population_theta_fn=lambda e: 2.0))
+        self.assertEqual(scorer.num_population_cache_misses, num_edges)
+        self.assertEqual(scorer.num_population_cache_hits, num_edges)
+
+        # moving a node changes the populations subtended by it, those
+        # ancestral to it, and those descending from it
+        node = [nd for nd in species_tree.postorder_internal_node_iter() if nd.parent_node is not None][0]
+        shift = min(ch.edge.length for ch in node.child_node_iter()) / 2.0
+        node.edge.length += shift
+        for ch in node.child_node_iter():
+            ch.edge.length -= shift
+        num_changed = len(node._child_nodes)
+        nd = node
+        while nd is not None:
+            num_changed += 1
+            nd = nd.parent_node
+        score2 = scorer.score_species_tree(species_tree)
+        self.assertEqual(scorer.num_population_cache_misses, num_edges + num_changed)
+        self.assertEqual(scorer.num_population_cache_hits, 2 * num_edges - num_changed)
+        self.assertAlmostEqual(score2,
+                multispeciescoalescent.MultispeciesCoalescentBatchScorer(coalescent_trees, map_fn).score_species_tree(species_tree),
+                8)
+        self.assertNotAlmostEqual(score1, score2, 6)
+
+        scorer.clear_cache()
+        self.assertAlmostEqual(scorer.score_species_tree(species_tree), score2, 8)
+        self.assertEqual(scorer.num_population_cache_misses, num_edges)
+
+    def test_invalid_structure(self):
+        species_tree, coalescent_tree, taxon_map = generate_multispecies_coalescent_system(
+                speciation_ages=[10, 20, 30],
+                # H and C lineages coalesce before H and C split
+                coalescent_ages=[5, 6, 7, 16, 35, 36]
+                )
+        scorer = multispeciescoalescent.MultispeciesCoalescentBatchScorer(
+                coalescent_trees=[coalescent_tree],
+                coalescent_species_lineage_map_fn=lambda x: taxon_map[x])
+        self.assertRaises(dendropy.utility.error.InvalidMultispeciesCoalescentStructureError,
+                scorer.score_species_tree, species_tree)
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -21,6 +21,7 @@ Tests of protracted speciation model/process.
 """
 
 import math
+import random
 import unittest
 import dendropy
 from dendropy.model import protractedspeciation
@@ -311,6 +312,64 @@ class ProtractedSpeciationCalcs(unittest.TestCase):
                     )
             self.assertAlmostEqual(obs_result, exp_result)
 
+class ProtractedSpeciationProcessSimulation(unittest.TestCase):
+
+    def get_process(self, seed):
+        return protractedspeciation.ProtractedSpeciationProcess(
+                speciation_initiation_from_orthospecies_rate=0.6,
+                speciation_initiation_from_incipient_species_rate=0.4,
+                speciation_completion_rate=0.3,
+                orthospecies_extinction_rate=0.15,
+                incipient_species_extinction_rate=0.2,
+                rng=random.Random(seed))
+
+    def check_lineage_tree(self, psp, lineage_tree):
+        extant_lineages = set(psp.current_orthospecies_lineages + psp.current_incipient_species_lineages)
+        self.assertEqual(set(nd.protracted_speciation_model_lineage for nd in lineage_tree.leaf_node_iter()),
+                extant_lineages)
+        for nd in lineage_tree:
+            self.assertIn(len(nd._child_nodes), (0, 2))
+        for nd in lineage_tree.leaf_node_iter():
+            self.assertAlmostEqual(nd.distance_from_root(), psp.current_time, 8)
+
+    def check_orthospecies_tree(self, orthospecies_tree):
+        for nd in orthospecies_tree.leaf_node_iter():
+            self.assertTrue(nd.protracted_speciation_model_lineage.is_orthospecies)
+
+    def test_max_time(self):
+        psp = self.get_process(1)
+        for i in range(20):
+            lineage_tree, orthospecies_tree = psp.generate_sample(max_time=5.0)
+            self.assertEqual(psp.current_time, 5.0)
+            self.check_lineage_tree(psp, lineage_tree)
+            self.check_orthospecies_tree(orthospecies_tree)
+
+    def test_max_extant_lineages(self):
+        psp = self.get_process(2)
+        for i in range(10):
+            lineage_tree, orthospecies_tree = psp.generate_sample(max_extant_lineages=50)
+            self.assertEqual(len(lineage_tree.leaf_nodes()), 50)
+            self.check_lineage_tree(psp, lineage_tree)
+            self.check_orthospecies_tree(orthospecies_tree)
+
+    def test_max_extant_orthospecies(self):
+        psp = self.get_process(3)
+        for i in range(10):
+            lineage_tree, orthospecies_tree = psp.generate_sample(max_extant_orthospecies=20)
+            self.assertEqual(len(orthospecies_tree.leaf_nodes()), 20)
+            self.check_lineage_tree(psp, lineage_tree)
+            self.check_orthospecies_tree(orthospecies_tree)
+
+    def test_iter_samples(self):
+        psp1 = self.get_process(4)
+        psp2 = self.get_process(4)
+        samples = list(psp1.iter_samples(5, max_extant_lineages=10))
+        self.assertEqual(len(samples), 5)
+        for lineage_tree, orthospecies_tree in samples:
+            expected_lineage_tree, expected_orthospecies_tree = psp2.generate_sample(max_extant_lineages=10)
+            self.assertEqual(lineage_tree.as_string("newick"), expected_lineage_tree.as_string("newick"))
+            self.assertEqual(orthospecies_tree.as_string("newick"), expected_orthospecies_tree.as_string("newick"))
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,84 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for simulation of replicate trees in parallel.
+"""
+
+import unittest
+import dendropy
+from dendropy.simulate import treesim
+from dendropy.simulate import replicates
+
+class ReplicateTreeSimulationTestCase(unittest.TestCase):
+
+    def simulate(self, **kwargs):
+        return treesim.simulate_replicate_trees(
+                treesim.birth_death_tree,
+                num_replicates=12,
+                simulator_kwargs={"birth_rate": 1.0, "death_rate": 0.2, "ntax": 8},
+                seed=7,
+                **kwargs)
+
+    def test_reproducible_across_processes(self):
+        trees1 = self.simulate(num_processes=1)
+        trees2 = self.simulate(num_processes=2, chunk_size=5)
+        self.assertEqual(len(trees1), 12)
+        self.assertEqual(len(trees2), 12)
+        self.assertEqual(trees1.as_string("newick"), trees2.as_string("newick"))
+        self.assertEqual(len(trees1.taxon_namespace), 8)
+        for tree in trees2:
+            self.assertIs(tree.taxon_namespace, trees2.taxon_namespace)
+            self.assertEqual(len(tree.leaf_nodes()), 8)
+        self.assertNotEqual(trees1[0].as_string("newick"), trees1[1].as_string("newick"))
+
+    def test_newick(self):
+        trees = self.simulate(num_processes=1)
+        newick_strings = list(treesim.iter_replicate_trees(
+                treesim.birth_death_tree,
+                num_replicates=12,
+                seed=7,
+                num_processes=2,
+                as_newick=True,
+                simulator_kwargs={"birth_rate": 1.0, "death_rate": 0.2, "ntax": 8}))
+        self.assertEqual(newick_strings, [t.as_string("newick") for t in trees])
+
+    def test_tree_array_and_progress(self):
+        progress = []
+        taxon_namespace = dendropy.TaxonNamespace(["a", "b", "c", "d", "e"])
+        tree_array = dendropy.TreeArray(taxon_namespace=taxon_namespace)
+        treesim.simulate_replicate_trees(
+                treesim.pure_kingman_tree,
+                num_replicates=10,
+                simulator_kwargs={"taxon_namespace": taxon_namespace},
+                tree_collection=tree_array,
+                seed=1,
+                num_processes=2,
+                chunk_size=4,
+                progress_hook=lambda n, total: progress.append((n, total)))
+        self.assertEqual(len(tree_array), 10)
+        self.assertEqual(len(taxon_namespace), 5)
+        self.assertEqual(progress, [(4, 10), (8, 10), (10, 10)])
+
+    def test_replicate_seeds(self):
+        seeds = replicates.replicate_seeds(3, 10)
+        self.assertEqual(len(set(seeds)), 10)
+        self.assertEqual(replicates.replicate_seeds(3, 4, start=6), seeds[6:])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,6 +20,8 @@
 Tests statistical routines.
 """
 
+import bisect
+import random
 import unittest
 from dendropy.test.support import dendropytest
 from dendropy.calculate import statistics
@@ -639,6 +641,90 @@ class FishersExactTests(dendropytest.ExtendedTestCase):
         p = ft.two_tail_p()
         self.assertAlmostEqual(p, 0.08026855207410688)
 
+class SummarizeTests(unittest.TestCase):
+
+    def testSummarize(self):
+        values = [(i * 7) % 23 for i in range(60)]
+        summary = statistics.summarize(values)
+        self.assertEqual(summary["range"], (0, 22))
+        self.assertEqual(summary["median"], statistics.median(values))
+        self.assertEqual(summary["hpd95"], statistics.empirical_hpd(values, conf=0.95))
+        self.assertEqual(summary["quant_5_95"], statistics.quantile_5_95(values))
+        mean, var = statistics.mean_and_sample_variance(values)
+        self.assertAlmostEqual(summary["mean"], mean)
+        self.assertAlmostEqual(summary["var"], var)
+        self.assertAlmostEqual(summary["sd"], var ** 0.5)
+
+    def testSummarizeMany(self):
+        samples = [[float(i * j % 17) for i in range(40)] for j in range(1, 5)]
+        summaries = statistics.summarize_many(samples + [[]])
+        self.assertEqual(len(summaries), 5)
+        for values, summary in zip(samples, summaries):
+            self.assertEqual(summary, statistics.summarize(values))
+        self.assertIs(summaries[-1], None)
+        summaries = statistics.summarize_many({"a": samples[0], "b": [], "c": samples[1]})
+        self.assertEqual(sorted(summaries.keys()), ["a", "c"])
+        self.assertEqual(summaries["c"], statistics.summarize(samples[1]))
+
+class QuantileSketchTests(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(1)
+        self.values = [rng.lognormvariate(0, 1) for i in range(20000)]
+        self.sorted_values = sorted(self.values)
+
+    def assertRankNear(self, value, q, delta=0.005):
+        rank = float(bisect.bisect_left(self.sorted_values, value)) / len(self.sorted_values)
+        self.assertAlmostEqual(rank, q, delta=delta)
+
+    def testQuantiles(self):
+        sketch = statistics.QuantileSketch(compression=100)
+        sketch.update(self.values)
+        self.assertEqual(len(sketch), len(self.values))
+        self.assertLessEqual(sketch.num_centroids, 100)
+        self.assertEqual(sketch.quantile(0.0), self.sorted_values[0])
+        self.assertEqual(sketch.quantile(1.0), self.sorted_values[-1])
+        for q in (0.001, 0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99, 0.999):
+            self.assertRankNear(sketch.quantile(q), q)
+            self.assertAlmostEqual(sketch.cdf(self.sorted_values[int(q * len(self.values))]), q, delta=0.005)
+
+    def testSmallSample(self):
+        sketch = statistics.QuantileSketch()
+        sketch.update([3.0, 1.0, 2.0])
+        self.assertEqual(sketch.num_centroids, 3)
+        self.assertEqual(sketch.quantile(0.5), 2.0)
+        self.assertEqual(sketch.cdf(0.5), 0.0)
+        self.assertEqual(sketch.cdf(3.0), 1.0)
+        self.assertRaises(ValueError, statistics.QuantileSketch().quantile, 0.5)
+
+    def testSummarize(self):
+        sketch = statistics.QuantileSketch()
+        sketch.update(self.values)
+        exact = statistics.summarize(self.values)
+        approx = sketch.summarize()
+        self.assertEqual(approx["range"], exact["range"])
+        self.assertAlmostEqual(approx["mean"], exact["mean"])
+        self.assertAlmostEqual(approx["var"], exact["var"])
+        self.assertAlmostEqual(approx["sd"], exact["sd"])
+        self.assertRankNear(approx["median"], 0.5)
+        self.assertRankNear(approx["quant_5_95"][0], 0.05)
+        self.assertRankNear(approx["quant_5_95"][1], 0.95)
+        for v1, v2 in zip(approx["hpd95"], exact["hpd95"]):
+            self.assertAlmostEqual(v1, v2, delta=0.1)
+
+    def testMerge(self):
+        sketch1 = statistics.QuantileSketch()
+        sketch1.update(self.values[:5000])
+        sketch2 = statistics.QuantileSketch()
+        sketch2.update(self.values[5000:])
+        sketch1.merge(sketch2)
+        self.assertEqual(len(sketch1), len(self.values))
+        summary = sketch1.summarize()
+        self.assertEqual(summary["range"], (self.sorted_values[0], self.sorted_values[-1]))
+        self.assertAlmostEqual(summary["var"], statistics.mean_and_sample_variance(self.values)[1])
+        for q in (0.01, 0.5, 0.99):
+            self.assertRankNear(sketch1.quantile(q), q)
+
 if __name__ == "__main__":
     unittest.main()
 
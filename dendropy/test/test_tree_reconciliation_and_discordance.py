@@ -150,6 +150,72 @@ class DeepCoalTest(unittest.TestCase):
             assert dc == expected, \
                 "deep coalescences by groups: expecting %d, but found %d" % (expected, dc)
 
+class ReconciliationIndexTestCase(unittest.TestCase):
+
+    def testDeepCoalescencesMatchDiscordance(self):
+        taxa = dendropy.TaxonNamespace()
+        gene_trees = dendropy.TreeList.get_from_string("""
+            [&R] (A,(B,(C,D))); [&R] ((A,C),(B,D)); [&R] (C,(A,(B,D)));
+            [&R] ((A,B),(C,D)); [&R] (D,(C,(B,A)));
+            """, "newick", taxon_namespace=taxa)
+        species_trees = dendropy.TreeList.get_from_string("""
+            [&R] (A,(B,(C,D)));
+            [&R] (B,(D,(C,A)));
+            [&R] ((A,D),(C,B));
+            """, "newick", taxon_namespace=taxa)
+        for st in species_trees:
+            index = reconcile.ReconciliationIndex(st)
+            results = index.reconcile_trees(gene_trees)
+            self.assertEqual(len(results), len(gene_trees))
+            for gt, result in zip(gene_trees, results):
+                self.assertEqual(result.num_deep_coalescences, reconcile.reconciliation_discordance(gt, st))
+            congruent = index.reconcile(st)
+            self.assertEqual(congruent, (0, 0, 0))
+            self.assertEqual(index.num_deep_coalescences(gene_trees),
+                    sum(r.num_deep_coalescences for r in results))
+
+    def testDuplicationsAndLosses(self):
+        species_tree = dendropy.Tree.get_from_string("[&R] ((A,B)AB,C)ABC;", "newick")
+        gene_tree = dendropy.Tree.get_from_string("[&R] ((A1,B1)x,(A2,C1)y)z;", "newick")
+        taxon_map = dict((t, species_tree.taxon_namespace.get_taxon(t.label[0])) for t in gene_tree.taxon_namespace)
+        index = reconcile.ReconciliationIndex(species_tree, contained_to_containing_taxon_map=taxon_map)
+        result = index.reconcile(gene_tree)
+        self.assertEqual(result.num_duplications, 1)
+        self.assertEqual(result.num_losses, 2)
+        self.assertEqual(result.num_deep_coalescences, 2)
+        node_map = index.map_gene_tree(gene_tree)
+        expected = {"x": "AB", "y": "ABC", "z": "ABC"}
+        for nd in gene_tree:
+            if nd.taxon is not None:
+                self.assertIs(node_map[nd].taxon, taxon_map[nd.taxon])
+            else:
+                self.assertEqual(node_map[nd].label, expected[nd.label])
+
+    def testTaxonMapping(self):
+        dataset = dendropy.DataSet.get_from_path(pathmap.tree_source_path(filename="deepcoal1.nex"), "nexus")
+        species_tree = dataset.get_tree_list(label="ContainingTree")[0]
+        gene_trees = dataset.get_tree_list(label="EmbeddedTrees")
+        taxon_map = dendropy.TaxonNamespaceMapping(
+                domain_taxon_namespace=gene_trees.taxon_namespace,
+                range_taxon_namespace=species_tree.taxon_namespace,
+                mapping_fn=lambda t: species_tree.taxon_namespace.require_taxon(label=t.label[0].upper()))
+        index = reconcile.ReconciliationIndex(species_tree, contained_to_containing_taxon_map=taxon_map)
+        results = index.reconcile_trees(gene_trees)
+        for gt, result in zip(gene_trees, results):
+            node_map = index.map_gene_tree(gt)
+            for nd in gt.postorder_node_iter():
+                species_taxa = set(taxon_map[leaf.taxon] for leaf in nd.leaf_iter())
+                self.assertIs(node_map[nd], species_tree.mrca(taxa=species_taxa))
+            self.assertTrue(result.num_deep_coalescences >= 0)
+        self.assertEqual(index.reconcile_trees(gene_trees, num_processes=2, chunk_size=3), results)
+
+    def testMissingTaxon(self):
+        taxa = dendropy.TaxonNamespace()
+        species_tree = dendropy.Tree.get_from_string("[&R] ((A,B),C);", "newick", taxon_namespace=taxa)
+        gene_tree = dendropy.Tree.get_from_string("[&R] ((A,B),D);", "newick", taxon_namespace=taxa)
+        index = reconcile.ReconciliationIndex(species_tree)
+        self.assertRaises(ValueError, index.reconcile, gene_tree)
+
 if __name__ == "__main__":
     unittest.main()
 
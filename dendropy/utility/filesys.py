@@ -23,9 +23,24 @@ Various utilities in support of filesystem interaction.
 import fnmatch
 import time
 import os
+import io
 import sys
 import re
+import gzip
+import bz2
 from threading import Event, Thread, Lock
+try:
+    import lzma
+except ImportError:
+    lzma = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+try:
+    from Queue import Queue, Full # Python 2 legacy support
+except ImportError:
+    from queue import Queue, Full
 
 from dendropy.utility import messaging
 _LOG = messaging.get_logger(__name__)
@@ -59,6 +74,446 @@ def pre_py34_open(file,
             mode=mode,
             buffering=buffering)
 
+###############################################################################
+## Compressed File Handling
+
+# (compression, leading "magic" bytes, file name extensions)
+COMPRESSION_FORMATS = (
+    ("gzip", b"\x1f\x8b", (".gz", ".gzip")),
+    ("bz2", b"BZh", (".bz2",)),
+    ("xz", b"\xfd7zXZ\x00", (".xz", ".lzma")),
+    ("zstd", b"\x28\xb5\x2f\xfd", (".zst", ".zstd")),
+)
+COMPRESSED_STREAM_BUFFER_SIZE = 1 << 20
+BACKGROUND_DECOMPRESSION = False
+
+def _compression_for_extension(path):
+    lpath = path.lower()
+    for compression, magic, extensions in COMPRESSION_FORMATS:
+        for ext in extensions:
+            if lpath.endswith(ext):
+                return compression
+    return None
+
+def detect_compression(path, use_extension=True):
+    """
+    Returns the name of the compression format ("gzip", "bz2", "xz" or
+    "zstd") of the file at ``path``, or |None| if it is not compressed. The
+    format is identified by the leading bytes of the file if it is a regular
+    file, or by its extension if it does not exist (and if ``use_extension``
+    is |True|). Other files (e.g., pipes or FIFOs) are never read here, as the
+    bytes consumed could not be read again, and are taken to be uncompressed.
+    """
+    if os.path.isfile(path):
+        with io.open(path, "rb") as f:
+            lead = f.read(6)
+        for compression, magic, extensions in COMPRESSION_FORMATS:
+            if lead.startswith(magic):
+                return compression
+        return None
+    if os.path.exists(path):
+        return None
+    if use_extension:
+        return _compression_for_extension(path)
+    return None
+
+def _open_compressed_binary(path, mode, compression):
+    if compression == "gzip":
+        return gzip.GzipFile(path, mode)
+    elif compression == "bz2":
+        return bz2.BZ2File(path, mode)
+    elif compression == "xz":
+        if lzma is None:
+            raise NotImplementedError("Reading or writing '{}' requires the 'lzma' module".format(path))
+        return lzma.LZMAFile(path, mode)
+    elif compression == "zstd":
+        if zstandard is None:
+            raise NotImplementedError("Reading or writing '{}' requires the 'zstandard' package".format(path))
+        raw = io.open(path, mode)
+        if mode == "rb":
+            return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        else:
+            return zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+    raise ValueError("Unsupported compression: '{}'".format(compression))
+
+class _BackgroundDecompressingReader(io.RawIOBase):
+    """
+    Wraps a (decompressing) binary stream, reading it in a background thread
+    into a bounded queue of large chunks, so that decompression proceeds
+    concurrently with the consumption (parsing) of the data.
+    """
+
+    def __init__(self, src, chunk_size=COMPRESSED_STREAM_BUFFER_SIZE, max_chunks=4):
+        io.RawIOBase.__init__(self)
+        self._src = src
+        self._chunk_size = chunk_size
+        self._queue = Queue(max_chunks)
+        self._current = b""
+        self._current_pos = 0
+        self._eof = False
+        self._stop_event = Event()
+        self._thread = Thread(target=self._fill)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _fill(self):
+        try:
+            while not self._stop_event.is_set():
+                chunk = self._src.read(self._chunk_size)
+                self._queue.put(chunk)
+                if not chunk:
+                    break
+        except Exception as e:
+            self._queue.put(e)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while self._current_pos >= len(self._current):
+            if self._eof:
+                return 0
+            chunk = self._queue.get()
+            if isinstance(chunk, Exception):
+                self._eof = True
+                raise chunk
+            if not chunk:
+                self._eof = True
+                return 0
+            self._current = chunk
+            self._current_pos = 0
+        n = min(len(b), len(self._current) - self._current_pos)
+        b[:n] = self._current[self._current_pos:self._current_pos + n]
+        self._current_pos += n
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._stop_event.set()
+            while self._thread.is_alive():
+                # unblock the reading thread if waiting on a full queue
+                while not self._queue.empty():
+                    self._queue.get()
+                self._thread.join(0.01)
+            self._src.close()
+        io.RawIOBase.close(self)
+
+def open_path(path,
+        mode="r",
+        compression=None,
+        background_decompression=None):
+    """
+    Opens the file at ``path`` for reading or writing text, transparently
+    handling compression.
+
+    When reading, compressed files (gzip, bz2, xz, or zstd) are detected by
+    their leading bytes and decompressed on the fly through large buffers
+    (pipes, FIFOs, and other non-regular files are not inspected, and are read
+    as uncompressed unless ``compression`` is given). If
+    ``background_decompression`` is |True| (default given by the module-level
+    ``BACKGROUND_DECOMPRESSION`` setting), decompression will be done in a
+    separate thread, concurrently with the consumption of the data. When
+    writing, the compression format is determined by the file name extension
+    (e.g., ".gz", ".bz2", ".xz", or ".zst"). In either case, the
+    compression format can also be given explicitly by ``compression``: "gzip",
+    "bz2", "xz", "zstd", or "none".
+
+    Uncompressed files are opened as by the builtin ``open()``, with
+    universal newline support.
+
+    Parameters
+    ----------
+    path : string
+        Path to file.
+    mode : string
+        "r" (read), "w" (write), or "a" (append).
+    compression : string
+        Compression format; if not specified, it is detected as described
+        above.
+    background_decompression : boolean
+        If |True|, decompress in a background thread.
+
+    Returns
+    -------
+    f : file-like object
+        File-like object opened for reading or writing text.
+    """
+    path = os.path.expandvars(os.path.expanduser(path))
+    mode = mode.replace("t", "").replace("U", "")
+    if compression is None:
+        if mode.startswith("r"):
+            compression = detect_compression(path, use_extension=False)
+        else:
+            compression = _compression_for_extension(path)
+    elif compression == "none":
+        compression = None
+    if compression is None:
+        if sys.version_info.major >= 3 and sys.version_info.minor >= 4:
+            return open(path, mode, newline=None)
+        else:
+            return pre_py34_open(path, mode, newline=None)
+    binary_mode = mode[0] + "b"
+    stream = _open_compressed_binary(path, binary_mode, compression)
+    if background_decompression is None:
+        background_decompression = BACKGROUND_DECOMPRESSION
+    if binary_mode == "rb" and background_decompression:
+        stream = _BackgroundDecompressingReader(stream)
+    return wrap_binary_stream(stream, binary_mode)
+
+def open_binary_path(path, compression=None):
+    """
+    Opens the file at ``path`` for reading bytes, transparently decompressing
+    it if it is compressed (see :func:`open_path`).
+    """
+    path = os.path.expandvars(os.path.expanduser(path))
+    if compression is None:
+        compression = detect_compression(path, use_extension=False)
+    elif compression == "none":
+        compression = None
+    if compression is None:
+        return io.open(path, "rb")
+    return _open_compressed_binary(path, "rb", compression)
+
+def wrap_binary_stream(stream, binary_mode="rb"):
+    """
+    Returns a file-like object for reading (or writing) text given a binary
+    stream (under Python 2, the stream itself is returned).
+    """
+    if sys.version_info.major < 3:
+        # Python 2: ``str`` is bytes; no decoding needed
+        return stream
+    if binary_mode == "rb" and not isinstance(stream, io.BufferedIOBase):
+        stream = io.BufferedReader(stream, buffer_size=COMPRESSED_STREAM_BUFFER_SIZE)
+    return io.TextIOWrapper(stream, newline=None)
+
+###############################################################################
+## PrefetchingReader
+
+class PrefetchingReader(object):
+    """
+    Reads the contents of a sequence of files in a background thread, ahead
+    of (and concurrently with) their consumption, into a bounded queue of
+    chunks. This allows, e.g., parsing of one file to proceed while the
+    following files are being read, which can substantially improve
+    throughput where file access has high latency (e.g., on network file
+    systems).
+
+    Files are opened for consumption, in order, using
+    :meth:`PrefetchingReader.open_next`. The reader should be closed when
+    done, which will stop the background thread if it is still running.
+    """
+
+    def __init__(self,
+            paths,
+            max_queued_chunks=8,
+            chunk_size=COMPRESSED_STREAM_BUFFER_SIZE,
+            read_hook=None):
+        """
+        Parameters
+        ----------
+        paths : iterable of strings
+            Paths of files to be read (compressed files will be transparently
+            decompressed).
+        max_queued_chunks : int
+            Maximum number of chunks to read ahead.
+        chunk_size : int
+            Size of each chunk, in bytes.
+        read_hook : function object
+            If given, this will be called (in the background thread) after
+            each chunk is read, with the file path, the number of bytes read
+            from it so far, and the elapsed time in seconds since it was
+            opened as arguments, allowing throughput to be monitored.
+        """
+        self.paths = list(paths)
+        self.chunk_size = chunk_size
+        self.read_hook = read_hook
+        self._queue = Queue(max(1, max_queued_chunks))
+        self._stop_event = Event()
+        self._next_path_index = 0
+        self._thread = Thread(target=self._read_files)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _put(self, item):
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _read_files(self):
+        for path_index, path in enumerate(self.paths):
+            try:
+                src = open_binary_path(path)
+                start_time = time.time()
+                bytes_read = 0
+                with src:
+                    while not self._stop_event.is_set():
+                        chunk = src.read(self.chunk_size)
+                        if chunk and self.read_hook is not None:
+                            bytes_read += len(chunk)
+                            self.read_hook(path, bytes_read, time.time() - start_time)
+                        if not self._put((path_index, chunk)):
+                            return
+                        if not chunk:
+                            break
+            except Exception as e:
+                self._put((path_index, e))
+                return
+
+    def _get(self, path_index):
+        item_path_index, chunk = self._queue.get()
+        assert item_path_index == path_index
+        if isinstance(chunk, Exception):
+            raise chunk
+        return chunk
+
+    def open_next(self):
+        """
+        Returns a file-like object open for reading the text of the next file
+        in the sequence.
+        """
+        if self._next_path_index >= len(self.paths):
+            raise IndexError("No more files to read")
+        stream = _PrefetchedFileStream(self,
+                self._next_path_index,
+                self.paths[self._next_path_index])
+        self._next_path_index += 1
+        return wrap_binary_stream(stream)
+
+    def close(self):
+        """
+        Stops reading and releases resources.
+        """
+        self._stop_event.set()
+        while self._thread.is_alive():
+            # unblock the reading thread if waiting on a full queue
+            while not self._queue.empty():
+                self._queue.get()
+            self._thread.join(0.01)
+
+class _PrefetchedFileStream(io.RawIOBase):
+
+    def __init__(self, prefetching_reader, path_index, name):
+        io.RawIOBase.__init__(self)
+        self._prefetching_reader = prefetching_reader
+        self._path_index = path_index
+        self.name = name
+        self._current = b""
+        self._current_pos = 0
+        self._eof = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while self._current_pos >= len(self._current):
+            if self._eof:
+                return 0
+            try:
+                chunk = self._prefetching_reader._get(self._path_index)
+            except Exception:
+                self._eof = True
+                raise
+            if not chunk:
+                self._eof = True
+                return 0
+            self._current = chunk
+            self._current_pos = 0
+        n = min(len(b), len(self._current) - self._current_pos)
+        b[:n] = self._current[self._current_pos:self._current_pos + n]
+        self._current_pos += n
+        return n
+
+    def close(self):
+        if not self.closed:
+            # discard any unconsumed chunks of this file so that the next
+            # file can be read
+            while not self._eof and not self._prefetching_reader._stop_event.is_set():
+                try:
+                    chunk = self._prefetching_reader._get(self._path_index)
+                except Exception:
+                    break
+                if not chunk:
+                    break
+            self._eof = True
+        io.RawIOBase.close(self)
+
+###############################################################################
+## FollowingFileStream
+
+class FollowingFileStream(io.RawIOBase):
+    """
+    Reads a file that is being written to (e.g., by a running analysis) in
+    the manner of "``tail -f``": on reaching the end of the data currently
+    in the file, instead of signaling end-of-file, waits (polling every
+    ``sleep_interval`` seconds) for more data to be appended.
+
+    End-of-file is signaled if no data has been appended for ``idle_timeout``
+    seconds (if given), or if ``stop_event`` is set.
+    """
+
+    def __init__(self,
+            path,
+            sleep_interval=0.5,
+            idle_timeout=None,
+            stop_event=None):
+        """
+        Parameters
+        ----------
+        path : string
+            Path to the file.
+        sleep_interval : float
+            Seconds to wait between checks for more data.
+        idle_timeout : float
+            If given, signal end-of-file if no data has been appended for this
+            many seconds.
+        stop_event : ``threading.Event``
+            If given, signal end-of-file as soon as this is set.
+        """
+        io.RawIOBase.__init__(self)
+        self.name = path
+        self.sleep_interval = sleep_interval
+        self.idle_timeout = idle_timeout
+        self.stop_event = stop_event
+        self.bytes_read = 0
+        self.is_stopped = False
+        self._src = io.open(os.path.expandvars(os.path.expanduser(path)), "rb", buffering=0)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        last_data_time = time.time()
+        while True:
+            n = self._src.readinto(b)
+            if n:
+                self.bytes_read += n
+                return n
+            if (self.stop_event is not None and self.stop_event.is_set()) \
+                    or (self.idle_timeout is not None and time.time() - last_data_time >= self.idle_timeout):
+                self.is_stopped = True
+                return 0
+            if os.fstat(self._src.fileno()).st_size < self.bytes_read:
+                raise IOError("File truncated while being followed: '{}'".format(self.name))
+            if self.stop_event is not None:
+                self.stop_event.wait(self.sleep_interval)
+            else:
+                time.sleep(self.sleep_interval)
+
+    def close(self):
+        if not self.closed:
+            self._src.close()
+        io.RawIOBase.close(self)
+
 ###############################################################################
 ## LineReadingThread
 